@@ -21,54 +21,97 @@ from google.cloud.aiplatform import version as aiplatform_version
 __version__ = aiplatform_version.__version__
 
 
-from google.cloud.aiplatform import initializer
+import importlib
+import sys
+from typing import Any, List
 
-from google.cloud.aiplatform.datasets import (
-    ImageDataset,
-    TabularDataset,
-    TextDataset,
-    TimeSeriesDataset,
-    VideoDataset,
-)
-from google.cloud.aiplatform import explain
-from google.cloud.aiplatform import gapic
-from google.cloud.aiplatform import hyperparameter_tuning
-from google.cloud.aiplatform.featurestore import (
-    EntityType,
-    Feature,
-    Featurestore,
-)
-from google.cloud.aiplatform.matching_engine import (
-    MatchingEngineIndex,
-    MatchingEngineIndexEndpoint,
-)
+from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.metadata import metadata
-from google.cloud.aiplatform.models import Endpoint
-from google.cloud.aiplatform.models import Model
-from google.cloud.aiplatform.model_evaluation import ModelEvaluation
-from google.cloud.aiplatform.jobs import (
-    BatchPredictionJob,
-    CustomJob,
-    HyperparameterTuningJob,
-)
-from google.cloud.aiplatform.pipeline_jobs import PipelineJob
-from google.cloud.aiplatform.tensorboard import (
-    Tensorboard,
-    TensorboardExperiment,
-    TensorboardRun,
-)
-from google.cloud.aiplatform.training_jobs import (
-    CustomTrainingJob,
-    CustomContainerTrainingJob,
-    CustomPythonPackageTrainingJob,
-    AutoMLTabularTrainingJob,
-    AutoMLForecastingTrainingJob,
-    SequenceToSequencePlusForecastingTrainingJob,
-    AutoMLImageTrainingJob,
-    AutoMLTextTrainingJob,
-    AutoMLVideoTrainingJob,
+
+# Adds the to_value conversions to the schema types, which the training jobs
+# and prediction requests rely on to pass them as protobuf Values.
+from google.cloud.aiplatform.gapic import schema as _gapic_schema  # noqa: F401
+
+# The resource classes and submodules below are imported on first access
+# (PEP 562) since importing all of them, and the GAPIC, BigQuery and pandas
+# modules they depend on, takes seconds.
+_LAZY_ATTRIBUTES = {
+    "ImageDataset": "google.cloud.aiplatform.datasets",
+    "TabularDataset": "google.cloud.aiplatform.datasets",
+    "TextDataset": "google.cloud.aiplatform.datasets",
+    "TimeSeriesDataset": "google.cloud.aiplatform.datasets",
+    "VideoDataset": "google.cloud.aiplatform.datasets",
+    "EntityType": "google.cloud.aiplatform.featurestore",
+    "Feature": "google.cloud.aiplatform.featurestore",
+    "Featurestore": "google.cloud.aiplatform.featurestore",
+    "MatchingEngineIndex": "google.cloud.aiplatform.matching_engine",
+    "MatchingEngineIndexEndpoint": "google.cloud.aiplatform.matching_engine",
+    "Endpoint": "google.cloud.aiplatform.models",
+    "Model": "google.cloud.aiplatform.models",
+    "ModelEvaluation": "google.cloud.aiplatform.model_evaluation",
+    "BatchPredictionJob": "google.cloud.aiplatform.jobs",
+    "CustomJob": "google.cloud.aiplatform.jobs",
+    "HyperparameterTuningJob": "google.cloud.aiplatform.jobs",
+    "PipelineJob": "google.cloud.aiplatform.pipeline_jobs",
+    "Tensorboard": "google.cloud.aiplatform.tensorboard",
+    "TensorboardExperiment": "google.cloud.aiplatform.tensorboard",
+    "TensorboardRun": "google.cloud.aiplatform.tensorboard",
+    "CustomTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "CustomContainerTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "CustomPythonPackageTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "AutoMLTabularTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "AutoMLForecastingTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "SequenceToSequencePlusForecastingTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "AutoMLImageTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "AutoMLTextTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "AutoMLVideoTrainingJob": "google.cloud.aiplatform.training_jobs",
+    "as_completed": "google.cloud.aiplatform.utils.job_poller",
+    "wait_all": "google.cloud.aiplatform.utils.job_poller",
+    "wait_any": "google.cloud.aiplatform.utils.job_poller",
+}
+
+# Submodules that importing the package used to expose as attributes.
+_LAZY_SUBMODULES = (
+    "datasets",
+    "explain",
+    "featurestore",
+    "gapic",
+    "helpers",
+    "hyperparameter_tuning",
+    "jobs",
+    "matching_engine",
+    "model_evaluation",
+    "models",
+    "pipeline_jobs",
+    "schema",
+    "tensorboard",
+    "training_jobs",
+    "v1",
+    "v1beta1",
 )
-from google.cloud.aiplatform import helpers
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) requires Python 3.7.
+    for _name in (*_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES):
+        __getattr__(_name)
+    del _name
+
 
 """
 Usage:
@@ -86,6 +129,7 @@ start_run = metadata.metadata_service.start_run
 
 
 __all__ = (
+    "as_completed",
     "explain",
     "gapic",
     "init",
@@ -96,6 +140,8 @@ __all__ = (
     "get_experiment_df",
     "get_pipeline_df",
     "start_run",
+    "wait_all",
+    "wait_any",
     "AutoMLImageTrainingJob",
     "AutoMLTabularTrainingJob",
     "AutoMLForecastingTrainingJob",
@@ -16,6 +16,7 @@
 #
 
 import abc
+import asyncio
 from concurrent import futures
 import datetime
 import functools
@@ -24,12 +25,14 @@ import logging
 import sys
 import threading
 import time
+import weakref
 from typing import (
     Any,
     Callable,
     Dict,
     List,
     Iterable,
+    Iterator,
     Optional,
     Sequence,
     Tuple,
@@ -40,6 +43,7 @@ from typing import (
 import proto
 
 from google.api_core import retry
+from google.api_core import retry_async
 from google.api_core import operation
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import initializer
@@ -50,6 +54,9 @@ from google.protobuf import json_format
 # This is the default retry callback to be used with get methods.
 _DEFAULT_RETRY = retry.Retry()
 
+# This is the default retry callback to be used with asyncio get methods.
+_DEFAULT_ASYNC_RETRY = retry_async.AsyncRetry()
+
 
 class Logger:
     """Logging wrapper class with high level helper methods."""
@@ -246,6 +253,14 @@ class FutureManager(metaclass=abc.ABCMeta):
 
         self._raise_future_exception()
 
+    async def wait_async(self):
+        """Helper method that awaits all futures without blocking the event loop."""
+        future = self.__latest_future
+        if future:
+            await asyncio.wait([asyncio.wrap_future(future)])
+
+        self._raise_future_exception()
+
     @property
     def _latest_future(self) -> Optional[futures.Future]:
         """Get the latest future if it exists."""
@@ -287,20 +302,15 @@ class FutureManager(metaclass=abc.ABCMeta):
             future (Future): Future of the submitted method call.
         """
 
-        def wait_for_dependencies_and_invoke(
-            deps: Sequence[futures.Future],
+        def invoke(
             method: Callable[..., Any],
             args: Sequence[Any],
             kwargs: Dict[str, Any],
             internal_callbacks: Iterable[Callable[[Any], Any]],
         ) -> Any:
-            """Wrapper method to wait on any dependencies before submitting
-            method.
+            """Wrapper method to invoke method once its dependencies completed.
 
             Args:
-                deps (Sequence[futures.Future]):
-                    Required. Dependent futures to wait on before executing method.
-                    Note: No validation is done on the dependencies.
                 method (Callable): Required. The method to submit.
                 args (Sequence[Any]): Required. The arguments to call the method with.
                 kwargs (Dict[str, Any]):
@@ -309,9 +319,6 @@ class FutureManager(metaclass=abc.ABCMeta):
                     Callbacks that take the result of method.
             """
 
-            for future in set(deps):
-                future.result()
-
             result = method(*args, **kwargs)
 
             # call callbacks from within future
@@ -351,9 +358,11 @@ class FutureManager(metaclass=abc.ABCMeta):
             if self.__latest_future:
                 deps.append(self.__latest_future)
 
-            self.__latest_future = initializer.global_pool.submit(
-                wait_for_dependencies_and_invoke,
-                deps=deps,
+            # The method is only handed to a worker thread once all the
+            # dependencies completed, so no worker blocks waiting on them.
+            self.__latest_future = initializer.global_pool.submit_after(
+                deps,
+                invoke,
                 method=method,
                 args=args,
                 kwargs=kwargs,
@@ -454,6 +463,11 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
     # to use custom resource id validators per resource
     _resource_id_validator: Optional[Callable[[str], None]] = None
 
+    # Monotonic time at which `_gca_resource` was last fetched from the service.
+    _gca_resource_synced_at: Optional[float] = None
+    # Overrides `initializer.global_config.max_staleness` for this object.
+    _max_staleness: Optional[float] = None
+
     def __init__(
         self,
         project: Optional[str] = None,
@@ -505,6 +519,43 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
             location_override=location,
         )
 
+    def _get_async_client(
+        self,
+        client_class: Optional[Type[utils.VertexAiServiceClientWithOverride]] = None,
+        prediction_client: bool = False,
+    ) -> Any:
+        """Returns an asyncio GAPIC client for this resource noun.
+
+        asyncio gRPC channels are bound to the event loop that created them, so
+        clients are cached per running event loop and reused by later calls on
+        the same loop.
+
+        Args:
+            client_class (utils.VertexAiServiceClientWithOverride):
+                Optional. Client to pair the asyncio client with. Defaults to
+                the client class of this resource noun.
+            prediction_client (bool): Optional. flag to use a prediction endpoint.
+        Returns:
+            client: asyncio GAPIC client of the default API version.
+        """
+        client_class = client_class or self.client_class
+        loop = asyncio.get_running_loop()
+
+        async_clients = self.__dict__.setdefault(
+            "_async_clients", weakref.WeakKeyDictionary()
+        )
+        loop_clients = async_clients.setdefault(loop, {})
+
+        client_key = (client_class, prediction_client)
+        if client_key not in loop_clients:
+            loop_clients[client_key] = initializer.global_config.create_async_client(
+                client_class=client_class,
+                credentials=self.credentials,
+                location_override=self.location,
+                prediction_client=prediction_client,
+            )
+        return loop_clients[client_key]
+
     @classmethod
     def _parse_resource_name(cls, resource_name: str) -> Dict[str, str]:
         """
@@ -595,15 +646,73 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
             resource_id_validator=self._resource_id_validator,
         )
 
-        return getattr(self.api_client, self._getter_method)(
+        gca_resource = getattr(self.api_client, self._getter_method)(
             name=resource_name, retry=_DEFAULT_RETRY
         )
+        self._gca_resource_synced_at = time.monotonic()
+        return gca_resource
 
     def _sync_gca_resource(self):
         """Sync GAPIC service representation of client class resource."""
 
         self._gca_resource = self._get_gca_resource(resource_name=self.resource_name)
 
+    async def _sync_gca_resource_async(self):
+        """Sync GAPIC service representation of client class resource without
+        blocking the event loop."""
+
+        self._gca_resource = await getattr(
+            self._get_async_client(), self._getter_method
+        )(name=self.resource_name, retry=_DEFAULT_ASYNC_RETRY)
+        self._gca_resource_synced_at = time.monotonic()
+
+    def _sync_gca_resource_if_stale(self):
+        """Sync GAPIC service representation of client class resource unless it
+        was fetched less than `max_staleness` seconds ago."""
+        max_staleness = self.max_staleness
+        if (
+            max_staleness
+            and self._gca_resource_synced_at is not None
+            and time.monotonic() - self._gca_resource_synced_at <= max_staleness
+        ):
+            return
+        self._sync_gca_resource()
+
+    def _mark_gca_resource_stale(self):
+        """Makes the next `_sync_gca_resource_if_stale` call fetch the resource,
+        ie: after a request that changes its service-side state."""
+        self._gca_resource_synced_at = None
+
+    def refresh(self) -> "VertexAiResourceNoun":
+        """Fetches the resource from the service, regardless of `max_staleness`.
+
+        Returns:
+            This resource.
+        """
+        self._sync_gca_resource()
+        return self
+
+    @property
+    def max_staleness(self) -> float:
+        """Number of seconds properties reflecting the service-side state of this
+        resource, ie: `state`, are served from the last fetched resource before
+        fetching it again.
+
+        Defaults to the value set with `aiplatform.init(max_staleness=...)`. Set
+        it to None to go back to that default.
+        """
+        if self._max_staleness is None:
+            return initializer.global_config.max_staleness
+        return self._max_staleness
+
+    @max_staleness.setter
+    def max_staleness(self, max_staleness: Optional[float]):
+        if max_staleness is not None and max_staleness < 0:
+            raise ValueError(
+                f"max_staleness must be non-negative, got {max_staleness}."
+            )
+        self._max_staleness = max_staleness
+
     @property
     def name(self) -> str:
         """Name of this resource."""
@@ -631,7 +740,7 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
     @property
     def update_time(self) -> datetime.datetime:
         """Time this resource was last updated."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.update_time
 
     @property
@@ -837,6 +946,46 @@ def optional_sync(
     return optional_run_in_thread
 
 
+def _iter_list_pages(list_response: Any) -> Iterator[Sequence[proto.Message]]:
+    """Yields the pages of GAPIC resources of a list response, fetching the
+    next page in the background while the current one is consumed.
+
+    Args:
+        list_response (Any):
+            Required. The pager returned by a GAPIC list method, or any iterable
+            of GAPIC resources which is yielded as a single page.
+
+    Yields:
+        Sequence[proto.Message]: The GAPIC resources of each page.
+    """
+    if not hasattr(list_response, "pages"):
+        yield list(list_response or [])
+        return
+
+    def get_resources(page: proto.Message) -> Sequence[proto.Message]:
+        # Every list response has exactly one repeated message field.
+        (resources_field,) = (
+            field.name
+            for field in type(page).pb(page).DESCRIPTOR.fields
+            if field.label == field.LABEL_REPEATED and field.message_type
+        )
+        return getattr(page, resources_field)
+
+    pages = iter(list_response.pages)
+    end_of_pages = object()
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        next_page = executor.submit(next, pages, end_of_pages)
+        while True:
+            page = next_page.result()
+            if page is end_of_pages:
+                return
+            next_page = executor.submit(next, pages, end_of_pages)
+            yield get_resources(page)
+    finally:
+        executor.shutdown(wait=True)
+
+
 class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager):
     """Allows optional asynchronous calls to this Vertex AI Resource
     Nouns."""
@@ -918,7 +1067,7 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             "_gca_resource",
             "credentials",
         ]
-        optional_sync_attributes = ["_prediction_client"]
+        optional_sync_attributes = ["_prediction_client", "_gca_resource_synced_at"]
 
         for attribute in sync_attributes:
             setattr(self, attribute, getattr(result, attribute))
@@ -960,12 +1109,12 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             project=project, location=location, credentials=credentials
         )
         sdk_resource._gca_resource = gapic_resource
+        sdk_resource._gca_resource_synced_at = time.monotonic()
         return sdk_resource
 
     # TODO(b/144545165): Improve documentation for list filtering once available
-    # TODO(b/184910159): Expose `page_size` field in list method
     @classmethod
-    def _list(
+    def _iter_list(
         cls,
         cls_filter: Callable[[proto.Message], bool] = lambda _: True,
         filter: Optional[str] = None,
@@ -974,17 +1123,23 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
         parent: Optional[str] = None,
-    ) -> List[VertexAiResourceNoun]:
-        """Private method to list all instances of this Vertex AI Resource,
-        takes a `cls_filter` arg to filter to a particular SDK resource
-        subclass.
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union[VertexAiResourceNoun, proto.Message]]:
+        """Private method to lazily list the instances of this Vertex AI
+        Resource, takes a `cls_filter` arg to filter to a particular SDK
+        resource subclass.
+
+        Pages are requested as the results are consumed, the next page being
+        fetched in the background while the current one is yielded. Closing the
+        iterator stops requesting pages.
 
         Args:
             cls_filter (Callable[[proto.Message], bool]):
                 A function that takes one argument, a GAPIC resource, and returns
                 a bool. If the function returns False, that resource will be
-                excluded from the returned list. Example usage:
-                cls_filter = lambda obj: obj.metadata in cls.valid_metadatas
+                excluded from the results.
             filter (str):
                 Optional. An expression for filtering the results of the request.
                 For field names both snake_case and camelCase are supported.
@@ -1003,10 +1158,23 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
                 credentials set in aiplatform.init.
             parent (str):
                 Optional. The parent resource name if any to retrieve resource list from.
-
-        Returns:
-            List[VertexAiResourceNoun] - A list of SDK resource objects
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[VertexAiResourceNoun, proto.Message] - The SDK resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
         """
+        if max_results is not None and max_results <= 0:
+            return
+
         resource = cls._empty_constructor(
             project=project, location=location, credentials=credentials
         )
@@ -1027,15 +1195,96 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         if order_by:
             list_request["order_by"] = order_by
 
-        resource_list = resource_list_method(request=list_request) or []
+        if page_size:
+            list_request["page_size"] = page_size
 
-        return [
-            cls._construct_sdk_resource_from_gapic(
-                gapic_resource, project=project, location=location, credentials=creds
+        pages = _iter_list_pages(resource_list_method(request=list_request))
+        num_results = 0
+        try:
+            for gapic_resources in pages:
+                for gapic_resource in gapic_resources:
+                    if not cls_filter(gapic_resource):
+                        continue
+                    if return_gapic_resources:
+                        yield gapic_resource
+                    else:
+                        yield cls._construct_sdk_resource_from_gapic(
+                            gapic_resource,
+                            project=project,
+                            location=location,
+                            credentials=creds,
+                        )
+                    num_results += 1
+                    if num_results == max_results:
+                        return
+        finally:
+            # Stops fetching pages in the background.
+            pages.close()
+
+    @classmethod
+    def _list(
+        cls,
+        cls_filter: Callable[[proto.Message], bool] = lambda _: True,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> List[VertexAiResourceNoun]:
+        """Private method to list all instances of this Vertex AI Resource,
+        takes a `cls_filter` arg to filter to a particular SDK resource
+        subclass.
+
+        Args:
+            cls_filter (Callable[[proto.Message], bool]):
+                A function that takes one argument, a GAPIC resource, and returns
+                a bool. If the function returns False, that resource will be
+                excluded from the returned list. Example usage:
+                cls_filter = lambda obj: obj.metadata in cls.valid_metadatas
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            parent (str):
+                Optional. The parent resource name if any to retrieve resource list from.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
+
+        Returns:
+            List[VertexAiResourceNoun] - A list of SDK resource objects
+        """
+        return list(
+            cls._iter_list(
+                cls_filter=cls_filter,
+                filter=filter,
+                order_by=order_by,
+                project=project,
+                location=location,
+                credentials=credentials,
+                parent=parent,
+                page_size=page_size,
+                max_results=max_results,
             )
-            for gapic_resource in resource_list
-            if cls_filter(gapic_resource)
-        ]
+        )
 
     @classmethod
     def _list_with_local_order(
@@ -1046,6 +1295,8 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List[VertexAiResourceNoun]:
         """Private method to list all instances of this Vertex AI Resource,
         takes a `cls_filter` arg to filter to a particular SDK resource
@@ -1074,6 +1325,12 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return, after
+                sorting. If not set, all resources are returned.
 
         Returns:
             List[VertexAiResourceNoun] - A list of SDK resource objects
@@ -1086,8 +1343,103 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            # The first results can only be known once all of them are sorted.
+            max_results=None if order_by else max_results,
         )
 
+        cls._sort_locally(li, order_by)
+
+        return li[:max_results] if max_results is not None else li
+
+    @classmethod
+    def _iter_list_with_local_order(
+        cls,
+        cls_filter: Callable[[proto.Message], bool] = lambda _: True,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union[VertexAiResourceNoun, proto.Message]]:
+        """Private method to lazily list the instances of this Vertex AI
+        Resource when the list API doesn't support `order_by`.
+
+        Results are yielded lazily as in `_iter_list` when `order_by` is not
+        set. Otherwise all resources are listed and sorted client-side before
+        the first one is yielded.
+
+        Args:
+            cls_filter (Callable[[proto.Message], bool]):
+                A function that takes one argument, a GAPIC resource, and returns
+                a bool. If the function returns False, that resource will be
+                excluded from the results.
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[VertexAiResourceNoun, proto.Message] - The SDK resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
+        """
+        results = cls._iter_list(
+            cls_filter=cls_filter,
+            filter=filter,
+            order_by=None,  # This method will handle the ordering locally
+            project=project,
+            location=location,
+            credentials=credentials,
+            page_size=page_size,
+            max_results=None if order_by else max_results,
+            return_gapic_resources=return_gapic_resources,
+        )
+
+        if not order_by:
+            yield from results
+            return
+
+        li = list(results)
+        cls._sort_locally(li, order_by)
+        yield from li[:max_results] if max_results is not None else li
+
+    @staticmethod
+    def _sort_locally(
+        li: List[Union[VertexAiResourceNoun, proto.Message]], order_by: Optional[str]
+    ):
+        """Sorts a list of SDK resource objects or GAPIC resources in place by `order_by`.
+
+        Args:
+            li (List[Union[VertexAiResourceNoun, proto.Message]]):
+                Required. The SDK resource objects or GAPIC resources to sort.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+        """
         if order_by:
             desc = "desc" in order_by
             order_by = order_by.replace("desc", "")
@@ -1098,6 +1450,86 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
                 reverse=desc,
             )
 
+    @classmethod
+    async def _list_async(
+        cls,
+        cls_filter: Callable[[proto.Message], bool] = lambda _: True,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+        local_order: bool = False,
+    ) -> List[VertexAiResourceNoun]:
+        """Private method to list all instances of this Vertex AI Resource with
+        the asyncio GAPIC client. Pages are fetched without blocking the event loop.
+
+        Args:
+            cls_filter (Callable[[proto.Message], bool]):
+                A function that takes one argument, a GAPIC resource, and returns
+                a bool. If the function returns False, that resource will be
+                excluded from the returned list.
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            parent (str):
+                Optional. The parent resource name if any to retrieve resource list from.
+            local_order (bool):
+                Optional. Sort the results client-side when the list API doesn't
+                support `order_by`.
+
+        Returns:
+            List[VertexAiResourceNoun] - A list of SDK resource objects
+        """
+        resource = cls._empty_constructor(
+            project=project, location=location, credentials=credentials
+        )
+
+        # Fetch credentials once and re-use for all `_empty_constructor()` calls
+        creds = resource.credentials
+
+        resource_list_method = getattr(
+            resource._get_async_client(), resource._list_method
+        )
+
+        list_request = {
+            "parent": parent
+            or initializer.global_config.common_location_path(
+                project=project, location=location
+            ),
+            "filter": filter,
+        }
+
+        if order_by and not local_order:
+            list_request["order_by"] = order_by
+
+        resource_pager = await resource_list_method(request=list_request)
+
+        li = [
+            cls._construct_sdk_resource_from_gapic(
+                gapic_resource, project=project, location=location, credentials=creds
+            )
+            async for gapic_resource in resource_pager
+            if cls_filter(gapic_resource)
+        ]
+
+        if local_order:
+            cls._sort_locally(li, order_by)
+
         return li
 
     @classmethod
@@ -1109,6 +1541,8 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
         parent: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List[VertexAiResourceNoun]:
         """List all instances of this Vertex AI Resource.
 
@@ -1139,6 +1573,12 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
                 credentials set in aiplatform.init.
             parent (str):
                 Optional. The parent resource name if any to retrieve list from.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[VertexAiResourceNoun] - A list of SDK resource objects
@@ -1151,6 +1591,78 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             location=location,
             credentials=credentials,
             parent=parent,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union[VertexAiResourceNoun, proto.Message]]:
+        """Lazily list the instances of this Vertex AI Resource.
+
+        Pages are requested as the results are consumed, so the first results
+        are available before the whole list has been fetched. The next page is
+        fetched in the background while the current one is consumed.
+
+        Example Usage:
+
+        for model in aiplatform.Model.iter_list(page_size=100):
+            print(model.display_name)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            parent (str):
+                Optional. The parent resource name if any to retrieve list from.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[VertexAiResourceNoun, proto.Message] - The SDK resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        return cls._iter_list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
 
     @optional_sync()
@@ -15,113 +15,66 @@
 # limitations under the License.
 #
 
-from google.cloud.aiplatform_v1beta1.services.dataset_service import (
-    client as dataset_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.endpoint_service import (
-    client as endpoint_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.featurestore_online_serving_service import (
-    client as featurestore_online_serving_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.featurestore_service import (
-    client as featurestore_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.index_service import (
-    client as index_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.index_endpoint_service import (
-    client as index_endpoint_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.job_service import (
-    client as job_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.metadata_service import (
-    client as metadata_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.model_service import (
-    client as model_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.pipeline_service import (
-    client as pipeline_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.prediction_service import (
-    client as prediction_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.specialist_pool_service import (
-    client as specialist_pool_service_client_v1beta1,
-)
-from google.cloud.aiplatform_v1beta1.services.tensorboard_service import (
-    client as tensorboard_service_client_v1beta1,
-)
+import importlib
+from types import ModuleType
+from typing import Dict
 
-from google.cloud.aiplatform_v1.services.dataset_service import (
-    client as dataset_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.endpoint_service import (
-    client as endpoint_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.featurestore_online_serving_service import (
-    client as featurestore_online_serving_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.featurestore_service import (
-    client as featurestore_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.index_service import (
-    client as index_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.index_endpoint_service import (
-    client as index_endpoint_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.job_service import (
-    client as job_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.metadata_service import (
-    client as metadata_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.model_service import (
-    client as model_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.pipeline_service import (
-    client as pipeline_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.prediction_service import (
-    client as prediction_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.specialist_pool_service import (
-    client as specialist_pool_service_client_v1,
-)
-from google.cloud.aiplatform_v1.services.tensorboard_service import (
-    client as tensorboard_service_client_v1,
-)
-
-__all__ = (
+# GAPIC client modules by compat name. Modules are imported on first
+# access, so that an API version is only loaded once something uses it.
+_CLIENT_MODULES: Dict[str, str] = {
     # v1
-    dataset_service_client_v1,
-    endpoint_service_client_v1,
-    featurestore_online_serving_service_client_v1,
-    featurestore_service_client_v1,
-    index_service_client_v1,
-    index_endpoint_service_client_v1,
-    job_service_client_v1,
-    metadata_service_client_v1,
-    model_service_client_v1,
-    pipeline_service_client_v1,
-    prediction_service_client_v1,
-    specialist_pool_service_client_v1,
-    tensorboard_service_client_v1,
+    "dataset_service_client_v1": "google.cloud.aiplatform_v1.services.dataset_service.client",
+    "endpoint_service_client_v1": "google.cloud.aiplatform_v1.services.endpoint_service.client",
+    "featurestore_online_serving_service_client_v1": "google.cloud.aiplatform_v1.services.featurestore_online_serving_service.client",
+    "featurestore_service_client_v1": "google.cloud.aiplatform_v1.services.featurestore_service.client",
+    "index_endpoint_service_client_v1": "google.cloud.aiplatform_v1.services.index_endpoint_service.client",
+    "index_service_client_v1": "google.cloud.aiplatform_v1.services.index_service.client",
+    "job_service_client_v1": "google.cloud.aiplatform_v1.services.job_service.client",
+    "metadata_service_client_v1": "google.cloud.aiplatform_v1.services.metadata_service.client",
+    "model_service_client_v1": "google.cloud.aiplatform_v1.services.model_service.client",
+    "pipeline_service_client_v1": "google.cloud.aiplatform_v1.services.pipeline_service.client",
+    "prediction_service_client_v1": "google.cloud.aiplatform_v1.services.prediction_service.client",
+    "specialist_pool_service_client_v1": "google.cloud.aiplatform_v1.services.specialist_pool_service.client",
+    "tensorboard_service_client_v1": "google.cloud.aiplatform_v1.services.tensorboard_service.client",
     # v1beta1
-    dataset_service_client_v1beta1,
-    endpoint_service_client_v1beta1,
-    featurestore_online_serving_service_client_v1beta1,
-    featurestore_service_client_v1beta1,
-    index_service_client_v1beta1,
-    index_endpoint_service_client_v1beta1,
-    job_service_client_v1beta1,
-    model_service_client_v1beta1,
-    pipeline_service_client_v1beta1,
-    prediction_service_client_v1beta1,
-    specialist_pool_service_client_v1beta1,
-    metadata_service_client_v1beta1,
-    tensorboard_service_client_v1beta1,
-)
+    "dataset_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.dataset_service.client",
+    "endpoint_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.endpoint_service.client",
+    "featurestore_online_serving_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.featurestore_online_serving_service.client",
+    "featurestore_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.featurestore_service.client",
+    "index_endpoint_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.index_endpoint_service.client",
+    "index_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.index_service.client",
+    "job_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.job_service.client",
+    "metadata_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.metadata_service.client",
+    "model_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.model_service.client",
+    "pipeline_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.pipeline_service.client",
+    "prediction_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.prediction_service.client",
+    "specialist_pool_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.specialist_pool_service.client",
+    "tensorboard_service_client_v1beta1": "google.cloud.aiplatform_v1beta1.services.tensorboard_service.client",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Imports and returns the module for `name` on first access.
+
+    Unversioned names, ie: `job_service_client`, resolve to the module of
+    `compat.DEFAULT_VERSION`.
+    """
+    if name in _CLIENT_MODULES:
+        module = importlib.import_module(_CLIENT_MODULES[name])
+    else:
+        from google.cloud.aiplatform import compat
+
+        versioned_name = f"{name}_{compat.DEFAULT_VERSION}"
+        if versioned_name not in _CLIENT_MODULES:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        module = __getattr__(versioned_name)
+
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLIENT_MODULES))
+
+
+__all__ = tuple(_CLIENT_MODULES)
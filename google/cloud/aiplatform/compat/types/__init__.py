@@ -15,248 +15,165 @@
 # limitations under the License.
 #
 
-from google.cloud.aiplatform_v1beta1.types import (
-    accelerator_type as accelerator_type_v1beta1,
-    annotation as annotation_v1beta1,
-    annotation_spec as annotation_spec_v1beta1,
-    artifact as artifact_v1beta1,
-    batch_prediction_job as batch_prediction_job_v1beta1,
-    completion_stats as completion_stats_v1beta1,
-    context as context_v1beta1,
-    custom_job as custom_job_v1beta1,
-    data_item as data_item_v1beta1,
-    data_labeling_job as data_labeling_job_v1beta1,
-    dataset as dataset_v1beta1,
-    dataset_service as dataset_service_v1beta1,
-    deployed_index_ref as matching_engine_deployed_index_ref_v1beta1,
-    deployed_model_ref as deployed_model_ref_v1beta1,
-    encryption_spec as encryption_spec_v1beta1,
-    endpoint as endpoint_v1beta1,
-    endpoint_service as endpoint_service_v1beta1,
-    entity_type as entity_type_v1beta1,
-    env_var as env_var_v1beta1,
-    event as event_v1beta1,
-    execution as execution_v1beta1,
-    explanation as explanation_v1beta1,
-    explanation_metadata as explanation_metadata_v1beta1,
-    feature as feature_v1beta1,
-    feature_monitoring_stats as feature_monitoring_stats_v1beta1,
-    feature_selector as feature_selector_v1beta1,
-    featurestore as featurestore_v1beta1,
-    featurestore_monitoring as featurestore_monitoring_v1beta1,
-    featurestore_online_service as featurestore_online_service_v1beta1,
-    featurestore_service as featurestore_service_v1beta1,
-    index as index_v1beta1,
-    index_endpoint as index_endpoint_v1beta1,
-    hyperparameter_tuning_job as hyperparameter_tuning_job_v1beta1,
-    io as io_v1beta1,
-    job_service as job_service_v1beta1,
-    job_state as job_state_v1beta1,
-    machine_resources as machine_resources_v1beta1,
-    manual_batch_tuning_parameters as manual_batch_tuning_parameters_v1beta1,
-    metadata_service as metadata_service_v1beta1,
-    metadata_store as metadata_store_v1beta1,
-    model as model_v1beta1,
-    model_evaluation as model_evaluation_v1beta1,
-    model_evaluation_slice as model_evaluation_slice_v1beta1,
-    model_service as model_service_v1beta1,
-    operation as operation_v1beta1,
-    pipeline_job as pipeline_job_v1beta1,
-    pipeline_service as pipeline_service_v1beta1,
-    pipeline_state as pipeline_state_v1beta1,
-    prediction_service as prediction_service_v1beta1,
-    specialist_pool as specialist_pool_v1beta1,
-    specialist_pool_service as specialist_pool_service_v1beta1,
-    study as study_v1beta1,
-    tensorboard as tensorboard_v1beta1,
-    tensorboard_data as tensorboard_data_v1beta1,
-    tensorboard_experiment as tensorboard_experiment_v1beta1,
-    tensorboard_run as tensorboard_run_v1beta1,
-    tensorboard_service as tensorboard_service_v1beta1,
-    tensorboard_time_series as tensorboard_time_series_v1beta1,
-    training_pipeline as training_pipeline_v1beta1,
-    types as types_v1beta1,
-)
-from google.cloud.aiplatform_v1.types import (
-    accelerator_type as accelerator_type_v1,
-    annotation as annotation_v1,
-    annotation_spec as annotation_spec_v1,
-    artifact as artifact_v1,
-    batch_prediction_job as batch_prediction_job_v1,
-    completion_stats as completion_stats_v1,
-    context as context_v1,
-    custom_job as custom_job_v1,
-    data_item as data_item_v1,
-    data_labeling_job as data_labeling_job_v1,
-    dataset as dataset_v1,
-    dataset_service as dataset_service_v1,
-    deployed_index_ref as matching_engine_deployed_index_ref_v1,
-    deployed_model_ref as deployed_model_ref_v1,
-    encryption_spec as encryption_spec_v1,
-    endpoint as endpoint_v1,
-    endpoint_service as endpoint_service_v1,
-    entity_type as entity_type_v1,
-    env_var as env_var_v1,
-    event as event_v1,
-    execution as execution_v1,
-    explanation as explanation_v1,
-    explanation_metadata as explanation_metadata_v1,
-    feature as feature_v1,
-    feature_monitoring_stats as feature_monitoring_stats_v1,
-    feature_selector as feature_selector_v1,
-    featurestore as featurestore_v1,
-    featurestore_online_service as featurestore_online_service_v1,
-    featurestore_service as featurestore_service_v1,
-    hyperparameter_tuning_job as hyperparameter_tuning_job_v1,
-    index as index_v1,
-    index_endpoint as index_endpoint_v1,
-    io as io_v1,
-    job_service as job_service_v1,
-    job_state as job_state_v1,
-    machine_resources as machine_resources_v1,
-    manual_batch_tuning_parameters as manual_batch_tuning_parameters_v1,
-    metadata_service as metadata_service_v1,
-    metadata_store as metadata_store_v1,
-    model as model_v1,
-    model_evaluation as model_evaluation_v1,
-    model_evaluation_slice as model_evaluation_slice_v1,
-    model_service as model_service_v1,
-    operation as operation_v1,
-    pipeline_job as pipeline_job_v1,
-    pipeline_service as pipeline_service_v1,
-    pipeline_state as pipeline_state_v1,
-    prediction_service as prediction_service_v1,
-    specialist_pool as specialist_pool_v1,
-    specialist_pool_service as specialist_pool_service_v1,
-    study as study_v1,
-    tensorboard as tensorboard_v1,
-    tensorboard_data as tensorboard_data_v1,
-    tensorboard_experiment as tensorboard_experiment_v1,
-    tensorboard_run as tensorboard_run_v1,
-    tensorboard_service as tensorboard_service_v1,
-    tensorboard_time_series as tensorboard_time_series_v1,
-    training_pipeline as training_pipeline_v1,
-    types as types_v1,
-)
+import importlib
+from types import ModuleType
+from typing import Dict
 
-__all__ = (
+# GAPIC type modules by compat name. Modules are imported on first
+# access, so that an API version is only loaded once something uses it.
+_TYPE_MODULES: Dict[str, str] = {
     # v1
-    accelerator_type_v1,
-    annotation_v1,
-    annotation_spec_v1,
-    artifact_v1,
-    batch_prediction_job_v1,
-    completion_stats_v1,
-    context_v1,
-    custom_job_v1,
-    data_item_v1,
-    data_labeling_job_v1,
-    dataset_v1,
-    dataset_service_v1,
-    deployed_model_ref_v1,
-    encryption_spec_v1,
-    endpoint_v1,
-    endpoint_service_v1,
-    entity_type_v1,
-    env_var_v1,
-    event_v1,
-    execution_v1,
-    explanation_v1,
-    explanation_metadata_v1,
-    feature_v1,
-    feature_monitoring_stats_v1,
-    feature_selector_v1,
-    featurestore_v1,
-    featurestore_online_service_v1,
-    featurestore_service_v1,
-    hyperparameter_tuning_job_v1,
-    io_v1,
-    job_service_v1,
-    job_state_v1,
-    machine_resources_v1,
-    manual_batch_tuning_parameters_v1,
-    matching_engine_deployed_index_ref_v1,
-    index_v1,
-    index_endpoint_v1,
-    metadata_service_v1,
-    metadata_store_v1,
-    model_v1,
-    model_evaluation_v1,
-    model_evaluation_slice_v1,
-    model_service_v1,
-    operation_v1,
-    pipeline_job_v1,
-    pipeline_service_v1,
-    pipeline_state_v1,
-    prediction_service_v1,
-    specialist_pool_v1,
-    specialist_pool_service_v1,
-    tensorboard_v1,
-    tensorboard_data_v1,
-    tensorboard_experiment_v1,
-    tensorboard_run_v1,
-    tensorboard_service_v1,
-    tensorboard_time_series_v1,
-    training_pipeline_v1,
-    types_v1,
+    "accelerator_type_v1": "google.cloud.aiplatform_v1.types.accelerator_type",
+    "annotation_spec_v1": "google.cloud.aiplatform_v1.types.annotation_spec",
+    "annotation_v1": "google.cloud.aiplatform_v1.types.annotation",
+    "artifact_v1": "google.cloud.aiplatform_v1.types.artifact",
+    "batch_prediction_job_v1": "google.cloud.aiplatform_v1.types.batch_prediction_job",
+    "completion_stats_v1": "google.cloud.aiplatform_v1.types.completion_stats",
+    "context_v1": "google.cloud.aiplatform_v1.types.context",
+    "custom_job_v1": "google.cloud.aiplatform_v1.types.custom_job",
+    "data_item_v1": "google.cloud.aiplatform_v1.types.data_item",
+    "data_labeling_job_v1": "google.cloud.aiplatform_v1.types.data_labeling_job",
+    "dataset_service_v1": "google.cloud.aiplatform_v1.types.dataset_service",
+    "dataset_v1": "google.cloud.aiplatform_v1.types.dataset",
+    "deployed_model_ref_v1": "google.cloud.aiplatform_v1.types.deployed_model_ref",
+    "encryption_spec_v1": "google.cloud.aiplatform_v1.types.encryption_spec",
+    "endpoint_service_v1": "google.cloud.aiplatform_v1.types.endpoint_service",
+    "endpoint_v1": "google.cloud.aiplatform_v1.types.endpoint",
+    "entity_type_v1": "google.cloud.aiplatform_v1.types.entity_type",
+    "env_var_v1": "google.cloud.aiplatform_v1.types.env_var",
+    "event_v1": "google.cloud.aiplatform_v1.types.event",
+    "execution_v1": "google.cloud.aiplatform_v1.types.execution",
+    "explanation_metadata_v1": "google.cloud.aiplatform_v1.types.explanation_metadata",
+    "explanation_v1": "google.cloud.aiplatform_v1.types.explanation",
+    "feature_monitoring_stats_v1": "google.cloud.aiplatform_v1.types.feature_monitoring_stats",
+    "feature_selector_v1": "google.cloud.aiplatform_v1.types.feature_selector",
+    "feature_v1": "google.cloud.aiplatform_v1.types.feature",
+    "featurestore_online_service_v1": "google.cloud.aiplatform_v1.types.featurestore_online_service",
+    "featurestore_service_v1": "google.cloud.aiplatform_v1.types.featurestore_service",
+    "featurestore_v1": "google.cloud.aiplatform_v1.types.featurestore",
+    "hyperparameter_tuning_job_v1": "google.cloud.aiplatform_v1.types.hyperparameter_tuning_job",
+    "index_endpoint_v1": "google.cloud.aiplatform_v1.types.index_endpoint",
+    "index_v1": "google.cloud.aiplatform_v1.types.index",
+    "io_v1": "google.cloud.aiplatform_v1.types.io",
+    "job_service_v1": "google.cloud.aiplatform_v1.types.job_service",
+    "job_state_v1": "google.cloud.aiplatform_v1.types.job_state",
+    "machine_resources_v1": "google.cloud.aiplatform_v1.types.machine_resources",
+    "manual_batch_tuning_parameters_v1": "google.cloud.aiplatform_v1.types.manual_batch_tuning_parameters",
+    "matching_engine_deployed_index_ref_v1": "google.cloud.aiplatform_v1.types.deployed_index_ref",
+    "metadata_service_v1": "google.cloud.aiplatform_v1.types.metadata_service",
+    "metadata_store_v1": "google.cloud.aiplatform_v1.types.metadata_store",
+    "model_evaluation_slice_v1": "google.cloud.aiplatform_v1.types.model_evaluation_slice",
+    "model_evaluation_v1": "google.cloud.aiplatform_v1.types.model_evaluation",
+    "model_service_v1": "google.cloud.aiplatform_v1.types.model_service",
+    "model_v1": "google.cloud.aiplatform_v1.types.model",
+    "operation_v1": "google.cloud.aiplatform_v1.types.operation",
+    "pipeline_job_v1": "google.cloud.aiplatform_v1.types.pipeline_job",
+    "pipeline_service_v1": "google.cloud.aiplatform_v1.types.pipeline_service",
+    "pipeline_state_v1": "google.cloud.aiplatform_v1.types.pipeline_state",
+    "prediction_service_v1": "google.cloud.aiplatform_v1.types.prediction_service",
+    "specialist_pool_service_v1": "google.cloud.aiplatform_v1.types.specialist_pool_service",
+    "specialist_pool_v1": "google.cloud.aiplatform_v1.types.specialist_pool",
+    "study_v1": "google.cloud.aiplatform_v1.types.study",
+    "tensorboard_data_v1": "google.cloud.aiplatform_v1.types.tensorboard_data",
+    "tensorboard_experiment_v1": "google.cloud.aiplatform_v1.types.tensorboard_experiment",
+    "tensorboard_run_v1": "google.cloud.aiplatform_v1.types.tensorboard_run",
+    "tensorboard_service_v1": "google.cloud.aiplatform_v1.types.tensorboard_service",
+    "tensorboard_time_series_v1": "google.cloud.aiplatform_v1.types.tensorboard_time_series",
+    "tensorboard_v1": "google.cloud.aiplatform_v1.types.tensorboard",
+    "training_pipeline_v1": "google.cloud.aiplatform_v1.types.training_pipeline",
+    "types_v1": "google.cloud.aiplatform_v1.types.types",
     # v1beta1
-    accelerator_type_v1beta1,
-    annotation_v1beta1,
-    annotation_spec_v1beta1,
-    artifact_v1beta1,
-    batch_prediction_job_v1beta1,
-    completion_stats_v1beta1,
-    context_v1beta1,
-    custom_job_v1beta1,
-    data_item_v1beta1,
-    data_labeling_job_v1beta1,
-    dataset_v1beta1,
-    dataset_service_v1beta1,
-    deployed_model_ref_v1beta1,
-    encryption_spec_v1beta1,
-    endpoint_v1beta1,
-    endpoint_service_v1beta1,
-    entity_type_v1beta1,
-    env_var_v1beta1,
-    event_v1beta1,
-    execution_v1beta1,
-    explanation_v1beta1,
-    explanation_metadata_v1beta1,
-    feature_v1beta1,
-    feature_monitoring_stats_v1beta1,
-    feature_selector_v1beta1,
-    featurestore_v1beta1,
-    featurestore_monitoring_v1beta1,
-    featurestore_online_service_v1beta1,
-    featurestore_service_v1beta1,
-    hyperparameter_tuning_job_v1beta1,
-    io_v1beta1,
-    job_service_v1beta1,
-    job_state_v1beta1,
-    machine_resources_v1beta1,
-    manual_batch_tuning_parameters_v1beta1,
-    matching_engine_deployed_index_ref_v1beta1,
-    index_v1beta1,
-    index_endpoint_v1beta1,
-    metadata_service_v1beta1,
-    metadata_store_v1beta1,
-    model_v1beta1,
-    model_evaluation_v1beta1,
-    model_evaluation_slice_v1beta1,
-    model_service_v1beta1,
-    operation_v1beta1,
-    pipeline_job_v1beta1,
-    pipeline_service_v1beta1,
-    pipeline_state_v1beta1,
-    prediction_service_v1beta1,
-    specialist_pool_v1beta1,
-    specialist_pool_service_v1beta1,
-    tensorboard_v1beta1,
-    tensorboard_data_v1beta1,
-    tensorboard_experiment_v1beta1,
-    tensorboard_run_v1beta1,
-    tensorboard_service_v1beta1,
-    tensorboard_time_series_v1beta1,
-    training_pipeline_v1beta1,
-    types_v1beta1,
-)
+    "accelerator_type_v1beta1": "google.cloud.aiplatform_v1beta1.types.accelerator_type",
+    "annotation_spec_v1beta1": "google.cloud.aiplatform_v1beta1.types.annotation_spec",
+    "annotation_v1beta1": "google.cloud.aiplatform_v1beta1.types.annotation",
+    "artifact_v1beta1": "google.cloud.aiplatform_v1beta1.types.artifact",
+    "batch_prediction_job_v1beta1": "google.cloud.aiplatform_v1beta1.types.batch_prediction_job",
+    "completion_stats_v1beta1": "google.cloud.aiplatform_v1beta1.types.completion_stats",
+    "context_v1beta1": "google.cloud.aiplatform_v1beta1.types.context",
+    "custom_job_v1beta1": "google.cloud.aiplatform_v1beta1.types.custom_job",
+    "data_item_v1beta1": "google.cloud.aiplatform_v1beta1.types.data_item",
+    "data_labeling_job_v1beta1": "google.cloud.aiplatform_v1beta1.types.data_labeling_job",
+    "dataset_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.dataset_service",
+    "dataset_v1beta1": "google.cloud.aiplatform_v1beta1.types.dataset",
+    "deployed_model_ref_v1beta1": "google.cloud.aiplatform_v1beta1.types.deployed_model_ref",
+    "encryption_spec_v1beta1": "google.cloud.aiplatform_v1beta1.types.encryption_spec",
+    "endpoint_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.endpoint_service",
+    "endpoint_v1beta1": "google.cloud.aiplatform_v1beta1.types.endpoint",
+    "entity_type_v1beta1": "google.cloud.aiplatform_v1beta1.types.entity_type",
+    "env_var_v1beta1": "google.cloud.aiplatform_v1beta1.types.env_var",
+    "event_v1beta1": "google.cloud.aiplatform_v1beta1.types.event",
+    "execution_v1beta1": "google.cloud.aiplatform_v1beta1.types.execution",
+    "explanation_metadata_v1beta1": "google.cloud.aiplatform_v1beta1.types.explanation_metadata",
+    "explanation_v1beta1": "google.cloud.aiplatform_v1beta1.types.explanation",
+    "feature_monitoring_stats_v1beta1": "google.cloud.aiplatform_v1beta1.types.feature_monitoring_stats",
+    "feature_selector_v1beta1": "google.cloud.aiplatform_v1beta1.types.feature_selector",
+    "feature_v1beta1": "google.cloud.aiplatform_v1beta1.types.feature",
+    "featurestore_monitoring_v1beta1": "google.cloud.aiplatform_v1beta1.types.featurestore_monitoring",
+    "featurestore_online_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.featurestore_online_service",
+    "featurestore_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.featurestore_service",
+    "featurestore_v1beta1": "google.cloud.aiplatform_v1beta1.types.featurestore",
+    "hyperparameter_tuning_job_v1beta1": "google.cloud.aiplatform_v1beta1.types.hyperparameter_tuning_job",
+    "index_endpoint_v1beta1": "google.cloud.aiplatform_v1beta1.types.index_endpoint",
+    "index_v1beta1": "google.cloud.aiplatform_v1beta1.types.index",
+    "io_v1beta1": "google.cloud.aiplatform_v1beta1.types.io",
+    "job_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.job_service",
+    "job_state_v1beta1": "google.cloud.aiplatform_v1beta1.types.job_state",
+    "machine_resources_v1beta1": "google.cloud.aiplatform_v1beta1.types.machine_resources",
+    "manual_batch_tuning_parameters_v1beta1": "google.cloud.aiplatform_v1beta1.types.manual_batch_tuning_parameters",
+    "matching_engine_deployed_index_ref_v1beta1": "google.cloud.aiplatform_v1beta1.types.deployed_index_ref",
+    "metadata_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.metadata_service",
+    "metadata_store_v1beta1": "google.cloud.aiplatform_v1beta1.types.metadata_store",
+    "model_evaluation_slice_v1beta1": "google.cloud.aiplatform_v1beta1.types.model_evaluation_slice",
+    "model_evaluation_v1beta1": "google.cloud.aiplatform_v1beta1.types.model_evaluation",
+    "model_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.model_service",
+    "model_v1beta1": "google.cloud.aiplatform_v1beta1.types.model",
+    "operation_v1beta1": "google.cloud.aiplatform_v1beta1.types.operation",
+    "pipeline_job_v1beta1": "google.cloud.aiplatform_v1beta1.types.pipeline_job",
+    "pipeline_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.pipeline_service",
+    "pipeline_state_v1beta1": "google.cloud.aiplatform_v1beta1.types.pipeline_state",
+    "prediction_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.prediction_service",
+    "specialist_pool_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.specialist_pool_service",
+    "specialist_pool_v1beta1": "google.cloud.aiplatform_v1beta1.types.specialist_pool",
+    "study_v1beta1": "google.cloud.aiplatform_v1beta1.types.study",
+    "tensorboard_data_v1beta1": "google.cloud.aiplatform_v1beta1.types.tensorboard_data",
+    "tensorboard_experiment_v1beta1": "google.cloud.aiplatform_v1beta1.types.tensorboard_experiment",
+    "tensorboard_run_v1beta1": "google.cloud.aiplatform_v1beta1.types.tensorboard_run",
+    "tensorboard_service_v1beta1": "google.cloud.aiplatform_v1beta1.types.tensorboard_service",
+    "tensorboard_time_series_v1beta1": "google.cloud.aiplatform_v1beta1.types.tensorboard_time_series",
+    "tensorboard_v1beta1": "google.cloud.aiplatform_v1beta1.types.tensorboard",
+    "training_pipeline_v1beta1": "google.cloud.aiplatform_v1beta1.types.training_pipeline",
+    "types_v1beta1": "google.cloud.aiplatform_v1beta1.types.types",
+}
+
+# Unversioned names that don't match the name of their module.
+_ALIASES = {
+    "matching_engine_index": "index",
+    "matching_engine_index_endpoint": "index_endpoint",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Imports and returns the module for `name` on first access.
+
+    Unversioned names, ie: `job_service`, resolve to the module of
+    `compat.DEFAULT_VERSION`.
+    """
+    if name in _TYPE_MODULES:
+        module = importlib.import_module(_TYPE_MODULES[name])
+    else:
+        from google.cloud.aiplatform import compat
+
+        versioned_name = f"{_ALIASES.get(name, name)}_{compat.DEFAULT_VERSION}"
+        if versioned_name not in _TYPE_MODULES:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        module = __getattr__(versioned_name)
+
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TYPE_MODULES))
+
+
+__all__ = tuple(_TYPE_MODULES)
@@ -15,7 +15,9 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import proto
 
 from google.api_core import operation
 from google.auth import credentials as auth_credentials
@@ -608,6 +610,8 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List[base.VertexAiResourceNoun]:
         """List all instances of this Dataset resource.
 
@@ -635,6 +639,12 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[base.VertexAiResourceNoun] - A list of Dataset resource objects
@@ -652,4 +662,78 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union[base.VertexAiResourceNoun, proto.Message]]:
+        """Lazily list the instances of this Dataset resource.
+
+        Pages are requested as the results are consumed. When `order_by` is
+        set, all resources are listed and sorted locally before the first one
+        is yielded.
+
+        Example Usage:
+
+        for dataset in aiplatform.TabularDataset.iter_list(page_size=100):
+            print(dataset.display_name)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[base.VertexAiResourceNoun, proto.Message] - The SDK resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        dataset_subclass_filter = (
+            lambda gapic_obj: gapic_obj.metadata_schema_uri
+            in cls._supported_metadata_schema_uris
+        )
+
+        return cls._iter_list_with_local_order(
+            cls_filter=dataset_subclass_filter,
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
@@ -15,8 +15,22 @@
 # limitations under the License.
 #
 
+import asyncio
+from concurrent import futures
 import datetime
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+import functools
+import itertools
+import operator
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import uuid
 
 from google.auth import credentials as auth_credentials
@@ -33,12 +47,60 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform import featurestore
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
-from google.cloud.aiplatform.utils import featurestore_utils, resource_manager_utils
+from google.cloud.aiplatform.utils import (
+    featurestore_utils,
+    gcs_utils,
+    resource_manager_utils,
+)
 
 from google.cloud import bigquery
+from google.cloud import storage
 
 _LOGGER = base.Logger(__name__)
 _ALL_FEATURE_IDS = "*"
+_MAX_STREAMING_READ_ENTITY_IDS = 100
+_CSV_STAGING_CHUNK_ROWS = 10000
+# Column types, as inferred by pandas, that CSV import parses back losslessly.
+_CSV_STAGING_INFERRED_DTYPES = frozenset(
+    [
+        "boolean",
+        "datetime",
+        "datetime64",
+        "empty",
+        "floating",
+        "integer",
+        "mixed-integer-float",
+        "string",
+    ]
+)
+
+# NumPy dtypes of the scalar FeatureValue types decoded into typed arrays.
+_SCALAR_VALUE_TYPE_DTYPES = {
+    "bool_value": "bool",
+    "double_value": "float64",
+    "int64_value": "int64",
+}
+_ARRAY_VALUE_TYPES = frozenset(
+    [
+        "bool_array_value",
+        "double_array_value",
+        "int64_array_value",
+        "string_array_value",
+    ]
+)
+# Feature data without a value, cached for features an entity has no value of.
+_MISSING_FEATURE_DATA = (
+    gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data.pb()()
+)
+
+
+class _CachedEntityView(NamedTuple):
+    """Entity view assembled from cached and freshly read feature data."""
+
+    entity_id: str
+    data: List[
+        gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data
+    ]
 
 
 class EntityType(base.VertexAiResourceNounWithFutureManager):
@@ -53,6 +115,11 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
     _parse_resource_name_method = "parse_entity_type_path"
     _format_resource_name_method = "entity_type_path"
 
+    # Read-through cache of online feature values, set by enable_online_cache.
+    _online_cache: Optional[featurestore_utils.FeatureValueCache] = None
+    # Value type name of each Feature, cached by list_features.
+    _feature_value_types: Optional[Dict[str, str]] = None
+
     @staticmethod
     def _resource_id_validator(resource_id: str):
         """Validates resource ID.
@@ -272,6 +339,8 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["EntityType"]:
         """Lists existing managed entityType resources in a featurestore, given a featurestore resource name or a featurestore ID.
 
@@ -333,6 +402,12 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to list entityTypes. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of entityTypes requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of entityTypes to return. If not
+                set, all entityTypes are returned.
 
         Returns:
             List[EntityType] - A list of managed entityType resource objects
@@ -344,15 +419,109 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
             project=project,
             location=location,
             credentials=credentials,
-            parent=utils.full_resource_name(
-                resource_name=featurestore_name,
-                resource_noun=featurestore.Featurestore._resource_noun,
-                parse_resource_name_method=featurestore.Featurestore._parse_resource_name,
-                format_resource_name_method=featurestore.Featurestore._format_resource_name,
+            parent=cls._get_featurestore_resource_name(
+                featurestore_name=featurestore_name,
                 project=project,
                 location=location,
-                resource_id_validator=featurestore.Featurestore._resource_id_validator,
             ),
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        featurestore_name: str,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union["EntityType", gca_entity_type.EntityType]]:
+        """Lazily lists existing managed entityType resources in a featurestore,
+        given a featurestore resource name or a featurestore ID.
+
+        Pages are requested as the results are consumed.
+
+        Example Usage:
+
+            for my_entity_type in aiplatform.EntityType.iter_list(
+                featurestore_name='my_featurestore_id'
+            ):
+                print(my_entity_type.resource_name)
+
+        Args:
+            featurestore_name (str):
+                Required. A fully-qualified featurestore resource name or a featurestore ID
+                of an existing featurestore to list entityTypes in.
+                Example: "projects/123/locations/us-central1/featurestores/my_featurestore_id"
+                or "my_featurestore_id" when project and location are initialized or passed.
+            filter (str):
+                Optional. Lists the EntityTypes that match the filter expression.
+                See `EntityType.list` for the supported filters.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                See `EntityType.list` for the supported fields.
+            project (str):
+                Optional. Project to list entityTypes in. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to list entityTypes in. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to list entityTypes. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of entityTypes requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of entityTypes to yield. If not
+                set, all entityTypes are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing EntityType objects.
+
+        Yields:
+            Union[EntityType, gca_entity_type.EntityType] - The managed
+            entityType resource objects, or the GAPIC resources if
+            `return_gapic_resources` is set.
+        """
+
+        return cls._iter_list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=cls._get_featurestore_resource_name(
+                featurestore_name=featurestore_name,
+                project=project,
+                location=location,
+            ),
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
+        )
+
+    @staticmethod
+    def _get_featurestore_resource_name(
+        featurestore_name: str,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> str:
+        """Returns the resource name of the featurestore to list entityTypes in."""
+        return utils.full_resource_name(
+            resource_name=featurestore_name,
+            resource_noun=featurestore.Featurestore._resource_noun,
+            parse_resource_name_method=featurestore.Featurestore._parse_resource_name,
+            format_resource_name_method=featurestore.Featurestore._format_resource_name,
+            project=project,
+            location=location,
+            resource_id_validator=featurestore.Featurestore._resource_id_validator,
         )
 
     def list_features(
@@ -409,11 +578,35 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
             List[featurestore.Feature] - A list of managed feature resource objects.
         """
         self.wait()
-        return featurestore.Feature.list(
+        features = featurestore.Feature.list(
             entity_type_name=self.resource_name,
             filter=filter,
             order_by=order_by,
         )
+        if filter is None:
+            self._feature_value_types = {
+                feature.name: feature._gca_resource.value_type.name
+                for feature in features
+            }
+        return features
+
+    def _get_feature_value_types(self) -> Dict[str, str]:
+        """Returns the value type name of each Feature in this EntityType.
+
+        The Features are listed on first use and cached until Features are
+        created or deleted through this EntityType.
+
+        Returns:
+            Dict[str, str]: The value type name, such as "INT64", of each
+            Feature ID.
+        """
+        if self._feature_value_types is None:
+            self.list_features()
+        return self._feature_value_types
+
+    def _invalidate_feature_schema(self) -> None:
+        """Drops the cached value types of the Features in this EntityType."""
+        self._feature_value_types = None
 
     @base.optional_sync()
     def delete_features(
@@ -441,6 +634,8 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
         for feature in features:
             feature.wait()
 
+        self._invalidate_feature_schema()
+
     @base.optional_sync()
     def delete(self, sync: bool = True, force: bool = False) -> None:
         """Deletes this EntityType resource. If force is set to True,
@@ -669,7 +864,7 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
 
         """
         self.wait()
-        return featurestore.Feature.create(
+        feature = featurestore.Feature.create(
             feature_id=feature_id,
             value_type=value_type,
             entity_type_name=self.resource_name,
@@ -679,6 +874,14 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
             sync=sync,
             create_request_timeout=create_request_timeout,
         )
+        # The schema is only dropped once the Feature exists, so that a read
+        # during the creation doesn't cache the schema without it.
+        create_future = feature._latest_future
+        if create_future is None:
+            self._invalidate_feature_schema()
+        else:
+            create_future.add_done_callback(lambda _: self._invalidate_feature_schema())
+        return feature
 
     def _validate_and_get_create_feature_requests(
         self,
@@ -800,6 +1003,7 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
         )
 
         batch_created_features_lro.result()
+        self._invalidate_feature_schema()
 
         _LOGGER.log_action_completed_against_resource(
             "entityType", "Batch created features", self
@@ -961,6 +1165,9 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
 
         import_lro.result()
 
+        if self._online_cache is not None:
+            self._online_cache.invalidate(self.resource_name)
+
         _LOGGER.log_action_completed_against_resource(
             "feature values", "imported", self
         )
@@ -1208,14 +1415,22 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
         entity_id_field: Optional[str] = None,
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         ingest_request_timeout: Optional[float] = None,
+        bq_staging_min_rows: Optional[int] = None,
+        max_concurrent_uploads: int = 8,
     ) -> "EntityType":
         """Ingest feature values from DataFrame.
 
         Note:
-            Calling this method will automatically create and delete a temporary
-            bigquery dataset in the same GCP project, which will be used
-            as the intermediary storage for ingesting feature values
-            from dataframe to featurestore.
+            By default, the DataFrame is loaded into a temporary bigquery
+            dataset in the same GCP project, which is created and deleted
+            automatically and used as the intermediary storage for ingesting
+            feature values from dataframe to featurestore.
+
+            If `bq_staging_min_rows` is set, DataFrames with fewer rows and
+            without array or bytes feature values skip BigQuery instead.
+            They are split into CSV files of up to 10000 rows that are
+            uploaded concurrently to the staging bucket, imported, and
+            deleted again.
 
             The call will return upon ingestion completes, where the
             feature values will be ingested into the entity_type.
@@ -1270,11 +1485,43 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
                 Optional. Strings which should be sent along with the request as metadata.
             ingest_request_timeout (float):
                 Optional. The timeout for the ingest request in seconds.
+            bq_staging_min_rows (int):
+                Optional. Minimum number of rows of DataFrames that are staged
+                in BigQuery. Smaller DataFrames are staged as CSV files in the
+                staging bucket. If not set, every DataFrame is staged in
+                BigQuery.
+            max_concurrent_uploads (int):
+                Optional. The maximum number of CSV files uploaded to GCS at
+                the same time.
 
         Returns:
             EntityType - The entityType resource object with feature values imported.
 
         """
+        feature_source_fields = feature_source_fields or {}
+        source_columns = [entity_id_field or "entity_id"] + [
+            feature_source_fields.get(feature_id, feature_id)
+            for feature_id in feature_ids
+        ]
+        if isinstance(feature_time, str):
+            source_columns.append(feature_time)
+
+        if (
+            bq_staging_min_rows is not None
+            and len(df_source) < bq_staging_min_rows
+            and self._can_stage_as_csv(df_source, source_columns)
+        ):
+            return self._ingest_from_df_through_gcs(
+                feature_ids=feature_ids,
+                feature_time=feature_time,
+                df_source=df_source[source_columns],
+                feature_source_fields=feature_source_fields,
+                entity_id_field=entity_id_field,
+                request_metadata=request_metadata,
+                ingest_request_timeout=ingest_request_timeout,
+                max_concurrent_uploads=max_concurrent_uploads,
+            )
+
         try:
             import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
         except ImportError:
@@ -1289,11 +1536,12 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
 
         self.wait()
 
-        feature_source_fields = feature_source_fields or {}
+        feature_value_types = self._get_ingested_feature_value_types(feature_ids)
+
         bq_schema = []
         for feature_id in feature_ids:
             feature_field_name = feature_source_fields.get(feature_id, feature_id)
-            feature_value_type = self.get_feature(feature_id).to_dict()["valueType"]
+            feature_value_type = feature_value_types[feature_id]
             bq_schema_field = self._get_bq_schema_field(
                 feature_field_name, feature_value_type
             )
@@ -1357,6 +1605,181 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
 
         return entity_type_obj
 
+    def _get_ingested_feature_value_types(
+        self, feature_ids: List[str]
+    ) -> Dict[str, str]:
+        """Returns the value type names of the Features to ingest values of.
+
+        Args:
+            feature_ids (List[str]):
+                Required. IDs of the Feature to import values of.
+
+        Returns:
+            Dict[str, str]: The value type name, such as "INT64", of each
+            Feature ID.
+
+        Raises:
+            ValueError if any of the Features does not exist.
+        """
+        feature_value_types = self._get_feature_value_types()
+        if not feature_value_types.keys() >= set(feature_ids):
+            # The Features may have been created since the schema was cached.
+            self._invalidate_feature_schema()
+            feature_value_types = self._get_feature_value_types()
+        missing_feature_ids = [
+            feature_id
+            for feature_id in feature_ids
+            if feature_id not in feature_value_types
+        ]
+        if missing_feature_ids:
+            raise ValueError(
+                f"Features {missing_feature_ids} do not exist in EntityType "
+                f"{self.resource_name}."
+            )
+        return feature_value_types
+
+    @staticmethod
+    def _can_stage_as_csv(
+        df_source: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        source_columns: List[str],
+    ) -> bool:
+        """Whether the source columns of a DataFrame survive a CSV round-trip.
+
+        Args:
+            df_source (pd.DataFrame):
+                Required. Pandas DataFrame containing the source data for ingestion.
+            source_columns (List[str]):
+                Required. Columns of the DataFrame that are ingested.
+
+        Returns:
+            bool: True if every source column exists and holds only scalar,
+            non-bytes values.
+        """
+        import pandas as pd
+
+        return all(
+            column in df_source.columns
+            and pd.api.types.infer_dtype(df_source[column], skipna=True)
+            in _CSV_STAGING_INFERRED_DTYPES
+            for column in source_columns
+        )
+
+    def _ingest_from_df_through_gcs(
+        self,
+        feature_ids: List[str],
+        feature_time: Union[str, datetime.datetime],
+        df_source: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        feature_source_fields: Dict[str, str],
+        entity_id_field: Optional[str],
+        request_metadata: Optional[Sequence[Tuple[str, str]]],
+        ingest_request_timeout: Optional[float],
+        max_concurrent_uploads: int,
+    ) -> "EntityType":
+        """Ingests feature values from a DataFrame staged as CSV files in GCS.
+
+        Args:
+            feature_ids (List[str]):
+                Required. IDs of the Feature to import values of.
+            feature_time (Union[str, datetime.datetime]):
+                Required. The source column that holds the Feature timestamp, or
+                a single Feature timestamp for all entities.
+            df_source (pd.DataFrame):
+                Required. The source columns of the DataFrame to ingest.
+            feature_source_fields (Dict[str, str]):
+                Required. Source column of each Feature whose ID differs from it.
+            entity_id_field (str):
+                Optional. Source column that holds entity IDs.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            ingest_request_timeout (float):
+                Optional. The timeout for the ingest request in seconds.
+            max_concurrent_uploads (int):
+                Required. The maximum number of CSV files uploaded at the same time.
+
+        Returns:
+            EntityType - The entityType resource object with feature values imported.
+        """
+        import pandas as pd
+
+        self.wait()
+
+        feature_value_types = self._get_ingested_feature_value_types(feature_ids)
+
+        df_source = df_source.copy()
+        for feature_id in feature_ids:
+            if feature_value_types[feature_id] == "INT64":
+                # Missing values make pandas hold integers as floats, which
+                # would be written as "1.0" and fail to parse as INT64.
+                feature_field_name = feature_source_fields.get(feature_id, feature_id)
+                df_source[feature_field_name] = df_source[feature_field_name].astype(
+                    "Int64"
+                )
+        for column in df_source.columns:
+            if isinstance(df_source[column].dtype, pd.DatetimeTZDtype):
+                # Timestamps are written with a "Z" suffix, so they must be
+                # in UTC. Naive timestamps are taken as UTC, as in BigQuery.
+                df_source[column] = df_source[column].dt.tz_convert("UTC")
+
+        staging_gcs_dir = gcs_utils.get_or_create_staging_gcs_dir(
+            project=self.project,
+            location=self.location,
+            credentials=self.credentials,
+        )
+        entity_type_name_components = self._parse_resource_name(self.resource_name)
+        staging_gcs_subdir = (
+            f"{staging_gcs_dir.rstrip('/')}/vertex_ai_auto_staging/"
+            f"{entity_type_name_components['featurestore']}_"
+            f"{entity_type_name_components['entity_type']}_{uuid.uuid4()}"
+        )
+        storage_client = storage.Client(
+            project=self.project, credentials=self.credentials
+        )
+
+        staged_blobs = []
+
+        def upload_chunk(chunk_index: int) -> storage.Blob:
+            chunk = df_source.iloc[chunk_index : chunk_index + _CSV_STAGING_CHUNK_ROWS]
+            blob = storage.Blob.from_string(
+                f"{staging_gcs_subdir}/{chunk_index:012d}.csv", client=storage_client
+            )
+            # Uploads are only retried on transient errors if they are
+            # conditional, so they are made conditional on creating the blob.
+            blob.upload_from_string(
+                chunk.to_csv(index=False, date_format="%Y-%m-%dT%H:%M:%S.%fZ"),
+                content_type="text/csv",
+                if_generation_match=0,
+            )
+            staged_blobs.append(blob)
+            return blob
+
+        chunk_indices = range(0, max(len(df_source), 1), _CSV_STAGING_CHUNK_ROWS)
+        try:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(max_concurrent_uploads, len(chunk_indices))
+            ) as executor:
+                uploaded_blobs = list(executor.map(upload_chunk, chunk_indices))
+
+            entity_type_obj = self.ingest_from_gcs(
+                feature_ids=feature_ids,
+                feature_time=feature_time,
+                gcs_source_uris=[
+                    f"gs://{blob.bucket.name}/{blob.name}" for blob in uploaded_blobs
+                ],
+                gcs_source_type="csv",
+                feature_source_fields=feature_source_fields,
+                entity_id_field=entity_id_field,
+                request_metadata=request_metadata,
+                ingest_request_timeout=ingest_request_timeout,
+            )
+        finally:
+            for blob in staged_blobs:
+                try:
+                    blob.delete()
+                except Exception:
+                    _LOGGER.warning(f"Failed to delete staged file {blob.name}.")
+
+        return entity_type_obj
+
     @staticmethod
     def _get_bq_schema_field(
         name: str, feature_value_type: str
@@ -1407,30 +1830,103 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
             location_override=location,
         )
 
+    @property
+    def online_cache(self) -> Optional[featurestore_utils.FeatureValueCache]:
+        """Read-through cache used by `read`, or None if caching is disabled."""
+        return self._online_cache
+
+    def enable_online_cache(
+        self,
+        max_size: int = 10000,
+        ttl: float = 60.0,
+        feature_ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: Optional[float] = None,
+        cache: Optional[featurestore_utils.FeatureValueCache] = None,
+    ) -> featurestore_utils.FeatureValueCache:
+        """Caches feature values read online from this EntityType.
+
+        Once enabled, `read` and `read_async` answer from the cache where they
+        can and only read the entities with missing or expired values from the
+        Featurestore. Reads of all features with "*" use the Features listed by
+        `list_features`, which are cached until Features are created or deleted
+        through this object. The cache is cleared for this EntityType when
+        feature values are ingested through this object.
+
+        Example Usage:
+
+            cache = my_entity_type.enable_online_cache(max_size=100000, ttl=60)
+            my_dataframe = my_entity_type.read(
+                entity_ids=['my_entity_id_1', 'my_entity_id_2'],
+                feature_ids=['my_feature_id_1', 'my_feature_id_2'],
+            )
+            print(cache.hit_rate)
+
+        Args:
+            max_size (int):
+                Optional. Maximum number of feature values held. The least
+                recently used values are evicted first.
+            ttl (float):
+                Optional. Seconds a feature value stays valid after it was read.
+            feature_ttls (Dict[str, float]):
+                Optional. TTL in seconds per feature ID, overriding `ttl`.
+            negative_ttl (float):
+                Optional. Seconds a missing feature value stays valid. Defaults
+                to the TTL of the feature. Set to 0 to disable negative caching.
+            cache (featurestore_utils.FeatureValueCache):
+                Optional. Existing cache to use, for example one shared by
+                several EntityTypes. The other arguments are ignored if set.
+
+        Returns:
+            featurestore_utils.FeatureValueCache: The cache used by this EntityType.
+        """
+        self._online_cache = cache or featurestore_utils.FeatureValueCache(
+            max_size=max_size,
+            ttl=ttl,
+            feature_ttls=feature_ttls,
+            negative_ttl=negative_ttl,
+        )
+        return self._online_cache
+
+    def disable_online_cache(self) -> None:
+        """Stops caching feature values read online from this EntityType."""
+        self._online_cache = None
+
     def read(
         self,
         entity_ids: Union[str, List[str]],
         feature_ids: Union[str, List[str]] = "*",
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         read_request_timeout: Optional[float] = None,
+        max_concurrent_requests: int = 8,
     ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
         """Reads feature values for given feature IDs of given entity IDs in this EntityType.
 
+        If an online cache is enabled with `enable_online_cache`, only entities
+        with missing or expired cached values are read from the Featurestore.
+
         Args:
             entity_ids (Union[str, List[str]]):
                 Required. ID for a specific entity, or a list of IDs of entities
-                to read Feature values of. The maximum number of IDs is 100 if a list.
+                to read Feature values of. A list of more than 100 IDs is split
+                into streaming reads of up to 100 IDs each that run concurrently.
             feature_ids (Union[str, List[str]]):
                 Required. ID for a specific feature, or a list of IDs of Features in the EntityType
                 for reading feature values. Default to "*", where value of all features will be read.
             request_metadata (Sequence[Tuple[str, str]]):
                 Optional. Strings which should be sent along with the request as metadata.
             read_request_timeout (float):
-                Optional. The timeout for the read request in seconds.
+                Optional. The timeout for each read request in seconds.
+            max_concurrent_requests (int):
+                Optional. The maximum number of streaming reads in flight when
+                more than 100 entity IDs are read. Must be at least 1.
 
         Returns:
             pd.DataFrame: entities' feature values in DataFrame
+
+        Raises:
+            ValueError: If `max_concurrent_requests` is less than 1.
         """
+        self._validate_max_concurrent_requests(max_concurrent_requests)
         self.wait()
         if isinstance(feature_ids, str):
             feature_ids = [feature_ids]
@@ -1439,6 +1935,38 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
             id_matcher=gca_feature_selector.IdMatcher(ids=feature_ids)
         )
 
+        if self._online_cache is not None:
+            if isinstance(entity_ids, str):
+                entity_ids = [entity_ids]
+            if _ALL_FEATURE_IDS in feature_ids:
+                feature_ids = list(self._get_feature_value_types())
+            entity_data, missed_entity_ids = self._lookup_cached_feature_data(
+                entity_ids=entity_ids, feature_ids=feature_ids
+            )
+            missed_shards = self._shard_entity_ids(missed_entity_ids)
+            read_shard_views = functools.partial(
+                self._streaming_read_entity_views,
+                feature_selector=feature_selector,
+                request_metadata=request_metadata,
+                read_request_timeout=read_request_timeout,
+            )
+            if not missed_entity_ids:
+                read_results = []
+            elif len(missed_shards) == 1:
+                read_results = [read_shard_views(missed_shards[0])]
+            else:
+                with futures.ThreadPoolExecutor(
+                    max_workers=min(max_concurrent_requests, len(missed_shards))
+                ) as executor:
+                    read_results = list(executor.map(read_shard_views, missed_shards))
+            return self._cache_and_construct_dataframe(
+                entity_ids=entity_ids,
+                feature_ids=feature_ids,
+                entity_data=entity_data,
+                missed_entity_ids=missed_entity_ids,
+                read_results=read_results,
+            )
+
         if isinstance(entity_ids, str):
             read_feature_values_request = (
                 gca_featurestore_online_service.ReadFeatureValuesRequest(
@@ -1454,37 +1982,420 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
                     timeout=read_request_timeout,
                 )
             )
-            header = read_feature_values_response.header
-            entity_views = [read_feature_values_response.entity_view]
-        elif isinstance(entity_ids, list):
-            streaming_read_feature_values_request = (
-                gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
-                    entity_type=self.resource_name,
-                    entity_ids=entity_ids,
-                    feature_selector=feature_selector,
-                )
+            return self._construct_dataframe(
+                feature_ids=[
+                    feature_descriptor.id
+                    for feature_descriptor in read_feature_values_response.header.feature_descriptors
+                ],
+                entity_views=[read_feature_values_response.entity_view],
             )
-            streaming_read_feature_values_responses = [
-                response
-                for response in self._featurestore_online_client.streaming_read_feature_values(
-                    request=streaming_read_feature_values_request,
-                    metadata=request_metadata,
-                    timeout=read_request_timeout,
-                )
+
+        shards = self._shard_entity_ids(entity_ids)
+        read_shard = functools.partial(
+            self._streaming_read,
+            feature_selector=feature_selector,
+            request_metadata=request_metadata,
+            read_request_timeout=read_request_timeout,
+        )
+
+        if len(shards) == 1:
+            return read_shard(shards[0])
+
+        # Each shard is decoded by its worker as soon as its stream completes.
+        with futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrent_requests, len(shards))
+        ) as executor:
+            return self._concat_dataframes(list(executor.map(read_shard, shards)))
+
+    def _streaming_read(
+        self,
+        entity_ids: List[str],
+        feature_selector: gca_feature_selector.FeatureSelector,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Reads feature values of up to 100 entities with one streaming read.
+
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of the entities to read Feature values of.
+            feature_selector (gca_feature_selector.FeatureSelector):
+                Required. Selector of the Features to read.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for the read request in seconds.
+
+        Returns:
+            pd.DataFrame: entities' feature values in DataFrame
+        """
+        return self._construct_dataframe(
+            *self._streaming_read_entity_views(
+                entity_ids=entity_ids,
+                feature_selector=feature_selector,
+                request_metadata=request_metadata,
+                read_request_timeout=read_request_timeout,
+            )
+        )
+
+    def _streaming_read_entity_views(
+        self,
+        entity_ids: List[str],
+        feature_selector: gca_feature_selector.FeatureSelector,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+    ) -> Tuple[
+        List[str],
+        List[gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView],
+    ]:
+        """Reads the entity views of up to 100 entities with one streaming read.
+
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of the entities to read Feature values of.
+            feature_selector (gca_feature_selector.FeatureSelector):
+                Required. Selector of the Features to read.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for the read request in seconds.
+
+        Returns:
+            Tuple[List[str], List[ReadFeatureValuesResponse.EntityView]]: The
+            feature IDs in the order of the entity view data, and the raw
+            protobuf entity views.
+        """
+        streaming_read_feature_values_request = (
+            gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
+                entity_type=self.resource_name,
+                entity_ids=entity_ids,
+                feature_selector=feature_selector,
+            )
+        )
+        streaming_read_feature_values_responses = iter(
+            self._featurestore_online_client.streaming_read_feature_values(
+                request=streaming_read_feature_values_request,
+                metadata=request_metadata,
+                timeout=read_request_timeout,
+            )
+        )
+        header = next(streaming_read_feature_values_responses).header
+
+        return (
+            [
+                feature_descriptor.id
+                for feature_descriptor in header.feature_descriptors
+            ],
+            [
+                response._pb.entity_view
+                for response in streaming_read_feature_values_responses
+            ],
+        )
+
+    def _lookup_cached_feature_data(
+        self,
+        entity_ids: List[str],
+        feature_ids: List[str],
+    ) -> Tuple[
+        Dict[
+            str,
+            List[
+                gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data
+            ],
+        ],
+        List[str],
+    ]:
+        """Looks up the requested feature data of entities in the online cache.
+
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of the entities to read Feature values of.
+            feature_ids (List[str]):
+                Required. IDs of the Features to read.
+
+        Returns:
+            Tuple[Dict[str, List[ReadFeatureValuesResponse.EntityView.Data]], List[str]]:
+            The cached data of the entities with every feature cached, and the
+            distinct IDs of the other entities, which have to be read.
+        """
+        entity_data = {}
+        missed_entity_ids = []
+        for entity_id in dict.fromkeys(entity_ids):
+            data = [
+                self._online_cache.get(self.resource_name, entity_id, feature_id)
+                for feature_id in feature_ids
             ]
-            header = streaming_read_feature_values_responses[0].header
-            entity_views = [
-                response.entity_view
-                for response in streaming_read_feature_values_responses[1:]
+            if any(feature_data is None for feature_data in data):
+                missed_entity_ids.append(entity_id)
+            else:
+                entity_data[entity_id] = data
+        return entity_data, missed_entity_ids
+
+    def _cache_and_construct_dataframe(
+        self,
+        entity_ids: List[str],
+        feature_ids: List[str],
+        entity_data: Dict[
+            str,
+            List[
+                gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data
+            ],
+        ],
+        missed_entity_ids: List[str],
+        read_results: List[
+            Tuple[
+                List[str],
+                List[
+                    gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView
+                ],
             ]
+        ],
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Caches freshly read feature data and constructs the dataframe of all
+        requested entities.
 
-        feature_ids = [
-            feature_descriptor.id for feature_descriptor in header.feature_descriptors
-        ]
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of the entities requested, in output order.
+            feature_ids (List[str]):
+                Required. IDs of the Features requested, in output order.
+            entity_data (Dict[str, List[ReadFeatureValuesResponse.EntityView.Data]]):
+                Required. Data of the entities answered from the cache.
+            missed_entity_ids (List[str]):
+                Required. IDs of the entities that were read.
+            read_results (List[Tuple[List[str], List[ReadFeatureValuesResponse.EntityView]]]):
+                Required. Header feature IDs and entity views of each read.
+
+        Returns:
+            pd.DataFrame: entities' feature values in DataFrame
+        """
+        for header_feature_ids, entity_views in read_results:
+            if not set(feature_ids).issuperset(header_feature_ids):
+                # Features were created by other clients since the schema was
+                # cached, the next read of all Features lists them again.
+                self._invalidate_feature_schema()
+            positions = {
+                feature_id: position
+                for position, feature_id in enumerate(header_feature_ids)
+            }
+            for entity_view in entity_views:
+                entity_data[entity_view.entity_id] = [
+                    entity_view.data[positions[feature_id]]
+                    if feature_id in positions
+                    else _MISSING_FEATURE_DATA
+                    for feature_id in feature_ids
+                ]
+
+        for entity_id in missed_entity_ids:
+            data = entity_data.setdefault(
+                entity_id, [_MISSING_FEATURE_DATA] * len(feature_ids)
+            )
+            for feature_id, feature_data in zip(feature_ids, data):
+                self._online_cache.put(
+                    self.resource_name,
+                    entity_id,
+                    feature_id,
+                    feature_data,
+                    is_missing=not feature_data.HasField("value"),
+                )
 
         return self._construct_dataframe(
             feature_ids=feature_ids,
-            entity_views=entity_views,
+            entity_views=[
+                _CachedEntityView(entity_id=entity_id, data=entity_data[entity_id])
+                for entity_id in entity_ids
+            ],
+        )
+
+    @staticmethod
+    def _shard_entity_ids(entity_ids: List[str]) -> List[List[str]]:
+        """Splits entity IDs into lists no longer than a streaming read accepts."""
+        return [
+            entity_ids[i : i + _MAX_STREAMING_READ_ENTITY_IDS]
+            for i in range(0, len(entity_ids), _MAX_STREAMING_READ_ENTITY_IDS)
+        ] or [entity_ids]
+
+    @staticmethod
+    def _concat_dataframes(
+        dataframes: List[
+            "pd.DataFrame"  # noqa: F821 - skip check for undefined name 'pd'
+        ],
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Concatenates the DataFrames read from entity ID shards, in order."""
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                f"Pandas is not installed. Please install pandas to use "
+                f"{EntityType._concat_dataframes.__name__}"
+            )
+
+        return pd.concat(dataframes, ignore_index=True)
+
+    @staticmethod
+    def _validate_max_concurrent_requests(max_concurrent_requests: int):
+        """Validates the `max_concurrent_requests` argument of a read.
+
+        Raises:
+            ValueError: If `max_concurrent_requests` is less than 1.
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError(
+                f"`max_concurrent_requests` should be at least 1, "
+                f"got {max_concurrent_requests} instead."
+            )
+
+    async def read_async(
+        self,
+        entity_ids: Union[str, List[str]],
+        feature_ids: Union[str, List[str]] = "*",
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+        max_concurrent_requests: int = 8,
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Reads feature values for given feature IDs of given entity IDs in this
+        EntityType without blocking the event loop.
+
+        If an online cache is enabled with `enable_online_cache`, only entities
+        with missing or expired cached values are read from the Featurestore.
+
+        Example Usage:
+
+            my_dataframe = await my_entity_type.read_async(
+                entity_ids=['my_entity_id_1', 'my_entity_id_2'],
+            )
+
+        Args:
+            entity_ids (Union[str, List[str]]):
+                Required. ID for a specific entity, or a list of IDs of entities
+                to read Feature values of. A list of more than 100 IDs is split
+                into streaming reads of up to 100 IDs each that run concurrently.
+            feature_ids (Union[str, List[str]]):
+                Required. ID for a specific feature, or a list of IDs of Features in the EntityType
+                for reading feature values. Default to "*", where value of all features will be read.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for each read request in seconds.
+            max_concurrent_requests (int):
+                Optional. The maximum number of streaming reads in flight when
+                more than 100 entity IDs are read. Must be at least 1.
+
+        Returns:
+            pd.DataFrame: entities' feature values in DataFrame
+
+        Raises:
+            ValueError: If `max_concurrent_requests` is less than 1.
+        """
+        self._validate_max_concurrent_requests(max_concurrent_requests)
+        await self.wait_async()
+        if isinstance(feature_ids, str):
+            feature_ids = [feature_ids]
+
+        feature_selector = gca_feature_selector.FeatureSelector(
+            id_matcher=gca_feature_selector.IdMatcher(ids=feature_ids)
+        )
+
+        featurestore_online_client = self._get_async_client(
+            client_class=utils.FeaturestoreOnlineServingClientWithOverride
+        )
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        async def read_shard_views(
+            shard: List[str],
+        ) -> Tuple[
+            List[str],
+            List[gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView],
+        ]:
+            async with semaphore:
+                streaming_read_feature_values_call = await featurestore_online_client.streaming_read_feature_values(
+                    request=gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
+                        entity_type=self.resource_name,
+                        entity_ids=shard,
+                        feature_selector=feature_selector,
+                    ),
+                    metadata=request_metadata,
+                    timeout=read_request_timeout,
+                )
+                header = None
+                entity_views = []
+                async for response in streaming_read_feature_values_call:
+                    if header is None:
+                        header = response.header
+                    else:
+                        entity_views.append(response._pb.entity_view)
+            return (
+                [
+                    feature_descriptor.id
+                    for feature_descriptor in header.feature_descriptors
+                ],
+                entity_views,
+            )
+
+        if self._online_cache is not None:
+            if isinstance(entity_ids, str):
+                entity_ids = [entity_ids]
+            if _ALL_FEATURE_IDS in feature_ids:
+                # Listing the Features when they are not cached yet is a
+                # blocking call, so it runs outside of the event loop.
+                feature_value_types = self._feature_value_types
+                if feature_value_types is None:
+                    feature_value_types = (
+                        await asyncio.get_event_loop().run_in_executor(
+                            None, self._get_feature_value_types
+                        )
+                    )
+                feature_ids = list(feature_value_types)
+            entity_data, missed_entity_ids = self._lookup_cached_feature_data(
+                entity_ids=entity_ids, feature_ids=feature_ids
+            )
+            read_results = (
+                await asyncio.gather(
+                    *(
+                        read_shard_views(shard)
+                        for shard in self._shard_entity_ids(missed_entity_ids)
+                    )
+                )
+                if missed_entity_ids
+                else []
+            )
+            return self._cache_and_construct_dataframe(
+                entity_ids=entity_ids,
+                feature_ids=feature_ids,
+                entity_data=entity_data,
+                missed_entity_ids=missed_entity_ids,
+                read_results=read_results,
+            )
+
+        if isinstance(entity_ids, str):
+            read_feature_values_response = (
+                await featurestore_online_client.read_feature_values(
+                    request=gca_featurestore_online_service.ReadFeatureValuesRequest(
+                        entity_type=self.resource_name,
+                        entity_id=entity_ids,
+                        feature_selector=feature_selector,
+                    ),
+                    metadata=request_metadata,
+                    timeout=read_request_timeout,
+                )
+            )
+            return self._construct_dataframe(
+                feature_ids=[
+                    feature_descriptor.id
+                    for feature_descriptor in read_feature_values_response.header.feature_descriptors
+                ],
+                entity_views=[read_feature_values_response.entity_view],
+            )
+
+        async def read_shard(shard: List[str]) -> "pd.DataFrame":  # noqa: F821
+            return self._construct_dataframe(*await read_shard_views(shard))
+
+        shards = self._shard_entity_ids(entity_ids)
+        if len(shards) == 1:
+            return await read_shard(shards[0])
+
+        return self._concat_dataframes(
+            await asyncio.gather(*(read_shard(shard) for shard in shards))
         )
 
     @staticmethod
@@ -1523,18 +2434,61 @@ class EntityType(base.VertexAiResourceNounWithFutureManager):
                 f"{EntityType._construct_dataframe.__name__}"
             )
 
-        data = []
-        for entity_view in entity_views:
-            entity_data = {"entity_id": entity_view.entity_id}
-            for feature_id, feature_data in zip(feature_ids, entity_view.data):
-                if feature_data._pb.HasField("value"):
-                    value_type = feature_data.value._pb.WhichOneof("value")
-                    feature_value = getattr(feature_data.value, value_type)
-                    if hasattr(feature_value, "values"):
-                        feature_value = feature_value.values
-                    entity_data[feature_id] = feature_value
-                else:
-                    entity_data[feature_id] = None
-            data.append(entity_data)
+        # Work on the raw protobufs, one feature column at a time.
+        entity_views = [getattr(view, "_pb", view) for view in entity_views]
+
+        data = {"entity_id": [entity_view.entity_id for entity_view in entity_views]}
+        feature_columns = zip(*(entity_view.data for entity_view in entity_views))
+        for feature_id, feature_column in itertools.zip_longest(
+            feature_ids, feature_columns, fillvalue=()
+        ):
+            if feature_id is not None:
+                data[feature_id] = EntityType._decode_feature_column(feature_column)
 
         return pd.DataFrame(data=data, columns=["entity_id"] + feature_ids)
+
+    @staticmethod
+    def _decode_feature_column(
+        feature_column: Sequence[
+            gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data
+        ],
+    ) -> Union["np.ndarray", List]:  # noqa: F821 - skip check for undefined name 'np'
+        """Decodes the values of one feature across entities.
+
+        Args:
+            feature_column (Sequence[ReadFeatureValuesResponse.EntityView.Data]):
+                Required. Raw protobuf data of a single feature for each entity.
+
+        Returns:
+            Union[np.ndarray, List]: A typed array if every entity has a bool,
+            double or int64 value, otherwise a list with None for missing values
+            and lists for array values.
+        """
+        import numpy as np
+
+        value_types = {
+            data.value.WhichOneof("value") if data.HasField("value") else None
+            for data in feature_column
+        }
+        if len(value_types) == 1:
+            (value_type,) = value_types
+            dtype = _SCALAR_VALUE_TYPE_DTYPES.get(value_type)
+            if dtype:
+                get_value = operator.attrgetter(f"value.{value_type}")
+                return np.fromiter(
+                    map(get_value, feature_column),
+                    dtype=dtype,
+                    count=len(feature_column),
+                )
+
+        values = []
+        for data in feature_column:
+            if data.HasField("value"):
+                value_type = data.value.WhichOneof("value")
+                value = getattr(data.value, value_type)
+                if value_type in _ARRAY_VALUE_TYPES:
+                    value = list(value.values)
+                values.append(value)
+            else:
+                values.append(None)
+        return values
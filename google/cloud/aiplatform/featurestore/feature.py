@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from google.auth import credentials as auth_credentials
 from google.protobuf import field_mask_pb2
@@ -265,6 +265,8 @@ class Feature(base.VertexAiResourceNounWithFutureManager):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["Feature"]:
         """Lists existing managed feature resources in an entityType, given an entityType resource name or an entity_type ID.
 
@@ -331,6 +333,12 @@ class Feature(base.VertexAiResourceNounWithFutureManager):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to list features. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of features requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of features to return. If not
+                set, all features are returned.
 
         Returns:
             List[Feature] - A list of managed feature resource objects
@@ -342,20 +350,121 @@ class Feature(base.VertexAiResourceNounWithFutureManager):
             project=project,
             location=location,
             credentials=credentials,
-            parent=utils.full_resource_name(
-                resource_name=entity_type_name,
-                resource_noun=featurestore.EntityType._resource_noun,
-                parse_resource_name_method=featurestore.EntityType._parse_resource_name,
-                format_resource_name_method=featurestore.EntityType._format_resource_name,
-                parent_resource_name_fields={
-                    featurestore.Featurestore._resource_noun: featurestore_id
-                }
-                if featurestore_id
-                else featurestore_id,
+            parent=cls._get_entity_type_resource_name(
+                entity_type_name=entity_type_name,
+                featurestore_id=featurestore_id,
+                project=project,
+                location=location,
+            ),
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        entity_type_name: str,
+        featurestore_id: Optional[str] = None,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union["Feature", gca_feature.Feature]]:
+        """Lazily lists existing managed feature resources in an entityType,
+        given an entityType resource name or an entity_type ID.
+
+        Pages are requested as the results are consumed.
+
+        Example Usage:
+
+            for my_feature in aiplatform.Feature.iter_list(
+                entity_type_name='my_entity_type_id',
+                featurestore_id='my_featurestore_id',
+            ):
+                print(my_feature.resource_name)
+
+        Args:
+            entity_type_name (str):
+                Required. A fully-qualified entityType resource name or an entity_type ID of an existing entityType
+                to list features in. The EntityType must exist in the Featurestore if provided by the featurestore_id.
+                Example: "projects/123/locations/us-central1/featurestores/my_featurestore_id/entityTypes/my_entity_type_id"
+                or "my_entity_type_id" when project and location are initialized or passed, with featurestore_id passed.
+            featurestore_id (str):
+                Optional. Featurestore ID of an existing featurestore to list features in,
+                when entity_type_name is passed as entity_type ID.
+            filter (str):
+                Optional. Lists the Features that match the filter expression.
+                See `Feature.list` for the supported filters.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                See `Feature.list` for the supported fields.
+            project (str):
+                Optional. Project to list features in. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to list features in. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to list features. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of features requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of features to yield. If not
+                set, all features are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing Feature objects.
+
+        Yields:
+            Union[Feature, gca_feature.Feature] - The managed feature resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        return cls._iter_list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=cls._get_entity_type_resource_name(
+                entity_type_name=entity_type_name,
+                featurestore_id=featurestore_id,
                 project=project,
                 location=location,
-                resource_id_validator=featurestore.EntityType._resource_id_validator,
             ),
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
+        )
+
+    @staticmethod
+    def _get_entity_type_resource_name(
+        entity_type_name: str,
+        featurestore_id: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> str:
+        """Returns the resource name of the entityType to list features in."""
+        return utils.full_resource_name(
+            resource_name=entity_type_name,
+            resource_noun=featurestore.EntityType._resource_noun,
+            parse_resource_name_method=featurestore.EntityType._parse_resource_name,
+            format_resource_name_method=featurestore.EntityType._format_resource_name,
+            parent_resource_name_fields={
+                featurestore.Featurestore._resource_noun: featurestore_id
+            }
+            if featurestore_id
+            else featurestore_id,
+            project=project,
+            location=location,
+            resource_id_validator=featurestore.EntityType._resource_id_validator,
         )
 
     @classmethod
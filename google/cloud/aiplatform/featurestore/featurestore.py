@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import uuid
 
 from google.auth import credentials as auth_credentials
@@ -31,7 +31,11 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform import featurestore
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
-from google.cloud.aiplatform.utils import featurestore_utils, resource_manager_utils
+from google.cloud.aiplatform.utils import (
+    bigquery_utils,
+    featurestore_utils,
+    resource_manager_utils,
+)
 
 from google.cloud import bigquery
 
@@ -1092,6 +1096,7 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
         feature_destination_fields: Optional[Dict[str, str]] = None,
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         serve_request_timeout: Optional[float] = None,
+        max_concurrent_streams: int = 8,
     ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
         """Batch serves feature values to pandas DataFrame
 
@@ -1101,6 +1106,10 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
             as the intermediary storage for batch serve feature values
             from featurestore to dataframe.
 
+            The BigQuery Storage read streams of the served table are read
+            concurrently into Arrow record batches, which are converted to
+            pandas once.
+
         Args:
             serving_feature_ids (Dict[str, List[str]]):
                 Required. A user defined dictionary to define the entity_types and their features for batch serve/read.
@@ -1175,33 +1184,281 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                      }
             serve_request_timeout (float):
                 Optional. The timeout for the serve request in seconds.
+            max_concurrent_streams (int):
+                Optional. The maximum number of BigQuery Storage read streams
+                read at the same time.
 
         Returns:
             pd.DataFrame: The pandas DataFrame containing feature values from batch serving.
 
         """
         try:
-            from google.cloud import bigquery_storage
+            import pandas as pd  # noqa: F401 - skip check for 'pandas' which is required by 'pyarrow.Table.to_pandas'
         except ImportError:
             raise ImportError(
-                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"Pandas is not installed. Please install pandas to use "
                 f"{self.batch_serve_to_df.__name__}"
             )
 
+        return self.batch_serve_to_arrow(
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            max_concurrent_streams=max_concurrent_streams,
+        ).to_pandas(split_blocks=True, self_destruct=True)
+
+    def batch_serve_to_arrow(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]] = None,
+        feature_destination_fields: Optional[Dict[str, str]] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        serve_request_timeout: Optional[float] = None,
+        max_concurrent_streams: int = 8,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values to a pyarrow Table.
+
+        Note:
+            Calling this method will automatically create and delete a temporary
+            bigquery dataset in the same GCP project, which will be used
+            as the intermediary storage for batch serve feature values
+            from featurestore to dataframe.
+
+        Args:
+            serving_feature_ids (Dict[str, List[str]]):
+                Required. A user defined dictionary to define the entity_types and their features for batch serve/read.
+                The keys of the dictionary are the serving entity_type ids and
+                the values are lists of serving feature ids in each entity_type.
+
+                Example:
+                    serving_feature_ids = {
+                        'my_entity_type_id_1': ['feature_id_1_1', 'feature_id_1_2'],
+                        'my_entity_type_id_2': ['feature_id_2_1', 'feature_id_2_2'],
+                    }
+
+            read_instances_df (pd.DataFrame):
+                Required. Read_instances_df is a pandas DataFrame containing the read instances.
+
+                Each read instance should consist of exactly one read timestamp
+                and one or more entity IDs identifying entities of the
+                corresponding EntityTypes whose Features are requested.
+
+                Each output instance contains Feature values of requested
+                entities concatenated together as of the read time.
+
+                An example read_instances_df may be
+                    pd.DataFrame(
+                        data=[
+                            {
+                                "my_entity_type_id_1": "my_entity_type_id_1_entity_1",
+                                "my_entity_type_id_2": "my_entity_type_id_2_entity_1",
+                                "timestamp": "2020-01-01T10:00:00.123Z"
+                        ],
+                    )
+
+                An example batch_serve_output_df may be
+                    pd.DataFrame(
+                        data=[
+                            {
+                                "my_entity_type_id_1": "my_entity_type_id_1_entity_1",
+                                "my_entity_type_id_2": "my_entity_type_id_2_entity_1",
+                                "foo": "feature_id_1_1_feature_value",
+                                "feature_id_1_2": "feature_id_1_2_feature_value",
+                                "feature_id_2_1": "feature_id_2_1_feature_value",
+                                "bar": "feature_id_2_2_feature_value",
+                                "timestamp": "2020-01-01T10:00:00.123Z"
+                        ],
+                    )
+
+                Timestamp in each read instance must be millisecond-aligned.
+
+                The columns can be in any order.
+
+                Values in the timestamp column must use the RFC 3339 format,
+                e.g. ``2012-07-30T10:43:17.123Z``.
+
+            pass_through_fields (List[str]):
+                Optional. When not empty, the specified fields in the
+                read_instances source will be joined as-is in the output,
+                in addition to those fields from the Featurestore Entity.
+
+                For BigQuery source, the type of the pass-through values
+                will be automatically inferred. For CSV source, the
+                pass-through values will be passed as opaque bytes.
+
+            feature_destination_fields (Dict[str, str]):
+                Optional. A user defined dictionary to map a feature's fully qualified resource name to
+                its destination field name. If the destination field name is not defined,
+                the feature ID will be used as its destination field name.
+
+                Example:
+                    feature_destination_fields = {
+                        'projects/123/locations/us-central1/featurestores/fs_id/entityTypes/et_id1/features/f_id11': 'foo',
+                        'projects/123/locations/us-central1/featurestores/fs_id/entityTypes/et_id2/features/f_id22': 'bar',
+                     }
+            serve_request_timeout (float):
+                Optional. The timeout for the serve request in seconds.
+            max_concurrent_streams (int):
+                Optional. The maximum number of BigQuery Storage read streams
+                read at the same time.
+
+        Returns:
+            pyarrow.Table: The table containing feature values from batch serving.
+        """
+        import pyarrow
+
+        record_batches = list(
+            self.batch_serve_to_record_batches(
+                serving_feature_ids=serving_feature_ids,
+                read_instances_df=read_instances_df,
+                pass_through_fields=pass_through_fields,
+                feature_destination_fields=feature_destination_fields,
+                request_metadata=request_metadata,
+                serve_request_timeout=serve_request_timeout,
+                max_concurrent_streams=max_concurrent_streams,
+            )
+        )
+        if not record_batches:
+            return pyarrow.table({})
+        return pyarrow.Table.from_batches(record_batches)
+
+    def batch_serve_to_record_batches(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]] = None,
+        feature_destination_fields: Optional[Dict[str, str]] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        serve_request_timeout: Optional[float] = None,
+        max_concurrent_streams: int = 8,
+        max_queued_batches: Optional[int] = None,
+    ) -> Iterator[
+        "pyarrow.RecordBatch"  # noqa: F821 - skip check for undefined name 'pyarrow'
+    ]:
+        """Batch serves feature values as an iterator of pyarrow RecordBatches.
+
+        Only a bounded number of record batches are held in memory, so results
+        larger than memory can be consumed batch by batch. The batch serve
+        starts when iteration starts, and the temporary bigquery dataset is
+        deleted when the iterator is exhausted or closed.
+
+        Example Usage:
+
+            for record_batch in my_featurestore.batch_serve_to_record_batches(
+                serving_feature_ids={'my_entity_type_id': ['my_feature_id']},
+                read_instances_df=my_read_instances_df,
+            ):
+                train_on(record_batch.to_pandas())
+
+        Note:
+            Calling this method will automatically create and delete a temporary
+            bigquery dataset in the same GCP project, which will be used
+            as the intermediary storage for batch serve feature values
+            from featurestore to dataframe.
+
+        Args:
+            serving_feature_ids (Dict[str, List[str]]):
+                Required. A user defined dictionary to define the entity_types and their features for batch serve/read.
+                The keys of the dictionary are the serving entity_type ids and
+                the values are lists of serving feature ids in each entity_type.
+
+                Example:
+                    serving_feature_ids = {
+                        'my_entity_type_id_1': ['feature_id_1_1', 'feature_id_1_2'],
+                        'my_entity_type_id_2': ['feature_id_2_1', 'feature_id_2_2'],
+                    }
+
+            read_instances_df (pd.DataFrame):
+                Required. Read_instances_df is a pandas DataFrame containing the read instances.
+
+                Each read instance should consist of exactly one read timestamp
+                and one or more entity IDs identifying entities of the
+                corresponding EntityTypes whose Features are requested.
+
+                Each output instance contains Feature values of requested
+                entities concatenated together as of the read time.
+
+                An example read_instances_df may be
+                    pd.DataFrame(
+                        data=[
+                            {
+                                "my_entity_type_id_1": "my_entity_type_id_1_entity_1",
+                                "my_entity_type_id_2": "my_entity_type_id_2_entity_1",
+                                "timestamp": "2020-01-01T10:00:00.123Z"
+                        ],
+                    )
+
+                An example batch_serve_output_df may be
+                    pd.DataFrame(
+                        data=[
+                            {
+                                "my_entity_type_id_1": "my_entity_type_id_1_entity_1",
+                                "my_entity_type_id_2": "my_entity_type_id_2_entity_1",
+                                "foo": "feature_id_1_1_feature_value",
+                                "feature_id_1_2": "feature_id_1_2_feature_value",
+                                "feature_id_2_1": "feature_id_2_1_feature_value",
+                                "bar": "feature_id_2_2_feature_value",
+                                "timestamp": "2020-01-01T10:00:00.123Z"
+                        ],
+                    )
+
+                Timestamp in each read instance must be millisecond-aligned.
+
+                The columns can be in any order.
+
+                Values in the timestamp column must use the RFC 3339 format,
+                e.g. ``2012-07-30T10:43:17.123Z``.
+
+            pass_through_fields (List[str]):
+                Optional. When not empty, the specified fields in the
+                read_instances source will be joined as-is in the output,
+                in addition to those fields from the Featurestore Entity.
+
+                For BigQuery source, the type of the pass-through values
+                will be automatically inferred. For CSV source, the
+                pass-through values will be passed as opaque bytes.
+
+            feature_destination_fields (Dict[str, str]):
+                Optional. A user defined dictionary to map a feature's fully qualified resource name to
+                its destination field name. If the destination field name is not defined,
+                the feature ID will be used as its destination field name.
+
+                Example:
+                    feature_destination_fields = {
+                        'projects/123/locations/us-central1/featurestores/fs_id/entityTypes/et_id1/features/f_id11': 'foo',
+                        'projects/123/locations/us-central1/featurestores/fs_id/entityTypes/et_id2/features/f_id22': 'bar',
+                     }
+            serve_request_timeout (float):
+                Optional. The timeout for the serve request in seconds.
+            max_concurrent_streams (int):
+                Optional. The maximum number of BigQuery Storage read streams
+                read at the same time.
+            max_queued_batches (int):
+                Optional. The maximum number of decoded record batches waiting
+                to be consumed. Defaults to twice `max_concurrent_streams`.
+
+        Yields:
+            pyarrow.RecordBatch: The record batches of the served feature
+            values. Batches of different read streams are interleaved.
+        """
         try:
-            import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
+            from google.cloud import bigquery_storage
         except ImportError:
             raise ImportError(
-                f"Pyarrow is not installed. Please install pyarrow to use "
-                f"{self.batch_serve_to_df.__name__}"
+                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"{self.batch_serve_to_record_batches.__name__}"
             )
 
         try:
-            import pandas as pd
+            import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
         except ImportError:
             raise ImportError(
-                f"Pandas is not installed. Please install pandas to use "
-                f"{self.batch_serve_to_df.__name__}"
+                f"Pyarrow is not installed. Please install pyarrow to use "
+                f"{self.batch_serve_to_record_batches.__name__}"
             )
 
         bigquery_client = bigquery.Client(
@@ -1266,16 +1523,15 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                 ),
             )
 
-            frames = []
-            for stream in read_session_proto.streams:
-                reader = bigquery_storage_read_client.read_rows(stream.name)
-                for message in reader.rows().pages:
-                    frames.append(message.to_dataframe())
+            yield from bigquery_utils.iter_read_session_record_batches(
+                read_client=bigquery_storage_read_client,
+                read_session=read_session_proto,
+                max_concurrent_streams=max_concurrent_streams,
+                max_queued_batches=max_queued_batches,
+            )
 
         finally:
             bigquery_client.delete_dataset(
                 dataset=temp_bq_dataset.dataset_id,
                 delete_contents=True,
             )
-
-        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(frames)
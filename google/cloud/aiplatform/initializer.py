@@ -16,11 +16,10 @@
 #
 
 
-from concurrent import futures
+import functools
 import logging
-import pkg_resources
 import os
-from typing import Optional, Type, Union
+from typing import Any, Dict, Optional, Type, Union, TYPE_CHECKING
 
 from google.api_core import client_options
 from google.api_core import gapic_v1
@@ -32,14 +31,19 @@ from google.cloud.aiplatform import compat
 from google.cloud.aiplatform.constants import base as constants
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.metadata import metadata
-from google.cloud.aiplatform.utils import resource_manager_utils
+from google.cloud.aiplatform.utils import client_pool
+from google.cloud.aiplatform.utils import dependency_scheduler
 
 from google.cloud.aiplatform.compat.types import (
     encryption_spec as gca_encryption_spec_compat,
     encryption_spec_v1 as gca_encryption_spec_v1,
-    encryption_spec_v1beta1 as gca_encryption_spec_v1beta1,
 )
 
+if TYPE_CHECKING:
+    from google.cloud.aiplatform.compat.types import (
+        encryption_spec_v1beta1 as gca_encryption_spec_v1beta1,
+    )
+
 
 class _Config:
     """Stores common parameters and options for API calls."""
@@ -49,7 +53,9 @@ class _Config:
         self._location = None
         self._staging_bucket = None
         self._credentials = None
+        self._default_credentials = None
         self._encryption_spec_key_name = None
+        self._max_staleness = 0
 
     def init(
         self,
@@ -61,6 +67,8 @@ class _Config:
         staging_bucket: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
         encryption_spec_key_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_staleness: Optional[float] = None,
     ):
         """Updates common initialization parameters with provided options.
 
@@ -84,6 +92,19 @@ class _Config:
                 resource is created.
 
                 If set, this resource and all sub-resources will be secured by this key.
+            max_workers (int):
+                Optional. The maximum number of methods called with `sync=False`
+                running at the same time. Methods waiting for upstream resources
+                don't count towards it.
+            max_staleness (float):
+                Optional. The default number of seconds properties reflecting
+                the service-side state of a resource, ie: `state` or `end_time`,
+                are served from the last fetched resource before fetching it
+                again. Defaults to 0, which fetches the resource on every access.
+                Can be overridden per resource with its `max_staleness` attribute.
+
+        Raises:
+            ValueError: If max_staleness is negative.
         """
 
         # reset metadata_service config if project or location is updated.
@@ -105,6 +126,14 @@ class _Config:
             self._credentials = credentials
         if encryption_spec_key_name:
             self._encryption_spec_key_name = encryption_spec_key_name
+        if max_workers:
+            global_pool.set_max_workers(max_workers)
+        if max_staleness is not None:
+            if max_staleness < 0:
+                raise ValueError(
+                    f"max_staleness must be non-negative, got {max_staleness}."
+                )
+            self._max_staleness = max_staleness
 
         if experiment:
             metadata.metadata_service.set_experiment(
@@ -122,7 +151,7 @@ class _Config:
     ) -> Optional[
         Union[
             gca_encryption_spec_v1.EncryptionSpec,
-            gca_encryption_spec_v1beta1.EncryptionSpec,
+            "gca_encryption_spec_v1beta1.EncryptionSpec",
         ]
     ]:
         """Creates a gca_encryption_spec.EncryptionSpec instance from the given
@@ -138,7 +167,7 @@ class _Config:
         if kms_key_name:
             gca_encryption_spec = gca_encryption_spec_compat
             if select_version == compat.V1BETA1:
-                gca_encryption_spec = gca_encryption_spec_v1beta1
+                gca_encryption_spec = compat.types.encryption_spec_v1beta1
             encryption_spec = gca_encryption_spec.EncryptionSpec(
                 kms_key_name=kms_key_name
             )
@@ -157,6 +186,10 @@ class _Config:
         # CLOUD_ML_PROJECT_ID env variable or Vertex AI starts setting GOOGLE_CLOUD_PROJECT env variable.
         project_number = os.environ.get("CLOUD_ML_PROJECT_ID")
         if project_number:
+            # Imported here since the Resource Manager client is only needed
+            # to resolve project numbers.
+            from google.cloud.aiplatform.utils import resource_manager_utils
+
             # Try to convert project number to project ID which is more readable.
             try:
                 project_id = resource_manager_utils.get_project_id(
@@ -202,13 +235,23 @@ class _Config:
         """Default credentials."""
         if self._credentials:
             return self._credentials
+        # Reuse the environment credentials so clients built with them share
+        # the same entry in the global client pool.
+        if self._default_credentials:
+            return self._default_credentials
         logger = logging.getLogger("google.auth._default")
         logging_warning_filter = utils.LoggingFilter(logging.WARNING)
         logger.addFilter(logging_warning_filter)
         credentials, _ = google.auth.default()
         logger.removeFilter(logging_warning_filter)
+        self._default_credentials = credentials
         return credentials
 
+    @property
+    def max_staleness(self) -> float:
+        """Default number of seconds synced resource state is served before fetching it again."""
+        return self._max_staleness
+
     @property
     def encryption_spec_key_name(self) -> Optional[str]:
         """Default encryption spec key name, if provided."""
@@ -300,30 +343,94 @@ class _Config:
         Returns:
             client: Instantiated Vertex AI Service client with optional overrides
         """
-        gapic_version = pkg_resources.get_distribution(
-            "google-cloud-aiplatform",
-        ).version
-        client_info = gapic_v1.client_info.ClientInfo(
-            gapic_version=gapic_version,
-            user_agent=f"{constants.USER_AGENT_PRODUCT}/{gapic_version}",
+        kwargs = self._get_client_kwargs(
+            credentials=credentials,
+            location_override=location_override,
+            prediction_client=prediction_client,
+            api_base_path_override=api_base_path_override,
         )
 
-        kwargs = {
+        return client_class(**kwargs)
+
+    def create_async_client(
+        self,
+        client_class: Type[utils.VertexAiServiceClientWithOverride],
+        credentials: Optional[auth_credentials.Credentials] = None,
+        location_override: Optional[str] = None,
+        prediction_client: bool = False,
+        api_base_path_override: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> Any:
+        """Instantiates the generated asyncio GAPIC client paired with the given
+        VertexAiServiceClient.
+
+        The returned client opens an asyncio gRPC channel, so it should be created
+        and used from within a running event loop.
+
+        Args:
+            client_class (utils.VertexAiServiceClientWithOverride):
+                Required. A Vertex AI Service Client with optional overrides.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom auth credentials. If not provided will use the current config.
+            location_override (str): Optional. location override.
+            prediction_client (str): Optional. flag to use a prediction endpoint.
+            api_base_path_override (str): Optional. Override default api base path.
+            version (str): Optional. API version of the client. Defaults to the client's default version.
+        Returns:
+            client: Instantiated asyncio GAPIC client.
+        """
+        kwargs = self._get_client_kwargs(
+            credentials=credentials,
+            location_override=location_override,
+            prediction_client=prediction_client,
+            api_base_path_override=api_base_path_override,
+        )
+
+        return client_class.get_gapic_async_client_class(version)(**kwargs)
+
+    def _get_client_kwargs(
+        self,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        location_override: Optional[str] = None,
+        prediction_client: bool = False,
+        api_base_path_override: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Composes the keyword arguments used to instantiate GAPIC clients."""
+        return {
             "credentials": credentials or self.credentials,
             "client_options": self.get_client_options(
                 location_override=location_override,
                 prediction_client=prediction_client,
                 api_base_path_override=api_base_path_override,
             ),
-            "client_info": client_info,
+            "client_info": _get_client_info(),
         }
 
-        return client_class(**kwargs)
+
+@functools.lru_cache(maxsize=None)
+def _get_client_info() -> gapic_v1.client_info.ClientInfo:
+    """Returns the client info sent with every request, built once per process."""
+    # Imported here since scanning the installed distributions is slow.
+    import pkg_resources
+
+    gapic_version = pkg_resources.get_distribution(
+        "google-cloud-aiplatform",
+    ).version
+    return gapic_v1.client_info.ClientInfo(
+        gapic_version=gapic_version,
+        user_agent=f"{constants.USER_AGENT_PRODUCT}/{gapic_version}",
+    )
 
 
 # global config to store init parameters: ie, aiplatform.init(project=..., location=...)
 global_config = _Config()
 
-global_pool = futures.ThreadPoolExecutor(
+# Runs the methods called with `sync=False` once the resources they depend on
+# are created. Call `aiplatform.init(max_workers=...)` to resize it.
+global_pool = dependency_scheduler.DependencyScheduler(
     max_workers=min(32, max(4, (os.cpu_count() or 0) * 5))
 )
+
+# GAPIC clients and their channels shared by all SDK resource objects.
+# Call `global_client_pool.close()` to release them explicitly.
+global_client_pool = client_pool.ClientPool()
@@ -15,15 +15,30 @@
 # limitations under the License.
 #
 
-from typing import Iterable, Optional, Union, Sequence, Dict, List
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    Sequence,
+    Dict,
+    List,
+    TYPE_CHECKING,
+)
 
 import abc
+import asyncio
+import codecs
 import copy
+import csv
 import datetime
+import json
 import time
 
+import proto
+
 from google.cloud import storage
-from google.cloud import bigquery
 
 from google.auth import credentials as auth_credentials
 from google.protobuf import duration_pb2  # type: ignore
@@ -47,13 +62,26 @@ from google.cloud.aiplatform.constants import base as constants
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import hyperparameter_tuning
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import bigquery_utils
 from google.cloud.aiplatform.utils import console_utils
+from google.cloud.aiplatform.utils import gcs_utils
+from google.cloud.aiplatform.utils import job_poller
 from google.cloud.aiplatform.utils import source_utils
 from google.cloud.aiplatform.utils import worker_spec_utils
 
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+
 
 _LOGGER = base.Logger(__name__)
 
+# File name prefixes of the shards a BatchPredictionJob writes to GCS, for custom
+# models and for AutoML tabular models.
+_BATCH_PREDICTION_RESULTS_PREFIXES = ("prediction.results", "predictions_")
+_BATCH_PREDICTION_ERRORS_PREFIXES = ("prediction.errors_stats", "errors_")
+# Table a BatchPredictionJob writes failed instances to in its BigQuery dataset.
+_BATCH_PREDICTION_ERRORS_TABLE = "errors"
+
 _JOB_COMPLETE_STATES = (
     gca_job_state.JobState.JOB_STATE_SUCCEEDED,
     gca_job_state.JobState.JOB_STATE_FAILED,
@@ -130,7 +158,7 @@ class _Job(base.VertexAiStatefulResource):
         """
 
         # Fetch the Job again for most up-to-date job state
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
 
         return self._gca_resource.state
 
@@ -138,21 +166,21 @@ class _Job(base.VertexAiStatefulResource):
     def start_time(self) -> Optional[datetime.datetime]:
         """Time when the Job resource entered the `JOB_STATE_RUNNING` for the
         first time."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "start_time")
 
     @property
     def end_time(self) -> Optional[datetime.datetime]:
         """Time when the Job resource entered the `JOB_STATE_SUCCEEDED`,
         `JOB_STATE_FAILED`, or `JOB_STATE_CANCELLED` state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "end_time")
 
     @property
     def error(self) -> Optional[status_pb2.Status]:
         """Detailed error info for this Job resource. Only populated when the
         Job's state is `JOB_STATE_FAILED` or `JOB_STATE_CANCELLED`."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "error")
 
     @property
@@ -196,19 +224,19 @@ class _Job(base.VertexAiStatefulResource):
         """
 
         # Used these numbers so failures surface fast
-        wait = 5  # start at five seconds
-        log_wait = 5
+        log_wait = 5  # start at five seconds
         max_wait = 60 * 5  # 5 minute wait
         multiplier = 2  # scale wait by 2 every iteration
 
+        # The shared poller checks the job state, so waiting on many jobs
+        # does not send one request per job every few seconds.
         previous_time = time.time()
-        while self.state not in _JOB_COMPLETE_STATES:
+        for _ in job_poller.global_poller.watch(self):
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 self._log_job_state()
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
-            time.sleep(wait)
 
         self._log_job_state()
 
@@ -219,6 +247,89 @@ class _Job(base.VertexAiStatefulResource):
         else:
             _LOGGER.log_action_completed_against_resource("run", "completed", self)
 
+    async def wait_for_completion_async(self) -> None:
+        """Waits for this Job to complete without blocking the event loop.
+
+        Example usage:
+            await my_job.wait_for_completion_async()
+
+        Raises:
+            RuntimeError: If job failed or cancelled.
+        """
+        await self.wait_async()
+
+        # Same cadence as _block_until_complete so failures surface fast
+        wait = 5
+        log_wait = 5
+        max_wait = 60 * 5
+        multiplier = 2
+
+        previous_time = time.time()
+        await self._sync_gca_resource_async()
+        while self._gca_resource.state not in _JOB_COMPLETE_STATES:
+            current_time = time.time()
+            if current_time - previous_time >= log_wait:
+                self._log_job_state()
+                log_wait = min(log_wait * multiplier, max_wait)
+                previous_time = current_time
+            await asyncio.sleep(wait)
+            await self._sync_gca_resource_async()
+
+        self._log_job_state()
+
+        if self._gca_resource.state in _JOB_ERROR_STATES:
+            raise RuntimeError("Job failed with:\n%s" % self._gca_resource.error)
+        else:
+            _LOGGER.log_action_completed_against_resource("run", "completed", self)
+
+    @classmethod
+    async def list_async(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> List[base.VertexAiResourceNoun]:
+        """List all instances of this Job Resource without blocking the event loop.
+
+        Example Usage:
+
+        jobs = await aiplatform.BatchPredictionJob.list_async(
+            filter='state="JOB_STATE_SUCCEEDED" AND display_name="my_job"',
+        )
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+
+        Returns:
+            List[VertexAiResourceNoun] - A list of Job resource objects
+        """
+
+        return await cls._list_async(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            local_order=True,
+        )
+
     @classmethod
     def list(
         cls,
@@ -227,6 +338,8 @@ class _Job(base.VertexAiStatefulResource):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List[base.VertexAiResourceNoun]:
         """List all instances of this Job Resource.
 
@@ -253,6 +366,12 @@ class _Job(base.VertexAiStatefulResource):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[VertexAiResourceNoun] - A list of Job resource objects
@@ -264,6 +383,74 @@ class _Job(base.VertexAiStatefulResource):
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union[base.VertexAiResourceNoun, proto.Message]]:
+        """Lazily list the instances of this Job Resource.
+
+        Pages are requested as the results are consumed. When `order_by` is
+        set, all resources are listed and sorted locally before the first one
+        is yielded.
+
+        Example Usage:
+
+        for job in aiplatform.BatchPredictionJob.iter_list(max_results=10):
+            print(job.display_name)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[base.VertexAiResourceNoun, proto.Message] - The SDK resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        return cls._iter_list_with_local_order(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
 
     def cancel(self) -> None:
@@ -275,6 +462,7 @@ class _Job(base.VertexAiStatefulResource):
 
         _LOGGER.log_action_start_against_resource("Cancelling", "run", self)
         getattr(self.api_client, self._cancel_method)(name=self.resource_name)
+        self._mark_gca_resource_stale()
 
 
 class BatchPredictionJob(_Job):
@@ -324,7 +512,7 @@ class BatchPredictionJob(_Job):
     @property
     def output_info(
         self,
-    ) -> Optional[aiplatform.gapic.BatchPredictionJob.OutputInfo]:
+    ) -> Optional["aiplatform.gapic.BatchPredictionJob.OutputInfo"]:
         """Information describing the output of this job, including output location
         into which prediction output is written.
 
@@ -771,7 +959,7 @@ class BatchPredictionJob(_Job):
 
     def iter_outputs(
         self, bq_max_results: Optional[int] = 100
-    ) -> Union[Iterable[storage.Blob], Iterable[bigquery.table.RowIterator]]:
+    ) -> Union[Iterable[storage.Blob], Iterable["bigquery.table.RowIterator"]]:
         """Returns an Iterable object to traverse the output files, either a
         list of GCS Blobs or a BigQuery RowIterator depending on the output
         config set when the BatchPredictionJob was created.
@@ -796,13 +984,7 @@ class BatchPredictionJob(_Job):
                 GCS or BQ output provided.
         """
 
-        self._assert_gca_resource_is_available()
-
-        if self.state != gca_job_state.JobState.JOB_STATE_SUCCEEDED:
-            raise RuntimeError(
-                f"Cannot read outputs until BatchPredictionJob has succeeded, "
-                f"current state: {self._gca_resource.state}"
-            )
+        self._assert_outputs_are_available()
 
         output_info = self._gca_resource.output_info
 
@@ -830,15 +1012,15 @@ class BatchPredictionJob(_Job):
             bq_dataset = output_info.bigquery_output_dataset
             bq_table = output_info.bigquery_output_table
 
-            if not bq_table:
-                raise RuntimeError(
-                    "A BigQuery table with predictions was not found, this "
-                    f"might be due to errors. Visit {self._dashboard_uri()} for details."
-                )
+            self._assert_bigquery_output_table_is_available()
 
             if bq_dataset.startswith("bq://"):
                 bq_dataset = bq_dataset[5:]
 
+            # Imported here since BigQuery and its pandas dependency are only
+            # needed for BigQuery outputs.
+            from google.cloud import bigquery
+
             # Build a BigQuery Client using the same credentials as JobServiceClient
             bq_client = bigquery.Client(
                 project=self.project,
@@ -858,6 +1040,420 @@ class BatchPredictionJob(_Job):
                 f"on your prediction output:\n{output_info}"
             )
 
+    def _assert_outputs_are_available(self) -> None:
+        """Raises RuntimeError unless this BatchPredictionJob has succeeded."""
+        self._assert_gca_resource_is_available()
+
+        if self.state != gca_job_state.JobState.JOB_STATE_SUCCEEDED:
+            raise RuntimeError(
+                f"Cannot read outputs until BatchPredictionJob has succeeded, "
+                f"current state: {self._gca_resource.state}"
+            )
+
+    def _assert_bigquery_output_table_is_available(self) -> None:
+        """Raises RuntimeError if the BigQuery predictions table was not written."""
+        if not self._gca_resource.output_info.bigquery_output_table:
+            raise RuntimeError(
+                "A BigQuery table with predictions was not found, this "
+                f"might be due to errors. Visit {self._dashboard_uri()} for details."
+            )
+
+    def iter_predictions(
+        self,
+        include_errors: bool = False,
+        max_concurrent_downloads: int = 8,
+    ) -> Iterator[Dict[str, Any]]:
+        """Returns an iterator over the decoded prediction records of this job.
+
+        For GCS outputs, the JSON Lines or CSV shards are downloaded
+        concurrently, a bounded number ahead of the consumer, and decoded line
+        by line. Records are yielded in shard order, prediction shards first.
+        CSV records map the header of their shard to the values of a row, as
+        strings. For BigQuery
+        outputs, the tables are read with the BigQuery Storage read API, see
+        `iter_prediction_batches`, and each row is yielded as a dict.
+
+        Example Usage:
+
+            for record in batch_prediction_job.iter_predictions():
+                print(record["instance"], record["prediction"])
+
+        Args:
+            include_errors (bool):
+                Optional. Whether to also yield the records of instances that
+                failed, which hold an "error" instead of a "prediction".
+            max_concurrent_downloads (int):
+                Optional. The maximum number of shards downloaded ahead of the
+                consumer, or of BigQuery read streams read at the same time.
+                Bounds memory use to that many shards or record batches.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The decoded records of the output.
+
+        Raises:
+            RuntimeError:
+                If BatchPredictionJob is in a JobState other than SUCCEEDED,
+                since outputs cannot be retrieved until the Job has finished.
+            NotImplementedError:
+                If the job wrote GCS predictions in a format other than JSON
+                Lines or CSV.
+        """
+        self._assert_outputs_are_available()
+
+        if self._gca_resource.output_info.bigquery_output_dataset:
+            self._assert_bigquery_output_table_is_available()
+            return (
+                row
+                for table in self._get_bigquery_output_tables(include_errors)
+                for record_batch in self._iter_bigquery_record_batches(
+                    table=table, max_concurrent_streams=max_concurrent_downloads
+                )
+                for row in self._iter_record_batch_rows(record_batch)
+            )
+
+        blobs = self.iter_outputs()
+
+        predictions_format = self._gca_resource.output_config.predictions_format
+        if predictions_format == "jsonl":
+            iter_records = self._iter_jsonl_records
+        elif predictions_format == "csv":
+            iter_records = self._iter_csv_records
+        else:
+            raise NotImplementedError(
+                f"Decoding predictions is only supported for jsonl and csv "
+                f"outputs in GCS, not for {predictions_format} outputs."
+            )
+
+        prefixes = _BATCH_PREDICTION_RESULTS_PREFIXES
+        if include_errors:
+            prefixes += _BATCH_PREDICTION_ERRORS_PREFIXES
+        shards = sorted(
+            (
+                blob
+                for blob in blobs
+                if blob.name.rsplit("/", 1)[-1].startswith(prefixes)
+            ),
+            key=lambda blob: (
+                blob.name.rsplit("/", 1)[-1].startswith(
+                    _BATCH_PREDICTION_ERRORS_PREFIXES
+                ),
+                blob.name,
+            ),
+        )
+
+        return iter_records(shards, max_concurrent_downloads=max_concurrent_downloads)
+
+    @staticmethod
+    def _iter_jsonl_records(
+        blobs: List[storage.Blob],
+        max_concurrent_downloads: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """Streams JSON Lines blobs concurrently and decodes them in order.
+
+        Args:
+            blobs (List[storage.Blob]):
+                Required. JSON Lines blobs, in the order to decode them.
+            max_concurrent_downloads (int):
+                Required. The maximum number of blobs read ahead of the
+                consumer.
+
+        Yields:
+            Dict[str, Any]: The decoded records.
+        """
+        for line in gcs_utils.iter_blob_lines(
+            blobs, max_concurrent_downloads=max_concurrent_downloads
+        ):
+            if line.strip():
+                yield json.loads(line)
+
+    @staticmethod
+    def _iter_record_batch_rows(
+        record_batch: "pyarrow.RecordBatch",  # noqa: F821 - skip check for undefined name 'pyarrow'
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields the rows of a record batch as dicts.
+
+        Built from `to_pydict`, since `RecordBatch.to_pylist` requires pyarrow
+        7.0.0.
+
+        Args:
+            record_batch (pyarrow.RecordBatch):
+                Required. The record batch to decode.
+
+        Yields:
+            Dict[str, Any]: The values of each row by column name.
+        """
+        columns = record_batch.to_pydict()
+        for values in zip(*columns.values()):
+            yield dict(zip(columns, values))
+
+    @staticmethod
+    def _iter_csv_records(
+        blobs: List[storage.Blob],
+        max_concurrent_downloads: int,
+    ) -> Iterator[Dict[str, str]]:
+        """Streams CSV blobs concurrently and decodes them in order.
+
+        Every blob starts with its own header row.
+
+        Args:
+            blobs (List[storage.Blob]):
+                Required. CSV blobs, in the order to decode them.
+            max_concurrent_downloads (int):
+                Required. The maximum number of blobs read ahead of the
+                consumer.
+
+        Yields:
+            Dict[str, str]: The decoded records.
+        """
+        for blob_lines in gcs_utils.iter_lines_by_blob(
+            blobs, max_concurrent_downloads=max_concurrent_downloads
+        ):
+            # The reader joins the lines of values quoted across line breaks.
+            yield from csv.DictReader(codecs.iterdecode(blob_lines, "utf-8"))
+
+    def to_dataframe(
+        self,
+        include_errors: bool = False,
+        max_concurrent_downloads: int = 8,
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Returns the decoded prediction records of this job as a DataFrame.
+
+        Args:
+            include_errors (bool):
+                Optional. Whether to also include the records of instances that
+                failed, which hold an "error" instead of a "prediction".
+            max_concurrent_downloads (int):
+                Optional. The maximum number of shards downloaded at the same time.
+
+        Returns:
+            pd.DataFrame: One row per record, with a column per top-level key,
+            such as "instance" and "prediction".
+
+        Raises:
+            ImportError: If pandas is not installed when using this method.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                f"Pandas is not installed. Please install pandas to use "
+                f"{self.to_dataframe.__name__}"
+            )
+
+        self._assert_outputs_are_available()
+        if self._gca_resource.output_info.bigquery_output_dataset:
+            self._assert_bigquery_output_table_is_available()
+            frames = [
+                self._read_bigquery_table(
+                    table=table, max_concurrent_streams=max_concurrent_downloads
+                ).to_pandas(split_blocks=True, self_destruct=True)
+                for table in self._get_bigquery_output_tables(include_errors)
+            ]
+            return (
+                pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            )
+
+        return pd.DataFrame(
+            list(
+                self.iter_predictions(
+                    include_errors=include_errors,
+                    max_concurrent_downloads=max_concurrent_downloads,
+                )
+            )
+        )
+
+    def iter_prediction_batches(
+        self,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = 8,
+        max_queued_batches: Optional[int] = None,
+    ) -> Iterator[
+        "pyarrow.RecordBatch"  # noqa: F821 - skip check for undefined name 'pyarrow'
+    ]:
+        """Reads the full BigQuery predictions table of this job as Arrow batches.
+
+        Unlike `iter_outputs`, which pages through the table with the BigQuery
+        REST API, the table is read with the BigQuery Storage read API over
+        several streams in parallel. Only the selected columns are read.
+
+        Example Usage:
+
+            for record_batch in batch_prediction_job.iter_prediction_batches(
+                columns=["prediction"]
+            ):
+                analyze(record_batch.to_pandas())
+
+        Args:
+            columns (List[str]):
+                Optional. Names of the columns to read. Reads all columns if not set.
+            max_concurrent_streams (int):
+                Optional. The maximum number of read streams read at the same time.
+            max_queued_batches (int):
+                Optional. The maximum number of decoded record batches waiting
+                to be consumed. Defaults to twice `max_concurrent_streams`.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: The record batches of the table.
+            Batches of different read streams are interleaved.
+
+        Raises:
+            RuntimeError:
+                If BatchPredictionJob is in a JobState other than SUCCEEDED, or
+                the predictions table was not written.
+            NotImplementedError:
+                If the job did not write its predictions to BigQuery.
+        """
+        self._assert_outputs_are_available()
+        if not self._gca_resource.output_info.bigquery_output_dataset:
+            raise NotImplementedError(
+                "Reading prediction batches is only supported for BigQuery outputs."
+            )
+
+        self._assert_bigquery_output_table_is_available()
+
+        return self._iter_bigquery_record_batches(
+            table=self._gca_resource.output_info.bigquery_output_table,
+            columns=columns,
+            max_concurrent_streams=max_concurrent_streams,
+            max_queued_batches=max_queued_batches,
+        )
+
+    def to_arrow(
+        self,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = 8,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Reads the full BigQuery predictions table of this job into a pyarrow Table.
+
+        Args:
+            columns (List[str]):
+                Optional. Names of the columns to read. Reads all columns if not set.
+            max_concurrent_streams (int):
+                Optional. The maximum number of read streams read at the same time.
+
+        Returns:
+            pyarrow.Table: The predictions table.
+
+        Raises:
+            RuntimeError:
+                If BatchPredictionJob is in a JobState other than SUCCEEDED, or
+                the predictions table was not written.
+            NotImplementedError:
+                If the job did not write its predictions to BigQuery.
+        """
+        self._assert_outputs_are_available()
+        if not self._gca_resource.output_info.bigquery_output_dataset:
+            raise NotImplementedError(
+                "Reading predictions into Arrow is only supported for BigQuery outputs."
+            )
+
+        self._assert_bigquery_output_table_is_available()
+
+        return self._read_bigquery_table(
+            table=self._gca_resource.output_info.bigquery_output_table,
+            columns=columns,
+            max_concurrent_streams=max_concurrent_streams,
+        )
+
+    def _get_bigquery_output_tables(self, include_errors: bool) -> List[str]:
+        """Returns the names of the output tables to read in the output dataset."""
+        tables = [self._gca_resource.output_info.bigquery_output_table]
+        if include_errors:
+            tables.append(_BATCH_PREDICTION_ERRORS_TABLE)
+        return tables
+
+    def _read_bigquery_table(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = 8,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Reads an output table of this job into a pyarrow Table.
+
+        Args:
+            table (str):
+                Required. Name of the table in the output dataset.
+            columns (List[str]):
+                Optional. Names of the columns to read.
+            max_concurrent_streams (int):
+                Optional. The maximum number of read streams read at the same time.
+
+        Returns:
+            pyarrow.Table: The table.
+        """
+        import pyarrow
+
+        record_batches = list(
+            self._iter_bigquery_record_batches(
+                table=table,
+                columns=columns,
+                max_concurrent_streams=max_concurrent_streams,
+            )
+        )
+        if not record_batches:
+            return pyarrow.table({})
+        return pyarrow.Table.from_batches(record_batches)
+
+    def _iter_bigquery_record_batches(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = 8,
+        max_queued_batches: Optional[int] = None,
+    ) -> Iterator[
+        "pyarrow.RecordBatch"  # noqa: F821 - skip check for undefined name 'pyarrow'
+    ]:
+        """Reads an output table of this job with the BigQuery Storage read API.
+
+        Args:
+            table (str):
+                Required. Name of the table in the output dataset.
+            columns (List[str]):
+                Optional. Names of the columns to read.
+            max_concurrent_streams (int):
+                Optional. The maximum number of read streams read at the same time.
+            max_queued_batches (int):
+                Optional. The maximum number of decoded record batches waiting
+                to be consumed.
+
+        Yields:
+            pyarrow.RecordBatch: The record batches of the table.
+        """
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            raise ImportError(
+                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"{self.iter_prediction_batches.__name__}"
+            )
+
+        # Format of `bigquery_output_dataset` from service is `bq://projectId.bqDatasetId`
+        bq_dataset = self._gca_resource.output_info.bigquery_output_dataset
+        if bq_dataset.startswith("bq://"):
+            bq_dataset = bq_dataset[5:]
+        bq_project, bq_dataset_id = bq_dataset.split(".", 1)
+
+        read_client = bigquery_storage.BigQueryReadClient(
+            credentials=self.api_client._transport._credentials
+        )
+        read_session = read_client.create_read_session(
+            parent=f"projects/{self.project}",
+            read_session=bigquery_storage.types.ReadSession(
+                table=f"projects/{bq_project}/datasets/{bq_dataset_id}/tables/{table}",
+                data_format=bigquery_storage.types.DataFormat.ARROW,
+                read_options=bigquery_storage.types.ReadSession.TableReadOptions(
+                    selected_fields=columns or []
+                ),
+            ),
+        )
+
+        yield from bigquery_utils.iter_read_session_record_batches(
+            read_client=read_client,
+            read_session=read_session,
+            max_concurrent_streams=max_concurrent_streams,
+            max_queued_batches=max_queued_batches,
+        )
+
     def wait_for_resource_creation(self) -> None:
         """Waits until resource has been created."""
         self._wait_for_resource_creation()
@@ -934,7 +1530,7 @@ class _RunnableJob(_Job):
         """
 
         # Fetch the Job again for most up-to-date web access uris
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._get_web_access_uris()
 
     @abc.abstractmethod
@@ -955,20 +1551,18 @@ class _RunnableJob(_Job):
         """
 
         # Used these numbers so failures surface fast
-        wait = 5  # start at five seconds
-        log_wait = 5
+        log_wait = 5  # start at five seconds
         max_wait = 60 * 5  # 5 minute wait
         multiplier = 2  # scale wait by 2 every iteration
 
         previous_time = time.time()
-        while self.state not in _JOB_COMPLETE_STATES:
+        for _ in job_poller.global_poller.watch(self):
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 self._log_job_state()
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
             self._log_web_access_uris()
-            time.sleep(wait)
 
         self._log_job_state()
 
@@ -1053,7 +1647,7 @@ class CustomJob(_RunnableJob):
         self,
         # TODO(b/223262536): Make display_name parameter fully optional in next major release
         display_name: str,
-        worker_pool_specs: Union[List[Dict], List[aiplatform.gapic.WorkerPoolSpec]],
+        worker_pool_specs: Union[List[Dict], List["aiplatform.gapic.WorkerPoolSpec"]],
         base_output_dir: Optional[str] = None,
         project: Optional[str] = None,
         location: Optional[str] = None,
@@ -15,8 +15,12 @@
 # limitations under the License.
 #
 
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+import itertools
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import weakref
 
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import base
@@ -35,6 +39,12 @@ import grpc
 
 _LOGGER = base.Logger(__name__)
 
+# Port the match service of a deployed index listens on.
+_MATCH_GRPC_PORT = 10000
+
+# Tag of the packed `float_val` field (number 2, length-delimited) of MatchRequest.
+_FLOAT_VAL_TAG = b"\x12"
+
 
 @dataclass
 class MatchNeighbor:
@@ -579,6 +589,8 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             "index_endpoint", "Deployed index", self
         )
 
+        self._close_matcher(deployed_index_id)
+
         # update local resource
         self._sync_gca_resource()
 
@@ -625,6 +637,8 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             "index_endpoint", "Undeployed index", self
         )
 
+        self._close_matcher(deployed_index_id)
+
         return self
 
     def mutate_deployed_index(
@@ -746,6 +760,8 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         # block before returning
         operation_future.result()
 
+        self._close_matcher(deployed_index_id)
+
         # update local resource
         self._sync_gca_resource()
 
@@ -795,16 +811,52 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         self._assert_gca_resource_is_available()
         return self._gca_resource.description
 
+    def matcher(
+        self, deployed_index_id: str, num_channels: int = 4
+    ) -> "MatchingEngineIndexMatcher":
+        """Creates a long-lived matcher for the specified deployed index.
+
+        The matcher resolves the match server address once and keeps a pool of
+        open gRPC channels to it, so it should be reused across queries and
+        closed when no longer needed.
+
+        Example Usage:
+
+            with my_index_endpoint.matcher(deployed_index_id="my_index") as matcher:
+                neighbors = matcher.match(queries=np.zeros((8, 128), np.float32))
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            num_channels (int):
+                Optional. Number of gRPC channels kept open to the match server.
+
+        Returns:
+            MatchingEngineIndexMatcher - Matcher for the deployed index.
+        """
+        return MatchingEngineIndexMatcher(
+            deployed_index_id=deployed_index_id,
+            target=self._get_match_target(deployed_index_id),
+            num_channels=num_channels,
+        )
+
     def match(
-        self, deployed_index_id: str, queries: List[List[float]], num_neighbors: int = 1
+        self,
+        deployed_index_id: str,
+        queries: Union[List[List[float]], "np.ndarray"],  # noqa: F821
+        num_neighbors: int = 1,
     ) -> List[List[MatchNeighbor]]:
         """Retrieves nearest neighbors for the given embedding queries on the specified deployed index.
 
+        Channels to the match server are opened on first use and reused by
+        later calls for the same deployed index.
+
         Args:
             deployed_index_id (str):
                 Required. The ID of the DeployedIndex to match the queries against.
-            queries (List[List[float]]):
-                Required. A list of queries. Each query is a list of floats, representing a single embedding.
+            queries (Union[List[List[float]], np.ndarray]):
+                Required. A list of queries or a 2-D float32 NumPy array. Each
+                query is a single embedding.
             num_neighbors (int):
                 Required. The number of nearest neighbors to be retrieved from database for
                 each query.
@@ -812,7 +864,28 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         Returns:
             List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
         """
+        matchers = self.__dict__.setdefault("_matchers", {})
+        matcher = matchers.get(deployed_index_id)
+        if matcher is None:
+            with self.__dict__.setdefault("_matchers_lock", threading.Lock()):
+                matcher = matchers.get(deployed_index_id)
+                if matcher is None:
+                    matcher = self.matcher(deployed_index_id=deployed_index_id)
+                    matchers[deployed_index_id] = matcher
+
+        return matcher.match(queries=queries, num_neighbors=num_neighbors)
+
+    def _get_match_target(self, deployed_index_id: str) -> str:
+        """Returns the address of the match server of a deployed index.
 
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex.
+        Returns:
+            The `host:port` address of the match server.
+        Raises:
+            RuntimeError: If no index with this ID is deployed to this endpoint.
+        """
         # Find the deployed index by id
         deployed_indexes = [
             deployed_index
@@ -826,32 +899,285 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         # Retrieve server ip from deployed index
         server_ip = deployed_indexes[0].private_endpoints.match_grpc_address
 
-        # Set up channel and stub
-        channel = grpc.insecure_channel("{}:10000".format(server_ip))
-        stub = match_service_pb2_grpc.MatchServiceStub(channel)
+        return f"{server_ip}:{_MATCH_GRPC_PORT}"
+
+    def _close_matcher(self, deployed_index_id: str):
+        """Closes the cached matcher of a deployed index, if any, so the server
+        address is resolved again on the next match."""
+        matcher = self.__dict__.get("_matchers", {}).pop(deployed_index_id, None)
+        if matcher:
+            matcher.close()
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encodes a non-negative integer as a protobuf base 128 varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+class MatchingEngineIndexMatcher:
+    """Long-lived client for the match service of one deployed index.
+
+    The matcher keeps `num_channels` gRPC channels open to the match server
+    and spreads requests across them. NumPy float32 query matrices are
+    serialized directly from the array buffer instead of through Python
+    float lists.
+    """
+
+    def __init__(
+        self,
+        deployed_index_id: str,
+        target: str,
+        num_channels: int = 4,
+    ):
+        """Opens the channel pool.
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            target (str):
+                Required. The `host:port` address of the match server.
+            num_channels (int):
+                Optional. Number of gRPC channels kept open to the match server.
+        Raises:
+            ValueError: If `num_channels` is less than 1.
+        """
+        if num_channels < 1:
+            raise ValueError("num_channels must be at least 1.")
+
+        self._deployed_index_id = deployed_index_id
+        self._target = target
+        # Without a local subchannel pool, channels to the same target share a
+        # single connection.
+        self._channel_options = [("grpc.use_local_subchannel_pool", 1)]
+        self._channels = [
+            grpc.insecure_channel(target, options=self._channel_options)
+            for _ in range(num_channels)
+        ]
+        self._stubs = [
+            match_service_pb2_grpc.MatchServiceStub(channel)
+            for channel in self._channels
+        ]
+        self._counter = itertools.count()
+        # asyncio channels and their stubs by the event loop they are bound to.
+        self._async_channels = weakref.WeakKeyDictionary()
+        self._async_stubs = weakref.WeakKeyDictionary()
+
+    @property
+    def deployed_index_id(self) -> str:
+        """The ID of the DeployedIndex queries are matched against."""
+        return self._deployed_index_id
+
+    @property
+    def target(self) -> str:
+        """The address of the match server."""
+        return self._target
+
+    def match(
+        self,
+        queries: Union[List[List[float]], "np.ndarray"],  # noqa: F821
+        num_neighbors: int = 1,
+        timeout: Optional[float] = None,
+    ) -> List[List[MatchNeighbor]]:
+        """Retrieves nearest neighbors for the given embedding queries in one
+        BatchMatch request.
+
+        Args:
+            queries (Union[List[List[float]], np.ndarray]):
+                Required. A list of queries or a 2-D float32 NumPy array. Each
+                query is a single embedding.
+            num_neighbors (int):
+                Optional. The number of nearest neighbors to be retrieved for
+                each query.
+            timeout (float):
+                Optional. The timeout for the request in seconds.
+
+        Returns:
+            List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
+        """
+        response = self._next_stub().BatchMatch(
+            self._build_batch_request(queries, num_neighbors), timeout=timeout
+        )
+        return self._parse_batch_response(response)
+
+    def match_iter(
+        self,
+        queries: Union[List[List[float]], "np.ndarray"],  # noqa: F821
+        num_neighbors: int = 1,
+        batch_size: int = 256,
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[List[MatchNeighbor]]:
+        """Streams nearest neighbors for a large set of queries.
+
+        Queries are split into BatchMatch requests of `batch_size` that are
+        pipelined over the channel pool. Neighbors are yielded in query order
+        as soon as their request completes.
+
+        Args:
+            queries (Union[List[List[float]], np.ndarray]):
+                Required. A list of queries or a 2-D float32 NumPy array. Each
+                query is a single embedding.
+            num_neighbors (int):
+                Optional. The number of nearest neighbors to be retrieved for
+                each query.
+            batch_size (int):
+                Optional. Number of queries sent in each BatchMatch request.
+            max_in_flight (int):
+                Optional. Maximum number of requests in flight. Defaults to the
+                number of channels.
+            timeout (float):
+                Optional. The timeout for each request in seconds.
+
+        Yields:
+            List[MatchNeighbor] - The nearest neighbors of each query.
+        Raises:
+            ValueError: If `batch_size` or `max_in_flight` is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        max_in_flight = max_in_flight or len(self._channels)
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+
+        batches = (
+            queries[start : start + batch_size]
+            for start in range(0, len(queries), batch_size)
+        )
+        in_flight = []
+        try:
+            for batch in batches:
+                if len(in_flight) == max_in_flight:
+                    yield from self._parse_batch_response(in_flight.pop(0).result())
+                in_flight.append(
+                    self._next_stub().BatchMatch.future(
+                        self._build_batch_request(batch, num_neighbors),
+                        timeout=timeout,
+                    )
+                )
+            while in_flight:
+                yield from self._parse_batch_response(in_flight.pop(0).result())
+        finally:
+            for call in in_flight:
+                call.cancel()
+
+    async def match_async(
+        self,
+        queries: Union[List[List[float]], "np.ndarray"],  # noqa: F821
+        num_neighbors: int = 1,
+        timeout: Optional[float] = None,
+    ) -> List[List[MatchNeighbor]]:
+        """Retrieves nearest neighbors without blocking the event loop.
+
+        Args:
+            queries (Union[List[List[float]], np.ndarray]):
+                Required. A list of queries or a 2-D float32 NumPy array. Each
+                query is a single embedding.
+            num_neighbors (int):
+                Optional. The number of nearest neighbors to be retrieved for
+                each query.
+            timeout (float):
+                Optional. The timeout for the request in seconds.
+
+        Returns:
+            List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
+        """
+        loop = asyncio.get_running_loop()
+        stub = self._async_stubs.get(loop)
+        if stub is None:
+            # asyncio channels are bound to the loop they are created on.
+            channel = grpc.aio.insecure_channel(
+                self._target, options=self._channel_options
+            )
+            stub = match_service_pb2_grpc.MatchServiceStub(channel)
+            self._async_channels[loop] = channel
+            self._async_stubs[loop] = stub
 
-        # Create the batch match request
-        batch_request = match_service_pb2.BatchMatchRequest()
+        response = await stub.BatchMatch(
+            self._build_batch_request(queries, num_neighbors), timeout=timeout
+        )
+        return self._parse_batch_response(response)
+
+    def close(self):
+        """Closes the channels to the match server."""
+        for channel in self._channels:
+            channel.close()
+        for loop, channel in list(self._async_channels.items()):
+            if loop.is_closed():
+                continue
+            # asyncio channels are closed on the loop they are bound to.
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(channel.close(), loop)
+            else:
+                loop.run_until_complete(channel.close())
+        self._async_channels.clear()
+        self._async_stubs.clear()
+
+    def __enter__(self) -> "MatchingEngineIndexMatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _next_stub(self) -> match_service_pb2_grpc.MatchServiceStub:
+        """Returns the stub of the next channel in round-robin order."""
+        return self._stubs[next(self._counter) % len(self._stubs)]
+
+    def _build_batch_request(
+        self, queries: Any, num_neighbors: int
+    ) -> match_service_pb2.BatchMatchRequest:
+        """Builds a BatchMatchRequest for the deployed index.
+
+        Args:
+            queries (Union[List[List[float]], np.ndarray]):
+                Required. A list of queries or a 2-D NumPy array.
+            num_neighbors (int):
+                Required. The number of nearest neighbors for each query.
+        Returns:
+            The BatchMatchRequest.
+        """
         batch_request_for_index = (
-            match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex()
+            match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex(
+                deployed_index_id=self._deployed_index_id
+            )
         )
-        batch_request_for_index.deployed_index_id = deployed_index_id
-        batch_request_for_index.requests.extend(
-            [
-                match_service_pb2.MatchRequest(
+
+        if hasattr(queries, "dtype"):
+            # NumPy arrays are encoded straight from their little-endian
+            # float32 buffer as the packed `float_val` field.
+            queries = queries.astype("<f4", copy=False)
+            for query in queries:
+                request = batch_request_for_index.requests.add(
                     num_neighbors=num_neighbors,
-                    deployed_index_id=deployed_index_id,
-                    float_val=query,
+                    deployed_index_id=self._deployed_index_id,
                 )
-                for query in queries
-            ]
-        )
-        batch_request.requests.append(batch_request_for_index)
+                payload = query.tobytes()
+                request.MergeFromString(
+                    _FLOAT_VAL_TAG + _encode_varint(len(payload)) + payload
+                )
+        else:
+            batch_request_for_index.requests.extend(
+                [
+                    match_service_pb2.MatchRequest(
+                        num_neighbors=num_neighbors,
+                        deployed_index_id=self._deployed_index_id,
+                        float_val=query,
+                    )
+                    for query in queries
+                ]
+            )
 
-        # Perform the request
-        response = stub.BatchMatch(batch_request)
+        return match_service_pb2.BatchMatchRequest(requests=[batch_request_for_index])
 
-        # Wrap the results in MatchNeighbor objects and return
+    @staticmethod
+    def _parse_batch_response(
+        response: match_service_pb2.BatchMatchResponse,
+    ) -> List[List[MatchNeighbor]]:
+        """Wraps the results of a BatchMatchResponse in MatchNeighbor objects."""
         return [
             [
                 MatchNeighbor(id=neighbor.id, distance=neighbor.distance)
@@ -15,14 +15,143 @@
 # limitations under the License.
 #
 
-from typing import Dict, Union, Optional
+from concurrent import futures
+import datetime
+import logging
+from typing import Dict, List, Union, Optional, Sequence, Set
 
 from google.cloud.aiplatform.metadata import constants
 from google.cloud.aiplatform.metadata.artifact import _Artifact
 from google.cloud.aiplatform.metadata.context import _Context
 from google.cloud.aiplatform.metadata.execution import _Execution
+from google.cloud.aiplatform.metadata.metadata_logger import _BufferedMetadataLogger
 from google.cloud.aiplatform.metadata.metadata_store import _MetadataStore
 
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of run lineage queries issued at the same time when building
+# the DataFrame of an Experiment or Pipeline.
+_MAX_CONCURRENT_LINEAGE_QUERIES = 16
+
+
+class _RunArtifactsCache:
+    """Caches the artifacts connected to the runs of an Experiment or Pipeline.
+
+    The lineage of a run is only queried when the run is new or its execution
+    was updated since it was cached, and stale lineages are queried
+    concurrently. Metadata of cached artifacts is refreshed with a single list
+    of the artifacts of the cached schemas updated since the previous refresh.
+    """
+
+    def __init__(self):
+        # Maps run execution resource names to their update time when their
+        # lineage was queried.
+        self._run_update_times: Dict[str, datetime.datetime] = {}
+        # Maps run execution resource names to the resource names of their
+        # input and output artifacts.
+        self._run_artifact_names: Dict[str, List[str]] = {}
+        # Maps artifact resource names to their metadata.
+        self._artifact_metadata: Dict[str, Dict] = {}
+        # Schema titles of the cached artifacts, ie: system.Metrics.
+        self._artifact_schema_titles: Set[str] = set()
+        # Latest update time of the cached artifacts.
+        self._artifacts_update_time: Optional[datetime.datetime] = None
+
+    def refresh(self, run_executions: Sequence[_Execution]):
+        """Brings the cached artifacts of the given runs up to date.
+
+        Args:
+            run_executions (Sequence[_Execution]):
+                Required. All the run executions of the Experiment or Pipeline.
+        """
+        if self._artifacts_update_time is not None:
+            self._refresh_artifact_metadata()
+
+        stale_run_executions = [
+            run_execution
+            for run_execution in run_executions
+            if run_execution.resource_name not in self._run_update_times
+            or self._run_update_times[run_execution.resource_name]
+            != run_execution._gca_resource.update_time
+        ]
+        if stale_run_executions:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(
+                    _MAX_CONCURRENT_LINEAGE_QUERIES, len(stale_run_executions)
+                )
+            ) as executor:
+                run_artifacts = executor.map(
+                    lambda run_execution: run_execution.query_input_and_output_artifacts(),
+                    stale_run_executions,
+                )
+                for run_execution, artifacts in zip(
+                    stale_run_executions, run_artifacts
+                ):
+                    self._run_update_times[
+                        run_execution.resource_name
+                    ] = run_execution._gca_resource.update_time
+                    self._run_artifact_names[run_execution.resource_name] = [
+                        metadata_artifact.resource_name
+                        for metadata_artifact in artifacts
+                    ]
+                    for metadata_artifact in artifacts:
+                        self._cache_artifact(metadata_artifact)
+
+        run_execution_names = {
+            run_execution.resource_name for run_execution in run_executions
+        }
+        for run_execution_name in list(self._run_update_times):
+            if run_execution_name not in run_execution_names:
+                del self._run_update_times[run_execution_name]
+                del self._run_artifact_names[run_execution_name]
+
+    def get_artifact_metadata(self, run_execution: _Execution) -> List[Dict]:
+        """Returns the metadata of the cached artifacts of a run.
+
+        Args:
+            run_execution (_Execution):
+                Required. A run execution passed to the last `refresh`.
+
+        Returns:
+            The metadata of the input and output artifacts of the run.
+        """
+        return [
+            self._artifact_metadata[artifact_name]
+            for artifact_name in self._run_artifact_names[run_execution.resource_name]
+        ]
+
+    def _refresh_artifact_metadata(self):
+        """Refreshes the metadata of the cached artifacts updated since the last refresh."""
+        # The metadata store may be shared with pipelines creating artifacts of
+        # other schemas, which are not listed.
+        schema_filter = " OR ".join(
+            f'schema_title="{schema_title}"'
+            for schema_title in sorted(self._artifact_schema_titles)
+        )
+        # Artifacts updated at the latest seen update time are listed again, in
+        # case they were updated again within the same timestamp.
+        updated_artifacts = _Artifact.list(
+            filter=(
+                f'update_time>="{self._artifacts_update_time.rfc3339()}" '
+                f"AND ({schema_filter})"
+            )
+        )
+        for metadata_artifact in updated_artifacts:
+            if metadata_artifact.resource_name in self._artifact_metadata:
+                self._cache_artifact(metadata_artifact)
+
+    def _cache_artifact(self, metadata_artifact: _Artifact):
+        self._artifact_metadata[
+            metadata_artifact.resource_name
+        ] = metadata_artifact.metadata
+        self._artifact_schema_titles.add(metadata_artifact.schema_title)
+        update_time = metadata_artifact._gca_resource.update_time
+        if update_time is not None and (
+            self._artifacts_update_time is None
+            or update_time > self._artifacts_update_time
+        ):
+            self._artifacts_update_time = update_time
+
 
 class _MetadataService:
     """Contains the exposed APIs to interact with the Managed Metadata Service."""
@@ -31,12 +160,42 @@ class _MetadataService:
         self._experiment = None
         self._run = None
         self._metrics = None
+        self._logger = _BufferedMetadataLogger()
+        # Maps Experiment and Pipeline Context resource names to the artifacts
+        # of their runs, so that repeated DataFrame queries only fetch changes.
+        self._run_artifacts_caches: Dict[str, _RunArtifactsCache] = {}
 
     def reset(self):
         """Reset all _MetadataService fields to None"""
+        self._flush_previous_run("resetting")
         self._experiment = None
         self._run = None
         self._metrics = None
+        self._run_artifacts_caches = {}
+
+    def flush(self):
+        """Waits until all logged params and metrics are written.
+
+        Params and metrics are logged in the background. They are also flushed
+        when a new run is started and when the interpreter exits.
+        """
+        self._logger.flush()
+
+    def _flush_previous_run(self, action: str):
+        """Flushes the params and metrics logged so far, logging the error of
+        failed updates instead of raising it, since they belong to the run
+        that is left.
+
+        Args:
+            action (str):
+                Required. What the run is left for, for the error message.
+        """
+        try:
+            self.flush()
+        except Exception as e:
+            # Updates that failed with a transient error stay buffered and are
+            # retried in the background.
+            _LOGGER.error("Failed to log metadata before %s: %s", action, e)
 
     @property
     def experiment_name(self) -> Optional[str]:
@@ -98,6 +257,7 @@ class _MetadataService:
                 "No experiment set for this run. Make sure to call aiplatform.init(experiment='my-experiment') "
                 "before trying to start_run. "
             )
+        self._flush_previous_run("starting a new run")
         run_execution_id = f"{self._experiment.name}-{run}"
         run_execution = _Execution.get_or_create(
             resource_id=run_execution_id,
@@ -136,23 +296,21 @@ class _MetadataService:
     def log_params(self, params: Dict[str, Union[float, int, str]]):
         """Log single or multiple parameters with specified key and value pairs.
 
+        The parameters are written in the background, see `flush`.
+
         Args:
             params (Dict):
                 Required. Parameter key/value pairs.
         """
 
         self._validate_experiment_and_run(method_name="log_params")
-        # query the latest run execution resource before logging.
-        execution = _Execution.get_or_create(
-            resource_id=self._run.name,
-            schema_title=constants.SYSTEM_RUN,
-            schema_version=constants.SCHEMA_VERSIONS[constants.SYSTEM_RUN],
-        )
-        execution.update(metadata=params)
+        self._logger.log(self._run, params)
 
     def log_metrics(self, metrics: Dict[str, Union[float, int]]):
         """Log single or multiple Metrics with specified key and value pairs.
 
+        The metrics are written in the background, see `flush`.
+
         Args:
             metrics (Dict):
                 Required. Metrics key/value pairs. Only float and int are supported format for value.
@@ -163,13 +321,7 @@ class _MetadataService:
 
         self._validate_experiment_and_run(method_name="log_metrics")
         self._validate_metrics_value_type(metrics)
-        # query the latest metrics artifact resource before logging.
-        artifact = _Artifact.get_or_create(
-            resource_id=self._metrics.name,
-            schema_title=constants.SYSTEM_METRICS,
-            schema_version=constants.SCHEMA_VERSIONS[constants.SYSTEM_METRICS],
-        )
-        artifact.update(metadata=metrics)
+        self._logger.log(self._metrics, metrics)
 
     def get_experiment_df(
         self, experiment: Optional[str] = None
@@ -210,6 +362,7 @@ class _MetadataService:
         if not experiment:
             experiment = self._experiment.name
 
+        self.flush()
         source = "experiment"
         experiment_resource_name = self._get_experiment_or_pipeline_resource_name(
             name=experiment,
@@ -237,6 +390,7 @@ class _MetadataService:
             ValueError if given experiment is not associated with a wrong schema.
         """
 
+        self.flush()
         source = "pipeline"
         pipeline_resource_name = self._get_experiment_or_pipeline_resource_name(
             name=pipeline, source=source, expected_schema=constants.SYSTEM_PIPELINE
@@ -311,6 +465,10 @@ class _MetadataService:
     ) -> "pd.DataFrame":  # noqa: F821
         """Get metrics and parameters associated with a given Context into a Dataframe.
 
+        The lineage of the runs is queried concurrently and cached, so that
+        subsequent calls for the same Context only query the lineage of new or
+        updated runs, plus a single list of the recently updated artifacts.
+
         Args:
             context_id (str):
                 Name of the Experiment or Pipeline.
@@ -326,6 +484,11 @@ class _MetadataService:
         filter = f'schema_title="{constants.SYSTEM_RUN}" AND in_context("{context_resource_name}")'
         run_executions = _Execution.list(filter=filter)
 
+        run_artifacts_cache = self._run_artifacts_caches.setdefault(
+            context_resource_name, _RunArtifactsCache()
+        )
+        run_artifacts_cache.refresh(run_executions)
+
         context_summary = []
         for run_execution in run_executions:
             run_dict = {
@@ -338,10 +501,12 @@ class _MetadataService:
                 )
             )
 
-            for metric_artifact in run_execution.query_input_and_output_artifacts():
+            for artifact_metadata in run_artifacts_cache.get_artifact_metadata(
+                run_execution
+            ):
                 run_dict.update(
                     self._execution_to_column_named_metadata(
-                        "metric", metric_artifact.metadata
+                        "metric", artifact_metadata
                     )
                 )
 
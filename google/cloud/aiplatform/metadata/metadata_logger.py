@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import atexit
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from google.api_core import retry
+
+from google.cloud.aiplatform.metadata import resource
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of buffered updates that triggers a flush before the flush interval
+# has passed.
+_DEFAULT_MAX_BUFFERED_UPDATES = 100
+
+# Seconds after which buffered updates are flushed.
+_DEFAULT_FLUSH_INTERVAL_SECS = 5.0
+
+# Times the update of a resource is attempted before its buffered metadata is
+# dropped, when it keeps failing with transient errors.
+_MAX_UPDATE_ATTEMPTS = 5
+
+
+class _BufferedMetadataLogger:
+    """Buffers metadata updates of resources and applies them in the background.
+
+    Updates logged for the same resource are merged in memory, later values
+    overriding earlier ones for the same key, so flushing them sends a single
+    update request per resource. A background thread flushes the buffered
+    updates once `max_buffered_updates` updates are buffered or
+    `flush_interval_secs` after the first buffered update, whichever comes
+    first. Buffered updates are also flushed when the interpreter exits.
+
+    Logging never waits on the network. Each resource is read again right
+    before it is updated, so that only the buffered keys overwrite its
+    metadata and keys written meanwhile by other clients are kept. Updates
+    that fail with a transient error are kept buffered to be retried with the
+    next flush, up to `_MAX_UPDATE_ATTEMPTS` attempts. Other failed updates
+    are dropped, and the keys they held are logged.
+    """
+
+    def __init__(
+        self,
+        max_buffered_updates: int = _DEFAULT_MAX_BUFFERED_UPDATES,
+        flush_interval_secs: float = _DEFAULT_FLUSH_INTERVAL_SECS,
+    ):
+        """Initializes the logger.
+
+        Args:
+            max_buffered_updates (int):
+                Optional. The number of buffered updates that triggers a flush.
+            flush_interval_secs (float):
+                Optional. The maximum number of seconds an update is buffered
+                before it is flushed, unless a flush fails.
+        """
+        self._max_buffered_updates = max_buffered_updates
+        self._flush_interval_secs = flush_interval_secs
+        self._condition = threading.Condition()
+        # Serializes flushes so that updates of a resource are applied in order.
+        self._flush_lock = threading.Lock()
+        # Maps id(resource) to the resource and its merged buffered metadata.
+        self._buffered: Dict[int, Tuple[resource._Resource, Dict]] = {}
+        self._num_buffered_updates = 0
+        # Maps id(resource) to the number of failed attempts to update it.
+        self._failed_attempts: Dict[int, int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def log(self, metadata_resource: resource._Resource, metadata: Dict):
+        """Buffers an update of the metadata of a resource.
+
+        Args:
+            metadata_resource (resource._Resource):
+                Required. The resource to update.
+            metadata (Dict):
+                Required. The metadata to merge into the metadata of the resource.
+        """
+        with self._condition:
+            _, buffered_metadata = self._buffered.setdefault(
+                id(metadata_resource), (metadata_resource, {})
+            )
+            buffered_metadata.update(metadata)
+            self._num_buffered_updates += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="aiplatform-metadata-logger",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self._flush_at_exit)
+            if self._num_buffered_updates >= self._max_buffered_updates:
+                self._condition.notify_all()
+
+    def flush(self):
+        """Applies all buffered updates, waiting for them to complete.
+
+        Raises:
+            Exception: The first error of applying the buffered updates. The
+                updates that failed with a transient error stay buffered.
+        """
+        with self._flush_lock:
+            retried_errors, dropped_errors = self._apply(self._take_buffered())
+        errors = dropped_errors + retried_errors
+        if errors:
+            raise errors[0]
+
+    def _take_buffered(self) -> List[Tuple[resource._Resource, Dict]]:
+        """Removes the buffered updates from the buffer and returns them."""
+        with self._condition:
+            buffered = list(self._buffered.values())
+            self._buffered.clear()
+            self._num_buffered_updates = 0
+            return buffered
+
+    def _apply(
+        self, buffered: List[Tuple[resource._Resource, Dict]]
+    ) -> Tuple[List[Exception], List[Exception]]:
+        """Applies updates, buffering the ones that failed with a transient
+        error again.
+
+        Returns:
+            The errors of the updates buffered again, and of the dropped ones.
+        """
+        retried_errors = []
+        dropped_errors = []
+        for metadata_resource, metadata in buffered:
+            try:
+                # The update sends the whole metadata of the resource, so it
+                # is based on the latest metadata rather than the cached one.
+                metadata_resource._sync_gca_resource()
+                metadata_resource.update(metadata=metadata)
+            except Exception as e:
+                with self._condition:
+                    attempts = self._failed_attempts.get(id(metadata_resource), 0) + 1
+                    if (
+                        not retry.if_transient_error(e)
+                        or attempts >= _MAX_UPDATE_ATTEMPTS
+                    ):
+                        self._failed_attempts.pop(id(metadata_resource), None)
+                        dropped_errors.append(e)
+                        _LOGGER.error(
+                            "Failed to log metadata keys %s of %s after %d "
+                            "attempts, they are dropped: %s",
+                            sorted(metadata),
+                            metadata_resource.resource_name,
+                            attempts,
+                            e,
+                        )
+                        continue
+                    self._failed_attempts[id(metadata_resource)] = attempts
+                    retried_errors.append(e)
+                    _, buffered_metadata = self._buffered.setdefault(
+                        id(metadata_resource), (metadata_resource, {})
+                    )
+                    # Updates buffered meanwhile are more recent.
+                    self._buffered[id(metadata_resource)] = (
+                        metadata_resource,
+                        {**metadata, **buffered_metadata},
+                    )
+                    self._num_buffered_updates += 1
+            else:
+                with self._condition:
+                    self._failed_attempts.pop(id(metadata_resource), None)
+        return retried_errors, dropped_errors
+
+    def _run(self):
+        """Flushes the buffered updates by size or time, forever."""
+        while True:
+            with self._condition:
+                while not self._buffered:
+                    self._condition.wait()
+                self._condition.wait_for(
+                    lambda: self._num_buffered_updates >= self._max_buffered_updates,
+                    timeout=self._flush_interval_secs,
+                )
+            with self._flush_lock:
+                retried_errors, _ = self._apply(self._take_buffered())
+            for error in retried_errors:
+                _LOGGER.warning(
+                    "Failed to log metadata, it will be retried with the next "
+                    "flush: %s",
+                    error,
+                )
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except Exception as e:
+            _LOGGER.error("Failed to log metadata before exiting: %s", e)
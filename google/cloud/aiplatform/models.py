@@ -19,7 +19,17 @@ import proto
 import re
 import shutil
 import tempfile
-from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from google.api_core import operation
 from google.api_core import exceptions as api_exceptions
@@ -33,6 +43,7 @@ from google.cloud.aiplatform import jobs
 from google.cloud.aiplatform import models
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import gcs_utils
+from google.cloud.aiplatform.utils import prediction_utils
 from google.cloud.aiplatform import model_evaluation
 
 from google.cloud.aiplatform.compat.services import endpoint_service_client
@@ -177,7 +188,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
         The traffic percentage values must add up to 100, or map must be empty if
         the Endpoint is to not accept any traffic at a moment.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return dict(self._gca_resource.traffic_split)
 
     @property
@@ -1443,6 +1454,107 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
             deployed_model_id=prediction_response.deployed_model_id,
         )
 
+    def predict_array(
+        self,
+        instances: Any,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Prediction:
+        """Make a prediction against this Endpoint with dense numeric instances.
+
+        The request is serialized in bulk from the array buffer and dense
+        numeric predictions are decoded straight into a NumPy array, skipping
+        the per-value protobuf conversion done by `predict`.
+
+        Example usage:
+            response = my_endpoint.predict_array(
+                instances=np.random.rand(1000, 512).astype(np.float32)
+            )
+            my_predictions = response.predictions  # np.ndarray
+
+        Args:
+            instances (Union[np.ndarray, pyarrow.Table, pyarrow.RecordBatch]):
+                Required. A 1-D or 2-D numeric array. Each row of a 2-D array is
+                sent as a list of numbers and each element of a 1-D array as a
+                number. A pyarrow table or record batch either has a single
+                fixed size list column with one instance per row, or one numeric
+                column per feature.
+            parameters (Dict):
+                The parameters that govern the prediction. The schema of
+                the parameters may be specified via Endpoint's
+                DeployedModels' [Model's
+                ][google.cloud.aiplatform.v1beta1.DeployedModel.model]
+                [PredictSchemata's][google.cloud.aiplatform.v1beta1.Model.predict_schemata]
+                ``parameters_schema_uri``.
+            timeout (float): Optional. The timeout for this request in seconds.
+        Returns:
+            prediction: Prediction with predictions as a float64 ndarray, when
+                all predictions are numbers or equal-length lists of numbers,
+                otherwise as a 1-D object ndarray, and the Model Id.
+        """
+        self.wait()
+
+        response = prediction_utils.send_predict_request(
+            prediction_client=self._prediction_client,
+            endpoint=self._gca_resource.name,
+            request=prediction_utils.encode_predict_request(
+                endpoint=self._gca_resource.name,
+                instances=instances,
+                parameters=parameters,
+            ),
+            timeout=timeout,
+        )
+        predictions, deployed_model_id = prediction_utils.decode_predict_response(
+            response
+        )
+
+        return Prediction(
+            predictions=predictions,
+            deployed_model_id=deployed_model_id,
+        )
+
+    def batch_predictor(
+        self,
+        max_batch_size: int = 64,
+        max_latency_ms: float = 10.0,
+        max_concurrent_requests: int = 8,
+        timeout: Optional[float] = None,
+    ) -> prediction_utils.BatchPredictor:
+        """Returns a client-side micro-batching predictor for this Endpoint.
+
+        Instances submitted to the predictor from many threads are gathered into
+        request-sized batches and sent over a bounded number of concurrent
+        prediction requests. Each caller receives the predictions for its own
+        instances only.
+
+        Example usage:
+            with my_endpoint.batch_predictor(max_batch_size=32) as predictor:
+                prediction = predictor.predict(instances=[[1.0, 2.0, 3.0]])
+
+        Args:
+            max_batch_size (int):
+                Optional. Maximum number of instances sent in one prediction request.
+            max_latency_ms (float):
+                Optional. Maximum time in milliseconds an instance waits for its
+                batch to fill before the batch is sent.
+            max_concurrent_requests (int):
+                Optional. Maximum number of prediction requests in flight.
+            timeout (float): Optional. The timeout for each request in seconds.
+        Returns:
+            prediction_utils.BatchPredictor:
+                A started predictor. Call `close()` or use it as a context manager
+                to flush pending instances and release its threads.
+        """
+        self.wait()
+
+        return prediction_utils.BatchPredictor(
+            endpoint=self,
+            max_batch_size=max_batch_size,
+            max_latency_ms=max_latency_ms,
+            max_concurrent_requests=max_concurrent_requests,
+            timeout=timeout,
+        )
+
     def explain(
         self,
         instances: List[Dict],
@@ -1502,6 +1614,101 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
             explanations=explain_response.explanations,
         )
 
+    async def predict_async(
+        self,
+        instances: List,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Prediction:
+        """Make an asynchronous prediction against this Endpoint.
+
+        Uses the asyncio prediction client so many predictions can be in flight on
+        one event loop without a thread per call.
+
+        Example usage:
+            response = await my_endpoint.predict_async(instances=[...])
+            my_predictions = response.predictions
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `Endpoint.predict` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. See
+                `Endpoint.predict` for details.
+            timeout (float): Optional. The timeout for this request in seconds.
+        Returns:
+            prediction: Prediction with returned predictions and Model Id.
+        """
+        await self.wait_async()
+
+        prediction_response = await self._get_async_client(
+            client_class=utils.PredictionClientWithOverride,
+            prediction_client=True,
+        ).predict(
+            endpoint=self._gca_resource.name,
+            instances=instances,
+            parameters=parameters,
+            timeout=timeout,
+        )
+
+        return Prediction(
+            predictions=[
+                json_format.MessageToDict(item)
+                for item in prediction_response.predictions.pb
+            ],
+            deployed_model_id=prediction_response.deployed_model_id,
+        )
+
+    async def explain_async(
+        self,
+        instances: List[Dict],
+        parameters: Optional[Dict] = None,
+        deployed_model_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Prediction:
+        """Make an asynchronous prediction with explanations against this Endpoint.
+
+        Example usage:
+            response = await my_endpoint.explain_async(instances=[...])
+            my_explanations = response.explanations
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `Endpoint.explain` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. See
+                `Endpoint.explain` for details.
+            deployed_model_id (str):
+                Optional. If specified, this ExplainRequest will be served by the
+                chosen DeployedModel, overriding this Endpoint's traffic split.
+            timeout (float): Optional. The timeout for this request in seconds.
+        Returns:
+            prediction: Prediction with returned predictions, explanations and Model Id.
+        """
+        await self.wait_async()
+
+        explain_response = await self._get_async_client(
+            client_class=utils.PredictionClientWithOverride,
+            prediction_client=True,
+        ).explain(
+            endpoint=self.resource_name,
+            instances=instances,
+            parameters=parameters,
+            deployed_model_id=deployed_model_id,
+            timeout=timeout,
+        )
+
+        return Prediction(
+            predictions=[
+                json_format.MessageToDict(item)
+                for item in explain_response.predictions.pb
+            ],
+            deployed_model_id=explain_response.deployed_model_id,
+            explanations=explain_response.explanations,
+        )
+
     @classmethod
     def list(
         cls,
@@ -1510,6 +1717,8 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["models.Endpoint"]:
         """List all Endpoint resource instances.
 
@@ -1536,6 +1745,12 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[models.Endpoint] - A list of Endpoint resource objects
@@ -1547,6 +1762,120 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union["models.Endpoint", proto.Message]]:
+        """Lazily list the instances of this Endpoint resource.
+
+        Pages are requested as the results are consumed. When `order_by` is
+        set, all resources are listed and sorted locally before the first one
+        is yielded.
+
+        Example Usage:
+
+        for endpoint in aiplatform.Endpoint.iter_list(page_size=100):
+            print(endpoint.display_name)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[models.Endpoint, proto.Message] - The SDK resource objects, or
+            the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        return cls._iter_list_with_local_order(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
+        )
+
+    @classmethod
+    async def list_async(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> List["models.Endpoint"]:
+        """List all Endpoint resource instances without blocking the event loop.
+
+        Example Usage:
+
+        endpoints = await aiplatform.Endpoint.list_async(order_by="create_time desc")
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+
+        Returns:
+            List[models.Endpoint] - A list of Endpoint resource objects
+        """
+
+        return await cls._list_async(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            local_order=True,
         )
 
     def list_models(self) -> List[gca_endpoint_compat.DeployedModel]:
@@ -1556,7 +1885,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager):
             deployed_models (List[aiplatform.gapic.DeployedModel]):
                 A list of the models deployed in this Endpoint.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return list(self._gca_resource.deployed_models)
 
     def undeploy_all(self, sync: bool = True) -> "Endpoint":
@@ -1648,7 +1977,7 @@ class Model(base.VertexAiResourceNounWithFutureManager):
     @property
     def supported_deployment_resources_types(
         self,
-    ) -> List[aiplatform.gapic.Model.DeploymentResourcesType]:
+    ) -> List["aiplatform.gapic.Model.DeploymentResourcesType"]:
         """List of deployment resource types accepted for this Model.
 
         When this Model is deployed, its prediction resources are described by
@@ -1704,7 +2033,7 @@ class Model(base.VertexAiResourceNounWithFutureManager):
         return list(self._gca_resource.supported_output_storage_formats)
 
     @property
-    def predict_schemata(self) -> Optional[aiplatform.gapic.PredictSchemata]:
+    def predict_schemata(self) -> Optional["aiplatform.gapic.PredictSchemata"]:
         """The schemata that describe formats of the Model's predictions and
         explanations, if available."""
         self._assert_gca_resource_is_available()
@@ -1737,7 +2066,7 @@ class Model(base.VertexAiResourceNounWithFutureManager):
             )
 
     @property
-    def container_spec(self) -> Optional[aiplatform.gapic.ModelContainerSpec]:
+    def container_spec(self) -> Optional["aiplatform.gapic.ModelContainerSpec"]:
         """The specification of the container that is to be used when deploying
         this Model. Not present for AutoML Models."""
         self._assert_gca_resource_is_available()
@@ -2680,6 +3009,8 @@ class Model(base.VertexAiResourceNounWithFutureManager):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["models.Model"]:
         """List all Model resource instances.
 
@@ -2706,6 +3037,12 @@ class Model(base.VertexAiResourceNounWithFutureManager):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[models.Model] - A list of Model resource objects
@@ -2717,6 +3054,55 @@ class Model(base.VertexAiResourceNounWithFutureManager):
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    async def list_async(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> List["models.Model"]:
+        """List all Model resource instances without blocking the event loop.
+
+        Example Usage:
+
+        my_models = await aiplatform.Model.list_async(
+            filter='labels.my_label="my_label_value" AND display_name="my_model"',
+        )
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+
+        Returns:
+            List[models.Model] - A list of Model resource objects
+        """
+
+        return await cls._list_async(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
         )
 
     @base.optional_sync()
@@ -3464,7 +3850,7 @@ class Model(base.VertexAiResourceNounWithFutureManager):
     def get_model_evaluation(
         self,
         evaluation_id: Optional[str] = None,
-    ) -> Optional[model_evaluation.ModelEvaluation]:
+    ) -> Optional["model_evaluation.ModelEvaluation"]:
         """Returns a ModelEvaluation resource and instantiates its representation.
         If no evaluation_id is passed, it will return the first evaluation associated
         with this model.
@@ -19,12 +19,15 @@ import datetime
 import logging
 import time
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import proto
 
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import job_poller
 from google.cloud.aiplatform.utils import yaml_utils
 from google.cloud.aiplatform.utils import pipeline_utils
 from google.protobuf import json_format
@@ -326,7 +329,7 @@ class PipelineJob(base.VertexAiStatefulResource):
     @property
     def state(self) -> Optional[gca_pipeline_state.PipelineState]:
         """Current pipeline state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.state
 
     @property
@@ -347,13 +350,12 @@ class PipelineJob(base.VertexAiStatefulResource):
     def _block_until_complete(self):
         """Helper method to block and check on job until complete."""
         # Used these numbers so failures surface fast
-        wait = 5  # start at five seconds
-        log_wait = 5
+        log_wait = 5  # start at five seconds
         max_wait = 60 * 5  # 5 minute wait
         multiplier = 2  # scale wait by 2 every iteration
 
         previous_time = time.time()
-        while self.state not in _PIPELINE_COMPLETE_STATES:
+        for _ in job_poller.global_poller.watch(self):
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
@@ -366,7 +368,6 @@ class PipelineJob(base.VertexAiStatefulResource):
                 )
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
-            time.sleep(wait)
 
         # Error is only populated when the job state is
         # JOB_STATE_FAILED or JOB_STATE_CANCELLED.
@@ -419,6 +420,7 @@ class PipelineJob(base.VertexAiStatefulResource):
         becomes a job with state set to `CANCELLED`.
         """
         self.api_client.cancel_pipeline_job(name=self.resource_name)
+        self._mark_gca_resource_stale()
 
     @classmethod
     def list(
@@ -428,6 +430,8 @@ class PipelineJob(base.VertexAiStatefulResource):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["PipelineJob"]:
         """List all instances of this PipelineJob resource.
 
@@ -455,6 +459,12 @@ class PipelineJob(base.VertexAiStatefulResource):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[PipelineJob] - A list of PipelineJob resource objects
@@ -466,6 +476,76 @@ class PipelineJob(base.VertexAiStatefulResource):
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union["PipelineJob", proto.Message]]:
+        """Lazily list the instances of this PipelineJob resource.
+
+        Pages are requested as the results are consumed. When `order_by` is
+        set, all resources are listed and sorted locally before the first one
+        is yielded.
+
+        Example Usage:
+
+        for pipeline_job in aiplatform.PipelineJob.iter_list(
+            filter='display_name="experiment_a27"',
+        ):
+            print(pipeline_job.state)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[PipelineJob, proto.Message] - The SDK resource objects, or
+            the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        return cls._iter_list_with_local_order(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
 
     def wait_for_resource_creation(self) -> None:
@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from google.auth import credentials as auth_credentials
 from google.protobuf import field_mask_pb2
@@ -487,6 +487,8 @@ class TensorboardExperiment(_TensorboardServiceResource):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["TensorboardExperiment"]:
         """List TensorboardExperiemnts in a Tensorboard resource.
 
@@ -518,6 +520,12 @@ class TensorboardExperiment(_TensorboardServiceResource):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
         Returns:
             List[TensorboardExperiment] - A list of TensorboardExperiments
         """
@@ -538,6 +546,92 @@ class TensorboardExperiment(_TensorboardServiceResource):
             location=location,
             credentials=credentials,
             parent=parent,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        tensorboard_name: str,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[
+        Union["TensorboardExperiment", gca_tensorboard_experiment.TensorboardExperiment]
+    ]:
+        """Lazily list TensorboardExperiments in a Tensorboard resource.
+
+        Pages are requested as the results are consumed.
+
+        Example Usage:
+
+            for experiment in aiplatform.TensorboardExperiment.iter_list(
+                tensorboard_name='projects/my-project/locations/us-central1/tensorboards/123'
+            ):
+                print(experiment.display_name)
+
+        Args:
+            tensorboard_name(str):
+                Required. The resource name or resource ID of the
+                Tensorboard to list
+                TensorboardExperiments. Format, if resource name:
+                'projects/{project}/locations/{location}/tensorboards/{tensorboard}'
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+        Yields:
+            Union[TensorboardExperiment, gca_tensorboard_experiment.TensorboardExperiment] -
+            The TensorboardExperiments, or the GAPIC resources if
+            `return_gapic_resources` is set.
+        """
+
+        parent = utils.full_resource_name(
+            resource_name=tensorboard_name,
+            resource_noun=Tensorboard._resource_noun,
+            parse_resource_name_method=Tensorboard._parse_resource_name,
+            format_resource_name_method=Tensorboard._format_resource_name,
+            project=project,
+            location=location,
+        )
+
+        return super()._iter_list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
 
 
@@ -752,6 +846,8 @@ class TensorboardRun(_TensorboardServiceResource):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["TensorboardRun"]:
         """List all instances of TensorboardRun in TensorboardExperiment.
 
@@ -788,6 +884,12 @@ class TensorboardRun(_TensorboardServiceResource):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
         Returns:
             List[TensorboardRun] - A list of TensorboardRun
         """
@@ -809,4 +911,95 @@ class TensorboardRun(_TensorboardServiceResource):
             location=location,
             credentials=credentials,
             parent=parent,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        tensorboard_experiment_name: str,
+        tensorboard_id: Optional[str] = None,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union["TensorboardRun", gca_tensorboard_run.TensorboardRun]]:
+        """Lazily list the TensorboardRuns in a TensorboardExperiment.
+
+        Pages are requested as the results are consumed.
+
+        Example Usage:
+
+            for run in aiplatform.TensorboardRun.iter_list(
+                tensorboard_experiment_name='projects/my-project/locations/us-central1/tensorboards/123/experiments/456'
+            ):
+                print(run.display_name)
+
+        Args:
+            tensorboard_experiment_name (str):
+                Required. The resource name or resource ID of the
+                TensorboardExperiment to list
+                TensorboardRun. Format, if resource name:
+                'projects/{project}/locations/{location}/tensorboards/{tensorboard}/experiments/{experiment}'
+
+                If resource ID is provided then tensorboard_id must be provided.
+            tensorboard_id (str):
+                Optional. The resource ID of the Tensorboard that contains the TensorboardExperiment
+                to list TensorboardRun.
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+        Yields:
+            Union[TensorboardRun, gca_tensorboard_run.TensorboardRun] - The
+            TensorboardRuns, or the GAPIC resources if `return_gapic_resources`
+            is set.
+        """
+
+        parent = utils.full_resource_name(
+            resource_name=tensorboard_experiment_name,
+            resource_noun=TensorboardExperiment._resource_noun,
+            parse_resource_name_method=TensorboardExperiment._parse_resource_name,
+            format_resource_name_method=TensorboardExperiment._format_resource_name,
+            parent_resource_name_fields={Tensorboard._resource_noun: tensorboard_id},
+            project=project,
+            location=location,
+        )
+
+        return super()._iter_list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
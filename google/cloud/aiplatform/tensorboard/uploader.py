@@ -16,19 +16,27 @@
 #
 """Uploads a TensorBoard logdir to TensorBoard.gcp."""
 import abc
+import collections
 from collections import defaultdict
+from concurrent import futures
 import functools
+import itertools
 import logging
 import os
+import queue
+import threading
 import time
 import re
 from typing import (
+    Callable,
     Dict,
     FrozenSet,
     Generator,
     Iterable,
+    List,
     Optional,
     ContextManager,
+    Set,
     Tuple,
 )
 import uuid
@@ -103,6 +111,13 @@ _DEFAULT_MAX_TENSOR_POINT_SIZE = 16 * (2**10)  # 16KiB
 
 _DEFAULT_MAX_BLOB_SIZE = 10 * (2**30)  # 10GiB
 
+# Default maximum number of blobs uploaded to GCS at the same time.
+_DEFAULT_MAX_CONCURRENT_BLOB_UPLOADS = 16
+
+# Number of events of a run read ahead to batch create their time series when
+# uploading to a new experiment in one-shot mode.
+_PRE_CREATE_EVENTS_CHUNK_SIZE = 1000
+
 logger = tb_logging.get_logger()
 logger.setLevel(logging.WARNING)
 
@@ -139,6 +154,9 @@ class TensorBoardUploader(object):
         one_shot: bool = False,
         event_file_inactive_secs: Optional[int] = None,
         run_name_prefix=None,
+        max_concurrent_blob_uploads: int = _DEFAULT_MAX_CONCURRENT_BLOB_UPLOADS,
+        checkpoint_path: Optional[str] = None,
+        max_concurrent_runs: int = 1,
     ):
         """Constructs a TensorBoardUploader.
 
@@ -178,6 +196,15 @@ class TensorBoardUploader(object):
             considered inactive.
           run_name_prefix: If present, all runs created by this invocation will have
             their name prefixed by this value.
+          max_concurrent_blob_uploads: Maximum number of blobs, like images and
+            graphs, uploaded to GCS at the same time.
+          checkpoint_path: Local or GCS path of a file to record the upload
+            progress in. If present, an uploader restarted with the same
+            experiment, logdir and checkpoint path resumes reading each event
+            file at the offset up to which its run was uploaded.
+          max_concurrent_runs: Maximum number of runs whose events are read and
+            sent at the same time. Each concurrently dispatched run batches its
+            own requests, while all of them share the RPC rate limits.
         """
         self._experiment_name = experiment_name
         self._experiment_display_name = experiment_display_name
@@ -188,7 +215,12 @@ class TensorBoardUploader(object):
         self._logdir = logdir
         self._allowed_plugins = frozenset(allowed_plugins)
         self._run_name_prefix = run_name_prefix
+        self._max_concurrent_blob_uploads = max_concurrent_blob_uploads
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint = None
+        self._max_concurrent_runs = max_concurrent_runs
         self._is_brand_new_experiment = False
+        self._pre_create_time_series = False
 
         self._upload_limits = upload_limits
         if not self._upload_limits:
@@ -244,24 +276,41 @@ class TensorBoardUploader(object):
         else:
             self._blob_rpc_rate_limiter = blob_rpc_rate_limiter
 
+        if self._max_concurrent_runs > 1:
+            self._rpc_rate_limiter = _SynchronizedRateLimiter(self._rpc_rate_limiter)
+            self._tensor_rpc_rate_limiter = _SynchronizedRateLimiter(
+                self._tensor_rpc_rate_limiter
+            )
+            self._blob_rpc_rate_limiter = _SynchronizedRateLimiter(
+                self._blob_rpc_rate_limiter
+            )
+
         def active_filter(secs):
             return (
                 not bool(event_file_inactive_secs)
                 or secs + event_file_inactive_secs >= time.time()
             )
 
+        if self._checkpoint_path:
+            # The checkpoint is only created with the experiment, before any
+            # event file is loaded.
+            def loader_factory(path):
+                return uploader_utils.CheckpointedEventFileLoader(
+                    path, self._checkpoint
+                )
+
+        else:
+            loader_factory = event_file_loader.TimestampedEventFileLoader
+
         directory_loader_factory = functools.partial(
             directory_loader.DirectoryLoader,
-            loader_factory=event_file_loader.TimestampedEventFileLoader,
+            loader_factory=loader_factory,
             path_filter=io_wrapper.IsTensorFlowEventsFile,
             active_filter=active_filter,
         )
         self._logdir_loader = logdir_loader.LogdirLoader(
             self._logdir, directory_loader_factory
         )
-        self._logdir_loader_pre_create = logdir_loader.LogdirLoader(
-            self._logdir, directory_loader_factory
-        )
         self._tracker = upload_tracker.UploadTracker(verbosity=self._verbosity)
 
         self._create_additional_senders()
@@ -304,20 +353,37 @@ class TensorBoardUploader(object):
         self._one_platform_resource_manager = uploader_utils.OnePlatformResourceManager(
             self._experiment.name, self._api
         )
+        if self._checkpoint_path:
+            self._checkpoint = uploader_utils.UploadCheckpoint(
+                self._checkpoint_path,
+                experiment_resource_name=self._experiment.name,
+                logdir=self._logdir,
+                reset=self._is_brand_new_experiment,
+            )
 
-        self._request_sender = _BatchedRequestSender(
-            self._experiment.name,
-            self._api,
-            allowed_plugins=self._allowed_plugins,
-            upload_limits=self._upload_limits,
-            rpc_rate_limiter=self._rpc_rate_limiter,
-            tensor_rpc_rate_limiter=self._tensor_rpc_rate_limiter,
-            blob_rpc_rate_limiter=self._blob_rpc_rate_limiter,
-            blob_storage_bucket=self._blob_storage_bucket,
-            blob_storage_folder=self._blob_storage_folder,
-            one_platform_resource_manager=self._one_platform_resource_manager,
-            tracker=self._tracker,
-        )
+        # The metadata of a time series is memorized on its first event, no
+        # matter which of the request senders dispatches the run.
+        tag_metadata = {}
+        request_senders = [
+            _BatchedRequestSender(
+                self._experiment.name,
+                self._api,
+                allowed_plugins=self._allowed_plugins,
+                upload_limits=self._upload_limits,
+                rpc_rate_limiter=self._rpc_rate_limiter,
+                tensor_rpc_rate_limiter=self._tensor_rpc_rate_limiter,
+                blob_rpc_rate_limiter=self._blob_rpc_rate_limiter,
+                blob_storage_bucket=self._blob_storage_bucket,
+                blob_storage_folder=self._blob_storage_folder,
+                one_platform_resource_manager=self._one_platform_resource_manager,
+                tracker=self._tracker,
+                max_concurrent_blob_uploads=self._max_concurrent_blob_uploads,
+                checkpoint=self._checkpoint,
+                tag_metadata=tag_metadata,
+            )
+            for _ in range(max(self._max_concurrent_runs, 1))
+        ]
+        self._request_sender = request_senders[0]
 
         # Update partials with experiment name
         for sender in self._additional_senders.keys():
@@ -325,9 +391,21 @@ class TensorBoardUploader(object):
                 experiment_resource_name=self._experiment.name,
             )
 
+        if self._checkpoint:
+
+            def commit_run(run_name: str):
+                self._checkpoint.commit(
+                    run=run_name[len(self._run_name_prefix or "") :]
+                )
+
+        else:
+            commit_run = None
+
         self._dispatcher = _Dispatcher(
             request_sender=self._request_sender,
             additional_senders=self._additional_senders,
+            concurrent_request_senders=request_senders[1:],
+            commit_run=commit_run,
         )
 
     def _create_additional_senders(self) -> Dict[str, uploader_utils.RequestSender]:
@@ -373,7 +451,7 @@ class TensorBoardUploader(object):
 
         if self._one_shot:
             if self._is_brand_new_experiment:
-                self._pre_create_runs_and_time_series()
+                self._pre_create_time_series = True
             else:
                 logger.warning(
                     "Please consider uploading to a new experiment instead of "
@@ -392,26 +470,57 @@ class TensorBoardUploader(object):
                 "without any uploadable data" % self._logdir
             )
 
-    def _pre_create_runs_and_time_series(self):
-        """
-        Iterates though the log dir to collect TensorboardRuns and
-        TensorboardTimeSeries that need to be created, and creates them in batch
-        to speed up uploading later on.
+    def _pre_create_runs_and_time_series(
+        self, run_to_events: Dict[str, Generator[tf.compat.v1.Event, None, None]]
+    ) -> Dict[str, Generator[tf.compat.v1.Event, None, None]]:
+        """Batch creates the TensorboardRuns and TensorboardTimeSeries of events.
+
+        The runs are created right away. The time series are created in batches
+        while the events stream through, so that uploading the events does not
+        need to create them one by one and the logdir is only read once.
+
+        Args:
+          run_to_events: Mapping from run name to generator of
+            `tf.compat.v1.Event` values, as returned by
+            `LogdirLoader.get_run_events`.
+
+        Returns:
+          Mapping from run name to generator of the same events, creating the
+          time series of each chunk of events before yielding it.
         """
-        self._logdir_loader_pre_create.synchronize_runs()
-        run_to_events = self._logdir_loader_pre_create.get_run_events()
-        if self._run_name_prefix:
-            run_to_events = {
-                self._run_name_prefix + k: v for k, v in run_to_events.items()
-            }
+        self._one_platform_resource_manager.batch_create_runs(list(run_to_events))
+        created_time_series = set()
+        return {
+            run_name: self._pre_create_time_series_of_events(
+                run_name, events, created_time_series
+            )
+            for run_name, events in run_to_events.items()
+        }
 
-        run_names = []
-        run_tag_name_to_time_series_proto = {}
-        for (run_name, events) in run_to_events.items():
-            run_names.append(run_name)
-            for event in events:
-                _filter_graph_defs(event)
+    def _pre_create_time_series_of_events(
+        self,
+        run_name: str,
+        events: Generator[tf.compat.v1.Event, None, None],
+        created_time_series: Set[Tuple[str, str]],
+    ) -> Generator[tf.compat.v1.Event, None, None]:
+        """Yields the events of a run after batch creating their time series.
+
+        Args:
+          run_name: Name of the run of the events.
+          events: Generator of the events of the run.
+          created_time_series: (run name, tag) of the time series created so
+            far. Updated with the time series created.
+        """
+        events = iter(events)
+        while True:
+            chunk = list(itertools.islice(events, _PRE_CREATE_EVENTS_CHUNK_SIZE))
+            if not chunk:
+                return
+            run_tag_name_to_time_series_proto = {}
+            for event in chunk:
                 for value in event.summary.value:
+                    if (run_name, value.tag) in created_time_series:
+                        continue
                     metadata, is_valid = self._request_sender.get_metadata_and_validate(
                         run_name, value
                     )
@@ -439,10 +548,12 @@ class TensorBoardUploader(object):
                         plugin_data=metadata.plugin_data.content,
                     )
 
-        self._one_platform_resource_manager.batch_create_runs(run_names)
-        self._one_platform_resource_manager.batch_create_time_series(
-            run_tag_name_to_time_series_proto
-        )
+            if run_tag_name_to_time_series_proto:
+                self._one_platform_resource_manager.batch_create_time_series(
+                    run_tag_name_to_time_series_proto
+                )
+                created_time_series.update(run_tag_name_to_time_series_proto)
+            yield from chunk
 
     def _upload_once(self):
         """Runs one upload cycle, sending zero or more RPCs."""
@@ -458,8 +569,12 @@ class TensorBoardUploader(object):
             run_to_events = {
                 self._run_name_prefix + k: v for k, v in run_to_events.items()
             }
+        if self._pre_create_time_series:
+            run_to_events = self._pre_create_runs_and_time_series(run_to_events)
         with self._tracker.send_tracker():
             self._dispatcher.dispatch_requests(run_to_events)
+        if self._checkpoint:
+            self._checkpoint.commit()
 
 
 class PermissionDeniedError(RuntimeError):
@@ -470,6 +585,23 @@ class ExperimentNotFoundError(RuntimeError):
     pass
 
 
+class _SynchronizedRateLimiter(object):
+    """Rate limiter shared by threads sending requests concurrently.
+
+    Ticks of different threads are serialized, so the threads together send
+    no more requests than the wrapped rate limiter allows.
+    """
+
+    def __init__(self, rate_limiter: util.RateLimiter):
+        self._rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+
+    def tick(self):
+        """Blocks until the wrapped rate limiter permits a tick."""
+        with self._lock:
+            self._rate_limiter.tick()
+
+
 class _OutOfSpaceError(Exception):
     """Action could not proceed without overflowing request budget.
 
@@ -508,6 +640,11 @@ class _BatchedRequestSender(object):
         blob_storage_folder: str,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
         tracker: upload_tracker.UploadTracker,
+        max_concurrent_blob_uploads: int = _DEFAULT_MAX_CONCURRENT_BLOB_UPLOADS,
+        checkpoint: Optional[uploader_utils.UploadCheckpoint] = None,
+        tag_metadata: Optional[
+            Dict[Tuple[str, str], tf.compat.v1.SummaryMetadata]
+        ] = None,
     ):
         """Constructs _BatchedRequestSender for the given experiment resource.
 
@@ -527,10 +664,19 @@ class _BatchedRequestSender(object):
           one_platform_resource_manager: An instance of the One Platform
             resource management class.
           tracker: Upload tracker to track information about uploads.
+          max_concurrent_blob_uploads: Maximum number of blobs uploaded to GCS
+            at the same time.
+          checkpoint: Checkpoint to record the metadata of the time series in.
+          tag_metadata: Metadata memorized per (run, tag) time series. Shared by
+            request senders dispatching different runs concurrently.
         """
         self._experiment_resource_name = experiment_resource_name
         self._api = api
-        self._tag_metadata = {}
+        self._checkpoint = checkpoint
+        self._tag_metadata = {} if tag_metadata is None else tag_metadata
+        if self._checkpoint:
+            # Later events of a time series may come without metadata.
+            self._tag_metadata.update(self._checkpoint.get_time_series_metadata())
         self._allowed_plugins = frozenset(allowed_plugins)
         self._tracker = tracker
         self._one_platform_resource_manager = one_platform_resource_manager
@@ -561,6 +707,7 @@ class _BatchedRequestSender(object):
             blob_storage_folder=blob_storage_folder,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            max_concurrent_blob_uploads=max_concurrent_blob_uploads,
         )
 
     def send_request(
@@ -627,6 +774,8 @@ class _BatchedRequestSender(object):
             first_in_time_series = True
             metadata = value.metadata
             self._tag_metadata[time_series_key] = metadata
+            if self._checkpoint:
+                self._checkpoint.set_time_series_metadata(run_name, value.tag, metadata)
 
         plugin_name = metadata.plugin_data.plugin_name
         if value.HasField("metadata") and (
@@ -657,6 +806,8 @@ class _Dispatcher(object):
         self,
         request_sender: _BatchedRequestSender,
         additional_senders: Optional[Dict[str, uploader_utils.RequestSender]] = None,
+        concurrent_request_senders: Optional[List[_BatchedRequestSender]] = None,
+        commit_run: Optional[Callable[[str], None]] = None,
     ):
         """Construct a _Dispatcher object for the TensorboardUploader.
 
@@ -664,12 +815,23 @@ class _Dispatcher(object):
             request_sender: A `_BatchedRequestSender` for handling events.
             additional_senders: A dictionary mapping a plugin name to additional
               Senders.
+            concurrent_request_senders: Further `_BatchedRequestSender`s. If
+              present, runs are dispatched concurrently by one thread per
+              request sender, each run to a single request sender.
+            commit_run: If present, the request sender of a run is flushed once
+              all of its events were added, and this is called with the run
+              name to record the events read so far as uploaded.
         """
         self._request_sender = request_sender
+        self._commit_run = commit_run
 
         if not additional_senders:
             additional_senders = {}
         self._additional_senders = additional_senders
+        self._request_senders = [request_sender] + list(
+            concurrent_request_senders or []
+        )
+        self._executor = None
 
     def _dispatch_additional_senders(
         self,
@@ -712,14 +874,81 @@ class _Dispatcher(object):
           run_to_events: Mapping from run name to generator of `tf.compat.v1.Event`
             values, as returned by `LogdirLoader.get_run_events`.
         """
+        if len(self._request_senders) > 1:
+            self._dispatch_requests_concurrently(run_to_events)
+            return
         for (run_name, events) in run_to_events.items():
             self._dispatch_additional_senders(run_name)
-            for event in events:
-                _filter_graph_defs(event)
-                for value in event.summary.value:
-                    self._request_sender.send_request(run_name, event, value)
+            self._dispatch_events(self._request_sender, run_name, events)
         self._request_sender.flush()
 
+    def _dispatch_requests_concurrently(
+        self, run_to_events: Dict[str, Generator[tf.compat.v1.Event, None, None]]
+    ):
+        """Routes the events of different runs from concurrent threads.
+
+        Every thread takes the next run not dispatched yet until none is left,
+        then flushes its request sender. As all events of a run go through the
+        same request sender, the points of each time series keep their order.
+
+        Args:
+          run_to_events: Mapping from run name to generator of `tf.compat.v1.Event`
+            values, as returned by `LogdirLoader.get_run_events`.
+        """
+        # Additional senders are not threadsafe.
+        for run_name in run_to_events:
+            self._dispatch_additional_senders(run_name)
+
+        runs = queue.Queue()
+        for run_name_and_events in run_to_events.items():
+            runs.put(run_name_and_events)
+
+        def dispatch_runs(request_sender: _BatchedRequestSender):
+            try:
+                while True:
+                    try:
+                        run_name, events = runs.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._dispatch_events(request_sender, run_name, events)
+                request_sender.flush()
+            except Exception:
+                # Stop the other threads after their current run.
+                try:
+                    while True:
+                        runs.get_nowait()
+                except queue.Empty:
+                    pass
+                raise
+
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=len(self._request_senders),
+                thread_name_prefix="tensorboard-dispatch",
+            )
+        dispatches = [
+            self._executor.submit(dispatch_runs, request_sender)
+            for request_sender in self._request_senders
+        ]
+        futures.wait(dispatches)
+        for dispatch in dispatches:
+            dispatch.result()
+
+    def _dispatch_events(
+        self,
+        request_sender: _BatchedRequestSender,
+        run_name: str,
+        events: Generator[tf.compat.v1.Event, None, None],
+    ):
+        """Adds the summary values of the events of a run to a request sender."""
+        for event in events:
+            _filter_graph_defs(event)
+            for value in event.summary.value:
+                request_sender.send_request(run_name, event, value)
+        if self._commit_run:
+            request_sender.flush()
+            self._commit_run(run_name)
+
 
 class _BaseBatchedRequestSender(object):
     """Helper class for building requests that fit under a size limit.
@@ -1246,9 +1475,9 @@ class _ByteBudgetManager(object):
 class _BlobRequestSender(_BaseBatchedRequestSender):
     """Uploader for blob-type event data.
 
-    Unlike the other types, this class does not accumulate events in batches;
-    every blob is sent individually and immediately.  Nonetheless we retain
-    the `add_event()`/`flush()` structure for symmetry.
+    Blobs are uploaded to GCS by a pool of threads while further events are
+    added, and only the ids of the blobs are accumulated in the request. A
+    request is sent by `flush()` once all of its blobs are uploaded.
 
     This class is not threadsafe. Use external synchronization if calling its
     methods concurrently.
@@ -1267,6 +1496,7 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
         blob_storage_folder: str,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        max_concurrent_blob_uploads: int = _DEFAULT_MAX_CONCURRENT_BLOB_UPLOADS,
     ):
         super().__init__(
             experiment_resource_id,
@@ -1279,6 +1509,10 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
         self._max_blob_size = max_blob_size
         self._bucket = blob_storage_bucket
         self._folder = blob_storage_folder
+        self._max_concurrent_blob_uploads = max_concurrent_blob_uploads
+        self._blob_upload_executor = None
+        # Uploads not waited for yet, as (future, blob size) in submit order.
+        self._pending_blob_uploads = collections.deque()
 
     def _new_request(self):
         super()._new_request()
@@ -1328,11 +1562,9 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
         )
         sent_blob_ids = []
         for blob in blobs:
-            with self._tracker.blob_tracker(len(blob)) as blob_tracker:
-                blob_id = self._send_blob(blob, blob_path_prefix)
-                if blob_id is not None:
-                    sent_blob_ids.append(str(blob_id))
-                    blob_tracker.mark_uploaded(blob_id is not None)
+            blob_id = self._send_blob(blob, blob_path_prefix)
+            if blob_id is not None:
+                sent_blob_ids.append(str(blob_id))
 
         return tensorboard_data.TimeSeriesDataPoint(
             step=event.step,
@@ -1348,29 +1580,63 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
             ),
         )
 
+    def flush(self):
+        """Waits for the blobs of the active request, then sends it."""
+        while self._pending_blob_uploads:
+            self._wait_for_blob_upload()
+        super().flush()
+
     def _send_blob(self, blob, blob_path_prefix):
-        """Sends a single blob to a GCS bucket in the consumer project.
+        """Starts sending a single blob to a GCS bucket in the consumer project.
 
-        The blob will not be sent if it is too large.
+        The blob will not be sent if it is too large. At most twice
+        `max_concurrent_blob_uploads` uploads are pending at a time, further
+        blobs wait for the oldest pending upload.
 
         Returns:
-          The ID of blob successfully sent.
+          The ID of blob being sent.
         """
         if len(blob) > self._max_blob_size:
-            logger.warning(
-                "Blob too large; skipping.  Size %d exceeds limit of %d bytes.",
-                len(blob),
-                self._max_blob_size,
-            )
+            with self._tracker.blob_tracker(len(blob)):
+                logger.warning(
+                    "Blob too large; skipping.  Size %d exceeds limit of %d bytes.",
+                    len(blob),
+                    self._max_blob_size,
+                )
             return None
 
         blob_id = uuid.uuid4()
         blob_path = (
             "{}/{}".format(blob_path_prefix, blob_id) if blob_path_prefix else blob_id
         )
-        self._bucket.blob(blob_path).upload_from_string(blob)
+        if self._blob_upload_executor is None:
+            self._blob_upload_executor = futures.ThreadPoolExecutor(
+                max_workers=self._max_concurrent_blob_uploads,
+                thread_name_prefix="tensorboard-blob-upload",
+            )
+        while len(self._pending_blob_uploads) >= 2 * self._max_concurrent_blob_uploads:
+            self._wait_for_blob_upload()
+        self._pending_blob_uploads.append(
+            (
+                self._blob_upload_executor.submit(
+                    self._bucket.blob(blob_path).upload_from_string, blob
+                ),
+                len(blob),
+            )
+        )
         return blob_id
 
+    def _wait_for_blob_upload(self):
+        """Waits for the oldest pending blob upload.
+
+        Raises:
+          Exception: If the upload failed.
+        """
+        upload, blob_size = self._pending_blob_uploads.popleft()
+        with self._tracker.blob_tracker(blob_size) as blob_tracker:
+            upload.result()
+            blob_tracker.mark_uploaded(True)
+
 
 def _varint_cost(n: int):
     """Computes the size of `n` encoded as an unsigned base-128 varint.
@@ -60,6 +60,18 @@ flags.DEFINE_string(
     "If present, all runs created by this invocation will have their name "
     "prefixed by this value.",
 )
+flags.DEFINE_string(
+    "checkpoint_path",
+    None,
+    "If present, local or GCS path of a file to record the upload progress in, "
+    "so that a restarted upload resumes where it stopped.",
+)
+flags.DEFINE_integer(
+    "max_concurrent_runs",
+    1,
+    "Maximum number of runs uploaded at the same time. Runs share the request "
+    "rate limits.",
+)
 flags.DEFINE_string(
     "api_uri",
     "aiplatform.googleapis.com",
@@ -144,6 +156,8 @@ def main(argv):
         one_shot=FLAGS.one_shot,
         event_file_inactive_secs=FLAGS.event_file_inactive_secs,
         run_name_prefix=FLAGS.run_name_prefix,
+        checkpoint_path=FLAGS.checkpoint_path,
+        max_concurrent_runs=FLAGS.max_concurrent_runs,
     )
 
     tb_uploader.create_experiment()
@@ -17,14 +17,24 @@
 
 """Shared utils for tensorboard log uploader."""
 import abc
+import base64
 import contextlib
 import json
 import logging
+import os
 import re
+import struct
+import threading
 import time
-from typing import Callable, Dict, Generator, Optional, List, Tuple
+from typing import Any, Callable, Dict, Generator, Iterator, Optional, List, Tuple
 import uuid
 
+import google_crc32c
+from tensorboard import data_compat
+from tensorboard import dataclass_compat
+from tensorboard.compat import tf
+from tensorboard.compat.proto import event_pb2
+from tensorboard.compat.proto import summary_pb2
 from tensorboard.util import tb_logging
 
 from google.api_core import exceptions
@@ -132,8 +142,9 @@ class OnePlatformResourceManager(object):
         """
         batch_size = OnePlatformResourceManager.CREATE_TIME_SERIES_BATCH_SIZE
         run_tag_name_to_time_series_entries = list(run_tag_name_to_time_series.items())
+        # Copied first, as runs may be added by another thread meanwhile.
         run_resource_name_to_run_name = {
-            v: k for k, v in self._run_name_to_run_resource_name.items()
+            v: k for k, v in list(self._run_name_to_run_resource_name.items())
         }
         created_time_series = []
         for i in range(0, len(run_tag_name_to_time_series_entries), batch_size):
@@ -437,6 +448,299 @@ class TimeSeriesResourceManager(object):
         return time_series
 
 
+class UploadCheckpoint(object):
+    """Progress of an upload, persisted so that a new uploader can resume it.
+
+    For every event file the checkpoint records the byte offset up to which
+    its records were uploaded, together with the initial tag metadata needed
+    to keep decoding the file from there. For every time series it records
+    the metadata of the time series.
+
+    File offsets are only committed by `commit()`, once all events read
+    from the files of a run have been uploaded. Data points are never
+    skipped by their step, since a restarted training job rewrites the steps
+    it already logged to a new event file. The data points of a run whose
+    upload was interrupted are sent again from the last committed offsets.
+
+    This class is threadsafe.
+    """
+
+    _VERSION = 1
+
+    # Minimum number of seconds between two saves when committing single runs.
+    SAVE_INTERVAL_SECS = 10
+
+    def __init__(
+        self,
+        path: str,
+        experiment_resource_name: str,
+        logdir: str,
+        reset: bool = False,
+    ):
+        """Constructor for UploadCheckpoint.
+
+        Args:
+            path (str):
+                Required. Local or GCS path of the checkpoint file.
+            experiment_resource_name (str):
+                Required. Resource name of the experiment the logdir is
+                uploaded to.
+            logdir (str):
+                Required. Path of the log directory being uploaded.
+            reset (bool):
+                Optional. Whether to ignore the progress recorded in an existing
+                checkpoint file, e.g. because the experiment is new.
+        """
+        self._path = path
+        self._experiment_resource_name = experiment_resource_name
+        self._logdir = logdir
+        # Maps event file paths to (offset, tag to initial SummaryMetadata).
+        self._files: Dict[str, Tuple[int, Dict[str, summary_pb2.SummaryMetadata]]] = {}
+        self._pending_files: Dict[
+            str, Tuple[int, Dict[str, summary_pb2.SummaryMetadata]]
+        ] = {}
+        self._metadata: Dict[Tuple[str, str], summary_pb2.SummaryMetadata] = {}
+        self._last_save_time = time.time()
+        self._lock = threading.RLock()
+        if not reset:
+            self._load()
+
+    def _load(self):
+        """Reads the recorded progress from the checkpoint file, if any."""
+        if not tf.io.gfile.exists(self._path):
+            return
+        with tf.io.gfile.GFile(self._path, "r") as f:
+            state = json.load(f)
+        if (
+            state.get("version") != self._VERSION
+            or state.get("experiment") != self._experiment_resource_name
+            or state.get("logdir") != self._logdir
+        ):
+            logger.warning(
+                "Ignoring upload checkpoint %s recorded for another upload.",
+                self._path,
+            )
+            return
+        for file_path, file_state in state["files"].items():
+            self._files[file_path] = (
+                file_state["offset"],
+                {
+                    tag: _decode_summary_metadata(metadata)
+                    for tag, metadata in file_state["initial_metadata"].items()
+                },
+            )
+        for run_name, tags in state["time_series"].items():
+            for tag, time_series_state in tags.items():
+                self._metadata[(run_name, tag)] = _decode_summary_metadata(
+                    time_series_state["metadata"]
+                )
+
+    def get_file_state(
+        self, file_path: str
+    ) -> Tuple[int, Dict[str, summary_pb2.SummaryMetadata]]:
+        """Returns the uploaded offset and initial tag metadata of a file."""
+        with self._lock:
+            offset, initial_metadata = self._files.get(file_path, (0, {}))
+            return offset, dict(initial_metadata)
+
+    def set_file_state(
+        self,
+        file_path: str,
+        offset: int,
+        initial_metadata: Dict[str, summary_pb2.SummaryMetadata],
+    ):
+        """Records the offset up to which a file was read.
+
+        The offset only counts as uploaded after the next `commit()`.
+        """
+        with self._lock:
+            self._pending_files[file_path] = (offset, initial_metadata)
+
+    def get_time_series_metadata(
+        self,
+    ) -> Dict[Tuple[str, str], summary_pb2.SummaryMetadata]:
+        """Returns the metadata of the recorded time series by (run, tag)."""
+        with self._lock:
+            return dict(self._metadata)
+
+    def set_time_series_metadata(
+        self, run_name: str, tag: str, metadata: summary_pb2.SummaryMetadata
+    ):
+        """Records the metadata of a time series."""
+        with self._lock:
+            self._metadata[(run_name, tag)] = metadata
+
+    def commit(self, run: Optional[str] = None):
+        """Commits the recorded file offsets and saves the checkpoint.
+
+        Must only be called while no file of the committed runs is being read.
+
+        Args:
+            run (str):
+                Optional. Path of the run directory relative to the logdir, as
+                named by `LogdirLoader`, to commit the file offsets of. The
+                offsets of all files are committed if not set. The checkpoint
+                is only saved if it was not saved in the last
+                `SAVE_INTERVAL_SECS` when committing a single run.
+        """
+        with self._lock:
+            if run is None:
+                file_paths = list(self._pending_files)
+            else:
+                file_paths = [
+                    file_path
+                    for file_path in self._pending_files
+                    if os.path.relpath(os.path.dirname(file_path), self._logdir)
+                    == os.path.normpath(run)
+                ]
+            for file_path in file_paths:
+                offset, initial_metadata = self._pending_files.pop(file_path)
+                # The loaders keep updating their initial metadata.
+                self._files[file_path] = (offset, dict(initial_metadata))
+            self.save(force=run is None)
+
+    def save(self, force: bool = False):
+        """Saves the checkpoint file.
+
+        Args:
+            force (bool):
+                Optional. Whether to save even if the checkpoint was saved less
+                than `SAVE_INTERVAL_SECS` ago.
+        """
+        with self._lock:
+            if (
+                not force
+                and time.time() - self._last_save_time < self.SAVE_INTERVAL_SECS
+            ):
+                return
+            time_series = {}
+            for (run_name, tag), metadata in self._metadata.items():
+                time_series.setdefault(run_name, {})[tag] = {
+                    "metadata": _encode_summary_metadata(metadata),
+                }
+            state = {
+                "version": self._VERSION,
+                "experiment": self._experiment_resource_name,
+                "logdir": self._logdir,
+                "files": {
+                    file_path: {
+                        "offset": offset,
+                        "initial_metadata": {
+                            tag: _encode_summary_metadata(metadata)
+                            for tag, metadata in initial_metadata.items()
+                        },
+                    }
+                    for file_path, (offset, initial_metadata) in self._files.items()
+                },
+                "time_series": time_series,
+            }
+            checkpoint_dir = os.path.dirname(self._path)
+            if checkpoint_dir:
+                tf.io.gfile.makedirs(checkpoint_dir)
+            # Write a temporary file first so that a crash never leaves a
+            # partially written checkpoint behind.
+            temp_path = self._path + ".tmp"
+            with tf.io.gfile.GFile(temp_path, "w") as f:
+                json.dump(state, f)
+            tf.io.gfile.rename(temp_path, self._path, overwrite=True)
+            self._last_save_time = time.time()
+
+
+class CheckpointedEventFileLoader(object):
+    """Loads the events of an event file, resuming at a checkpointed offset.
+
+    Yields the same (wall time, event) pairs as
+    `event_file_loader.TimestampedEventFileLoader`, but reads the TFRecord
+    framing itself so that reading starts at the offset recorded in an
+    `UploadCheckpoint`. A file that has not grown since it was last read is
+    not opened at all.
+    """
+
+    # Bytes of a record besides its data: length, length CRC and data CRC.
+    _RECORD_HEADER_SIZE = 12
+    _RECORD_FOOTER_SIZE = 4
+
+    def __init__(self, file_path: str, checkpoint: UploadCheckpoint):
+        """Constructor for CheckpointedEventFileLoader.
+
+        Args:
+            file_path (str):
+                Required. Path of the event file.
+            checkpoint (UploadCheckpoint):
+                Required. Checkpoint to resume from and record progress in.
+        """
+        self._file_path = file_path
+        self._checkpoint = checkpoint
+        self._offset, self._initial_metadata = checkpoint.get_file_state(file_path)
+
+    def Load(self) -> Iterator[Tuple[float, event_pb2.Event]]:
+        """Loads all new events of the file.
+
+        A truncated record at the end of the file is left to be read by the
+        next call, once it is complete.
+
+        Yields:
+            Pairs of (UNIX timestamp float, Event proto) for all events in the
+            file that have not been yielded yet.
+        """
+        try:
+            if tf.io.gfile.stat(self._file_path).length <= self._offset:
+                return
+        except tf.errors.NotFoundError:
+            return
+        with tf.io.gfile.GFile(self._file_path, "rb") as f:
+            f.seek(self._offset)
+            while True:
+                record = self._read_record(f)
+                if record is None:
+                    return
+                event = data_compat.migrate_event(event_pb2.Event.FromString(record))
+                for event in dataclass_compat.migrate_event(
+                    event, self._initial_metadata
+                ):
+                    yield (event.wall_time, event)
+                self._offset += (
+                    self._RECORD_HEADER_SIZE + len(record) + self._RECORD_FOOTER_SIZE
+                )
+                self._checkpoint.set_file_state(
+                    self._file_path, self._offset, self._initial_metadata
+                )
+
+    def _read_record(self, f: Any) -> Optional[bytes]:
+        """Reads the data of the next complete, intact record, if any."""
+        header = f.read(self._RECORD_HEADER_SIZE)
+        if len(header) < self._RECORD_HEADER_SIZE:
+            return None
+        (length,) = struct.unpack("<Q", header[:8])
+        (length_crc,) = struct.unpack("<I", header[8:])
+        if _masked_crc32c(header[:8]) != length_crc:
+            logger.warning("Corrupt record header in %s.", self._file_path)
+            return None
+        data = f.read(length + self._RECORD_FOOTER_SIZE)
+        if len(data) < length + self._RECORD_FOOTER_SIZE:
+            return None
+        record = data[:length]
+        (data_crc,) = struct.unpack("<I", data[length:])
+        if _masked_crc32c(record) != data_crc:
+            logger.warning("Corrupt record data in %s.", self._file_path)
+            return None
+        return record
+
+
+def _masked_crc32c(data: bytes) -> int:
+    """Returns the masked CRC32C checksum TFRecord files store for data."""
+    crc = google_crc32c.value(data)
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+def _encode_summary_metadata(metadata: summary_pb2.SummaryMetadata) -> str:
+    return base64.b64encode(metadata.SerializeToString()).decode("ascii")
+
+
+def _decode_summary_metadata(encoded: str) -> summary_pb2.SummaryMetadata:
+    return summary_pb2.SummaryMetadata.FromString(base64.b64decode(encoded))
+
+
 def get_source_bucket(logdir: str) -> Optional[storage.Bucket]:
     """Returns a storage bucket object given a log directory.
 
@@ -17,7 +17,7 @@
 
 import datetime
 import time
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import abc
 
@@ -31,6 +31,7 @@ from google.cloud.aiplatform import jobs
 from google.cloud.aiplatform import schema
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import console_utils
+from google.cloud.aiplatform.utils import job_poller
 
 from google.cloud.aiplatform.compat.types import (
     env_var as gca_env_var,
@@ -166,14 +167,14 @@ class _TrainingJob(base.VertexAiStatefulResource):
     def start_time(self) -> Optional[datetime.datetime]:
         """Time when the TrainingJob entered the `PIPELINE_STATE_RUNNING` for
         the first time."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "start_time")
 
     @property
     def end_time(self) -> Optional[datetime.datetime]:
         """Time when the TrainingJob resource entered the `PIPELINE_STATE_SUCCEEDED`,
         `PIPELINE_STATE_FAILED`, `PIPELINE_STATE_CANCELLED` state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "end_time")
 
     @property
@@ -181,7 +182,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
         """Detailed error info for this TrainingJob resource. Only populated when
         the TrainingJob's state is `PIPELINE_STATE_FAILED` or
         `PIPELINE_STATE_CANCELLED`."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "error")
 
     @classmethod
@@ -789,7 +790,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
         if self._assert_has_run():
             return
 
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.state
 
     def get_model(self, sync=True) -> models.Model:
@@ -868,15 +869,21 @@ class _TrainingJob(base.VertexAiStatefulResource):
         """Helper method to block and check on job until complete."""
 
         # Used these numbers so failures surface fast
-        wait = 5  # start at five seconds
-        log_wait = 5
+        log_wait = 5  # start at five seconds
         max_wait = 60 * 5  # 5 minute wait
         multiplier = 2  # scale wait by 2 every iteration
 
         previous_time = time.time()
+        previous_resource = None
 
-        while self.state not in _PIPELINE_COMPLETE_STATES:
+        for _ in job_poller.global_poller.watch(self):
             current_time = time.time()
+            # The callback may send requests of its own, so it only runs when
+            # the resource changed or its state is logged, rather than on
+            # every status check.
+            resource = self._gca_resource._pb.SerializeToString()
+            run_callback = resource != previous_resource
+            previous_resource = resource
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
                     "%s %s current state:\n%s"
@@ -888,8 +895,9 @@ class _TrainingJob(base.VertexAiStatefulResource):
                 )
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
-            self._wait_callback()
-            time.sleep(wait)
+                run_callback = True
+            if run_callback:
+                self._wait_callback()
 
         self._raise_failure()
 
@@ -950,6 +958,8 @@ class _TrainingJob(base.VertexAiStatefulResource):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
     ) -> List["base.VertexAiResourceNoun"]:
         """List all instances of this TrainingJob resource.
 
@@ -977,6 +987,12 @@ class _TrainingJob(base.VertexAiStatefulResource):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to retrieve list. Overrides
                 credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to return. If not
+                set, all resources are returned.
 
         Returns:
             List[VertexAiResourceNoun] - A list of TrainingJob resource objects
@@ -994,6 +1010,80 @@ class _TrainingJob(base.VertexAiStatefulResource):
             project=project,
             location=location,
             credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        return_gapic_resources: bool = False,
+    ) -> Iterator[Union[base.VertexAiResourceNoun, proto.Message]]:
+        """Lazily list the instances of this TrainingJob resource.
+
+        Pages are requested as the results are consumed. When `order_by` is
+        set, all resources are listed and sorted locally before the first one
+        is yielded.
+
+        Example Usage:
+
+        for training_job in aiplatform.CustomTrainingJob.iter_list(max_results=10):
+            print(training_job.display_name)
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            page_size (int):
+                Optional. The number of resources requested per page. If not
+                set, the service default is used.
+            max_results (int):
+                Optional. The maximum number of resources to yield. If not set,
+                all resources are yielded.
+            return_gapic_resources (bool):
+                Optional. Whether to yield the GAPIC resources as returned by
+                the service instead of constructing SDK resource objects.
+
+        Yields:
+            Union[base.VertexAiResourceNoun, proto.Message] - The SDK resource
+            objects, or the GAPIC resources if `return_gapic_resources` is set.
+        """
+
+        training_job_subclass_filter = (
+            lambda gapic_obj: gapic_obj.training_task_definition
+            in cls._supported_training_schemas
+        )
+
+        return cls._iter_list_with_local_order(
+            cls_filter=training_job_subclass_filter,
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            page_size=page_size,
+            max_results=max_results,
+            return_gapic_resources=return_gapic_resources,
         )
 
     def cancel(self) -> None:
@@ -1011,6 +1101,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
                 "to start. `cancel()` can only be called on a job that is running."
             )
         self.api_client.cancel_training_pipeline(name=self.resource_name)
+        self._mark_gca_resource_stale()
 
     def wait_for_resource_creation(self) -> None:
         """Waits until resource has been created."""
@@ -18,10 +18,20 @@
 
 import abc
 import datetime
+import importlib
 import pathlib
 import logging
 import re
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    TypeVar,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from google.protobuf import timestamp_pb2
 
@@ -33,35 +43,37 @@ from google.cloud import storage
 from google.cloud.aiplatform import compat
 from google.cloud.aiplatform.constants import base as constants
 from google.cloud.aiplatform import initializer
-
-from google.cloud.aiplatform.compat.services import (
-    dataset_service_client_v1beta1,
-    endpoint_service_client_v1beta1,
-    featurestore_online_serving_service_client_v1beta1,
-    featurestore_service_client_v1beta1,
-    index_service_client_v1beta1,
-    index_endpoint_service_client_v1beta1,
-    job_service_client_v1beta1,
-    metadata_service_client_v1beta1,
-    model_service_client_v1beta1,
-    pipeline_service_client_v1beta1,
-    prediction_service_client_v1beta1,
-    tensorboard_service_client_v1beta1,
-)
-from google.cloud.aiplatform.compat.services import (
-    dataset_service_client_v1,
-    endpoint_service_client_v1,
-    featurestore_online_serving_service_client_v1,
-    featurestore_service_client_v1,
-    index_service_client_v1,
-    index_endpoint_service_client_v1,
-    job_service_client_v1,
-    metadata_service_client_v1,
-    model_service_client_v1,
-    pipeline_service_client_v1,
-    prediction_service_client_v1,
-    tensorboard_service_client_v1,
-)
+from google.cloud.aiplatform.utils import client_pool
+
+if TYPE_CHECKING:
+    from google.cloud.aiplatform.compat.services import (
+        dataset_service_client_v1beta1,
+        endpoint_service_client_v1beta1,
+        featurestore_online_serving_service_client_v1beta1,
+        featurestore_service_client_v1beta1,
+        index_service_client_v1beta1,
+        index_endpoint_service_client_v1beta1,
+        job_service_client_v1beta1,
+        metadata_service_client_v1beta1,
+        model_service_client_v1beta1,
+        pipeline_service_client_v1beta1,
+        prediction_service_client_v1beta1,
+        tensorboard_service_client_v1beta1,
+    )
+    from google.cloud.aiplatform.compat.services import (
+        dataset_service_client_v1,
+        endpoint_service_client_v1,
+        featurestore_online_serving_service_client_v1,
+        featurestore_service_client_v1,
+        index_service_client_v1,
+        index_endpoint_service_client_v1,
+        job_service_client_v1,
+        metadata_service_client_v1,
+        model_service_client_v1,
+        pipeline_service_client_v1,
+        prediction_service_client_v1,
+        tensorboard_service_client_v1,
+    )
 
 from google.cloud.aiplatform.compat.types import (
     accelerator_type as gca_accelerator_type,
@@ -70,29 +82,31 @@ from google.cloud.aiplatform.compat.types import (
 VertexAiServiceClient = TypeVar(
     "VertexAiServiceClient",
     # v1beta1
-    dataset_service_client_v1beta1.DatasetServiceClient,
-    endpoint_service_client_v1beta1.EndpointServiceClient,
-    featurestore_online_serving_service_client_v1beta1.FeaturestoreOnlineServingServiceClient,
-    featurestore_service_client_v1beta1.FeaturestoreServiceClient,
-    index_service_client_v1beta1.IndexServiceClient,
-    index_endpoint_service_client_v1beta1.IndexEndpointServiceClient,
-    model_service_client_v1beta1.ModelServiceClient,
-    prediction_service_client_v1beta1.PredictionServiceClient,
-    pipeline_service_client_v1beta1.PipelineServiceClient,
-    job_service_client_v1beta1.JobServiceClient,
-    metadata_service_client_v1beta1.MetadataServiceClient,
-    tensorboard_service_client_v1beta1.TensorboardServiceClient,
+    "dataset_service_client_v1beta1.DatasetServiceClient",
+    "endpoint_service_client_v1beta1.EndpointServiceClient",
+    "featurestore_online_serving_service_client_v1beta1.FeaturestoreOnlineServingServiceClient",
+    "featurestore_service_client_v1beta1.FeaturestoreServiceClient",
+    "index_service_client_v1beta1.IndexServiceClient",
+    "index_endpoint_service_client_v1beta1.IndexEndpointServiceClient",
+    "model_service_client_v1beta1.ModelServiceClient",
+    "prediction_service_client_v1beta1.PredictionServiceClient",
+    "pipeline_service_client_v1beta1.PipelineServiceClient",
+    "job_service_client_v1beta1.JobServiceClient",
+    "metadata_service_client_v1beta1.MetadataServiceClient",
+    "tensorboard_service_client_v1beta1.TensorboardServiceClient",
     # v1
-    dataset_service_client_v1.DatasetServiceClient,
-    endpoint_service_client_v1.EndpointServiceClient,
-    featurestore_online_serving_service_client_v1.FeaturestoreOnlineServingServiceClient,
-    featurestore_service_client_v1.FeaturestoreServiceClient,
-    metadata_service_client_v1.MetadataServiceClient,
-    model_service_client_v1.ModelServiceClient,
-    prediction_service_client_v1.PredictionServiceClient,
-    pipeline_service_client_v1.PipelineServiceClient,
-    job_service_client_v1.JobServiceClient,
-    tensorboard_service_client_v1.TensorboardServiceClient,
+    "dataset_service_client_v1.DatasetServiceClient",
+    "endpoint_service_client_v1.EndpointServiceClient",
+    "featurestore_online_serving_service_client_v1.FeaturestoreOnlineServingServiceClient",
+    "featurestore_service_client_v1.FeaturestoreServiceClient",
+    "index_service_client_v1.IndexServiceClient",
+    "index_endpoint_service_client_v1.IndexEndpointServiceClient",
+    "metadata_service_client_v1.MetadataServiceClient",
+    "model_service_client_v1.ModelServiceClient",
+    "prediction_service_client_v1.PredictionServiceClient",
+    "pipeline_service_client_v1.PipelineServiceClient",
+    "job_service_client_v1.JobServiceClient",
+    "tensorboard_service_client_v1.TensorboardServiceClient",
 )
 
 
@@ -323,8 +337,8 @@ def extract_bucket_and_prefix_from_gcs_path(gcs_path: str) -> Tuple[str, Optiona
 
 class ClientWithOverride:
     class WrappedClient:
-        """Wrapper class for client that creates client at API invocation
-        time."""
+        """Wrapper class for client that resolves the client from the shared
+        client pool at API invocation time."""
 
         def __init__(
             self,
@@ -350,20 +364,25 @@ class ClientWithOverride:
             self._credentials = credentials
             self._client_options = client_options
             self._client_info = client_info
+            self._pool_key = client_pool.ClientPool.get_key(
+                client_class=client_class,
+                client_options=client_options,
+                client_info=client_info,
+                credentials=credentials,
+            )
 
         def __getattr__(self, name: str) -> Any:
-            """Instantiates client and returns attribute of the client."""
-            temporary_client = self._client_class(
-                credentials=self._credentials,
+            """Gets the pooled client and returns attribute of the client."""
+            if name.startswith("__"):
+                raise AttributeError(name)
+            client = initializer.global_client_pool.get_client(
+                client_class=self._client_class,
                 client_options=self._client_options,
                 client_info=self._client_info,
+                credentials=self._credentials,
+                key=self._pool_key,
             )
-            return getattr(temporary_client, name)
-
-    @property
-    @abc.abstractmethod
-    def _is_temporary(self) -> bool:
-        pass
+            return getattr(client, name)
 
     @property
     @classmethod
@@ -394,28 +413,33 @@ class ClientWithOverride:
                 Optional. Client credentials to pass to client.
         """
 
-        self._clients = {
-            version: self.WrappedClient(
-                client_class=client_class,
-                client_options=client_options,
-                client_info=client_info,
-                credentials=credentials,
-            )
-            if self._is_temporary
-            else client_class(
-                client_options=client_options,
-                client_info=client_info,
-                credentials=credentials,
-            )
-            for version, client_class in self._version_map
-        }
+        self._client_options = client_options
+        self._client_info = client_info
+        self._credentials = credentials
+
+        # Wrappers are cheap, the underlying clients and channels are only
+        # created on first use and are shared through the global client pool.
+        # Wrappers for non-default versions are created when selected so that
+        # their GAPIC modules are only imported when they are used.
+        self._clients = {}
+        self.select_version(self._default_version)
 
     def __getattr__(self, name: str) -> Any:
-        """Instantiates client and returns attribute of the client."""
+        """Returns attribute of the client for the default version."""
+        if name.startswith("__"):
+            raise AttributeError(name)
         return getattr(self._clients[self._default_version], name)
 
     def select_version(self, version: str) -> VertexAiServiceClient:
-        return self._clients[version]
+        client = self._clients.get(version)
+        if client is None:
+            client = self._clients[version] = self.WrappedClient(
+                client_class=self.get_gapic_client_class(version),
+                client_options=self._client_options,
+                client_info=self._client_info,
+                credentials=self._credentials,
+            )
+        return client
 
     @classmethod
     def get_gapic_client_class(
@@ -431,132 +455,147 @@ class ClientWithOverride:
         Retuns:
             Underlying GAPIC client for this wrapper and version.
         """
-        return dict(cls._version_map)[version or cls._default_version]
+        # The version map names the client by its `compat.services` module to
+        # only import the GAPIC module of the requested version.
+        module_name, class_name = dict(cls._version_map)[
+            version or cls._default_version
+        ].split(".")
+        return getattr(getattr(compat.services, module_name), class_name)
+
+    @classmethod
+    def get_gapic_async_client_class(cls, version: Optional[str] = None) -> Type:
+        """Gets the generated asyncio GAPIC client paired with the underlying client.
+
+        Args:
+            version (str):
+                Optional. Version of client to retrieve otherwise the default version is returned.
+        Returns:
+            Underlying GAPIC asyncio client for this wrapper and version.
+        """
+        client_class = cls.get_gapic_client_class(version)
+        # Generated services export both clients from the service package, ie:
+        # google.cloud.aiplatform_v1.services.prediction_service
+        service_package = importlib.import_module(
+            client_class.__module__.rsplit(".", 1)[0]
+        )
+        return getattr(
+            service_package, client_class.__name__.replace("Client", "AsyncClient")
+        )
 
 
 class DatasetClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, dataset_service_client_v1.DatasetServiceClient),
-        (compat.V1BETA1, dataset_service_client_v1beta1.DatasetServiceClient),
+        (compat.V1, "dataset_service_client_v1.DatasetServiceClient"),
+        (compat.V1BETA1, "dataset_service_client_v1beta1.DatasetServiceClient"),
     )
 
 
 class EndpointClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, endpoint_service_client_v1.EndpointServiceClient),
-        (compat.V1BETA1, endpoint_service_client_v1beta1.EndpointServiceClient),
+        (compat.V1, "endpoint_service_client_v1.EndpointServiceClient"),
+        (compat.V1BETA1, "endpoint_service_client_v1beta1.EndpointServiceClient"),
     )
 
 
 class IndexClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, index_service_client_v1.IndexServiceClient),
-        (compat.V1BETA1, index_service_client_v1beta1.IndexServiceClient),
+        (compat.V1, "index_service_client_v1.IndexServiceClient"),
+        (compat.V1BETA1, "index_service_client_v1beta1.IndexServiceClient"),
     )
 
 
 class IndexEndpointClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, index_endpoint_service_client_v1.IndexEndpointServiceClient),
+        (compat.V1, "index_endpoint_service_client_v1.IndexEndpointServiceClient"),
         (
             compat.V1BETA1,
-            index_endpoint_service_client_v1beta1.IndexEndpointServiceClient,
+            "index_endpoint_service_client_v1beta1.IndexEndpointServiceClient",
         ),
     )
 
 
 class FeaturestoreClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, featurestore_service_client_v1.FeaturestoreServiceClient),
-        (compat.V1BETA1, featurestore_service_client_v1beta1.FeaturestoreServiceClient),
+        (compat.V1, "featurestore_service_client_v1.FeaturestoreServiceClient"),
+        (
+            compat.V1BETA1,
+            "featurestore_service_client_v1beta1.FeaturestoreServiceClient",
+        ),
     )
 
 
 class FeaturestoreOnlineServingClientWithOverride(ClientWithOverride):
-    _is_temporary = False
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
         (
             compat.V1,
-            featurestore_online_serving_service_client_v1.FeaturestoreOnlineServingServiceClient,
+            "featurestore_online_serving_service_client_v1.FeaturestoreOnlineServingServiceClient",
         ),
         (
             compat.V1BETA1,
-            featurestore_online_serving_service_client_v1beta1.FeaturestoreOnlineServingServiceClient,
+            "featurestore_online_serving_service_client_v1beta1.FeaturestoreOnlineServingServiceClient",
         ),
     )
 
 
 class JobClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, job_service_client_v1.JobServiceClient),
-        (compat.V1BETA1, job_service_client_v1beta1.JobServiceClient),
+        (compat.V1, "job_service_client_v1.JobServiceClient"),
+        (compat.V1BETA1, "job_service_client_v1beta1.JobServiceClient"),
     )
 
 
 class ModelClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, model_service_client_v1.ModelServiceClient),
-        (compat.V1BETA1, model_service_client_v1beta1.ModelServiceClient),
+        (compat.V1, "model_service_client_v1.ModelServiceClient"),
+        (compat.V1BETA1, "model_service_client_v1beta1.ModelServiceClient"),
     )
 
 
 class PipelineClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, pipeline_service_client_v1.PipelineServiceClient),
-        (compat.V1BETA1, pipeline_service_client_v1beta1.PipelineServiceClient),
+        (compat.V1, "pipeline_service_client_v1.PipelineServiceClient"),
+        (compat.V1BETA1, "pipeline_service_client_v1beta1.PipelineServiceClient"),
     )
 
 
 class PipelineJobClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, pipeline_service_client_v1.PipelineServiceClient),
-        (compat.V1BETA1, pipeline_service_client_v1beta1.PipelineServiceClient),
+        (compat.V1, "pipeline_service_client_v1.PipelineServiceClient"),
+        (compat.V1BETA1, "pipeline_service_client_v1beta1.PipelineServiceClient"),
     )
 
 
 class PredictionClientWithOverride(ClientWithOverride):
-    _is_temporary = False
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, prediction_service_client_v1.PredictionServiceClient),
-        (compat.V1BETA1, prediction_service_client_v1beta1.PredictionServiceClient),
+        (compat.V1, "prediction_service_client_v1.PredictionServiceClient"),
+        (compat.V1BETA1, "prediction_service_client_v1beta1.PredictionServiceClient"),
     )
 
 
 class MetadataClientWithOverride(ClientWithOverride):
-    _is_temporary = True
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, metadata_service_client_v1.MetadataServiceClient),
-        (compat.V1BETA1, metadata_service_client_v1beta1.MetadataServiceClient),
+        (compat.V1, "metadata_service_client_v1.MetadataServiceClient"),
+        (compat.V1BETA1, "metadata_service_client_v1beta1.MetadataServiceClient"),
     )
 
 
 class TensorboardClientWithOverride(ClientWithOverride):
-    _is_temporary = False
     _default_version = compat.DEFAULT_VERSION
     _version_map = (
-        (compat.V1, tensorboard_service_client_v1.TensorboardServiceClient),
-        (compat.V1BETA1, tensorboard_service_client_v1beta1.TensorboardServiceClient),
+        (compat.V1, "tensorboard_service_client_v1.TensorboardServiceClient"),
+        (compat.V1BETA1, "tensorboard_service_client_v1beta1.TensorboardServiceClient"),
     )
 
 
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import queue
+import threading
+from typing import Any, Iterator, Optional
+
+# Seconds a stream reader waits for room in the batch queue before checking
+# whether the consumer has stopped.
+_QUEUE_PUT_POLL_INTERVAL = 0.1
+
+
+def iter_read_session_record_batches(
+    read_client: Any,
+    read_session: Any,
+    max_concurrent_streams: int = 8,
+    max_queued_batches: Optional[int] = None,
+) -> Iterator[
+    "pyarrow.RecordBatch"  # noqa: F821 - skip check for undefined name 'pyarrow'
+]:
+    """Reads the streams of a BigQuery Storage read session concurrently.
+
+    Record batches are yielded as soon as any stream produces them, so batches
+    of different streams are interleaved. Memory is bounded by the queued
+    batches plus one batch being decoded per stream reader. Closing the
+    iterator early stops the stream readers.
+
+    Args:
+        read_client (bigquery_storage.BigQueryReadClient):
+            Required. Client to read the streams with.
+        read_session (bigquery_storage.types.ReadSession):
+            Required. Read session with data format ARROW.
+        max_concurrent_streams (int):
+            Optional. The maximum number of streams read at the same time.
+        max_queued_batches (int):
+            Optional. The maximum number of decoded batches waiting to be
+            consumed. Defaults to twice `max_concurrent_streams`.
+
+    Yields:
+        pyarrow.RecordBatch: The record batches of all streams.
+    """
+    streams = list(read_session.streams)
+    if not streams:
+        return
+
+    batches = queue.Queue(maxsize=max_queued_batches or 2 * max_concurrent_streams)
+    stopped = threading.Event()
+    stream_done = object()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                batches.put(item, timeout=_QUEUE_PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read_stream(stream_name: str):
+        try:
+            if stopped.is_set():
+                return
+            for page in read_client.read_rows(stream_name).rows().pages:
+                if not put(page.to_arrow()):
+                    return
+        except Exception as exc:
+            put(exc)
+        finally:
+            put(stream_done)
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=min(max_concurrent_streams, len(streams))
+    )
+    try:
+        for stream in streams:
+            executor.submit(read_stream, stream.name)
+
+        remaining_streams = len(streams)
+        while remaining_streams:
+            item = batches.get()
+            if item is stream_done:
+                remaining_streams -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stopped.set()
+        executor.shutdown(wait=True)
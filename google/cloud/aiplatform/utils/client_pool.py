@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
+
+from google.api_core import client_options
+from google.api_core import gapic_v1
+from google.auth import credentials as auth_credentials
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ClientPool:
+    """Process-wide pool of GAPIC clients.
+
+    Clients, and the gRPC channels they own, are shared between every SDK
+    resource object that talks to the same service version at the same API
+    endpoint with the same credentials. A pool created in a parent process
+    is emptied, without closing the inherited channels, the first time it is
+    used in a forked child.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[Hashable, ...], Any] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @staticmethod
+    def get_key(
+        client_class: Type,
+        client_options: client_options.ClientOptions,
+        client_info: gapic_v1.client_info.ClientInfo,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> Tuple[Hashable, ...]:
+        """Returns the key clients built with the given arguments are pooled
+        under.
+
+        Args:
+            client_class (Type):
+                Required. GAPIC client class. The class also determines the API
+                version.
+            client_options (client_options.ClientOptions):
+                Required. Client options to pass to client.
+            client_info (gapic_v1.client_info.ClientInfo):
+                Required. Client info to pass to client.
+            credentials (auth_credentials.credentials):
+                Optional. Client credentials to pass to client.
+        Returns:
+            The pool key.
+        """
+        return (
+            client_class,
+            client_options.api_endpoint,
+            client_info.to_user_agent(),
+            credentials,
+        )
+
+    def get_client(
+        self,
+        client_class: Type,
+        client_options: client_options.ClientOptions,
+        client_info: gapic_v1.client_info.ClientInfo,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        key: Optional[Tuple[Hashable, ...]] = None,
+    ) -> Any:
+        """Returns the pooled client for the given arguments, creating it on
+        first use.
+
+        Args:
+            client_class (Type):
+                Required. GAPIC client class to instantiate.
+            client_options (client_options.ClientOptions):
+                Required. Client options to pass to client.
+            client_info (gapic_v1.client_info.ClientInfo):
+                Required. Client info to pass to client.
+            credentials (auth_credentials.credentials):
+                Optional. Client credentials to pass to client.
+            key (Tuple):
+                Optional. Precomputed result of `get_key` for these arguments.
+        Returns:
+            The shared GAPIC client.
+        """
+        key = key or self.get_key(
+            client_class=client_class,
+            client_options=client_options,
+            client_info=client_info,
+            credentials=credentials,
+        )
+
+        if self._pid == os.getpid():
+            client = self._clients.get(key)
+            if client is not None:
+                return client
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # gRPC channels must not be used across fork, so the child
+                # starts with an empty pool.
+                self._clients = {}
+                self._pid = os.getpid()
+
+            client = self._clients.get(key)
+            if client is None:
+                client = client_class(
+                    credentials=credentials,
+                    client_options=client_options,
+                    client_info=client_info,
+                )
+                self._clients[key] = client
+            return client
+
+    def close(self):
+        """Closes the transports of all pooled clients and empties the pool.
+
+        Clients requested after this call are created again on demand.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            owned = self._pid == os.getpid()
+            self._pid = os.getpid()
+
+        if not owned:
+            return
+
+        for client in clients.values():
+            try:
+                client.transport.close()
+            except Exception:
+                _LOGGER.warning("Failed to close client transport.", exc_info=True)
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import threading
+from typing import Any, Callable, Iterable, Set
+
+
+class DependencyScheduler(futures.Executor):
+    """Thread pool executor that runs tasks once their dependencies are done.
+
+    A task submitted with `submit_after` is not handed to a worker thread
+    until every future it depends on has completed, so no worker is ever
+    blocked waiting on upstream work. Dependencies are tracked with future
+    callbacks: the task is queued by whichever thread completes its last
+    dependency, or run by it once the interpreter is exiting. If a dependency
+    fails, the task is not run and its future fails with the same exception.
+    """
+
+    def __init__(self, max_workers: int):
+        """Initializes the scheduler.
+
+        Args:
+            max_workers (int):
+                Required. The maximum number of tasks running at the same time.
+        """
+        self._max_workers = max_workers
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        # Futures of the tasks that have not completed yet.
+        self._pending: Set[futures.Future] = set()
+        self._num_waiting = 0
+        self._num_queued = 0
+        self._num_running = 0
+        self._shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of tasks running at the same time."""
+        return self._max_workers
+
+    @property
+    def num_waiting(self) -> int:
+        """The number of tasks waiting for their dependencies to complete."""
+        with self._lock:
+            return self._num_waiting
+
+    @property
+    def num_queued(self) -> int:
+        """The number of tasks ready to run and waiting for a worker thread."""
+        with self._lock:
+            return self._num_queued
+
+    @property
+    def num_running(self) -> int:
+        """The number of tasks running on a worker thread."""
+        with self._lock:
+            return self._num_running
+
+    def set_max_workers(self, max_workers: int):
+        """Changes the maximum number of tasks running at the same time.
+
+        Tasks already queued on the previous worker threads still run there,
+        tasks queued from now on run on the new worker threads.
+
+        Args:
+            max_workers (int):
+                Required. The maximum number of tasks running at the same time.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot resize a scheduler after shutdown")
+            if max_workers == self._max_workers:
+                return
+            previous_executor = self._executor
+            self._executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+            self._max_workers = max_workers
+        previous_executor.shutdown(wait=False)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> futures.Future:
+        """Schedules `fn(*args, **kwargs)` to run on a worker thread.
+
+        Returns:
+            The future of the call.
+        """
+        return self.submit_after((), fn, *args, **kwargs)
+
+    def submit_after(
+        self,
+        dependencies: Iterable[futures.Future],
+        fn: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> futures.Future:
+        """Schedules `fn(*args, **kwargs)` to run once all `dependencies` are done.
+
+        Args:
+            dependencies (Iterable[futures.Future]):
+                Required. The futures to complete before running `fn`. If any of
+                them fails, `fn` is not run and the returned future fails with
+                the same exception.
+            fn (Callable[..., Any]):
+                Required. The function to run.
+
+        Returns:
+            The future of the call.
+        """
+        future = futures.Future()
+        dependencies = set(dependencies)
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._pending.add(future)
+            self._num_waiting += 1
+        future.add_done_callback(self._discard_pending)
+
+        remaining_dependencies = [len(dependencies)]
+        remaining_dependencies_lock = threading.Lock()
+
+        def on_dependency_done(_: futures.Future):
+            with remaining_dependencies_lock:
+                remaining_dependencies[0] -= 1
+                if remaining_dependencies[0]:
+                    return
+            self._enqueue(future, dependencies, fn, args, kwargs)
+
+        if not dependencies:
+            self._enqueue(future, dependencies, fn, args, kwargs)
+        for dependency in dependencies:
+            # Runs immediately on this thread if the dependency is already done.
+            dependency.add_done_callback(on_dependency_done)
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stops accepting tasks and releases the worker threads.
+
+        Args:
+            wait (bool):
+                Optional. Whether to wait for all scheduled tasks, including the
+                ones still waiting for their dependencies, to complete.
+            cancel_futures (bool):
+                Optional. Whether to cancel the tasks that have not started yet.
+        """
+        with self._lock:
+            self._shutdown = True
+            pending = list(self._pending)
+        if cancel_futures:
+            for future in pending:
+                future.cancel()
+        if wait:
+            futures.wait(pending)
+        with self._lock:
+            executor = self._executor
+        # Tasks cancelled above that are still queued on the executor return
+        # without running, so the executor doesn't need to cancel them.
+        executor.shutdown(wait=wait)
+
+    def _enqueue(
+        self,
+        future: futures.Future,
+        dependencies: Set[futures.Future],
+        fn: Callable[..., Any],
+        args: Iterable[Any],
+        kwargs: dict,
+    ):
+        """Hands a task whose dependencies are done to a worker thread."""
+        with self._lock:
+            self._num_waiting -= 1
+
+        for dependency in dependencies:
+            if dependency.cancelled():
+                error = futures.CancelledError()
+            else:
+                error = dependency.exception()
+            if error:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+                return
+
+        with self._lock:
+            self._num_queued += 1
+            executor = self._executor
+        try:
+            executor.submit(self._run, future, fn, args, kwargs)
+        except RuntimeError as e:
+            with self._lock:
+                shutdown = self._shutdown
+            if not shutdown:
+                # The interpreter is exiting and concurrent.futures no longer
+                # starts tasks, so the thread that completed the last
+                # dependency runs this one for the chain to finish.
+                self._run(future, fn, args, kwargs)
+                return
+            # The scheduler was shut down without waiting for this task.
+            with self._lock:
+                self._num_queued -= 1
+            if future.set_running_or_notify_cancel():
+                future.set_exception(e)
+
+    def _run(
+        self,
+        future: futures.Future,
+        fn: Callable[..., Any],
+        args: Iterable[Any],
+        kwargs: dict,
+    ):
+        """Runs a task on a worker thread and sets the result of its future."""
+        with self._lock:
+            self._num_queued -= 1
+            self._num_running += 1
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        finally:
+            with self._lock:
+                self._num_running -= 1
+
+    def _discard_pending(self, future: futures.Future):
+        with self._lock:
+            self._pending.discard(future)
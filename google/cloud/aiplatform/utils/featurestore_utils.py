@@ -15,8 +15,11 @@
 # limitations under the License.
 #
 
+import collections
 import re
-from typing import Dict, NamedTuple, Optional
+import threading
+import time
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
 
 from google.cloud.aiplatform.compat.services import featurestore_service_client
 from google.cloud.aiplatform.compat.types import (
@@ -175,3 +178,147 @@ class _FeatureConfig(NamedTuple):
         )
 
         return create_feature_request
+
+
+class FeatureValueCache:
+    """Size-bounded LRU cache of online feature values.
+
+    Entries are keyed on (entity_type, entity_id, feature_id) and expire after
+    the TTL of their feature. Values that the Featurestore reported as missing
+    can be cached with a separate TTL, so unknown entities are not read again
+    on every lookup.
+
+    Usage:
+
+    cache = FeatureValueCache(max_size=100000, ttl=60, feature_ttls={'age': 3600})
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: float = 60.0,
+        feature_ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: Optional[float] = None,
+    ):
+        """Creates an empty cache.
+
+        Args:
+            max_size (int):
+                Optional. Maximum number of feature values held. The least
+                recently used values are evicted first.
+            ttl (float):
+                Optional. Seconds a feature value stays valid after it was read.
+            feature_ttls (Dict[str, float]):
+                Optional. TTL in seconds per feature ID, overriding `ttl`.
+            negative_ttl (float):
+                Optional. Seconds a missing feature value stays valid. Defaults
+                to the TTL of the feature. Set to 0 to disable negative caching.
+
+        Raises:
+            ValueError if max_size is not positive or a TTL is negative.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}.")
+        feature_ttls = dict(feature_ttls or {})
+        for value in [ttl, negative_ttl, *feature_ttls.values()]:
+            if value is not None and value < 0:
+                raise ValueError(f"TTLs must not be negative, got {value}.")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._feature_ttls = feature_ttls
+        self._negative_ttl = negative_ttl
+        self._entries: "collections.OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_ttl(self, feature_id: str, is_missing: bool) -> float:
+        """Returns the TTL of a value of the given feature."""
+        if is_missing and self._negative_ttl is not None:
+            return self._negative_ttl
+        return self._feature_ttls.get(feature_id, self._ttl)
+
+    def get(self, entity_type: str, entity_id: str, feature_id: str) -> Optional[Any]:
+        """Returns the cached value of a feature, or None on a miss.
+
+        Args:
+            entity_type (str):
+                Required. Resource name of the EntityType.
+            entity_id (str):
+                Required. ID of the entity.
+            feature_id (str):
+                Required. ID of the feature.
+        Returns:
+            The cached value, or None if it is not cached or has expired.
+        """
+        key = (entity_type, entity_id, feature_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        entity_type: str,
+        entity_id: str,
+        feature_id: str,
+        value: Any,
+        is_missing: bool = False,
+    ) -> None:
+        """Caches the value of a feature.
+
+        Args:
+            entity_type (str):
+                Required. Resource name of the EntityType.
+            entity_id (str):
+                Required. ID of the entity.
+            feature_id (str):
+                Required. ID of the feature.
+            value (Any):
+                Required. Value to cache.
+            is_missing (bool):
+                Optional. Whether the value records that the feature has no value.
+        """
+        ttl = self._get_ttl(feature_id, is_missing)
+        if ttl <= 0:
+            return
+        key = (entity_type, entity_id, feature_id)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """Drops cached values.
+
+        Args:
+            entity_type (str):
+                Optional. Resource name of the EntityType to drop values of.
+                Drops all values if not set.
+        """
+        with self._lock:
+            if entity_type is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == entity_type]:
+                del self._entries[key]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
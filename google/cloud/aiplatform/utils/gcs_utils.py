@@ -15,37 +15,76 @@
 # limitations under the License.
 
 
+import base64
+import collections
+from concurrent import futures
 import datetime
 import glob
+import io
+import itertools
 import logging
+import os
 import pathlib
-from typing import Optional
+import queue
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from google.api_core import exceptions
 from google.auth import credentials as auth_credentials
 from google.cloud import storage
+import google_crc32c
 
 from google.cloud.aiplatform import initializer
 
 
 _logger = logging.getLogger(__name__)
 
+# Files at least this large are uploaded as parts composed into one object.
+_COMPOSITE_UPLOAD_THRESHOLD = 150 * 1024 * 1024
+_COMPOSITE_UPLOAD_PART_SIZE = 64 * 1024 * 1024
+# The maximum number of objects Cloud Storage composes in one request.
+_MAX_COMPOSE_COMPONENTS = 32
+_COMPOSITE_UPLOAD_PART_SUFFIX = ".vertex-ai-upload-part-"
+_CHECKSUM_READ_SIZE = 8 * 1024 * 1024
+# The maximum number of lines of a blob read ahead of the consumer.
+_BLOB_LINES_BUFFER_SIZE = 1000
+# Blobs are read line by line from ranged downloads of this many bytes.
+_BLOB_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+_END_OF_BLOB = object()
+
+# Names of the default staging buckets known to exist in this process.
+_verified_staging_buckets = set()
+
 
 def upload_to_gcs(
     source_path: str,
     destination_uri: str,
     project: Optional[str] = None,
     credentials: Optional[auth_credentials.Credentials] = None,
+    max_concurrent_uploads: int = 8,
+    skip_unchanged: bool = True,
 ):
     """Uploads local files to GCS.
 
     After upload the `destination_uri` will contain the same data as the `source_path`.
 
+    Files are uploaded concurrently. Files of at least
+    `_COMPOSITE_UPLOAD_THRESHOLD` bytes are uploaded as parts in parallel and
+    composed into one object. Interrupted uploads can be resumed by calling
+    this function again: files whose destination object already has the same
+    size and CRC32C checksum are skipped.
+
     Args:
         source_path: Required. Path of the local data to copy to GCS.
         destination_uri: Required. GCS URI where the data should be uploaded.
         project: Optional. Google Cloud Project that contains the staging bucket.
         credentials: The custom credentials to use when making API calls.
             If not provided, default credentials will be used.
+        max_concurrent_uploads: Optional. The maximum number of files, or
+            parts of large files, uploaded at the same time.
+        skip_unchanged: Optional. Whether to skip files whose destination
+            object has the same checksum. Costs a list call for directories
+            and a get call for single files.
 
     Raises:
         RuntimeError: When source_path does not exist.
@@ -63,6 +102,7 @@ def upload_to_gcs(
         source_file_paths = glob.glob(
             pathname=str(source_path_obj / "**"), recursive=True
         )
+        uploads = []
         for source_file_path in source_file_paths:
             source_file_path_obj = pathlib.Path(source_file_path)
             if source_file_path_obj.is_dir():
@@ -74,19 +114,292 @@ def upload_to_gcs(
             destination_file_uri = (
                 destination_uri.rstrip("/") + "/" + source_file_relative_posix_path
             )
+            uploads.append((source_file_path, destination_file_uri))
+    else:
+        uploads = [(source_path, destination_uri)]
+
+    existing_objects = {}
+    if skip_unchanged:
+        existing_objects = _get_existing_objects(
+            storage_client=storage_client,
+            destination_uri=destination_uri,
+            is_dir=source_path_obj.is_dir(),
+        )
+
+    pending_uploads = []
+    for source_file_path, destination_file_uri in uploads:
+        if _is_unchanged(source_file_path, existing_objects.get(destination_file_uri)):
+            _logger.debug(
+                f'Skipping "{source_file_path}", "{destination_file_uri}" is up to date'
+            )
+            continue
+        pending_uploads.append((source_file_path, destination_file_uri))
+
+    _upload_files(
+        storage_client=storage_client,
+        uploads=pending_uploads,
+        max_concurrent_uploads=max_concurrent_uploads,
+    )
+
+
+def _get_existing_objects(
+    storage_client: storage.Client,
+    destination_uri: str,
+    is_dir: bool,
+) -> Dict[str, storage.Blob]:
+    """Returns the objects that already exist at an upload destination.
+
+    Args:
+        storage_client: Required. Client to look up the objects with.
+        destination_uri: Required. GCS URI of the upload destination.
+        is_dir: Required. Whether the destination is a directory.
+
+    Returns:
+        The existing objects by GCS URI.
+    """
+    destination_blob = storage.Blob.from_string(destination_uri, client=storage_client)
+    bucket = destination_blob.bucket
+    try:
+        if is_dir:
+            prefix = destination_blob.name.rstrip("/") + "/"
+            blobs = list(storage_client.list_blobs(bucket, prefix=prefix))
+        else:
+            blobs = [bucket.get_blob(destination_blob.name)]
+    except exceptions.NotFound:
+        return {}
+    return {f"gs://{bucket.name}/{blob.name}": blob for blob in blobs if blob}
+
+
+def _is_unchanged(source_file_path: str, blob: Optional[storage.Blob]) -> bool:
+    """Returns whether an object holds the same data as a local file.
+
+    Args:
+        source_file_path: Required. Path of the local file.
+        blob: Optional. The existing destination object, if any.
+
+    Returns:
+        True if the object has the size and CRC32C checksum of the file.
+    """
+    if blob is None or not blob.crc32c:
+        return False
+    if blob.size != os.path.getsize(source_file_path):
+        return False
+    return blob.crc32c == _file_crc32c(source_file_path)
+
+
+def _file_crc32c(file_path: str) -> str:
+    """Returns the base64 encoded CRC32C checksum of a file, as GCS reports it."""
+    checksum = google_crc32c.Checksum()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHECKSUM_READ_SIZE), b""):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode("utf-8")
+
+
+def _upload_files(
+    storage_client: storage.Client,
+    uploads: List[Tuple[str, str]],
+    max_concurrent_uploads: int,
+):
+    """Uploads local files to GCS concurrently.
+
+    Large files are split into parts that are uploaded as temporary objects
+    alongside the other files and composed once all of their parts are
+    uploaded.
+
+    Args:
+        storage_client: Required. Client to upload with.
+        uploads: Required. Paths of local files and the GCS URIs to upload
+            them to.
+        max_concurrent_uploads: Required. The maximum number of files, or
+            parts of large files, uploaded at the same time.
+    """
+    if not uploads:
+        return
+
+    with futures.ThreadPoolExecutor(max_workers=max_concurrent_uploads) as executor:
+        pending = set()
+        remaining_parts = {}
+        for source_file_path, destination_file_uri in uploads:
             _logger.debug(f'Uploading "{source_file_path}" to "{destination_file_uri}"')
             destination_blob = storage.Blob.from_string(
                 destination_file_uri, client=storage_client
             )
-            destination_blob.upload_from_filename(filename=source_file_path)
-    else:
-        source_file_path = source_path
-        destination_file_uri = destination_uri
-        _logger.debug(f'Uploading "{source_file_path}" to "{destination_file_uri}"')
-        destination_blob = storage.Blob.from_string(
-            destination_file_uri, client=storage_client
+            file_size = os.path.getsize(source_file_path)
+            if file_size < _COMPOSITE_UPLOAD_THRESHOLD:
+                pending.add(
+                    executor.submit(
+                        destination_blob.upload_from_filename,
+                        filename=source_file_path,
+                    )
+                )
+                continue
+
+            part_blobs = _upload_file_parts(
+                executor=executor,
+                source_file_path=source_file_path,
+                file_size=file_size,
+                destination_blob=destination_blob,
+                pending=pending,
+            )
+            remaining_parts[destination_file_uri] = [
+                destination_blob,
+                part_blobs,
+                len(part_blobs),
+            ]
+
+        try:
+            while pending:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    destination_file_uri = future.result()
+                    composite_upload = remaining_parts.get(destination_file_uri)
+                    if composite_upload is None:
+                        continue
+                    if composite_upload[2] == 0:
+                        # The parts were composed.
+                        del remaining_parts[destination_file_uri]
+                        continue
+                    composite_upload[2] -= 1
+                    if composite_upload[2] == 0:
+                        pending.add(
+                            executor.submit(
+                                _compose_parts,
+                                composite_upload[0],
+                                composite_upload[1],
+                            )
+                        )
+        except Exception:
+            for future in pending:
+                future.cancel()
+            futures.wait(pending)
+            # Do not leave parts of large files behind in the destination.
+            for _, part_blobs, _ in remaining_parts.values():
+                _delete_blobs(part_blobs)
+            raise
+
+
+def _upload_file_parts(
+    executor: futures.Executor,
+    source_file_path: str,
+    file_size: int,
+    destination_blob: storage.Blob,
+    pending: Set[futures.Future],
+) -> List[storage.Blob]:
+    """Starts uploading the parts of a large file as temporary objects.
+
+    Args:
+        executor: Required. Executor to upload the parts with.
+        source_file_path: Required. Path of the local file.
+        file_size: Required. Size of the local file in bytes.
+        destination_blob: Required. The object the parts are composed into.
+        pending: Required. Set the upload futures are added to. Each future
+            returns the GCS URI of the destination object.
+
+    Returns:
+        The temporary part objects, in order.
+    """
+    part_size = max(
+        _COMPOSITE_UPLOAD_PART_SIZE,
+        -(-file_size // _MAX_COMPOSE_COMPONENTS),
+    )
+    destination_file_uri = (
+        f"gs://{destination_blob.bucket.name}/{destination_blob.name}"
+    )
+
+    def upload_part(part_blob: storage.Blob, offset: int, size: int) -> str:
+        with open(source_file_path, "rb") as f:
+            f.seek(offset)
+            part_blob.upload_from_file(f, size=size)
+        return destination_file_uri
+
+    part_blobs = []
+    for index, offset in enumerate(range(0, file_size, part_size)):
+        part_blob = destination_blob.bucket.blob(
+            f"{destination_blob.name}{_COMPOSITE_UPLOAD_PART_SUFFIX}{index}"
+        )
+        part_blobs.append(part_blob)
+        pending.add(
+            executor.submit(
+                upload_part, part_blob, offset, min(part_size, file_size - offset)
+            )
         )
-        destination_blob.upload_from_filename(filename=source_file_path)
+    return part_blobs
+
+
+def _compose_parts(
+    destination_blob: storage.Blob, part_blobs: List[storage.Blob]
+) -> str:
+    """Composes uploaded parts into the destination object and deletes them.
+
+    Returns:
+        GCS URI of the destination object.
+    """
+    destination_blob.compose(part_blobs)
+    _delete_blobs(part_blobs)
+    return f"gs://{destination_blob.bucket.name}/{destination_blob.name}"
+
+
+def _delete_blobs(blobs: List[storage.Blob]):
+    """Deletes objects, ignoring the ones that do not exist."""
+    for blob in blobs:
+        try:
+            blob.delete()
+        except exceptions.NotFound:
+            pass
+
+
+def get_or_create_staging_gcs_dir(
+    staging_gcs_dir: Optional[str] = None,
+    project: Optional[str] = None,
+    location: Optional[str] = None,
+    credentials: Optional[auth_credentials.Credentials] = None,
+) -> str:
+    """Returns the GCS directory to stage data in.
+
+    Uses the given directory or the staging bucket set in aiplatform.init. If
+    neither is set, the regional default staging bucket of the project is
+    created if it does not exist and used.
+
+    Args:
+        staging_gcs_dir:
+            Optional. Google Cloud Storage bucket to be used for data staging.
+        project: Optional. Google Cloud Project that contains the staging bucket.
+        location: Optional. Google Cloud location to use for the staging bucket.
+        credentials: The custom credentials to use when making API calls.
+            If not provided, default credentials will be used.
+
+    Returns:
+        Google Cloud Storage URI of the staging directory.
+    """
+    staging_gcs_dir = staging_gcs_dir or initializer.global_config.staging_bucket
+    if not staging_gcs_dir:
+        project = project or initializer.global_config.project
+        location = location or initializer.global_config.location
+        credentials = credentials or initializer.global_config.credentials
+        # Creating the bucket if it does not exist.
+        # Currently we only do this when staging_gcs_dir is not specified.
+        # The buckets that we create are regional.
+        # This prevents errors when some service required regional bucket.
+        # E.g. "FailedPrecondition: 400 The Cloud Storage bucket of `gs://...` is in location `us`. It must be in the same regional location as the service location `us-central1`."
+        # We are making the bucket name region-specific since the bucket is regional.
+        staging_bucket_name = project + "-vertex-staging-" + location
+        if staging_bucket_name not in _verified_staging_buckets:
+            client = storage.Client(project=project, credentials=credentials)
+            staging_bucket = storage.Bucket(client=client, name=staging_bucket_name)
+            if not staging_bucket.exists():
+                _logger.info(f'Creating staging GCS bucket "{staging_bucket_name}"')
+                staging_bucket = client.create_bucket(
+                    bucket_or_name=staging_bucket,
+                    project=project,
+                    location=location,
+                )
+            _verified_staging_buckets.add(staging_bucket_name)
+        staging_gcs_dir = "gs://" + staging_bucket_name
+
+    return staging_gcs_dir
 
 
 def stage_local_data_in_gcs(
@@ -95,6 +408,7 @@ def stage_local_data_in_gcs(
     project: Optional[str] = None,
     location: Optional[str] = None,
     credentials: Optional[auth_credentials.Credentials] = None,
+    max_concurrent_uploads: int = 8,
 ) -> str:
     """Stages a local data in GCS.
 
@@ -109,6 +423,8 @@ def stage_local_data_in_gcs(
         location: Optional. Google Cloud location to use for the staging bucket.
         credentials: The custom credentials to use when making API calls.
             If not provided, default credentials will be used.
+        max_concurrent_uploads: Optional. The maximum number of files, or
+            parts of large files, uploaded at the same time.
 
     Returns:
         Google Cloud Storage URI of the staged data.
@@ -122,28 +438,12 @@ def stage_local_data_in_gcs(
     if not data_path_obj.exists():
         raise RuntimeError(f"Local data does not exist: data_path='{data_path}'")
 
-    staging_gcs_dir = staging_gcs_dir or initializer.global_config.staging_bucket
-    if not staging_gcs_dir:
-        project = project or initializer.global_config.project
-        location = location or initializer.global_config.location
-        credentials = credentials or initializer.global_config.credentials
-        # Creating the bucket if it does not exist.
-        # Currently we only do this when staging_gcs_dir is not specified.
-        # The buckets that we create are regional.
-        # This prevents errors when some service required regional bucket.
-        # E.g. "FailedPrecondition: 400 The Cloud Storage bucket of `gs://...` is in location `us`. It must be in the same regional location as the service location `us-central1`."
-        # We are making the bucket name region-specific since the bucket is regional.
-        staging_bucket_name = project + "-vertex-staging-" + location
-        client = storage.Client(project=project, credentials=credentials)
-        staging_bucket = storage.Bucket(client=client, name=staging_bucket_name)
-        if not staging_bucket.exists():
-            _logger.info(f'Creating staging GCS bucket "{staging_bucket_name}"')
-            staging_bucket = client.create_bucket(
-                bucket_or_name=staging_bucket,
-                project=project,
-                location=location,
-            )
-        staging_gcs_dir = "gs://" + staging_bucket_name
+    staging_gcs_dir = get_or_create_staging_gcs_dir(
+        staging_gcs_dir=staging_gcs_dir,
+        project=project,
+        location=location,
+        credentials=credentials,
+    )
 
     timestamp = datetime.datetime.now().isoformat(sep="-", timespec="milliseconds")
     staging_gcs_subdir = (
@@ -155,11 +455,134 @@ def stage_local_data_in_gcs(
         staged_data_uri = staging_gcs_subdir + "/" + data_path_obj.name
 
     _logger.info(f'Uploading "{data_path}" to "{staged_data_uri}"')
+    # The timestamped staging directory is new, so there is nothing to skip.
     upload_to_gcs(
         source_path=data_path,
         destination_uri=staged_data_uri,
         project=project,
         credentials=credentials,
+        max_concurrent_uploads=max_concurrent_uploads,
+        skip_unchanged=False,
     )
 
     return staged_data_uri
+
+
+def _iter_lines_of_blob(blob: storage.Blob) -> Iterator[bytes]:
+    """Yields the lines of a blob from ranged downloads of its contents.
+
+    Ranged downloads are used instead of `Blob.open`, which requires
+    google-cloud-storage 1.38.0.
+
+    Args:
+        blob: Required. The blob to read.
+
+    Yields:
+        bytes: Each line of the blob, including its line break.
+    """
+    if blob.size is None:
+        blob.reload()
+    partial_line = b""
+    for start in range(0, blob.size, _BLOB_DOWNLOAD_CHUNK_SIZE):
+        end = min(start + _BLOB_DOWNLOAD_CHUNK_SIZE, blob.size) - 1
+        data = partial_line + blob.download_as_bytes(start=start, end=end)
+        # The bytes after the last line break continue in the next chunk.
+        lines_end = data.rfind(b"\n") + 1
+        partial_line = data[lines_end:]
+        yield from io.BytesIO(data[:lines_end])
+    if partial_line:
+        yield partial_line
+
+
+def iter_lines_by_blob(
+    blobs: Iterable[storage.Blob],
+    max_concurrent_downloads: int = 8,
+) -> Iterator[Iterator[bytes]]:
+    """Streams blobs concurrently and yields an iterator over the lines of each.
+
+    Each blob is read line by line, so it is never held in memory as a whole.
+    At most `max_concurrent_downloads` blobs are read at any time, each at most
+    `_BLOB_LINES_BUFFER_SIZE` lines ahead of the consumer. The next blob is
+    read as soon as all lines of a blob are handed to the consumer. The lines
+    of a blob the consumer did not read are skipped once it moves on to the
+    next blob.
+
+    Args:
+        blobs: Required. Blobs to read, in the order to yield their lines.
+        max_concurrent_downloads: Optional. The maximum number of blobs read
+            ahead of the consumer.
+
+    Yields:
+        Iterator[bytes]: The lines of each blob, including their line break.
+    """
+    # Set once the consumer stops, to release the readers blocked on a full
+    # buffer.
+    stopped = threading.Event()
+
+    def put_unless_stopped(lines: queue.Queue, item) -> bool:
+        while not stopped.is_set():
+            try:
+                lines.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read_lines(blob: storage.Blob, lines: queue.Queue):
+        try:
+            for line in _iter_lines_of_blob(blob):
+                if not put_unless_stopped(lines, line):
+                    return
+        finally:
+            put_unless_stopped(lines, _END_OF_BLOB)
+
+    blobs = iter(blobs)
+    with futures.ThreadPoolExecutor(max_workers=max_concurrent_downloads) as executor:
+
+        def start_reading(blob: storage.Blob) -> Tuple[queue.Queue, futures.Future]:
+            lines = queue.Queue(maxsize=_BLOB_LINES_BUFFER_SIZE)
+            return lines, executor.submit(read_lines, blob, lines)
+
+        readers = collections.deque(
+            start_reading(blob)
+            for blob in itertools.islice(blobs, max_concurrent_downloads)
+        )
+        try:
+            while readers:
+                lines, reader = readers.popleft()
+                blob_lines = iter(lines.get, _END_OF_BLOB)
+                yield blob_lines
+                for _ in blob_lines:
+                    pass
+                # Raises the error the blob failed to be read with, if any.
+                reader.result()
+                for next_blob in itertools.islice(blobs, 1):
+                    readers.append(start_reading(next_blob))
+        finally:
+            stopped.set()
+
+
+def iter_blob_lines(
+    blobs: Iterable[storage.Blob],
+    max_concurrent_downloads: int = 8,
+) -> Iterator[bytes]:
+    """Streams blobs concurrently and yields their lines in order.
+
+    See `iter_lines_by_blob` for how the blobs are read.
+
+    Args:
+        blobs: Required. Blobs to read, in the order to yield their lines.
+        max_concurrent_downloads: Optional. The maximum number of blobs read
+            ahead of the consumer.
+
+    Yields:
+        bytes: Each line of the blobs, including its line break.
+    """
+    lines_by_blob = iter_lines_by_blob(
+        blobs, max_concurrent_downloads=max_concurrent_downloads
+    )
+    try:
+        for blob_lines in lines_by_blob:
+            yield from blob_lines
+    finally:
+        lines_by_blob.close()
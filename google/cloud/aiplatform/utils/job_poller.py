@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import collections
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from google.api_core import retry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between status checks right after a job is tracked or changes state.
+_MIN_POLL_INTERVAL = 5.0
+# Upper bound the poll interval backs off to while no tracked job changes state.
+# Kept close to the minimum so that waiting callers notice state changes soon.
+_MAX_POLL_INTERVAL = 10.0
+# Factor the poll interval grows by after each status check without changes.
+_POLL_BACKOFF_MULTIPLIER = 1.5
+# Tracked jobs of one kind in one location from which their states are read
+# with a single list call instead of one get call per job.
+_LIST_BATCH_MIN_JOBS = 10
+# Active jobs listed per tracked job before the remaining tracked jobs of the
+# group are checked with get calls, for locations running many other jobs.
+_LIST_MAX_JOBS_PER_TRACKED_JOB = 5
+# Consecutive transient errors checking the state of a job that are retried on
+# the next poll tick before waiting on the job fails.
+_MAX_TRANSIENT_POLL_ERRORS = 5
+
+
+class _TrackedJob:
+    """A job tracked by a JobStatusPoller and the outcome of its polling."""
+
+    def __init__(self, job: Any):
+        self.job = job
+        self.done = False
+        self.checks = 0
+        self.transient_errors = 0
+        self.error: Optional[Exception] = None
+
+
+class JobStatusPoller:
+    """Tracks the states of many Vertex AI jobs from one background thread.
+
+    Every tracked job is checked on each poll tick. Jobs of the same kind in
+    the same location are checked with a single filtered list call once at
+    least `list_batch_min_jobs` of them are tracked, otherwise with one get
+    call per job. The poll interval starts at `min_poll_interval`, grows by
+    `backoff_multiplier` after each tick in which no tracked job changed
+    state, and is capped at `max_poll_interval`. A job whose state check
+    fails with a transient error is checked again on the next tick. Any other
+    error only fails the waiting on that job. The background thread only
+    runs while jobs are tracked.
+
+    Jobs are any `base.VertexAiStatefulResource` with a `_list_method`, like
+    CustomJob, BatchPredictionJob, PipelineJob or the training jobs.
+    """
+
+    def __init__(
+        self,
+        min_poll_interval: float = _MIN_POLL_INTERVAL,
+        max_poll_interval: float = _MAX_POLL_INTERVAL,
+        backoff_multiplier: float = _POLL_BACKOFF_MULTIPLIER,
+        list_batch_min_jobs: int = _LIST_BATCH_MIN_JOBS,
+    ):
+        """Initializes the poller.
+
+        Args:
+            min_poll_interval (float):
+                Optional. Seconds between status checks while tracked jobs are
+                changing state.
+            max_poll_interval (float):
+                Optional. The maximum number of seconds between status checks.
+            backoff_multiplier (float):
+                Optional. Factor the poll interval grows by after each status
+                check in which no tracked job changed state.
+            list_batch_min_jobs (int):
+                Optional. The minimum number of tracked jobs of one kind in
+                one location that are checked with a list call.
+        """
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._backoff_multiplier = backoff_multiplier
+        self._list_batch_min_jobs = list_batch_min_jobs
+
+        self._condition = threading.Condition()
+        self._tracked: Dict[int, _TrackedJob] = {}
+        self._new_jobs: List[_TrackedJob] = []
+        self._thread: Optional[threading.Thread] = None
+        self._poll_interval = min_poll_interval
+        self._next_poll_time = float("-inf")
+
+    def watch(self, job: Any) -> Iterator[Any]:
+        """Yields the job each time a status check finds it not done.
+
+        Waiting loops use this to log progress once per status check. The
+        first status check of a job that is not tracked yet happens right
+        away.
+
+        Example usage:
+            for job in poller.watch(job):
+                job._log_job_state()
+
+        Args:
+            job (base.VertexAiStatefulResource):
+                Required. The job to wait for.
+
+        Yields:
+            base.VertexAiStatefulResource: The job, after each status check
+                that found it not done.
+
+        Raises:
+            Exception: If checking the state of the job failed.
+        """
+        tracked = self._track(job)
+        seen_checks = 0
+        while True:
+            with self._condition:
+                while not tracked.done and tracked.checks == seen_checks:
+                    self._condition.wait()
+                done, seen_checks = tracked.done, tracked.checks
+
+            if done:
+                if tracked.error is not None:
+                    raise tracked.error
+                return
+            yield job
+
+    def as_completed(
+        self, jobs: Iterable[Any], timeout: Optional[float] = None
+    ) -> Iterator[Any]:
+        """Yields jobs as they reach a done state.
+
+        Args:
+            jobs (Iterable[base.VertexAiStatefulResource]):
+                Required. The jobs to wait for.
+            timeout (float):
+                Optional. The maximum number of seconds to wait for all jobs.
+                Waits until all jobs are done if not set.
+
+        Yields:
+            base.VertexAiStatefulResource: The jobs, in the order they are done.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the timeout passed before all
+                jobs were done.
+            Exception: If checking the state of a job failed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        pending = collections.OrderedDict()
+        for job in jobs:
+            if id(job) not in pending:
+                pending[id(job)] = self._track(job)
+
+        while pending:
+            with self._condition:
+                while not any(tracked.done for tracked in pending.values()):
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise futures.TimeoutError(
+                            f"{len(pending)} jobs are not done after {timeout} seconds."
+                        )
+                    self._condition.wait(remaining)
+                done_keys = [key for key, tracked in pending.items() if tracked.done]
+
+            for key in done_keys:
+                tracked = pending.pop(key)
+                if tracked.error is not None:
+                    raise tracked.error
+                yield tracked.job
+
+    def _track(self, job: Any) -> _TrackedJob:
+        """Starts tracking a job and the background thread if needed.
+
+        Args:
+            job (base.VertexAiStatefulResource):
+                Required. The job to track. Waits for the job resource to be
+                created if it is being created asynchronously.
+
+        Returns:
+            The tracking entry of the job, shared with other waiters.
+        """
+        if not getattr(job._gca_resource, "name", None):
+            job._wait_for_resource_creation()
+
+        with self._condition:
+            tracked = self._tracked.get(id(job))
+            if tracked is None:
+                tracked = self._tracked[id(job)] = _TrackedJob(job)
+                # New jobs are checked right away, the other tracked jobs
+                # again after the minimum interval.
+                self._new_jobs.append(tracked)
+                self._poll_interval = self._min_poll_interval
+                self._next_poll_time = min(
+                    self._next_poll_time,
+                    time.monotonic() + self._min_poll_interval,
+                )
+                self._condition.notify_all()
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="aiplatform-job-poller", daemon=True
+                )
+                self._thread.start()
+
+        return tracked
+
+    def _run(self):
+        """Polls the tracked jobs until none are left."""
+        while True:
+            with self._condition:
+                while (
+                    self._tracked
+                    and not self._new_jobs
+                    and time.monotonic() < self._next_poll_time
+                ):
+                    self._condition.wait(self._next_poll_time - time.monotonic())
+                if not self._tracked:
+                    self._thread = None
+                    return
+                poll_time = time.monotonic()
+                is_tick = poll_time >= self._next_poll_time
+                if is_tick:
+                    tracked_jobs = list(self._tracked.values())
+                else:
+                    tracked_jobs = self._new_jobs
+                self._new_jobs = []
+
+            changed = self._poll(tracked_jobs)
+
+            with self._condition:
+                for tracked in tracked_jobs:
+                    tracked.checks += 1
+                    if tracked.done:
+                        self._tracked.pop(id(tracked.job), None)
+                if is_tick:
+                    if changed:
+                        self._poll_interval = self._min_poll_interval
+                    else:
+                        self._poll_interval = min(
+                            self._poll_interval * self._backoff_multiplier,
+                            self._max_poll_interval,
+                        )
+                    self._next_poll_time = poll_time + self._poll_interval
+                self._condition.notify_all()
+
+    def _poll(self, tracked_jobs: List[_TrackedJob]) -> bool:
+        """Refreshes the states of the given jobs.
+
+        Args:
+            tracked_jobs (List[_TrackedJob]):
+                Required. The jobs to refresh.
+
+        Returns:
+            True if the state of any job changed.
+        """
+        groups = collections.defaultdict(list)
+        for tracked in tracked_jobs:
+            groups[self._group_key(tracked.job)].append(tracked)
+
+        changed = False
+        for (_, parent), group in groups.items():
+            if len(group) >= self._list_batch_min_jobs:
+                try:
+                    changed |= self._poll_with_list(parent, group)
+                    continue
+                except Exception:
+                    # The jobs are checked one by one instead, so that an
+                    # error only fails the jobs it applies to.
+                    _LOGGER.debug(
+                        "Listing the states of %d jobs failed.",
+                        len(group),
+                        exc_info=True,
+                    )
+            for tracked in group:
+                changed |= self._poll_with_get(tracked)
+        return changed
+
+    @staticmethod
+    def _group_key(job: Any) -> Tuple[str, str]:
+        """Returns the list method and location of a job."""
+        parent = "/".join(job.resource_name.split("/")[:4])
+        return job._list_method, parent
+
+    @staticmethod
+    def _poll_with_get(tracked: _TrackedJob) -> bool:
+        """Refreshes a job with a get call.
+
+        Transient errors are retried on the next poll tick, up to
+        `_MAX_TRANSIENT_POLL_ERRORS` times in a row. Other errors mark the
+        job as done with that error.
+
+        Returns:
+            True if the state of the job changed.
+        """
+        job = tracked.job
+        previous_state = getattr(job._gca_resource, "state", None)
+        try:
+            job._sync_gca_resource()
+        except Exception as exc:
+            if (
+                retry.if_transient_error(exc)
+                and tracked.transient_errors < _MAX_TRANSIENT_POLL_ERRORS
+            ):
+                tracked.transient_errors += 1
+                _LOGGER.debug(
+                    "Checking the state of %s failed, retrying.",
+                    job.resource_name,
+                    exc_info=True,
+                )
+                return False
+            tracked.error = exc
+            tracked.done = True
+            return True
+        tracked.transient_errors = 0
+        tracked.done = job._gca_resource.state in job._valid_done_states
+        return job._gca_resource.state != previous_state
+
+    def _poll_with_list(self, parent: str, group: List[_TrackedJob]) -> bool:
+        """Refreshes jobs of one kind in one location with a list call.
+
+        Only jobs that are not done are listed. Listed jobs get their resource
+        replaced by the listed one. Jobs missing from the list, or not
+        reached after listing `_LIST_MAX_JOBS_PER_TRACKED_JOB` times as many
+        jobs as are in the group, are refreshed with a get call instead.
+
+        Returns:
+            True if the state of any job changed.
+        """
+        job = group[0].job
+        list_filter = " AND ".join(
+            f'state!="{state.name}"'
+            for state in sorted(job._valid_done_states, key=lambda s: s.name)
+        )
+        list_method = getattr(job.api_client, job._list_method)
+        tracked_names = {tracked.job.resource_name for tracked in group}
+        max_listed_jobs = len(group) * _LIST_MAX_JOBS_PER_TRACKED_JOB
+        active_resources = {}
+        for listed_jobs, resource in enumerate(
+            list_method(request={"parent": parent, "filter": list_filter}), 1
+        ):
+            if resource.name in tracked_names:
+                active_resources[resource.name] = resource
+            # Stops paging through the other active jobs of the location.
+            if (
+                len(active_resources) == len(tracked_names)
+                or listed_jobs >= max_listed_jobs
+            ):
+                break
+
+        changed = False
+        for tracked in group:
+            resource = active_resources.get(tracked.job.resource_name)
+            if resource is None:
+                changed |= self._poll_with_get(tracked)
+                continue
+            if resource.state != tracked.job._gca_resource.state:
+                changed = True
+            tracked.job._gca_resource = resource
+        return changed
+
+
+# Process-wide poller shared by all jobs waiting for completion.
+global_poller = JobStatusPoller()
+
+
+def as_completed(jobs: Iterable[Any], timeout: Optional[float] = None) -> Iterator[Any]:
+    """Yields jobs as they reach a done state.
+
+    Jobs are done when they succeeded, failed, were cancelled or paused.
+    Failed jobs are yielded like any other, check `job.state` to tell them
+    apart.
+
+    Example usage:
+        for job in aiplatform.as_completed(jobs):
+            print(job.display_name, job.state)
+
+    Args:
+        jobs (Iterable[base.VertexAiStatefulResource]):
+            Required. The jobs to wait for, like CustomJob, BatchPredictionJob,
+            PipelineJob or a training job.
+        timeout (float):
+            Optional. The maximum number of seconds to wait for all jobs.
+            Waits until all jobs are done if not set.
+
+    Yields:
+        base.VertexAiStatefulResource: The jobs, in the order they are done.
+
+    Raises:
+        concurrent.futures.TimeoutError: If the timeout passed before all jobs
+            were done.
+    """
+    return global_poller.as_completed(jobs, timeout=timeout)
+
+
+def wait_any(jobs: Iterable[Any], timeout: Optional[float] = None) -> Any:
+    """Waits for the first of the given jobs to reach a done state.
+
+    Args:
+        jobs (Iterable[base.VertexAiStatefulResource]):
+            Required. The jobs to wait for.
+        timeout (float):
+            Optional. The maximum number of seconds to wait. Waits until a
+            job is done if not set.
+
+    Returns:
+        The first job that is done.
+
+    Raises:
+        ValueError: If no jobs are given.
+        concurrent.futures.TimeoutError: If the timeout passed before any job
+            was done.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        raise ValueError("At least one job is required.")
+    return next(global_poller.as_completed(jobs, timeout=timeout))
+
+
+def wait_all(jobs: Iterable[Any], timeout: Optional[float] = None) -> List[Any]:
+    """Waits for all the given jobs to reach a done state.
+
+    Args:
+        jobs (Iterable[base.VertexAiStatefulResource]):
+            Required. The jobs to wait for.
+        timeout (float):
+            Optional. The maximum number of seconds to wait. Waits until all
+            jobs are done if not set.
+
+    Returns:
+        The given jobs, in the given order.
+
+    Raises:
+        concurrent.futures.TimeoutError: If the timeout passed before all jobs
+            were done.
+    """
+    jobs = list(jobs)
+    for _ in global_poller.as_completed(jobs, timeout=timeout):
+        pass
+    return jobs
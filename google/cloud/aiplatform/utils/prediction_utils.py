@@ -0,0 +1,645 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import json
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import grpc
+
+from google.api_core import exceptions
+from google.api_core import gapic_v1
+from google.protobuf import json_format
+from google.protobuf import struct_pb2
+
+from google.cloud.aiplatform import compat
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import models
+
+# Sentinel placed on the request queue to stop the dispatcher thread.
+_STOP = object()
+
+# Wire format tags used to read and write PredictRequest / PredictResponse
+# bytes directly, without building a protobuf message per value.
+_ENDPOINT_TAG = b"\x0a"  # PredictRequest.endpoint
+_INSTANCE_TAG = b"\x12"  # PredictRequest.instances
+_PARAMETERS_TAG = b"\x1a"  # PredictRequest.parameters
+_PREDICTIONS_FIELD = 1  # PredictResponse.predictions
+_DEPLOYED_MODEL_ID_FIELD = 2  # PredictResponse.deployed_model_id
+_NUMBER_VALUE_TAG = b"\x11"  # Value.number_value
+_LIST_VALUE_TAG = b"\x32"  # Value.list_value
+# ListValue.values entry holding a Value with a number_value.
+_LIST_ITEM_TAG = b"\x0a\x09\x11"
+
+_PREDICT_METHOD = (
+    f"/google.cloud.aiplatform.{compat.DEFAULT_VERSION}.PredictionService/Predict"
+)
+
+
+class _PendingRequest:
+    """Tracks the slices of one caller's instances until all are predicted."""
+
+    def __init__(self, num_instances: int):
+        """Initializes the pending request.
+
+        Args:
+            num_instances (int): Required. Number of instances sent by the caller.
+        """
+        self.future = futures.Future()
+        self._predictions: List[Any] = [None] * num_instances
+        self._remaining = num_instances
+        self._deployed_model_id = None
+        self._lock = threading.Lock()
+
+    def set_slice_result(
+        self, offset: int, predictions: List[Any], deployed_model_id: str
+    ):
+        """Stores the predictions of one slice and resolves the future once
+        every instance has a prediction."""
+        with self._lock:
+            if self.future.done():
+                return
+            self._predictions[offset : offset + len(predictions)] = predictions
+            self._deployed_model_id = self._deployed_model_id or deployed_model_id
+            self._remaining -= len(predictions)
+            if self._remaining:
+                return
+        self.future.set_result(
+            models.Prediction(
+                predictions=self._predictions,
+                deployed_model_id=self._deployed_model_id,
+            )
+        )
+
+    def set_exception(self, exception: Exception):
+        """Fails the caller's future if it is not already resolved."""
+        with self._lock:
+            if self.future.done():
+                return
+            self.future.set_exception(exception)
+
+
+class _Slice:
+    """A contiguous run of one caller's instances placed into a batch."""
+
+    def __init__(
+        self,
+        request: _PendingRequest,
+        offset: int,
+        instances: List,
+        parameters: Optional[Dict],
+        parameters_key: str,
+    ):
+        self.request = request
+        self.offset = offset
+        self.instances = instances
+        self.parameters = parameters
+        self.parameters_key = parameters_key
+
+
+class BatchPredictor:
+    """Client-side micro-batcher for Endpoint online predictions.
+
+    Instances submitted concurrently from many threads are gathered into
+    request-sized batches. A batch is sent as soon as it holds
+    `max_batch_size` instances or its oldest instance has waited
+    `max_latency_ms`. Batches are sent over a bounded number of concurrent
+    prediction RPCs and each caller receives only the predictions for its own
+    instances.
+
+    Example usage:
+
+        with my_endpoint.batch_predictor(max_batch_size=64) as predictor:
+            prediction = predictor.predict(instances=[[1.0, 2.0]])
+    """
+
+    def __init__(
+        self,
+        endpoint: "models.Endpoint",
+        max_batch_size: int = 64,
+        max_latency_ms: float = 10.0,
+        max_concurrent_requests: int = 8,
+        timeout: Optional[float] = None,
+    ):
+        """Starts the background dispatcher for the given Endpoint.
+
+        Args:
+            endpoint (models.Endpoint):
+                Required. The Endpoint to send predictions to.
+            max_batch_size (int):
+                Optional. Maximum number of instances sent in one prediction
+                request. Instances from a single call larger than this are
+                split across several requests.
+            max_latency_ms (float):
+                Optional. Maximum time in milliseconds an instance waits for
+                its batch to fill before the batch is sent anyway.
+            max_concurrent_requests (int):
+                Optional. Maximum number of prediction requests in flight.
+            timeout (float):
+                Optional. The timeout for each prediction request in seconds.
+
+        Raises:
+            ValueError: If `max_batch_size`, `max_latency_ms` or
+                `max_concurrent_requests` is out of range.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_latency_ms < 0:
+            raise ValueError("max_latency_ms must not be negative.")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1.")
+
+        self._endpoint_name = endpoint.resource_name
+        self._prediction_client = endpoint._prediction_client
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency_ms / 1000
+        self._timeout = timeout
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_concurrent_requests)
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_concurrent_requests)
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="aiplatform-batch-predictor", daemon=True
+        )
+        self._dispatcher.start()
+
+    def submit(
+        self, instances: List, parameters: Optional[Dict] = None
+    ) -> futures.Future:
+        """Queues instances for prediction without blocking.
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the prediction call.
+            parameters (Dict):
+                Optional. The parameters that govern the prediction. Only
+                instances sharing the same parameters are batched together.
+        Returns:
+            future (futures.Future):
+                Future resolving to a Prediction with one prediction per instance,
+                in the order the instances were given.
+        Raises:
+            ValueError: If `instances` is empty.
+            RuntimeError: If the predictor has been closed.
+        """
+        if not instances:
+            raise ValueError("At least one instance is required.")
+
+        instances = list(instances)
+        request = _PendingRequest(len(instances))
+        parameters_key = json.dumps(parameters, sort_keys=True)
+
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("BatchPredictor has been closed.")
+            for offset in range(0, len(instances), self._max_batch_size):
+                self._queue.put(
+                    _Slice(
+                        request=request,
+                        offset=offset,
+                        instances=instances[offset : offset + self._max_batch_size],
+                        parameters=parameters,
+                        parameters_key=parameters_key,
+                    )
+                )
+
+        return request.future
+
+    def predict(
+        self, instances: List, parameters: Optional[Dict] = None
+    ) -> "models.Prediction":
+        """Makes a batched prediction and blocks until it is complete.
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the prediction call.
+            parameters (Dict):
+                Optional. The parameters that govern the prediction.
+        Returns:
+            prediction: Prediction with returned predictions and Model Id.
+        """
+        return self.submit(instances=instances, parameters=parameters).result()
+
+    def close(self):
+        """Sends all queued instances and stops the background threads."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "BatchPredictor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _dispatch_loop(self):
+        """Gathers queued slices into batches until the predictor is closed."""
+        carry_over = None
+        stopping = False
+
+        while not stopping or carry_over:
+            first = carry_over or self._queue.get()
+            carry_over = None
+            if first is _STOP:
+                break
+
+            batch = [first]
+            batch_size = len(first.instances)
+            deadline = time.monotonic() + self._max_latency
+
+            while batch_size < self._max_batch_size and not stopping:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                if (
+                    item.parameters_key != first.parameters_key
+                    or batch_size + len(item.instances) > self._max_batch_size
+                ):
+                    carry_over = item
+                    break
+                batch.append(item)
+                batch_size += len(item.instances)
+
+            self._in_flight.acquire()
+            try:
+                self._executor.submit(self._send_batch, batch)
+            except Exception as exc:
+                self._in_flight.release()
+                for batch_slice in batch:
+                    batch_slice.request.set_exception(exc)
+
+        # Fail anything that was queued after the stop sentinel.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item.request.set_exception(
+                    RuntimeError("BatchPredictor has been closed.")
+                )
+
+    def _send_batch(self, batch: List[_Slice]):
+        """Sends one prediction request and routes predictions to callers."""
+        try:
+            instances = [
+                instance for batch_slice in batch for instance in batch_slice.instances
+            ]
+            prediction_response = self._prediction_client.predict(
+                endpoint=self._endpoint_name,
+                instances=instances,
+                parameters=batch[0].parameters,
+                timeout=self._timeout,
+            )
+            predictions = [
+                json_format.MessageToDict(item)
+                for item in prediction_response.predictions.pb
+            ]
+            if len(predictions) != len(instances):
+                raise RuntimeError(
+                    f"Expected {len(instances)} predictions but the Endpoint "
+                    f"returned {len(predictions)}."
+                )
+
+            start = 0
+            for batch_slice in batch:
+                end = start + len(batch_slice.instances)
+                batch_slice.request.set_slice_result(
+                    offset=batch_slice.offset,
+                    predictions=predictions[start:end],
+                    deployed_model_id=prediction_response.deployed_model_id,
+                )
+                start = end
+        except Exception as exc:
+            for batch_slice in batch:
+                batch_slice.request.set_exception(exc)
+        finally:
+            self._in_flight.release()
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encodes a non-negative integer as a protobuf base 128 varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decodes the protobuf varint starting at `pos`.
+
+    Returns:
+        The decoded value and the position after it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _import_numpy():
+    """Imports NumPy, which is needed for the array prediction path."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is not installed. Please install numpy to make predictions "
+            "with arrays."
+        )
+    return np
+
+
+def _to_float_array(instances: Any) -> "np.ndarray":  # noqa: F821
+    """Converts array-like instances to a 1-D or 2-D float64 ndarray.
+
+    Args:
+        instances (Union[np.ndarray, pyarrow.Table, pyarrow.RecordBatch]):
+            Required. The instances. A pyarrow table or record batch either has
+            a single fixed size list column holding one instance per row, or
+            one numeric column per feature.
+    Returns:
+        The instances as a float64 ndarray.
+    Raises:
+        ValueError: If the instances are not 1-D or 2-D.
+    """
+    np = _import_numpy()
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    if pa is not None and isinstance(instances, (pa.Table, pa.RecordBatch)):
+        columns = instances.columns
+        if len(columns) == 1 and pa.types.is_fixed_size_list(columns[0].type):
+            column = columns[0]
+            if isinstance(column, pa.ChunkedArray):
+                column = column.combine_chunks()
+            instances = (
+                column.flatten()
+                .to_numpy(zero_copy_only=False)
+                .reshape(-1, column.type.list_size)
+            )
+        else:
+            instances = np.column_stack([np.asarray(column) for column in columns])
+
+    array = np.asarray(instances, dtype="<f8")
+    if array.ndim not in (1, 2):
+        raise ValueError(
+            f"Instances must be a 1-D or 2-D array, got {array.ndim} dimensions."
+        )
+    return array
+
+
+def encode_predict_request(
+    endpoint: str, instances: Any, parameters: Optional[Dict] = None
+) -> bytes:
+    """Serializes a PredictRequest for dense numeric instances.
+
+    Every row of a 2-D array becomes a list of numbers and every element of a
+    1-D array becomes a number. All instances are written with vectorized
+    NumPy operations instead of one protobuf Value per number.
+
+    Args:
+        endpoint (str):
+            Required. The resource name of the Endpoint.
+        instances (Union[np.ndarray, pyarrow.Table, pyarrow.RecordBatch]):
+            Required. The instances that are the input to the prediction call.
+        parameters (Dict):
+            Optional. The parameters that govern the prediction.
+    Returns:
+        The serialized PredictRequest.
+    """
+    np = _import_numpy()
+    array = _to_float_array(instances)
+
+    if array.ndim == 1:
+        value_length = len(_NUMBER_VALUE_TAG) + 8
+        prefix = _INSTANCE_TAG + _encode_varint(value_length) + _NUMBER_VALUE_TAG
+        row_dtype = np.dtype([("prefix", f"S{len(prefix)}"), ("value", "<f8")])
+        rows = np.empty(len(array), dtype=row_dtype)
+        rows["value"] = array
+    else:
+        list_length = (len(_LIST_ITEM_TAG) + 8) * array.shape[1]
+        value_length = (
+            len(_LIST_VALUE_TAG) + len(_encode_varint(list_length)) + list_length
+        )
+        prefix = (
+            _INSTANCE_TAG
+            + _encode_varint(value_length)
+            + _LIST_VALUE_TAG
+            + _encode_varint(list_length)
+        )
+        item_dtype = np.dtype([("tag", f"S{len(_LIST_ITEM_TAG)}"), ("value", "<f8")])
+        row_dtype = np.dtype(
+            [("prefix", f"S{len(prefix)}"), ("items", item_dtype, array.shape[1:])]
+        )
+        rows = np.empty(len(array), dtype=row_dtype)
+        rows["items"]["tag"] = _LIST_ITEM_TAG
+        rows["items"]["value"] = array
+    rows["prefix"] = prefix
+
+    endpoint_bytes = endpoint.encode("utf-8")
+    request = [
+        _ENDPOINT_TAG,
+        _encode_varint(len(endpoint_bytes)),
+        endpoint_bytes,
+        rows.tobytes(),
+    ]
+    if parameters is not None:
+        parameters_bytes = json_format.ParseDict(
+            parameters, struct_pb2.Value()
+        ).SerializeToString()
+        request += [
+            _PARAMETERS_TAG,
+            _encode_varint(len(parameters_bytes)),
+            parameters_bytes,
+        ]
+    return b"".join(request)
+
+
+def _decode_dense_predictions(
+    data: bytes, spans: Sequence[Tuple[int, int]]
+) -> Optional["np.ndarray"]:  # noqa: F821
+    """Decodes predictions that are all numbers or all equal-length lists of
+    numbers, laid out back to back, directly from the response bytes.
+
+    Args:
+        data (bytes):
+            Required. The serialized PredictResponse.
+        spans (Sequence[Tuple[int, int]]):
+            Required. Start and end offsets of every serialized prediction.
+    Returns:
+        The predictions as a float64 ndarray, or None if they do not have
+        this layout.
+    """
+    np = _import_numpy()
+
+    start, end = spans[0]
+    length = end - start
+    first = data[start:end]
+
+    if first[:1] == _NUMBER_VALUE_TAG and length == len(_NUMBER_VALUE_TAG) + 8:
+        item_tag, header_length, shape = b"", len(_NUMBER_VALUE_TAG), (len(spans),)
+    elif first[:1] == _LIST_VALUE_TAG:
+        list_length, header_length = _decode_varint(first, 1)
+        item_length = len(_LIST_ITEM_TAG) + 8
+        if header_length + list_length != length or list_length % item_length:
+            return None
+        item_tag = _LIST_ITEM_TAG
+        shape = (len(spans), list_length // item_length)
+    else:
+        return None
+
+    # Consecutive predictions of the same length are a fixed stride apart.
+    stride = 1 + len(_encode_varint(length)) + length
+    starts = np.fromiter((span[0] for span in spans), dtype=np.int64, count=len(spans))
+    if len(spans) > 1 and not (np.diff(starts) == stride).all():
+        return None
+
+    headers = np.ndarray(
+        shape=(len(spans), header_length),
+        dtype=np.uint8,
+        buffer=data,
+        offset=start,
+        strides=(stride, 1),
+    )
+    if not (headers == np.frombuffer(first[:header_length], dtype=np.uint8)).all():
+        return None
+
+    item_dtype = np.dtype([("tag", f"V{len(item_tag)}"), ("value", "<f8")])
+    if not item_tag:
+        item_dtype = np.dtype([("value", "<f8")])
+    items = np.ndarray(
+        shape=shape,
+        dtype=item_dtype,
+        buffer=data,
+        offset=start + header_length,
+        strides=(stride,) + (item_dtype.itemsize,) * (len(shape) - 1),
+    )
+    if item_tag and not (items["tag"] == np.void(item_tag)).all():
+        return None
+
+    return np.array(items["value"])
+
+
+def decode_predict_response(data: bytes) -> Tuple["np.ndarray", str]:  # noqa: F821
+    """Decodes the predictions of a serialized PredictResponse into an ndarray.
+
+    Dense numeric predictions are read straight from the response bytes into a
+    float64 array. Any other predictions are converted through protobuf and
+    returned as a 1-D object array with one Python value per prediction.
+
+    Args:
+        data (bytes):
+            Required. The serialized PredictResponse.
+    Returns:
+        The predictions and the ID of the DeployedModel that served them.
+    Raises:
+        ValueError: If the response cannot be parsed.
+    """
+    np = _import_numpy()
+
+    spans = []
+    deployed_model_id = ""
+    pos = 0
+    while pos < len(data):
+        key, pos = _decode_varint(data, pos)
+        field_number, wire_type = key >> 3, key & 0x7
+        if wire_type == 2:
+            length, pos = _decode_varint(data, pos)
+            if field_number == _PREDICTIONS_FIELD:
+                spans.append((pos, pos + length))
+            elif field_number == _DEPLOYED_MODEL_ID_FIELD:
+                deployed_model_id = data[pos : pos + length].decode("utf-8")
+            pos += length
+        elif wire_type == 0:
+            _, pos = _decode_varint(data, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} in PredictResponse.")
+
+    if not spans:
+        return np.empty((0,)), deployed_model_id
+
+    predictions = _decode_dense_predictions(data, spans)
+    if predictions is None:
+        predictions = np.empty(len(spans), dtype=object)
+        for i, (start, end) in enumerate(spans):
+            predictions[i] = json_format.MessageToDict(
+                struct_pb2.Value.FromString(data[start:end])
+            )
+    return predictions, deployed_model_id
+
+
+def send_predict_request(
+    prediction_client: Any,
+    endpoint: str,
+    request: bytes,
+    timeout: Optional[float] = None,
+) -> bytes:
+    """Sends a serialized PredictRequest over the channel of a prediction client.
+
+    Args:
+        prediction_client (PredictionClientWithOverride):
+            Required. The gRPC prediction client whose channel is used.
+        endpoint (str):
+            Required. The resource name of the Endpoint.
+        request (bytes):
+            Required. The serialized PredictRequest.
+        timeout (float):
+            Optional. The timeout for this request in seconds.
+    Returns:
+        The serialized PredictResponse.
+    """
+    predict = prediction_client._transport.grpc_channel.unary_unary(_PREDICT_METHOD)
+    metadata = (
+        initializer._get_client_info().to_grpc_metadata(),
+        gapic_v1.routing_header.to_grpc_metadata((("endpoint", endpoint),)),
+    )
+    try:
+        return predict(request, timeout=timeout, metadata=metadata)
+    except grpc.RpcError as exc:
+        raise exceptions.from_grpc_error(exc) from exc
@@ -16,6 +16,7 @@
 
 
 import functools
+import hashlib
 import os
 import pathlib
 import shutil
@@ -24,12 +25,24 @@ import sys
 import tempfile
 from typing import Optional, Sequence, Callable
 
+from google.api_core import exceptions
 from google.auth import credentials as auth_credentials
+from google.cloud import storage
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import utils
 
 _LOGGER = base.Logger(__name__)
 
+# Local directory built packages are cached in, keyed by their source hash.
+_LOCAL_PACKAGE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "google-cloud-aiplatform",
+    "training-packages",
+)
+# Directories and file suffixes that do not change what a package runs.
+_IGNORED_SOURCE_DIRS = ("__pycache__",)
+_IGNORED_SOURCE_SUFFIXES = (".pyc",)
+
 
 def _get_python_executable() -> str:
     """Returns Python executable.
@@ -119,6 +132,57 @@ setup(
         # Module name that can be executed during training. ie. python -m
         return f"{self._ROOT_MODULE}.{self.task_module_name}"
 
+    @property
+    def package_file_name(self) -> str:
+        """File name of the source distribution built by make_package."""
+        return f"{self._ROOT_MODULE}-{self._SETUP_PY_VERSION}.tar.gz"
+
+    def source_hash(self) -> str:
+        """Returns a hash of everything the built package depends on.
+
+        The hash covers the script, or every file under the script folder,
+        the task module name, the requirements and the setup.py template.
+        Compiled Python files are ignored.
+
+        Returns:
+            Hex digest of the SHA-256 hash.
+        """
+        source_hash = hashlib.sha256()
+        for value in [
+            self._SETUP_PY_TEMPLATE,
+            self._SETUP_PY_VERSION,
+            self.task_module_name,
+            *self.requirements,
+        ]:
+            source_hash.update(value.encode("utf-8"))
+            source_hash.update(b"\0")
+
+        if os.path.isdir(self.script_path):
+            source_files = []
+            for root, dirs, files in os.walk(self.script_path):
+                dirs[:] = [d for d in dirs if d not in _IGNORED_SOURCE_DIRS]
+                source_files.extend(
+                    os.path.join(root, f)
+                    for f in files
+                    if not f.endswith(_IGNORED_SOURCE_SUFFIXES)
+                )
+            source_files = sorted(
+                (pathlib.Path(f).relative_to(self.script_path).as_posix(), f)
+                for f in source_files
+            )
+        else:
+            source_files = [("", self.script_path)]
+
+        for relative_path, source_file in source_files:
+            source_hash.update(relative_path.encode("utf-8"))
+            source_hash.update(b"\0")
+            with open(source_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    source_hash.update(chunk)
+            source_hash.update(b"\0")
+
+        return source_hash.hexdigest()
+
     def make_package(self, package_directory: str) -> str:
         """Converts script into a Python package suitable for python module
         execution.
@@ -146,11 +210,7 @@ setup(
         setup_py_path = trainer_root_path / "setup.py"
 
         # The path to the generated source distribution.
-        source_distribution_path = (
-            trainer_root_path
-            / "dist"
-            / f"{self._ROOT_MODULE}-{self._SETUP_PY_VERSION}.tar.gz"
-        )
+        source_distribution_path = trainer_root_path / "dist" / self.package_file_name
 
         trainer_root_path.mkdir()
         trainer_path.mkdir()
@@ -218,27 +278,134 @@ setup(
             _LOGGER.info("Training script copied to:\n%s." % output_location)
             return output_location
 
+    def make_cached_package(self, source_hash: Optional[str] = None) -> str:
+        """Returns the package from the local cache, building it if needed.
+
+        Args:
+            source_hash (str):
+                Optional. The source hash of the package, computed if not given.
+        Returns:
+            Path to the cached source distribution.
+        Raises:
+            RunTimeError: If package creation fails.
+            OSError: If the package cannot be written to the local cache.
+        """
+        source_hash = source_hash or self.source_hash()
+        cached_package_path = self._cached_package_path(source_hash)
+        if cached_package_path.is_file():
+            _LOGGER.info("Using cached training script package %s." % source_hash)
+            return str(cached_package_path)
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            self._add_to_package_cache(
+                self.make_package(tmpdirname), cached_package_path
+            )
+        return str(cached_package_path)
+
+    def _cached_package_path(self, source_hash: str) -> pathlib.Path:
+        """Returns the local cache path of the package built from the sources
+        with the given hash."""
+        return (
+            pathlib.Path(_LOCAL_PACKAGE_CACHE_DIR)
+            / source_hash
+            / self.package_file_name
+        )
+
+    @staticmethod
+    def _add_to_package_cache(package_path: str, cached_package_path: pathlib.Path):
+        """Copies a built package to its local cache path.
+
+        Raises:
+            OSError: If the package cannot be written to the local cache.
+        """
+        cache_dir = cached_package_path.parent
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Copy next to the cached path first so concurrent builds of the
+        # same sources never see a partially written package.
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+            partial_package_path = f.name
+        shutil.copyfile(package_path, partial_package_path)
+        os.replace(partial_package_path, cached_package_path)
+
     def package_and_copy_to_gcs(
         self,
         gcs_staging_dir: str,
         project: str = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        use_cache: bool = True,
     ) -> str:
         """Packages script in Python package and copies package to GCS bucket.
 
+        With `use_cache`, the package is stored under a name derived from the
+        hash of its sources. If that object already exists in the staging
+        directory, packaging and upload are both skipped. Otherwise the
+        package is taken from the local cache or built and added to it.
+
         Args
             gcs_staging_dir (str): Required. GCS Staging directory.
             project (str): Required. Project where GCS Staging bucket is located.
             credentials (auth_credentials.Credentials):
                 Optional credentials used with GCS client.
+            use_cache (bool):
+                Optional. Whether to reuse packages built from the same sources.
+                If False, a new package is built and copied to a timestamped
+                location.
         Returns:
             GCS location of Python package.
         """
+        if not use_cache:
+            copy_method = functools.partial(
+                utils._timestamped_copy_to_gcs,
+                gcs_dir=gcs_staging_dir,
+                project=project,
+                credentials=credentials,
+            )
+            return self.package_and_copy(copy_method=copy_method)
 
-        copy_method = functools.partial(
-            utils._timestamped_copy_to_gcs,
-            gcs_dir=gcs_staging_dir,
-            project=project,
-            credentials=credentials,
+        source_hash = self.source_hash()
+        gcs_bucket, gcs_blob_prefix = utils.extract_bucket_and_prefix_from_gcs_path(
+            gcs_staging_dir
         )
-        return self.package_and_copy(copy_method=copy_method)
+        blob_path = "-".join(["aiplatform", source_hash, self.package_file_name])
+        if gcs_blob_prefix:
+            blob_path = "/".join([gcs_blob_prefix, blob_path])
+
+        client = storage.Client(project=project, credentials=credentials)
+        blob = client.bucket(gcs_bucket).blob(blob_path)
+        gcs_path = "".join(["gs://", "/".join([blob.bucket.name, blob.name])])
+
+        if blob.exists():
+            _LOGGER.info("Training script package already staged at:\n%s." % gcs_path)
+            return gcs_path
+
+        cached_package_path = self._cached_package_path(source_hash)
+        if cached_package_path.is_file():
+            _LOGGER.info("Using cached training script package %s." % source_hash)
+            self._upload_package(blob, str(cached_package_path))
+        else:
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                package_path = self.make_package(tmpdirname)
+                # Only errors writing to the local cache are tolerated, errors
+                # building the package propagate.
+                try:
+                    self._add_to_package_cache(package_path, cached_package_path)
+                except OSError as exc:
+                    _LOGGER.info(f"Not caching training script package: {exc}")
+                else:
+                    package_path = str(cached_package_path)
+                self._upload_package(blob, package_path)
+
+        _LOGGER.info("Training script copied to:\n%s." % gcs_path)
+        return gcs_path
+
+    @staticmethod
+    def _upload_package(blob: storage.Blob, package_path: str):
+        """Uploads a package unless the object was created concurrently.
+
+        Objects are named by the hash of their sources, so an object created
+        in the meantime holds the same package.
+        """
+        try:
+            blob.upload_from_filename(package_path, if_generation_match=0)
+        except exceptions.PreconditionFailed:
+            pass
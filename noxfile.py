@@ -188,6 +188,23 @@ def unit(session):
     default(session)
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION)
+def benchmark(session):
+    """Run the client-side benchmarks against in-process fake services."""
+    constraints_path = str(
+        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
+    )
+    install_unittest_dependencies(session, "-c", constraints_path)
+
+    session.run(
+        "py.test",
+        "--quiet",
+        "-s",
+        os.path.join("tests", "benchmark"),
+        *session.posargs,
+    )
+
+
 def install_systemtest_dependencies(session, *constraints):
 
     # Use pre-release gRPC for system tests.
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import threading
+import time
+
+import grpc
+import pytest
+
+from google import auth
+from google.auth import credentials as auth_credentials
+from unittest.mock import patch
+
+from google.cloud import aiplatform
+from google.cloud.aiplatform import models
+from google.cloud.aiplatform.compat.services import prediction_service_client
+from google.cloud.aiplatform.compat.types import (
+    endpoint as gca_endpoint,
+    prediction_service as gca_prediction_service,
+)
+from google.cloud.aiplatform_v1.services.prediction_service.transports import (
+    grpc as prediction_grpc_transport,
+)
+from google.protobuf import timestamp_pb2
+
+_TEST_PROJECT = "test-project"
+_TEST_LOCATION = "us-central1"
+_TEST_ENDPOINT_NAME = (
+    f"projects/{_TEST_PROJECT}/locations/{_TEST_LOCATION}/endpoints/1234"
+)
+_TEST_DEPLOYED_MODEL_ID = "5678"
+
+# Simulated server-side cost of every Predict RPC, independent of its size.
+_PER_RPC_LATENCY_S = 0.002
+
+
+class FakePredictionService:
+    """In-process PredictionService that echoes instances back as predictions."""
+
+    def __init__(self, per_rpc_latency: float = _PER_RPC_LATENCY_S):
+        self.per_rpc_latency = per_rpc_latency
+        self.rpc_count = 0
+        self.instance_count = 0
+        self._lock = threading.Lock()
+
+    def predict(
+        self, request: gca_prediction_service.PredictRequest, context
+    ) -> gca_prediction_service.PredictResponse:
+        with self._lock:
+            self.rpc_count += 1
+            self.instance_count += len(request.instances)
+        time.sleep(self.per_rpc_latency)
+        response = gca_prediction_service.PredictResponse(
+            deployed_model_id=_TEST_DEPLOYED_MODEL_ID
+        )
+        response._pb.predictions.extend(request._pb.instances)
+        return response
+
+    def reset(self):
+        with self._lock:
+            self.rpc_count = 0
+            self.instance_count = 0
+
+
+@pytest.fixture(scope="module")
+def google_auth_mock():
+    with patch.object(auth, "default") as google_auth_mock:
+        google_auth_mock.return_value = (
+            auth_credentials.AnonymousCredentials(),
+            _TEST_PROJECT,
+        )
+        yield google_auth_mock
+
+
+@pytest.fixture(scope="module")
+def fake_prediction_service():
+    service = FakePredictionService()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=64))
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "google.cloud.aiplatform.v1.PredictionService",
+                {
+                    "Predict": grpc.unary_unary_rpc_method_handler(
+                        service.predict,
+                        request_deserializer=gca_prediction_service.PredictRequest.deserialize,
+                        response_serializer=gca_prediction_service.PredictResponse.serialize,
+                    )
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    service.address = f"localhost:{port}"
+    yield service
+    server.stop(grace=None)
+
+
+class FakeRawPredictionService:
+    """In-process PredictionService that answers every Predict RPC with the same
+    serialized response, without parsing the request."""
+
+    def __init__(self):
+        self.response = b""
+        self.request_bytes = 0
+
+    def predict(self, request: bytes, context) -> bytes:
+        self.request_bytes += len(request)
+        return self.response
+
+
+@pytest.fixture(scope="module")
+def fake_raw_prediction_service():
+    service = FakeRawPredictionService()
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        options=[("grpc.max_receive_message_length", -1)],
+    )
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "google.cloud.aiplatform.v1.PredictionService",
+                {"Predict": grpc.unary_unary_rpc_method_handler(service.predict)},
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    service.address = f"localhost:{port}"
+    yield service
+    server.stop(grace=None)
+
+
+def _create_fake_endpoint(address: str) -> models.Endpoint:
+    """Creates an Endpoint whose prediction client talks to `address`."""
+    aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+    create_time = timestamp_pb2.Timestamp()
+    create_time.GetCurrentTime()
+    endpoint = models.Endpoint._construct_sdk_resource_from_gapic(
+        gca_endpoint.Endpoint(name=_TEST_ENDPOINT_NAME, create_time=create_time)
+    )
+    endpoint._prediction_client = prediction_service_client.PredictionServiceClient(
+        transport=prediction_grpc_transport.PredictionServiceGrpcTransport(
+            channel=grpc.insecure_channel(
+                address, options=[("grpc.max_receive_message_length", -1)]
+            )
+        )
+    )
+    return endpoint
+
+
+@pytest.fixture
+def fake_endpoint(google_auth_mock, fake_prediction_service):
+    """An Endpoint whose prediction client talks to the fake service."""
+    endpoint = _create_fake_endpoint(fake_prediction_service.address)
+    fake_prediction_service.reset()
+    yield endpoint
+    endpoint._prediction_client.transport.close()
+
+
+@pytest.fixture
+def fake_raw_endpoint(google_auth_mock, fake_raw_prediction_service):
+    """An Endpoint whose prediction client talks to the fake raw service."""
+    endpoint = _create_fake_endpoint(fake_raw_prediction_service.address)
+    yield endpoint
+    endpoint._prediction_client.transport.close()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Compares Endpoint.predict with Endpoint.batch_predictor.
+
+Many caller threads each send a few instances at a time to an in-process fake
+PredictionService that charges a fixed cost per RPC. Run with:
+
+    pytest -s tests/benchmark/aiplatform/test_endpoint_batch_predictor_benchmark.py
+"""
+
+from concurrent import futures
+import os
+import time
+
+_NUM_CALLERS = int(os.environ.get("AIPLATFORM_BENCHMARK_CALLERS", "32"))
+_CALLS_PER_CALLER = int(os.environ.get("AIPLATFORM_BENCHMARK_CALLS", "50"))
+_INSTANCES_PER_CALL = 2
+
+
+def _run_callers(predict_fn):
+    def caller(caller_id):
+        for call_id in range(_CALLS_PER_CALLER):
+            instances = [
+                [float(caller_id), float(call_id), float(i)]
+                for i in range(_INSTANCES_PER_CALL)
+            ]
+            prediction = predict_fn(instances)
+            assert prediction.predictions == instances
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=_NUM_CALLERS) as executor:
+        for result in executor.map(caller, range(_NUM_CALLERS)):
+            assert result is None
+    return time.perf_counter() - start
+
+
+def _report(label, elapsed, rpc_count):
+    instances = _NUM_CALLERS * _CALLS_PER_CALLER * _INSTANCES_PER_CALL
+    print(
+        f"\n{label}: {elapsed:.3f}s, {rpc_count} RPCs, "
+        f"{instances / elapsed:,.0f} instances/s"
+    )
+
+
+def test_benchmark_batch_predictor(fake_endpoint, fake_prediction_service):
+    unbatched_elapsed = _run_callers(
+        lambda instances: fake_endpoint.predict(instances=instances)
+    )
+    unbatched_rpcs = fake_prediction_service.rpc_count
+    _report("Endpoint.predict", unbatched_elapsed, unbatched_rpcs)
+
+    fake_prediction_service.reset()
+    with fake_endpoint.batch_predictor(
+        max_batch_size=64, max_latency_ms=2, max_concurrent_requests=8
+    ) as predictor:
+        batched_elapsed = _run_callers(
+            lambda instances: predictor.predict(instances=instances)
+        )
+    batched_rpcs = fake_prediction_service.rpc_count
+    _report("Endpoint.batch_predictor", batched_elapsed, batched_rpcs)
+
+    assert batched_rpcs < unbatched_rpcs
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Compares Endpoint.predict with Endpoint.predict_array on dense float inputs.
+
+Both calls send a rows x columns float matrix to an in-process fake
+PredictionService that returns a canned response of one list of
+`_PREDICTION_WIDTH` numbers per row, so only client-side serialization and
+decoding is measured. Run with:
+
+    pytest -s tests/benchmark/aiplatform/test_endpoint_predict_array_benchmark.py
+"""
+
+import os
+import time
+
+import numpy as np
+
+from google.cloud.aiplatform.compat.types import (
+    prediction_service as gca_prediction_service,
+)
+
+_NUM_ROWS = int(os.environ.get("AIPLATFORM_BENCHMARK_ROWS", "10000"))
+_NUM_COLUMNS = int(os.environ.get("AIPLATFORM_BENCHMARK_COLUMNS", "512"))
+_PREDICTION_WIDTH = 8
+
+
+def _report(label, elapsed):
+    print(
+        f"\n{label}: {elapsed:.3f}s for {_NUM_ROWS}x{_NUM_COLUMNS} floats, "
+        f"{_NUM_ROWS / elapsed:,.0f} instances/s"
+    )
+
+
+def test_benchmark_predict_array(fake_raw_endpoint, fake_raw_prediction_service):
+    instances = np.random.default_rng(0).random(
+        (_NUM_ROWS, _NUM_COLUMNS), dtype=np.float32
+    )
+    expected = np.random.default_rng(1).random((_NUM_ROWS, _PREDICTION_WIDTH))
+
+    response = gca_prediction_service.PredictResponse(deployed_model_id="5678")
+    response.predictions.extend(expected.tolist())
+    fake_raw_prediction_service.response = (
+        gca_prediction_service.PredictResponse.serialize(response)
+    )
+
+    start = time.perf_counter()
+    prediction = fake_raw_endpoint.predict(instances=instances.tolist())
+    predict_elapsed = time.perf_counter() - start
+    predict_request_bytes = fake_raw_prediction_service.request_bytes
+    _report("Endpoint.predict", predict_elapsed)
+    np.testing.assert_array_equal(np.array(prediction.predictions), expected)
+
+    fake_raw_prediction_service.request_bytes = 0
+    start = time.perf_counter()
+    prediction = fake_raw_endpoint.predict_array(instances=instances)
+    predict_array_elapsed = time.perf_counter() - start
+    _report("Endpoint.predict_array", predict_array_elapsed)
+    np.testing.assert_array_equal(prediction.predictions, expected)
+
+    # Both paths send the same PredictRequest.
+    assert fake_raw_prediction_service.request_bytes == predict_request_bytes
+    assert predict_array_elapsed < predict_elapsed
@@ -21,6 +21,8 @@ from google import auth
 from google.auth import credentials as auth_credentials
 from unittest.mock import patch
 
+from google.cloud.aiplatform.utils import job_poller
+
 
 @pytest.fixture(scope="module")
 def google_auth_mock():
@@ -30,3 +32,12 @@ def google_auth_mock():
             "test-project",
         )
         yield google_auth_mock
+
+
+@pytest.fixture(autouse=True)
+def job_poller_intervals_mock():
+    """Checks the states of jobs waited on without pausing between checks."""
+    with patch.object(
+        job_poller.global_poller, "_min_poll_interval", 0.01
+    ), patch.object(job_poller.global_poller, "_max_poll_interval", 0.01):
+        yield
@@ -725,6 +725,9 @@ class TestForecastingTrainingJob:
                 holiday_regions=_TEST_TRAINING_HOLIDAY_REGIONS,
             )
 
+        if not sync:
+            job.wait()
+
     @pytest.mark.parametrize("sync", [True, False])
     @pytest.mark.parametrize(
         "training_job",
@@ -506,6 +506,9 @@ class TestAutoMLImageTrainingJob:
                 sync=sync,
             )
 
+        if not sync:
+            job.wait()
+
     @pytest.mark.usefixtures(
         "mock_pipeline_service_create",
         "mock_pipeline_service_get",
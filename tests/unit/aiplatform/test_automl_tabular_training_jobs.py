@@ -965,6 +965,9 @@ class TestAutoMLTabularTrainingJob:
                 sync=sync,
             )
 
+        if not sync:
+            job.wait()
+
     @pytest.mark.parametrize("sync", [True, False])
     def test_run_raises_if_pipeline_fails(
         self, mock_pipeline_service_create_and_get_with_fail, mock_dataset_tabular, sync
@@ -711,6 +711,9 @@ class TestAutoMLTextTrainingJob:
                 sync=sync,
             )
 
+        if not sync:
+            job.wait()
+
     @pytest.mark.usefixtures(
         "mock_pipeline_service_create",
         "mock_pipeline_service_get",
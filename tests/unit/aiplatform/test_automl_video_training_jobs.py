@@ -749,6 +749,9 @@ class TestAutoMLVideoTrainingJob:
                 sync=sync,
             )
 
+        if not sync:
+            job.wait()
+
     @pytest.mark.usefixtures(
         "mock_pipeline_service_create",
         "mock_pipeline_service_get",
@@ -16,6 +16,8 @@
 #
 
 import copy
+import numpy as np
+import pyarrow as pa
 import pytest
 
 from unittest import mock
@@ -33,6 +35,7 @@ from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import explain
 from google.cloud.aiplatform import models
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import prediction_utils
 
 from google.cloud.aiplatform.compat.services import (
     model_service_client,
@@ -375,6 +378,21 @@ def list_endpoints_mock():
         yield list_endpoints_mock
 
 
+@pytest.fixture
+def list_endpoints_async_mock():
+    async def endpoint_pager():
+        for endpoint in _TEST_ENDPOINT_LIST:
+            yield endpoint
+
+    with mock.patch.object(
+        utils.EndpointClientWithOverride.get_gapic_async_client_class(),
+        "list_endpoints",
+        new_callable=mock.AsyncMock,
+    ) as list_endpoints_async_mock:
+        list_endpoints_async_mock.side_effect = lambda **kwargs: endpoint_pager()
+        yield list_endpoints_async_mock
+
+
 @pytest.fixture
 def create_endpoint_client_mock():
     with mock.patch.object(
@@ -402,6 +420,64 @@ def predict_client_predict_mock():
         yield predict_mock
 
 
+@pytest.fixture
+def predict_client_predict_echo_mock():
+    def echo_predict(endpoint, instances, parameters, timeout):
+        response = gca_prediction_service.PredictResponse(deployed_model_id=_TEST_ID)
+        response.predictions.extend(instances)
+        return response
+
+    with mock.patch.object(
+        prediction_service_client.PredictionServiceClient, "predict"
+    ) as predict_mock:
+        predict_mock.side_effect = echo_predict
+        yield predict_mock
+
+
+@pytest.fixture
+def send_predict_request_echo_mock():
+    def echo_predict(prediction_client, endpoint, request, timeout):
+        predict_request = gca_prediction_service.PredictRequest.deserialize(request)
+        response = gca_prediction_service.PredictResponse(deployed_model_id=_TEST_ID)
+        response._pb.predictions.extend(predict_request._pb.instances)
+        return gca_prediction_service.PredictResponse.serialize(response)
+
+    with mock.patch.object(
+        prediction_utils, "send_predict_request"
+    ) as send_predict_request_mock:
+        send_predict_request_mock.side_effect = echo_predict
+        yield send_predict_request_mock
+
+
+@pytest.fixture
+def predict_client_predict_async_mock():
+    with mock.patch.object(
+        utils.PredictionClientWithOverride.get_gapic_async_client_class(),
+        "predict",
+        new_callable=mock.AsyncMock,
+    ) as predict_async_mock:
+        predict_async_mock.return_value = gca_prediction_service.PredictResponse(
+            deployed_model_id=_TEST_MODEL_ID
+        )
+        predict_async_mock.return_value.predictions.extend(_TEST_PREDICTION)
+        yield predict_async_mock
+
+
+@pytest.fixture
+def predict_client_explain_async_mock():
+    with mock.patch.object(
+        utils.PredictionClientWithOverride.get_gapic_async_client_class(),
+        "explain",
+        new_callable=mock.AsyncMock,
+    ) as explain_async_mock:
+        explain_async_mock.return_value = gca_prediction_service.ExplainResponse(
+            deployed_model_id=_TEST_MODEL_ID,
+        )
+        explain_async_mock.return_value.predictions.extend(_TEST_PREDICTION)
+        explain_async_mock.return_value.explanations.extend(_TEST_EXPLANATIONS)
+        yield explain_async_mock
+
+
 @pytest.fixture
 def predict_client_explain_mock():
     with mock.patch.object(
@@ -1606,6 +1682,122 @@ class TestEndpoint:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_array(self, send_predict_request_echo_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        instances = np.arange(12, dtype=np.float32).reshape(4, 3)
+
+        test_prediction = test_endpoint.predict_array(
+            instances=instances, parameters={"param": 3.0}, timeout=10.0
+        )
+
+        assert isinstance(test_prediction.predictions, np.ndarray)
+        assert test_prediction.predictions.dtype == np.float64
+        np.testing.assert_array_equal(test_prediction.predictions, instances)
+        assert test_prediction.deployed_model_id == _TEST_ID
+
+        call_kwargs = send_predict_request_echo_mock.call_args.kwargs
+        assert call_kwargs["endpoint"] == _TEST_ENDPOINT_NAME
+        assert call_kwargs["timeout"] == 10.0
+        predict_request = gca_prediction_service.PredictRequest.deserialize(
+            call_kwargs["request"]
+        )
+        assert predict_request.endpoint == _TEST_ENDPOINT_NAME
+        assert [list(instance) for instance in predict_request.instances] == (
+            instances.tolist()
+        )
+        assert dict(predict_request.parameters) == {"param": 3.0}
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_array_scalar_instances(self, send_predict_request_echo_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        test_prediction = test_endpoint.predict_array(instances=np.array([1.5, 2.5]))
+
+        np.testing.assert_array_equal(test_prediction.predictions, [1.5, 2.5])
+
+    @pytest.mark.parametrize(
+        "instances",
+        [
+            pa.table({"a": [1.0, 2.0], "b": [3.0, 4.0]}),
+            pa.record_batch(
+                [pa.array([[1.0, 3.0], [2.0, 4.0]], type=pa.list_(pa.float32(), 2))],
+                names=["embedding"],
+            ),
+        ],
+    )
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_array_arrow_instances(
+        self, instances, send_predict_request_echo_mock
+    ):
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        test_prediction = test_endpoint.predict_array(instances=instances)
+
+        np.testing.assert_array_equal(
+            test_prediction.predictions, [[1.0, 3.0], [2.0, 4.0]]
+        )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_array_non_numeric_predictions(self):
+        response = gca_prediction_service.PredictResponse(deployed_model_id=_TEST_ID)
+        response.predictions.extend([{"label": "a"}, {"label": "b"}])
+
+        with mock.patch.object(
+            prediction_utils,
+            "send_predict_request",
+            return_value=gca_prediction_service.PredictResponse.serialize(response),
+        ):
+            test_prediction = models.Endpoint(_TEST_ID).predict_array(
+                instances=np.zeros((2, 3))
+            )
+
+        assert test_prediction.predictions.dtype == object
+        assert list(test_prediction.predictions) == [{"label": "a"}, {"label": "b"}]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_predict_async(self, predict_client_predict_async_mock):
+
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = await test_endpoint.predict_async(
+            instances=_TEST_INSTANCES, parameters={"param": 3.0}, timeout=10.0
+        )
+
+        true_prediction = models.Prediction(
+            predictions=_TEST_PREDICTION, deployed_model_id=_TEST_ID
+        )
+
+        assert true_prediction == test_prediction
+        predict_client_predict_async_mock.assert_awaited_once_with(
+            endpoint=_TEST_ENDPOINT_NAME,
+            instances=_TEST_INSTANCES,
+            parameters={"param": 3.0},
+            timeout=10.0,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_explain_async(self, predict_client_explain_async_mock):
+
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = await test_endpoint.explain_async(
+            instances=_TEST_INSTANCES,
+            parameters={"param": 3.0},
+            deployed_model_id=_TEST_MODEL_ID,
+        )
+
+        assert test_prediction.predictions == _TEST_PREDICTION
+        assert test_prediction.deployed_model_id == _TEST_MODEL_ID
+        assert list(test_prediction.explanations) == _TEST_EXPLANATIONS
+        predict_client_explain_async_mock.assert_awaited_once_with(
+            endpoint=_TEST_ENDPOINT_NAME,
+            instances=_TEST_INSTANCES,
+            parameters={"param": 3.0},
+            deployed_model_id=_TEST_MODEL_ID,
+            timeout=None,
+        )
+
     @pytest.mark.usefixtures("get_endpoint_mock")
     def test_predict_with_timeout(self, predict_client_predict_mock):
 
@@ -1639,6 +1831,93 @@ class TestEndpoint:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_batch_predictor_merges_concurrent_requests(
+        self, predict_client_predict_echo_mock
+    ):
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        with test_endpoint.batch_predictor(
+            max_batch_size=4, max_latency_ms=1000, max_concurrent_requests=1
+        ) as predictor:
+            prediction_futures = [
+                predictor.submit(instances=[[float(i)], [float(i) + 0.5]])
+                for i in range(4)
+            ]
+            predictions = [future.result() for future in prediction_futures]
+
+        for i, prediction in enumerate(predictions):
+            assert prediction == models.Prediction(
+                predictions=[[float(i)], [float(i) + 0.5]],
+                deployed_model_id=_TEST_ID,
+            )
+        assert predict_client_predict_echo_mock.call_count == 2
+        for call in predict_client_predict_echo_mock.call_args_list:
+            assert call.kwargs["endpoint"] == _TEST_ENDPOINT_NAME
+            assert len(call.kwargs["instances"]) == 4
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_batch_predictor_splits_large_requests(
+        self, predict_client_predict_echo_mock
+    ):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_instances = [[float(i)] for i in range(10)]
+
+        with test_endpoint.batch_predictor(
+            max_batch_size=3, max_latency_ms=0
+        ) as predictor:
+            prediction = predictor.predict(instances=test_instances)
+
+        assert prediction.predictions == test_instances
+        assert predict_client_predict_echo_mock.call_count == 4
+        assert all(
+            len(call.kwargs["instances"]) <= 3
+            for call in predict_client_predict_echo_mock.call_args_list
+        )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_batch_predictor_does_not_merge_different_parameters(
+        self, predict_client_predict_echo_mock
+    ):
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        with test_endpoint.batch_predictor(
+            max_batch_size=8, max_latency_ms=1000, max_concurrent_requests=1
+        ) as predictor:
+            future_1 = predictor.submit(instances=[[1.0]], parameters={"param": 1})
+            future_2 = predictor.submit(instances=[[2.0]], parameters={"param": 2})
+
+        assert future_1.result().predictions == [[1.0]]
+        assert future_2.result().predictions == [[2.0]]
+        predict_client_predict_echo_mock.assert_has_calls(
+            [
+                mock.call(
+                    endpoint=_TEST_ENDPOINT_NAME,
+                    instances=[[1.0]],
+                    parameters={"param": 1},
+                    timeout=None,
+                ),
+                mock.call(
+                    endpoint=_TEST_ENDPOINT_NAME,
+                    instances=[[2.0]],
+                    parameters={"param": 2},
+                    timeout=None,
+                ),
+            ]
+        )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_batch_predictor_propagates_errors(self, predict_client_predict_mock):
+        predict_client_predict_mock.side_effect = RuntimeError("prediction failed")
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        with test_endpoint.batch_predictor(max_latency_ms=0) as predictor:
+            with pytest.raises(RuntimeError, match="prediction failed"):
+                predictor.predict(instances=_TEST_INSTANCES)
+
+        with pytest.raises(RuntimeError, match="closed"):
+            predictor.submit(instances=_TEST_INSTANCES)
+
     @pytest.mark.usefixtures("get_endpoint_mock")
     def test_explain_with_timeout(self, predict_client_explain_mock):
 
@@ -1745,6 +2024,24 @@ class TestEndpoint:
 
         assert ep_list[0].create_time > ep_list[1].create_time > ep_list[2].create_time
 
+    @pytest.mark.asyncio
+    async def test_list_endpoint_async_order_by_time(self, list_endpoints_async_mock):
+        ep_list = await aiplatform.Endpoint.list_async(
+            filter=_TEST_LIST_FILTER, order_by=_TEST_LIST_ORDER_BY_CREATE_TIME
+        )
+
+        # `order_by` is not passed to API since it is not an accepted field
+        list_endpoints_async_mock.assert_awaited_once_with(
+            request={"parent": _TEST_PARENT, "filter": _TEST_LIST_FILTER}
+        )
+
+        assert len(ep_list) == len(_TEST_ENDPOINT_LIST)
+
+        for ep in ep_list:
+            assert type(ep) == aiplatform.Endpoint
+
+        assert ep_list[0].create_time > ep_list[1].create_time > ep_list[2].create_time
+
     def test_list_endpoint_order_by_display_name(self, list_endpoints_mock):
         """Test call to Endpoint.list() and ensure list is returned in order of display_name"""
 
@@ -54,6 +54,7 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud import bigquery
 from google.cloud import bigquery_storage
 from google.cloud import resourcemanager
+from google.cloud import storage
 
 from google.cloud.bigquery_storage_v1.types import stream as gcbqs_stream
 
@@ -242,6 +243,7 @@ _TEST_SERVING_FEATURE_IDS = {
 
 _TEST_FEATURE_TIME_FIELD = "feature_time_field"
 _TEST_FEATURE_TIME = datetime.datetime.now()
+_TEST_STAGING_BUCKET = "gs://my_staging_bucket"
 
 _TEST_BQ_SOURCE_URI = "bq://project.dataset.table_name"
 _TEST_GCS_AVRO_SOURCE_URIS = [
@@ -637,6 +639,95 @@ def streaming_read_feature_values_mock():
         yield streaming_read_feature_values_mock
 
 
+def _get_streaming_read_responses(request):
+    """Answers a streaming read with the header and one view per entity."""
+    yield gca_featurestore_online_service.ReadFeatureValuesResponse(
+        header=_get_header_proto(feature_ids=[_TEST_FEATURE_ID])
+    )
+    for entity_id in request.entity_ids:
+        yield gca_featurestore_online_service.ReadFeatureValuesResponse(
+            entity_view=_get_entity_view_proto(
+                entity_id=entity_id,
+                feature_value_types=[_TEST_FEATURE_VALUE_TYPE],
+                feature_values=[_TEST_FEATURE_VALUE],
+            ),
+        )
+
+
+@pytest.fixture
+def streaming_read_feature_values_per_entity_mock():
+    with patch.object(
+        featurestore_online_serving_service_client.FeaturestoreOnlineServingServiceClient,
+        "streaming_read_feature_values",
+    ) as streaming_read_feature_values_mock:
+        streaming_read_feature_values_mock.side_effect = (
+            lambda request, **kwargs: _get_streaming_read_responses(request)
+        )
+        yield streaming_read_feature_values_mock
+
+
+@pytest.fixture
+def streaming_read_feature_values_per_entity_async_mock():
+    async def streaming_responses(request):
+        for response in _get_streaming_read_responses(request):
+            yield response
+
+    with patch.object(
+        utils.FeaturestoreOnlineServingClientWithOverride.get_gapic_async_client_class(),
+        "streaming_read_feature_values",
+        new_callable=mock.AsyncMock,
+    ) as streaming_read_feature_values_async_mock:
+        streaming_read_feature_values_async_mock.side_effect = (
+            lambda request, **kwargs: streaming_responses(request)
+        )
+        yield streaming_read_feature_values_async_mock
+
+
+@pytest.fixture
+def read_feature_values_async_mock():
+    with patch.object(
+        utils.FeaturestoreOnlineServingClientWithOverride.get_gapic_async_client_class(),
+        "read_feature_values",
+        new_callable=mock.AsyncMock,
+    ) as read_feature_values_async_mock:
+        read_feature_values_async_mock.return_value = (
+            gca_featurestore_online_service.ReadFeatureValuesResponse(
+                header=_get_header_proto(feature_ids=[_TEST_FEATURE_ID]),
+                entity_view=_get_entity_view_proto(
+                    entity_id=_TEST_READ_ENTITY_ID,
+                    feature_value_types=[_TEST_FEATURE_VALUE_TYPE],
+                    feature_values=[_TEST_FEATURE_VALUE],
+                ),
+            )
+        )
+        yield read_feature_values_async_mock
+
+
+@pytest.fixture
+def streaming_read_feature_values_async_mock():
+    async def streaming_responses():
+        yield gca_featurestore_online_service.ReadFeatureValuesResponse(
+            header=_get_header_proto(feature_ids=[_TEST_FEATURE_ID])
+        )
+        yield gca_featurestore_online_service.ReadFeatureValuesResponse(
+            entity_view=_get_entity_view_proto(
+                entity_id=_TEST_READ_ENTITY_ID,
+                feature_value_types=[_TEST_FEATURE_VALUE_TYPE],
+                feature_values=[_TEST_FEATURE_VALUE],
+            ),
+        )
+
+    with patch.object(
+        utils.FeaturestoreOnlineServingClientWithOverride.get_gapic_async_client_class(),
+        "streaming_read_feature_values",
+        new_callable=mock.AsyncMock,
+    ) as streaming_read_feature_values_async_mock:
+        streaming_read_feature_values_async_mock.side_effect = (
+            lambda **kwargs: streaming_responses()
+        )
+        yield streaming_read_feature_values_async_mock
+
+
 # ALL Feature Mocks
 @pytest.fixture
 def get_feature_mock():
@@ -668,6 +759,20 @@ def list_features_mock():
         yield list_features_mock
 
 
+@pytest.fixture
+def list_importing_features_mock():
+    with patch.object(
+        featurestore_service_client.FeaturestoreServiceClient, "list_features"
+    ) as list_importing_features_mock:
+        list_importing_features_mock.return_value = [
+            gca_feature.Feature(
+                name=f"{_TEST_ENTITY_TYPE_NAME}/features/{_TEST_IMPORTING_FEATURE_ID}",
+                value_type=_TEST_FEATURE_VALUE_TYPE,
+            )
+        ]
+        yield list_importing_features_mock
+
+
 @pytest.fixture
 def delete_feature_mock():
     with mock.patch.object(
@@ -789,6 +894,62 @@ class TestFeaturestoreUtils:
             featurestore_utils.validate_value_type(value_type=value_type)
 
 
+class TestFeatureValueCache:
+    def test_get_counts_hits_and_misses(self):
+        cache = featurestore_utils.FeatureValueCache()
+        cache.put(_TEST_ENTITY_TYPE_NAME, "entity_1", _TEST_FEATURE_ID, "value")
+
+        assert (
+            cache.get(_TEST_ENTITY_TYPE_NAME, "entity_1", _TEST_FEATURE_ID) == "value"
+        )
+        assert cache.get(_TEST_ENTITY_TYPE_NAME, "entity_2", _TEST_FEATURE_ID) is None
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+    def test_evicts_least_recently_used(self):
+        cache = featurestore_utils.FeatureValueCache(max_size=2)
+        cache.put(_TEST_ENTITY_TYPE_NAME, "entity_1", _TEST_FEATURE_ID, 1)
+        cache.put(_TEST_ENTITY_TYPE_NAME, "entity_2", _TEST_FEATURE_ID, 2)
+        cache.get(_TEST_ENTITY_TYPE_NAME, "entity_1", _TEST_FEATURE_ID)
+        cache.put(_TEST_ENTITY_TYPE_NAME, "entity_3", _TEST_FEATURE_ID, 3)
+
+        assert len(cache) == 2
+        assert cache.get(_TEST_ENTITY_TYPE_NAME, "entity_2", _TEST_FEATURE_ID) is None
+        assert cache.get(_TEST_ENTITY_TYPE_NAME, "entity_1", _TEST_FEATURE_ID) == 1
+
+    def test_expires_values_after_feature_ttl(self):
+        cache = featurestore_utils.FeatureValueCache(
+            ttl=10, feature_ttls={"slow_feature": 100}, negative_ttl=0
+        )
+        with patch.object(featurestore_utils.time, "monotonic", return_value=0):
+            cache.put(_TEST_ENTITY_TYPE_NAME, "entity_1", "fast_feature", 1)
+            cache.put(_TEST_ENTITY_TYPE_NAME, "entity_1", "slow_feature", 2)
+            cache.put(
+                _TEST_ENTITY_TYPE_NAME, "entity_1", "missing", None, is_missing=True
+            )
+
+        with patch.object(featurestore_utils.time, "monotonic", return_value=50):
+            assert cache.get(_TEST_ENTITY_TYPE_NAME, "entity_1", "fast_feature") is None
+            assert cache.get(_TEST_ENTITY_TYPE_NAME, "entity_1", "slow_feature") == 2
+        assert len(cache) == 1
+
+    def test_invalidate_entity_type(self):
+        cache = featurestore_utils.FeatureValueCache()
+        cache.put(_TEST_ENTITY_TYPE_NAME, "entity_1", _TEST_FEATURE_ID, 1)
+        cache.put("other_entity_type", "entity_1", _TEST_FEATURE_ID, 1)
+
+        cache.invalidate(_TEST_ENTITY_TYPE_NAME)
+
+        assert len(cache) == 1
+        assert cache.get("other_entity_type", "entity_1", _TEST_FEATURE_ID) == 1
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_size": 0}, {"ttl": -1}, {"feature_ttls": {"f": -1}}]
+    )
+    def test_init_with_invalid_arguments_raises(self, kwargs):
+        with pytest.raises(ValueError):
+            featurestore_utils.FeatureValueCache(**kwargs)
+
+
 class Test_FeatureConfig:
     def test_feature_config_return_create_feature_request(self):
 
@@ -1676,6 +1837,90 @@ class TestFeaturestore:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bqs_init_client_mock",
+        "get_project_mock",
+        "batch_read_feature_values_mock",
+    )
+    def test_batch_serve_to_arrow_reads_all_streams(
+        self, bqs_client_mock, bqs_create_read_session, bq_delete_dataset_mock
+    ):
+        pyarrow = pytest.importorskip("pyarrow")
+        bqs_create_read_session.return_value.streams = [
+            gcbqs_stream.ReadStream(name=f"stream_{i}") for i in range(3)
+        ]
+
+        def read_rows(stream_name):
+            reader = mock.Mock()
+            reader.rows.return_value.pages = [
+                mock.Mock(
+                    to_arrow=mock.Mock(
+                        return_value=pyarrow.record_batch(
+                            [pyarrow.array([f"{stream_name}_{page}"])],
+                            names=["entity_id"],
+                        )
+                    )
+                )
+                for page in range(2)
+            ]
+            return reader
+
+        bqs_client_mock.read_rows.side_effect = read_rows
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+
+        table = my_featurestore.batch_serve_to_arrow(
+            serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+            read_instances_df=pd.DataFrame(),
+            max_concurrent_streams=2,
+        )
+
+        assert sorted(table.column("entity_id").to_pylist()) == [
+            f"stream_{i}_{page}" for i in range(3) for page in range(2)
+        ]
+        bq_delete_dataset_mock.assert_called_once()
+
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bqs_init_client_mock",
+        "bqs_create_read_session",
+        "get_project_mock",
+    )
+    def test_batch_serve_to_record_batches_deletes_dataset_when_closed(
+        self, bqs_client_mock, batch_read_feature_values_mock, bq_delete_dataset_mock
+    ):
+        bqs_client_mock.read_rows.return_value.rows.return_value.pages = [
+            mock.Mock(to_arrow=mock.Mock(return_value=page)) for page in range(10)
+        ]
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+
+        record_batches = my_featurestore.batch_serve_to_record_batches(
+            serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+            read_instances_df=pd.DataFrame(),
+        )
+        batch_read_feature_values_mock.assert_not_called()
+
+        assert next(record_batches) == 0
+        bq_delete_dataset_mock.assert_not_called()
+        record_batches.close()
+
+        batch_read_feature_values_mock.assert_called_once()
+        bq_delete_dataset_mock.assert_called_once()
+
 
 class TestEntityType:
     def setup_method(self):
@@ -1767,6 +2012,38 @@ class TestEntityType:
         for my_entity_type in my_entity_type_list:
             assert type(my_entity_type) == aiplatform.EntityType
 
+    @pytest.mark.parametrize(
+        "featurestore_name", [_TEST_FEATURESTORE_NAME, _TEST_FEATURESTORE_ID]
+    )
+    def test_iter_list_entity_types(self, featurestore_name, list_entity_types_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_entity_type_list = list(
+            aiplatform.EntityType.iter_list(
+                featurestore_name=featurestore_name, page_size=10
+            )
+        )
+
+        list_entity_types_mock.assert_called_once_with(
+            request={
+                "parent": _TEST_FEATURESTORE_NAME,
+                "filter": None,
+                "page_size": 10,
+            }
+        )
+        assert len(my_entity_type_list) == len(_TEST_ENTITY_TYPE_LIST)
+        for my_entity_type in my_entity_type_list:
+            assert type(my_entity_type) == aiplatform.EntityType
+
+    def test_list_entity_types_with_max_results(self, list_entity_types_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_entity_type_list = aiplatform.EntityType.list(
+            featurestore_name=_TEST_FEATURESTORE_ID, max_results=1
+        )
+
+        assert len(my_entity_type_list) == 1
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     def test_list_features(self, list_features_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -2089,7 +2366,7 @@ class TestEntityType:
 
     @pytest.mark.usefixtures(
         "get_entity_type_mock",
-        "get_feature_mock",
+        "list_importing_features_mock",
         "bq_init_client_mock",
         "bq_init_dataset_mock",
         "bq_create_dataset_mock",
@@ -2155,7 +2432,7 @@ class TestEntityType:
 
     @pytest.mark.usefixtures(
         "get_entity_type_mock",
-        "get_feature_mock",
+        "list_importing_features_mock",
         "bq_init_client_mock",
         "bq_init_dataset_mock",
         "bq_create_dataset_mock",
@@ -2223,6 +2500,232 @@ class TestEntityType:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock", "list_importing_features_mock", "bq_init_client_mock"
+    )
+    @patch("uuid.uuid4", uuid_mock)
+    def test_ingest_from_df_stages_small_df_as_csv_in_gcs(
+        self, import_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_STAGING_BUCKET)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": [f"entity_{i}" for i in range(25000)],
+                _TEST_IMPORTING_FEATURE_SOURCE_FIELD: range(25000),
+                "unused_column": [[1, 2]] * 25000,
+            }
+        )
+
+        with patch.object(
+            storage.Blob, "upload_from_string"
+        ) as upload_from_string_mock, patch.object(
+            storage.Blob, "delete"
+        ) as delete_mock:
+            my_entity_type.ingest_from_df(
+                feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+                feature_time=_TEST_FEATURE_TIME_DATETIME,
+                df_source=df_source,
+                feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
+                bq_staging_min_rows=100000,
+            )
+
+        staging_dir = (
+            f"{_TEST_STAGING_BUCKET}/vertex_ai_auto_staging/"
+            f"{_TEST_FEATURESTORE_ID}_{_TEST_ENTITY_TYPE_ID}_{uuid_mock()}"
+        )
+        request = import_feature_values_mock.call_args.kwargs["request"]
+        assert list(request.csv_source.gcs_source.uris) == [
+            f"{staging_dir}/000000000000.csv",
+            f"{staging_dir}/000000010000.csv",
+            f"{staging_dir}/000000020000.csv",
+        ]
+        assert not request.bigquery_source.input_uri
+        assert upload_from_string_mock.call_count == 3
+        first_chunk = min(
+            upload_from_string_mock.call_args_list, key=lambda call: len(call.args[0])
+        )
+        assert first_chunk.args[0].splitlines()[0] == (
+            f"entity_id,{_TEST_IMPORTING_FEATURE_SOURCE_FIELD}"
+        )
+        assert first_chunk.kwargs["if_generation_match"] == 0
+        assert delete_mock.call_count == 3
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock", "list_importing_features_mock", "bq_init_client_mock"
+    )
+    def test_ingest_from_df_stages_csv_values_that_parse_back(
+        self, import_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_STAGING_BUCKET)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": ["entity_1", "entity_2"],
+                _TEST_IMPORTING_FEATURE_SOURCE_FIELD: [1, None],
+                _TEST_FEATURE_TIME_FIELD: pd.to_datetime(
+                    ["2022-01-01 11:59:59", "2022-07-01 11:59:59"]
+                ).tz_localize("America/New_York"),
+            }
+        )
+
+        with patch.object(
+            storage.Blob, "upload_from_string"
+        ) as upload_from_string_mock, patch.object(storage.Blob, "delete"):
+            my_entity_type.ingest_from_df(
+                feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+                feature_time=_TEST_FEATURE_TIME_FIELD,
+                df_source=df_source,
+                feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
+                bq_staging_min_rows=100000,
+            )
+
+        upload_from_string_mock.assert_called_once()
+        assert upload_from_string_mock.call_args.args[0].splitlines() == [
+            f"entity_id,{_TEST_IMPORTING_FEATURE_SOURCE_FIELD},"
+            f"{_TEST_FEATURE_TIME_FIELD}",
+            "entity_1,1,2022-01-01T16:59:59.000000Z",
+            "entity_2,,2022-07-01T15:59:59.000000Z",
+        ]
+        # The caller's DataFrame is left untouched.
+        assert df_source[_TEST_IMPORTING_FEATURE_SOURCE_FIELD].dtype == "float64"
+        request = import_feature_values_mock.call_args.kwargs["request"]
+        assert request.feature_time_field == _TEST_FEATURE_TIME_FIELD
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock",
+        "list_importing_features_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_delete_dataset_mock",
+        "get_project_mock",
+        "bq_init_schema_field_mock",
+    )
+    def test_ingest_from_df_stages_small_df_in_bq_by_default(
+        self, import_feature_values_mock, bq_load_table_from_dataframe_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_STAGING_BUCKET)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": ["entity_1"],
+                _TEST_IMPORTING_FEATURE_SOURCE_FIELD: [1],
+            }
+        )
+
+        with patch.object(storage.Blob, "upload_from_string") as upload_mock:
+            my_entity_type.ingest_from_df(
+                feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+                feature_time=_TEST_FEATURE_TIME_DATETIME,
+                df_source=df_source,
+                feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
+            )
+
+        upload_mock.assert_not_called()
+        bq_load_table_from_dataframe_mock.assert_called_once()
+        request = import_feature_values_mock.call_args.kwargs["request"]
+        assert request.bigquery_source.input_uri
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock",
+        "list_importing_features_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_delete_dataset_mock",
+        "get_project_mock",
+        "bq_init_schema_field_mock",
+    )
+    def test_ingest_from_df_stages_array_values_in_bq(
+        self, import_feature_values_mock, bq_load_table_from_dataframe_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket=_TEST_STAGING_BUCKET)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": ["entity_1"],
+                _TEST_IMPORTING_FEATURE_SOURCE_FIELD: [[1.0, 2.0]],
+            }
+        )
+
+        my_entity_type.ingest_from_df(
+            feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+            feature_time=_TEST_FEATURE_TIME_DATETIME,
+            df_source=df_source,
+            feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
+        )
+
+        bq_load_table_from_dataframe_mock.assert_called_once()
+        request = import_feature_values_mock.call_args.kwargs["request"]
+        assert request.bigquery_source.input_uri
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock", "get_feature_mock", "create_feature_mock"
+    )
+    def test_feature_schema_is_listed_once_until_features_change(
+        self, list_importing_features_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+
+        for _ in range(2):
+            assert my_entity_type._get_feature_value_types() == {
+                _TEST_IMPORTING_FEATURE_ID: _TEST_FEATURE_VALUE_TYPE_STR
+            }
+        assert list_importing_features_mock.call_count == 1
+
+        my_entity_type.create_feature(
+            feature_id=_TEST_FEATURE_ID, value_type=_TEST_FEATURE_VALUE_TYPE_STR
+        )
+        my_entity_type._get_feature_value_types()
+        assert list_importing_features_mock.call_count == 2
+
+    @pytest.mark.parametrize("sync", [True, False])
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock", "get_feature_mock", "list_importing_features_mock"
+    )
+    def test_create_feature_invalidates_feature_schema_once_created(
+        self, create_feature_mock, sync
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type._get_feature_value_types()
+        schema_cached_during_create = []
+        create_feature_mock.side_effect = lambda **_: (
+            schema_cached_during_create.append(
+                my_entity_type._feature_value_types is not None
+            )
+            or create_feature_mock.return_value
+        )
+
+        my_feature = my_entity_type.create_feature(
+            feature_id=_TEST_FEATURE_ID,
+            value_type=_TEST_FEATURE_VALUE_TYPE_STR,
+            sync=sync,
+        )
+        my_feature.wait()
+
+        assert schema_cached_during_create == [True]
+        assert my_entity_type._feature_value_types is None
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock",
+        "list_importing_features_mock",
+        "bq_init_client_mock",
+    )
+    def test_ingest_from_df_with_unknown_feature_raises(self, get_feature_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+
+        with pytest.raises(ValueError):
+            my_entity_type.ingest_from_df(
+                feature_ids=[_TEST_IMPORTING_FEATURE_ID, "unknown_feature_id"],
+                feature_time=_TEST_FEATURE_TIME_DATETIME,
+                df_source=pd.DataFrame(),
+            )
+        get_feature_mock.assert_not_called()
+
     @pytest.mark.parametrize(
         "feature_value_type, expected_field_type, expected_mode",
         [
@@ -2327,6 +2830,304 @@ class TestEntityType:
         assert result.entity_id[0] == _TEST_READ_ENTITY_ID
         assert result.get(_TEST_FEATURE_ID)[0] == _TEST_FEATURE_VALUE
 
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_read_shards_more_than_100_entities(
+        self, streaming_read_feature_values_per_entity_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        entity_ids = [f"entity_{i:03d}" for i in range(250)]
+
+        result = my_entity_type.read(
+            entity_ids=entity_ids,
+            feature_ids=_TEST_FEATURE_ID,
+            max_concurrent_requests=2,
+        )
+
+        requested_shards = [
+            list(call.kwargs["request"].entity_ids)
+            for call in streaming_read_feature_values_per_entity_mock.call_args_list
+        ]
+        assert sorted(requested_shards) == [
+            entity_ids[:100],
+            entity_ids[100:200],
+            entity_ids[200:],
+        ]
+        assert result.entity_id.tolist() == entity_ids
+        assert (result[_TEST_FEATURE_ID] == _TEST_FEATURE_VALUE).all()
+        assert result.index.tolist() == list(range(250))
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    async def test_read_shards_more_than_100_entities_async(
+        self, streaming_read_feature_values_per_entity_async_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        entity_ids = [f"entity_{i:03d}" for i in range(150)]
+
+        result = await my_entity_type.read_async(
+            entity_ids=entity_ids, feature_ids=_TEST_FEATURE_ID
+        )
+
+        assert streaming_read_feature_values_per_entity_async_mock.await_count == 2
+        assert result.entity_id.tolist() == entity_ids
+        assert (result[_TEST_FEATURE_ID] == _TEST_FEATURE_VALUE).all()
+
+    @pytest.mark.parametrize("max_concurrent_requests", [0, -1])
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_read_with_invalid_max_concurrent_requests_raises(
+        self, max_concurrent_requests, streaming_read_feature_values_per_entity_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+
+        with pytest.raises(ValueError):
+            my_entity_type.read(
+                entity_ids=[f"entity_{i:03d}" for i in range(150)],
+                feature_ids=_TEST_FEATURE_ID,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+        streaming_read_feature_values_per_entity_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent_requests", [0, -1])
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    async def test_read_async_with_invalid_max_concurrent_requests_raises(
+        self,
+        max_concurrent_requests,
+        streaming_read_feature_values_per_entity_async_mock,
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+
+        with pytest.raises(ValueError):
+            await my_entity_type.read_async(
+                entity_ids=[f"entity_{i:03d}" for i in range(150)],
+                feature_ids=_TEST_FEATURE_ID,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+        streaming_read_feature_values_per_entity_async_mock.assert_not_called()
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_read_with_online_cache_reads_only_missed_entities(
+        self, streaming_read_feature_values_per_entity_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        cache = my_entity_type.enable_online_cache(max_size=100, ttl=60)
+
+        my_entity_type.read(
+            entity_ids=["entity_1", "entity_2"], feature_ids=_TEST_FEATURE_ID
+        )
+        result = my_entity_type.read(
+            entity_ids=["entity_2", "entity_3", "entity_1"],
+            feature_ids=_TEST_FEATURE_ID,
+        )
+
+        second_request = streaming_read_feature_values_per_entity_mock.call_args.kwargs[
+            "request"
+        ]
+        assert list(second_request.entity_ids) == ["entity_3"]
+        assert result.entity_id.tolist() == ["entity_2", "entity_3", "entity_1"]
+        assert (result[_TEST_FEATURE_ID] == _TEST_FEATURE_VALUE).all()
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        my_entity_type.read(entity_ids="entity_3", feature_ids=_TEST_FEATURE_ID)
+        assert streaming_read_feature_values_per_entity_mock.call_count == 2
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_read_with_online_cache_caches_missing_values(
+        self, streaming_read_feature_values_mock
+    ):
+        streaming_read_feature_values_mock.return_value = [
+            gca_featurestore_online_service.ReadFeatureValuesResponse(
+                header=_get_header_proto(feature_ids=[_TEST_FEATURE_ID])
+            ),
+            gca_featurestore_online_service.ReadFeatureValuesResponse(
+                entity_view=gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView(
+                    entity_id=_TEST_READ_ENTITY_ID,
+                    data=[
+                        gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data()
+                    ],
+                )
+            ),
+        ]
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.enable_online_cache()
+
+        for _ in range(2):
+            result = my_entity_type.read(
+                entity_ids=[_TEST_READ_ENTITY_ID], feature_ids=_TEST_FEATURE_ID
+            )
+
+        streaming_read_feature_values_mock.assert_called_once()
+        assert result.entity_id.tolist() == [_TEST_READ_ENTITY_ID]
+        assert result[_TEST_FEATURE_ID].tolist() == [None]
+
+    @pytest.mark.usefixtures("get_entity_type_mock", "list_importing_features_mock")
+    def test_read_all_features_with_online_cache_uses_feature_schema(
+        self, streaming_read_feature_values_per_entity_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        cache = my_entity_type.enable_online_cache()
+
+        result = my_entity_type.read(entity_ids=["entity_1"])
+
+        assert result.columns.tolist() == ["entity_id", _TEST_IMPORTING_FEATURE_ID]
+        assert cache.get(
+            my_entity_type.resource_name, "entity_1", _TEST_IMPORTING_FEATURE_ID
+        )
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock", "streaming_read_feature_values_per_entity_mock"
+    )
+    def test_read_all_features_with_online_cache_lists_features_once(
+        self, list_importing_features_mock
+    ):
+        list_importing_features_mock.return_value = [
+            gca_feature.Feature(
+                name=f"{_TEST_ENTITY_TYPE_NAME}/features/{_TEST_FEATURE_ID}",
+                value_type=_TEST_FEATURE_VALUE_TYPE,
+            )
+        ]
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.enable_online_cache()
+        my_entity_type.read(entity_ids=["entity_1"])
+
+        result = my_entity_type.read(entity_ids=["entity_1", "entity_2"])
+
+        assert list_importing_features_mock.call_count == 1
+        assert result[_TEST_FEATURE_ID].tolist() == [_TEST_FEATURE_VALUE] * 2
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock", "streaming_read_feature_values_per_entity_mock"
+    )
+    def test_read_all_features_with_online_cache_lists_features_after_unknown_one(
+        self, list_importing_features_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.enable_online_cache()
+        my_entity_type.read(entity_ids=["entity_1"])
+        list_importing_features_mock.return_value = [
+            *list_importing_features_mock.return_value,
+            gca_feature.Feature(
+                name=f"{_TEST_ENTITY_TYPE_NAME}/features/{_TEST_FEATURE_ID}",
+                value_type=_TEST_FEATURE_VALUE_TYPE,
+            ),
+        ]
+
+        result = my_entity_type.read(entity_ids=["entity_1"])
+
+        # The first read answered with a Feature missing from the schema.
+        assert list_importing_features_mock.call_count == 2
+        assert _TEST_FEATURE_ID in result.columns
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    async def test_read_all_features_async_with_online_cache(
+        self,
+        list_importing_features_mock,
+        streaming_read_feature_values_per_entity_async_mock,
+    ):
+        list_importing_features_mock.return_value = [
+            gca_feature.Feature(
+                name=f"{_TEST_ENTITY_TYPE_NAME}/features/{_TEST_FEATURE_ID}",
+                value_type=_TEST_FEATURE_VALUE_TYPE,
+            )
+        ]
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.enable_online_cache()
+
+        await my_entity_type.read_async(entity_ids=["entity_1"])
+        result = await my_entity_type.read_async(entity_ids=["entity_1"])
+
+        assert list_importing_features_mock.call_count == 1
+        assert streaming_read_feature_values_per_entity_async_mock.await_count == 1
+        assert result[_TEST_FEATURE_ID].tolist() == [_TEST_FEATURE_VALUE]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    async def test_read_async_with_online_cache(
+        self, streaming_read_feature_values_per_entity_async_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        my_entity_type.enable_online_cache()
+
+        await my_entity_type.read_async(
+            entity_ids=["entity_1"], feature_ids=_TEST_FEATURE_ID
+        )
+        result = await my_entity_type.read_async(
+            entity_ids=["entity_1"], feature_ids=_TEST_FEATURE_ID
+        )
+
+        assert streaming_read_feature_values_per_entity_async_mock.await_count == 1
+        assert result[_TEST_FEATURE_ID].tolist() == [_TEST_FEATURE_VALUE]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    async def test_read_single_entity_async(self, read_feature_values_async_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        expected_read_feature_values_request = (
+            gca_featurestore_online_service.ReadFeatureValuesRequest(
+                entity_type=my_entity_type.resource_name,
+                entity_id=_TEST_READ_ENTITY_ID,
+                feature_selector=gca_feature_selector.FeatureSelector(
+                    id_matcher=gca_feature_selector.IdMatcher(ids=["*"])
+                ),
+            )
+        )
+        result = await my_entity_type.read_async(
+            entity_ids=_TEST_READ_ENTITY_ID,
+            read_request_timeout=180.0,
+        )
+        read_feature_values_async_mock.assert_awaited_once_with(
+            request=expected_read_feature_values_request,
+            metadata=_TEST_REQUEST_METADATA,
+            timeout=180.0,
+        )
+        assert type(result) == pd.DataFrame
+        assert len(result) == 1
+        assert result.entity_id[0] == _TEST_READ_ENTITY_ID
+        assert result.get(_TEST_FEATURE_ID)[0] == _TEST_FEATURE_VALUE
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    async def test_read_multiple_entities_async(
+        self, streaming_read_feature_values_async_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        expected_streaming_read_feature_values_request = (
+            gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
+                entity_type=my_entity_type.resource_name,
+                entity_ids=_TEST_READ_ENTITY_IDS,
+                feature_selector=gca_feature_selector.FeatureSelector(
+                    id_matcher=gca_feature_selector.IdMatcher(ids=[_TEST_FEATURE_ID])
+                ),
+            )
+        )
+        result = await my_entity_type.read_async(
+            entity_ids=_TEST_READ_ENTITY_IDS,
+            feature_ids=_TEST_FEATURE_ID,
+        )
+        streaming_read_feature_values_async_mock.assert_awaited_once_with(
+            request=expected_streaming_read_feature_values_request,
+            metadata=_TEST_REQUEST_METADATA,
+            timeout=None,
+        )
+        assert type(result) == pd.DataFrame
+        assert len(result) == 1
+        assert result.entity_id[0] == _TEST_READ_ENTITY_ID
+        assert result.get(_TEST_FEATURE_ID)[0] == _TEST_FEATURE_VALUE
+
     @pytest.mark.parametrize(
         "feature_ids, feature_value_types, entity_ids, feature_values, expected_df",
         [
@@ -2735,6 +3536,31 @@ class TestEntityType:
         )
         assert df.equals(expected_df)
 
+    def test_construct_dataframe_from_raw_protos_uses_typed_columns(self):
+        entity_views = [
+            _get_entity_view_proto(
+                entity_id=entity_id,
+                feature_value_types=[
+                    _TEST_BOOL_TYPE,
+                    _TEST_DOUBLE_TYPE,
+                    _TEST_INT_TYPE,
+                ],
+                feature_values=[entity_id == "entity_01", 1.5, 7],
+            )._pb
+            for entity_id in ["entity_01", "entity_02"]
+        ]
+
+        df = aiplatform.EntityType._construct_dataframe(
+            feature_ids=[_TEST_BOOL_COL, _TEST_DOUBLE_COL, _TEST_INT_COL],
+            entity_views=entity_views,
+        )
+
+        assert list(df.dtypes) == ["object", "bool", "float64", "int64"]
+        assert df.values.tolist() == [
+            ["entity_01", True, 1.5, 7],
+            ["entity_02", False, 1.5, 7],
+        ]
+
 
 class TestFeature:
     def setup_method(self):
@@ -2848,6 +3674,37 @@ class TestFeature:
         for my_feature in my_feature_list:
             assert type(my_feature) == aiplatform.Feature
 
+    @pytest.mark.parametrize(
+        "entity_type_name, featurestore_id",
+        [
+            (_TEST_ENTITY_TYPE_NAME, None),
+            (_TEST_ENTITY_TYPE_ID, _TEST_FEATURESTORE_ID),
+        ],
+    )
+    def test_iter_list_features(
+        self, entity_type_name, featurestore_id, list_features_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_feature_list = list(
+            aiplatform.Feature.iter_list(
+                entity_type_name=entity_type_name,
+                featurestore_id=featurestore_id,
+                page_size=10,
+                max_results=1,
+            )
+        )
+
+        list_features_mock.assert_called_once_with(
+            request={
+                "parent": _TEST_ENTITY_TYPE_NAME,
+                "filter": None,
+                "page_size": 10,
+            }
+        )
+        assert len(my_feature_list) == 1
+        assert type(my_feature_list[0]) == aiplatform.Feature
+
     @pytest.mark.usefixtures("get_feature_mock")
     def test_search_features(self, search_features_mock):
         aiplatform.init(project=_TEST_PROJECT)
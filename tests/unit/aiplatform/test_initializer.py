@@ -215,10 +215,21 @@ class TestInit:
 
         assert client_options.api_endpoint == "asia-east1-override.googleapis.com"
 
+    def test_init_max_staleness(self):
+        assert initializer.global_config.max_staleness == 0
+        initializer.global_config.init(max_staleness=30)
+        assert initializer.global_config.max_staleness == 30
+
+    def test_init_max_staleness_negative_raises(self):
+        with pytest.raises(ValueError):
+            initializer.global_config.init(max_staleness=-1)
+
 
 class TestThreadPool:
     def teardown_method(self):
         initializer.global_pool.shutdown(wait=True)
+        # Leaves a default sized pool for the following tests.
+        importlib.reload(initializer)
 
     @pytest.mark.parametrize(
         "cpu_count, expected", [(4, 20), (32, 32), (None, 4), (2, 10)]
@@ -228,3 +239,8 @@ class TestThreadPool:
             cpu_count_mock.return_value = cpu_count
             importlib.reload(initializer)
             assert initializer.global_pool._max_workers == expected
+
+    def test_init_max_workers_resizes_pool(self):
+        importlib.reload(initializer)
+        initializer.global_config.init(max_workers=3)
+        assert initializer.global_pool.max_workers == 3
@@ -15,14 +15,17 @@
 # limitations under the License.
 #
 
+import json
 import pytest
 
+from datetime import datetime, timedelta
 from unittest import mock
 from importlib import reload
 from unittest.mock import patch
 
 from google.cloud import storage
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
 
 from google.auth import credentials as auth_credentials
 
@@ -30,11 +33,14 @@ from google.cloud import aiplatform
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import job_poller
 
 from google.cloud.aiplatform.compat.types import (
     batch_prediction_job as gca_batch_prediction_job_compat,
     explanation as gca_explanation_compat,
     io as gca_io_compat,
+    job_service as gca_job_service_compat,
     job_state as gca_job_state_compat,
     machine_resources as gca_machine_resources_compat,
     manual_batch_tuning_parameters as gca_manual_batch_tuning_parameters_compat,
@@ -43,6 +49,7 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform.compat.services import (
     job_service_client,
 )
+from google.cloud.aiplatform_v1.services.job_service import pagers
 
 _TEST_API_CLIENT = job_service_client.JobServiceClient
 
@@ -59,6 +66,7 @@ _TEST_BQ_MAX_RESULTS = 100
 _TEST_GCS_BUCKET_NAME = "my-bucket"
 
 _TEST_BQ_PATH = f"bq://{_TEST_BQ_PROJECT_ID}.{_TEST_BQ_DATASET_ID}"
+_TEST_BQ_STREAM_VALUES = {"stream_0": [0, 1], "stream_1": [2, 3]}
 _TEST_GCS_BUCKET_PATH = f"gs://{_TEST_GCS_BUCKET_NAME}"
 _TEST_GCS_JSONL_SOURCE_URI = f"{_TEST_GCS_BUCKET_PATH}/bp_input_config.jsonl"
 _TEST_PARENT = f"projects/{_TEST_PROJECT}/locations/{_TEST_LOCATION}"
@@ -80,6 +88,15 @@ _TEST_BATCH_PREDICTION_BQ_DEST_PREFIX_WITH_PROTOCOL = (
     f"bq://{_TEST_BATCH_PREDICTION_BQ_PREFIX}"
 )
 
+_TEST_BATCH_PREDICTION_JOB_LIST = [
+    gca_batch_prediction_job_compat.BatchPredictionJob(
+        name=_TEST_BATCH_PREDICTION_JOB_NAME,
+        display_name=_TEST_BATCH_PREDICTION_JOB_DISPLAY_NAME,
+        create_time=datetime.now() - timedelta(minutes=minutes),
+    )
+    for minutes in (15, 5, 10)
+]
+
 _TEST_JOB_STATE_SUCCESS = gca_job_state_compat.JobState(4)
 _TEST_JOB_STATE_RUNNING = gca_job_state_compat.JobState(3)
 _TEST_JOB_STATE_PENDING = gca_job_state_compat.JobState(2)
@@ -130,6 +147,52 @@ _TEST_GCS_BLOBS = [
     storage.Blob(name="some/path/prediction.jsonl", bucket=_TEST_GCS_BUCKET_NAME)
 ]
 
+
+def _get_output_blob(name, contents):
+    blob = storage.Blob(name=f"some/path/{name}", bucket=_TEST_GCS_BUCKET_NAME)
+    blob._properties["size"] = len(contents)
+    blob.download_as_bytes = mock.Mock(
+        side_effect=lambda start, end: contents[start : end + 1]
+    )
+    return blob
+
+
+def _get_jsonl_output_blob(name, records):
+    contents = "\n".join(json.dumps(record) for record in records).encode()
+    return _get_output_blob(name, contents)
+
+
+_TEST_GCS_JSONL_OUTPUT_BLOBS = [
+    _get_jsonl_output_blob(
+        "prediction.errors_stats-00000-of-00001",
+        [{"instance": [0.0], "error": {"status": 3}}],
+    ),
+    _get_jsonl_output_blob(
+        "prediction.results-00001-of-00002",
+        [{"instance": [3.0], "prediction": 6.0}],
+    ),
+    _get_jsonl_output_blob(
+        "prediction.results-00000-of-00002",
+        [
+            {"instance": [1.0], "prediction": 2.0},
+            {"instance": [2.0], "prediction": 4.0},
+        ],
+    ),
+    storage.Blob(name="some/path/other_file.txt", bucket=_TEST_GCS_BUCKET_NAME),
+]
+
+_TEST_GCS_CSV_OUTPUT_BLOBS = [
+    _get_output_blob(
+        "predictions_00002.csv",
+        b"x,prediction\r\n3,6\r\n",
+    ),
+    _get_output_blob(
+        "predictions_00001.csv",
+        b'x,prediction\r\n1,2\r\n"multi\nline",4\r\n',
+    ),
+    _get_output_blob("errors_00001.csv", b"x,error\r\n0,invalid\r\n"),
+]
+
 _TEST_MACHINE_TYPE = "n1-standard-4"
 _TEST_ACCELERATOR_TYPE = "NVIDIA_TESLA_P100"
 _TEST_ACCELERATOR_COUNT = 2
@@ -307,6 +370,39 @@ def get_batch_prediction_job_gcs_output_mock():
         yield get_batch_prediction_job_mock
 
 
+@pytest.fixture
+def bqs_client_mock():
+    """Serves a read session of two streams with two Arrow pages each."""
+    import pyarrow
+
+    def read_rows(stream_name):
+        reader = mock.Mock()
+        reader.rows.return_value.pages = [
+            mock.Mock(
+                to_arrow=mock.Mock(
+                    return_value=pyarrow.record_batch(
+                        [pyarrow.array([float(value)])], names=["prediction"]
+                    )
+                )
+            )
+            for value in _TEST_BQ_STREAM_VALUES[stream_name]
+        ]
+        return reader
+
+    with patch.object(bigquery_storage, "BigQueryReadClient") as bqs_init_client_mock:
+        bqs_client_mock = bqs_init_client_mock.return_value
+        bqs_client_mock.create_read_session.return_value = (
+            bigquery_storage.types.ReadSession(
+                streams=[
+                    bigquery_storage.types.ReadStream(name=name)
+                    for name in _TEST_BQ_STREAM_VALUES
+                ]
+            )
+        )
+        bqs_client_mock.read_rows.side_effect = read_rows
+        yield bqs_client_mock
+
+
 @pytest.fixture
 def get_batch_prediction_job_bq_output_mock():
     with patch.object(
@@ -397,6 +493,73 @@ def bq_list_rows_mock():
         yield list_rows_mock
 
 
+@pytest.fixture
+def get_batch_prediction_job_async_mock():
+    with patch.object(
+        utils.JobClientWithOverride.get_gapic_async_client_class(),
+        "get_batch_prediction_job",
+        new_callable=mock.AsyncMock,
+    ) as get_batch_prediction_job_async_mock:
+        get_batch_prediction_job_async_mock.side_effect = [
+            gca_batch_prediction_job_compat.BatchPredictionJob(
+                name=_TEST_BATCH_PREDICTION_JOB_NAME,
+                display_name=_TEST_DISPLAY_NAME,
+                state=state,
+            )
+            for state in (_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS)
+        ]
+        yield get_batch_prediction_job_async_mock
+
+
+@pytest.fixture
+def list_batch_prediction_jobs_async_mock():
+    async def job_pager():
+        for job in _TEST_BATCH_PREDICTION_JOB_LIST:
+            yield job
+
+    with patch.object(
+        utils.JobClientWithOverride.get_gapic_async_client_class(),
+        "list_batch_prediction_jobs",
+        new_callable=mock.AsyncMock,
+    ) as list_batch_prediction_jobs_async_mock:
+        list_batch_prediction_jobs_async_mock.side_effect = lambda **kwargs: job_pager()
+        yield list_batch_prediction_jobs_async_mock
+
+
+@pytest.fixture
+def list_batch_prediction_jobs_page_mock():
+    # One job per page.
+    responses = [
+        gca_job_service_compat.ListBatchPredictionJobsResponse(
+            batch_prediction_jobs=[job],
+            next_page_token=str(page + 1)
+            if page + 1 < len(_TEST_BATCH_PREDICTION_JOB_LIST)
+            else "",
+        )
+        for page, job in enumerate(_TEST_BATCH_PREDICTION_JOB_LIST)
+    ]
+    yield mock.Mock(
+        side_effect=lambda request, metadata: responses[int(request.page_token or 0)]
+    )
+
+
+@pytest.fixture
+def list_batch_prediction_jobs_mock(list_batch_prediction_jobs_page_mock):
+    def list_batch_prediction_jobs(request):
+        request = gca_job_service_compat.ListBatchPredictionJobsRequest(request)
+        return pagers.ListBatchPredictionJobsPager(
+            method=list_batch_prediction_jobs_page_mock,
+            request=request,
+            response=list_batch_prediction_jobs_page_mock(request, metadata=()),
+        )
+
+    with patch.object(
+        _TEST_API_CLIENT, "list_batch_prediction_jobs"
+    ) as list_batch_prediction_jobs_mock:
+        list_batch_prediction_jobs_mock.side_effect = list_batch_prediction_jobs
+        yield list_batch_prediction_jobs_mock
+
+
 @pytest.mark.usefixtures("google_auth_mock")
 class TestBatchPredictionJob:
     def setup_method(self):
@@ -429,6 +592,168 @@ class TestBatchPredictionJob:
             name=_TEST_BATCH_PREDICTION_JOB_NAME, retry=base._DEFAULT_RETRY
         )
 
+    def test_batch_prediction_job_status_within_max_staleness(
+        self, get_batch_prediction_job_mock
+    ):
+        aiplatform.init(max_staleness=60)
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        bp_job_state = bp.state
+        bp.start_time
+        bp.end_time
+        bp.error
+
+        assert get_batch_prediction_job_mock.call_count == 1
+        assert bp_job_state == _TEST_JOB_STATE_PENDING
+
+        # Past max_staleness the job is fetched again.
+        bp._gca_resource_synced_at -= 61
+
+        assert bp.state == _TEST_JOB_STATE_RUNNING
+        assert get_batch_prediction_job_mock.call_count == 2
+
+    def test_batch_prediction_job_max_staleness_overrides_global_default(
+        self, get_batch_prediction_job_mock
+    ):
+        aiplatform.init(max_staleness=60)
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+        bp.max_staleness = 0
+
+        assert bp.state == _TEST_JOB_STATE_RUNNING
+        assert get_batch_prediction_job_mock.call_count == 2
+
+        with pytest.raises(ValueError):
+            bp.max_staleness = -1
+
+    def test_batch_prediction_job_refresh(self, get_batch_prediction_job_mock):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+        bp.max_staleness = 60
+
+        assert bp.refresh() is bp
+        assert bp.state == _TEST_JOB_STATE_RUNNING
+        assert get_batch_prediction_job_mock.call_count == 2
+
+    def test_batch_prediction_job_cancel_marks_state_stale(
+        self, get_batch_prediction_job_mock
+    ):
+        aiplatform.init(max_staleness=60)
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        with patch.object(_TEST_API_CLIENT, "cancel_batch_prediction_job"):
+            bp.cancel()
+
+        assert bp.state == _TEST_JOB_STATE_RUNNING
+        assert get_batch_prediction_job_mock.call_count == 2
+
+    def test_batch_prediction_job_list_within_max_staleness(
+        self, list_batch_prediction_jobs_mock, get_batch_prediction_job_mock
+    ):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, max_staleness=60
+        )
+
+        for bp in jobs.BatchPredictionJob.list():
+            bp.state
+
+        get_batch_prediction_job_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_batch_prediction_job_mock")
+    async def test_batch_prediction_job_wait_for_completion_async(
+        self, get_batch_prediction_job_async_mock
+    ):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        with patch.object(jobs.asyncio, "sleep", new_callable=mock.AsyncMock):
+            await bp.wait_for_completion_async()
+
+        assert get_batch_prediction_job_async_mock.await_count == 2
+        get_batch_prediction_job_async_mock.assert_awaited_with(
+            name=_TEST_BATCH_PREDICTION_JOB_NAME, retry=base._DEFAULT_ASYNC_RETRY
+        )
+        assert bp._gca_resource.state == _TEST_JOB_STATE_SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_batch_prediction_job_list_async(
+        self, list_batch_prediction_jobs_async_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+        job_list = await jobs.BatchPredictionJob.list_async(order_by="create_time desc")
+
+        list_batch_prediction_jobs_async_mock.assert_awaited_once_with(
+            request={"parent": _TEST_PARENT, "filter": None}
+        )
+        assert len(job_list) == len(_TEST_BATCH_PREDICTION_JOB_LIST)
+        assert all(type(job) == jobs.BatchPredictionJob for job in job_list)
+        assert job_list[0].create_time > job_list[1].create_time
+        assert job_list[1].create_time > job_list[2].create_time
+
+    def test_batch_prediction_job_iter_list_fetches_pages_lazily(
+        self, list_batch_prediction_jobs_mock, list_batch_prediction_jobs_page_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+        job_iterator = jobs.BatchPredictionJob.iter_list(page_size=1)
+        first_job = next(job_iterator)
+
+        list_batch_prediction_jobs_mock.assert_called_once_with(
+            request={"parent": _TEST_PARENT, "filter": None, "page_size": 1}
+        )
+        # The first page, and at most the prefetched second one.
+        assert list_batch_prediction_jobs_page_mock.call_count <= 2
+        assert type(first_job) == jobs.BatchPredictionJob
+        assert first_job._gca_resource == _TEST_BATCH_PREDICTION_JOB_LIST[0]
+
+        remaining_jobs = list(job_iterator)
+
+        assert list_batch_prediction_jobs_page_mock.call_count == len(
+            _TEST_BATCH_PREDICTION_JOB_LIST
+        )
+        assert [job._gca_resource for job in remaining_jobs] == (
+            _TEST_BATCH_PREDICTION_JOB_LIST[1:]
+        )
+
+    def test_batch_prediction_job_iter_list_max_results_gapic_resources(
+        self, list_batch_prediction_jobs_mock, list_batch_prediction_jobs_page_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+        job_list = list(
+            jobs.BatchPredictionJob.iter_list(
+                max_results=1, return_gapic_resources=True
+            )
+        )
+
+        assert job_list == _TEST_BATCH_PREDICTION_JOB_LIST[:1]
+        # Pages beyond the prefetched one are never requested.
+        assert list_batch_prediction_jobs_page_mock.call_count <= 2
+
+    @pytest.mark.usefixtures("list_batch_prediction_jobs_mock")
+    def test_batch_prediction_job_list_max_results_after_local_order(self):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+        job_list = jobs.BatchPredictionJob.list(
+            order_by="create_time desc", max_results=2
+        )
+
+        most_recent_jobs = sorted(
+            _TEST_BATCH_PREDICTION_JOB_LIST,
+            key=lambda job: job.create_time,
+            reverse=True,
+        )[:2]
+        assert [job._gca_resource for job in job_list] == most_recent_jobs
+
     def test_batch_prediction_job_done_get(self, get_batch_prediction_job_mock):
         bp = jobs.BatchPredictionJob(
             batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
@@ -477,6 +802,117 @@ class TestBatchPredictionJob:
             )
         )
 
+    @pytest.mark.usefixtures("get_batch_prediction_job_gcs_output_mock")
+    def test_batch_prediction_iter_predictions(self, storage_list_blobs_mock):
+        storage_list_blobs_mock.return_value = _TEST_GCS_JSONL_OUTPUT_BLOBS
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        records = list(bp.iter_predictions(max_concurrent_downloads=1))
+
+        assert records == [
+            {"instance": [1.0], "prediction": 2.0},
+            {"instance": [2.0], "prediction": 4.0},
+            {"instance": [3.0], "prediction": 6.0},
+        ]
+        _TEST_GCS_JSONL_OUTPUT_BLOBS[0].download_as_bytes.assert_not_called()
+
+    def test_batch_prediction_iter_predictions_csv(
+        self, get_batch_prediction_job_gcs_output_mock, storage_list_blobs_mock
+    ):
+        job = get_batch_prediction_job_gcs_output_mock.return_value
+        job.output_config.predictions_format = "csv"
+        storage_list_blobs_mock.return_value = _TEST_GCS_CSV_OUTPUT_BLOBS
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        records = list(
+            bp.iter_predictions(include_errors=True, max_concurrent_downloads=1)
+        )
+
+        # Every shard has its own header row.
+        assert records == [
+            {"x": "1", "prediction": "2"},
+            {"x": "multi\nline", "prediction": "4"},
+            {"x": "3", "prediction": "6"},
+            {"x": "0", "error": "invalid"},
+        ]
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_gcs_output_mock")
+    def test_batch_prediction_to_dataframe_with_errors(self, storage_list_blobs_mock):
+        storage_list_blobs_mock.return_value = _TEST_GCS_JSONL_OUTPUT_BLOBS
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        df = bp.to_dataframe(include_errors=True)
+
+        assert df.columns.tolist() == ["instance", "prediction", "error"]
+        assert df.prediction.tolist()[:3] == [2.0, 4.0, 6.0]
+        assert df.error.tolist()[3] == {"status": 3}
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_bq_output_mock")
+    def test_batch_prediction_iter_prediction_batches_bq(
+        self, bqs_client_mock, bq_list_rows_mock
+    ):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        batches = list(
+            bp.iter_prediction_batches(columns=["prediction"], max_concurrent_streams=2)
+        )
+
+        read_session = bqs_client_mock.create_read_session.call_args.kwargs[
+            "read_session"
+        ]
+        assert read_session.table == (
+            f"projects/{_TEST_BQ_PROJECT_ID}/datasets/{_TEST_BQ_DATASET_ID}"
+            f"/tables/{_TEST_BQ_TABLE_NAME}"
+        )
+        assert list(read_session.read_options.selected_fields) == ["prediction"]
+        assert sorted(
+            value for batch in batches for value in batch.column(0).to_pylist()
+        ) == [0.0, 1.0, 2.0, 3.0]
+        bq_list_rows_mock.assert_not_called()
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_bq_output_mock")
+    def test_batch_prediction_iter_predictions_bq(self, bqs_client_mock):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        records = list(bp.iter_predictions(max_concurrent_downloads=2))
+
+        assert sorted(records, key=lambda record: record["prediction"]) == [
+            {"prediction": 0.0},
+            {"prediction": 1.0},
+            {"prediction": 2.0},
+            {"prediction": 3.0},
+        ]
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_bq_output_mock")
+    def test_batch_prediction_to_dataframe_bq(self, bqs_client_mock):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        df = bp.to_dataframe()
+
+        assert df.columns.tolist() == ["prediction"]
+        assert sorted(df.prediction.tolist()) == [0.0, 1.0, 2.0, 3.0]
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_gcs_output_mock")
+    def test_batch_prediction_iter_prediction_batches_gcs_raises(self):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        with pytest.raises(NotImplementedError):
+            bp.iter_prediction_batches()
+
     @pytest.mark.usefixtures("get_batch_prediction_job_running_bq_output_mock")
     def test_batch_prediction_iter_dirs_while_running(self):
         """
@@ -638,20 +1074,23 @@ class TestBatchPredictionJob:
     def test_batch_predict_job_done_create(self, create_batch_prediction_job_mock):
         aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
 
-        # Make SDK batch_predict method call
-        batch_prediction_job = jobs.BatchPredictionJob.create(
-            model_name=_TEST_MODEL_NAME,
-            job_display_name=_TEST_BATCH_PREDICTION_JOB_DISPLAY_NAME,
-            gcs_source=_TEST_BATCH_PREDICTION_GCS_SOURCE,
-            gcs_destination_prefix=_TEST_BATCH_PREDICTION_GCS_DEST_PREFIX,
-            sync=False,
-        )
+        # Keeps the job from completing before it is checked below, resource
+        # creation is checked once a second.
+        with patch.object(job_poller.global_poller, "_min_poll_interval", 2):
+            # Make SDK batch_predict method call
+            batch_prediction_job = jobs.BatchPredictionJob.create(
+                model_name=_TEST_MODEL_NAME,
+                job_display_name=_TEST_BATCH_PREDICTION_JOB_DISPLAY_NAME,
+                gcs_source=_TEST_BATCH_PREDICTION_GCS_SOURCE,
+                gcs_destination_prefix=_TEST_BATCH_PREDICTION_GCS_DEST_PREFIX,
+                sync=False,
+            )
 
-        batch_prediction_job.wait_for_resource_creation()
+            batch_prediction_job.wait_for_resource_creation()
 
-        assert batch_prediction_job.done() is False
+            assert batch_prediction_job.done() is False
 
-        batch_prediction_job.wait()
+            batch_prediction_job.wait()
 
         assert batch_prediction_job.done() is True
 
@@ -15,15 +15,23 @@
 # limitations under the License.
 #
 
+import asyncio
 import uuid
+from concurrent import futures
 from importlib import reload
 from unittest import mock
 from unittest.mock import patch
 
+import grpc
+import numpy as np
+
 from google.api_core import operation
 from google.cloud import aiplatform
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.matching_engine import matching_engine_index_endpoint
+from google.cloud.aiplatform.matching_engine._protos import match_service_pb2
+from google.cloud.aiplatform.matching_engine._protos import match_service_pb2_grpc
 from google.cloud.aiplatform.compat.types import (
     matching_engine_deployed_index_ref as gca_matching_engine_deployed_index_ref,
     index_endpoint as gca_index_endpoint,
@@ -210,6 +218,7 @@ _TEST_QUERIES = [
     ]
 ]
 _TEST_NUM_NEIGHBOURS = 1
+_TEST_MATCH_GRPC_ADDRESS = "localhost"
 
 
 def uuid_mock():
@@ -255,6 +264,9 @@ def get_index_endpoint_mock():
                 id=_TEST_DEPLOYED_INDEX_ID,
                 index=_TEST_INDEX_NAME,
                 display_name=_TEST_DEPLOYED_INDEX_DISPLAY_NAME,
+                private_endpoints=gca_index_endpoint.IndexPrivateEndpoints(
+                    match_grpc_address=_TEST_MATCH_GRPC_ADDRESS
+                ),
                 enable_access_logging=_TEST_ENABLE_ACCESS_LOGGING,
                 reserved_ip_ranges=_TEST_RESERVED_IP_RANGES,
                 deployment_group=_TEST_DEPLOYMENT_GROUP,
@@ -380,6 +392,42 @@ def create_index_endpoint_mock():
         yield create_index_endpoint_mock
 
 
+class FakeMatchServiceServicer(match_service_pb2_grpc.MatchServiceServicer):
+    """Answers each query with `num_neighbors` neighbors whose distance is the
+    sum of the query embedding."""
+
+    def __init__(self):
+        self.batch_requests = []
+
+    def BatchMatch(self, request, context):
+        self.batch_requests.append(request)
+        response = match_service_pb2.BatchMatchResponse()
+        for request_for_index in request.requests:
+            response_for_index = response.responses.add(
+                deployed_index_id=request_for_index.deployed_index_id
+            )
+            for match_request in request_for_index.requests:
+                match_response = response_for_index.responses.add()
+                for i in range(match_request.num_neighbors):
+                    match_response.neighbor.add(
+                        id=f"{match_request.deployed_index_id}-{i}",
+                        distance=sum(match_request.float_val),
+                    )
+        return response
+
+
+@pytest.fixture
+def fake_match_service():
+    servicer = FakeMatchServiceServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    match_service_pb2_grpc.add_MatchServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port(f"{_TEST_MATCH_GRPC_ADDRESS}:0")
+    server.start()
+    with patch.object(matching_engine_index_endpoint, "_MATCH_GRPC_PORT", port):
+        yield servicer
+    server.stop(grace=None)
+
+
 @pytest.mark.usefixtures("google_auth_mock")
 class TestMatchingEngineIndexEndpoint:
     def setup_method(self):
@@ -617,3 +665,115 @@ class TestMatchingEngineIndexEndpoint:
         delete_index_endpoint_mock.assert_called_once_with(
             name=_TEST_INDEX_ENDPOINT_NAME
         )
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_reuses_channels(self, fake_match_service):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        with patch.object(
+            grpc, "insecure_channel", wraps=grpc.insecure_channel
+        ) as insecure_channel_mock:
+            for _ in range(3):
+                response = my_index_endpoint.match(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    queries=_TEST_QUERIES,
+                    num_neighbors=_TEST_NUM_NEIGHBOURS,
+                )
+
+        # One pool of channels is opened for all calls
+        assert insecure_channel_mock.call_count == 4
+        assert len(fake_match_service.batch_requests) == 3
+
+        batch_request = fake_match_service.batch_requests[0]
+        assert batch_request.requests[0].deployed_index_id == _TEST_DEPLOYED_INDEX_ID
+        assert list(batch_request.requests[0].requests[0].float_val) == pytest.approx(
+            _TEST_QUERIES[0]
+        )
+
+        assert len(response) == len(_TEST_QUERIES)
+        assert response[0][0].id == f"{_TEST_DEPLOYED_INDEX_ID}-0"
+        assert response[0][0].distance == pytest.approx(sum(_TEST_QUERIES[0]), 1e-4)
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_unknown_deployed_index_raises(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        with pytest.raises(RuntimeError):
+            my_index_endpoint.match(deployed_index_id="unknown", queries=_TEST_QUERIES)
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_matcher_match_numpy_queries(self, fake_match_service):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+        queries = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        with my_index_endpoint.matcher(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID
+        ) as matcher:
+            response = matcher.match(queries=queries, num_neighbors=2)
+
+        match_requests = fake_match_service.batch_requests[0].requests[0].requests
+        assert [list(request.float_val) for request in match_requests] == (
+            queries.tolist()
+        )
+        assert all(request.num_neighbors == 2 for request in match_requests)
+        assert [[neighbor.distance for neighbor in r] for r in response] == [
+            [6.0, 6.0],
+            [22.0, 22.0],
+            [38.0, 38.0],
+        ]
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_matcher_match_iter(self, fake_match_service):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+        queries = np.arange(20, dtype=np.float64).reshape(10, 2)
+
+        with my_index_endpoint.matcher(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID, num_channels=2
+        ) as matcher:
+            response = list(matcher.match_iter(queries=queries, batch_size=3))
+
+        assert len(fake_match_service.batch_requests) == 4
+        assert [r[0].distance for r in response] == queries.sum(axis=1).tolist()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    async def test_matcher_match_async(self, fake_match_service):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+        queries = np.ones((2, 3), dtype=np.float32)
+
+        with my_index_endpoint.matcher(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID
+        ) as matcher:
+            response = await matcher.match_async(queries=queries)
+            channel = matcher._async_channels[asyncio.get_running_loop()]
+            with patch.object(channel, "close", wraps=channel.close) as close_mock:
+                matcher.close()
+                # The channel is closed on its loop once the test yields to it.
+                await asyncio.sleep(0.1)
+
+        close_mock.assert_awaited_once()
+
+        assert [[neighbor.distance for neighbor in r] for r in response] == [
+            [3.0],
+            [3.0],
+        ]
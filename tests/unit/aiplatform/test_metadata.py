@@ -15,7 +15,9 @@
 # limitations under the License.
 #
 
+import datetime
 from importlib import reload
+import threading
 from unittest import mock
 from unittest.mock import patch, call
 
@@ -29,6 +31,7 @@ from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.metadata import constants
 from google.cloud.aiplatform.metadata import metadata
+from google.cloud.aiplatform.metadata import metadata_logger
 from google.cloud.aiplatform_v1 import (
     AddContextArtifactsAndExecutionsResponse,
     Event,
@@ -95,6 +98,8 @@ _TEST_METRIC_KEY_2 = "accuracy"
 _TEST_METRICS = {_TEST_METRIC_KEY_1: 222, _TEST_METRIC_KEY_2: 1}
 _TEST_OTHER_METRICS = {_TEST_METRIC_KEY_2: 0.9}
 
+_TEST_UPDATE_TIME = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
 # schema
 _TEST_WRONG_SCHEMA_TITLE = "system.WrongSchema"
 
@@ -293,8 +298,9 @@ def query_execution_inputs_and_outputs_mock():
     with patch.object(
         MetadataServiceClient, "query_execution_inputs_and_outputs"
     ) as query_execution_inputs_and_outputs_mock:
-        query_execution_inputs_and_outputs_mock.side_effect = [
-            LineageSubgraph(
+        # Lineage is queried concurrently, so responses are keyed by execution.
+        lineage_subgraphs = {
+            _TEST_EXECUTION_NAME: LineageSubgraph(
                 artifacts=[
                     GapicArtifact(
                         name=_TEST_ARTIFACT_NAME,
@@ -304,10 +310,11 @@ def query_execution_inputs_and_outputs_mock():
                             constants.SYSTEM_METRICS
                         ],
                         metadata=_TEST_METRICS,
+                        update_time=_TEST_UPDATE_TIME,
                     ),
                 ],
             ),
-            LineageSubgraph(
+            _TEST_OTHER_EXECUTION_NAME: LineageSubgraph(
                 artifacts=[
                     GapicArtifact(
                         name=_TEST_OTHER_ARTIFACT_NAME,
@@ -317,13 +324,32 @@ def query_execution_inputs_and_outputs_mock():
                             constants.SYSTEM_METRICS
                         ],
                         metadata=_TEST_OTHER_METRICS,
+                        update_time=_TEST_UPDATE_TIME,
                     ),
                 ],
             ),
-        ]
+        }
+        query_execution_inputs_and_outputs_mock.side_effect = (
+            lambda execution: lineage_subgraphs[execution]
+        )
         yield query_execution_inputs_and_outputs_mock
 
 
+@pytest.fixture
+def list_artifacts_mock():
+    with patch.object(MetadataServiceClient, "list_artifacts") as list_artifacts_mock:
+        list_artifacts_mock.return_value = [
+            GapicArtifact(
+                name=_TEST_ARTIFACT_NAME,
+                display_name=_TEST_ARTIFACT_ID,
+                schema_title=constants.SYSTEM_METRICS,
+                schema_version=constants.SCHEMA_VERSIONS[constants.SYSTEM_METRICS],
+                metadata=_TEST_OTHER_METRICS,
+            ),
+        ]
+        yield list_artifacts_mock
+
+
 @pytest.fixture
 def get_artifact_mock():
     with patch.object(MetadataServiceClient, "get_artifact") as get_artifact_mock:
@@ -594,6 +620,7 @@ class TestMetadata:
         )
         aiplatform.start_run(_TEST_RUN)
         aiplatform.log_params(_TEST_PARAMS)
+        metadata.metadata_service.flush()
 
         updated_execution = GapicExecution(
             name=_TEST_EXECUTION_NAME,
@@ -620,6 +647,7 @@ class TestMetadata:
         )
         aiplatform.start_run(_TEST_RUN)
         aiplatform.log_metrics(_TEST_METRICS)
+        metadata.metadata_service.flush()
 
         updated_artifact = GapicArtifact(
             name=_TEST_ARTIFACT_NAME,
@@ -631,6 +659,130 @@ class TestMetadata:
 
         update_artifact_mock.assert_called_once_with(artifact=updated_artifact)
 
+    @pytest.mark.usefixtures("get_metadata_store_mock")
+    @pytest.mark.usefixtures("get_context_mock")
+    @pytest.mark.usefixtures("get_execution_mock")
+    @pytest.mark.usefixtures("add_context_artifacts_and_executions_mock")
+    @pytest.mark.usefixtures("get_artifact_mock")
+    @pytest.mark.usefixtures("add_execution_events_mock")
+    def test_log_metrics_merges_buffered_metrics(
+        self,
+        get_artifact_mock,
+        update_artifact_mock,
+    ):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, experiment=_TEST_EXPERIMENT
+        )
+        aiplatform.start_run(_TEST_RUN)
+        get_artifact_mock.reset_mock()
+
+        aiplatform.log_metrics({"accuracy": 0.5, "loss": 0.7})
+        aiplatform.log_metrics({"accuracy": 0.9})
+
+        # Logging neither reads nor writes the artifact.
+        get_artifact_mock.assert_not_called()
+        update_artifact_mock.assert_not_called()
+
+        metadata.metadata_service.flush()
+
+        update_artifact_mock.assert_called_once()
+        assert update_artifact_mock.call_args[1]["artifact"].metadata == {
+            "accuracy": 0.9,
+            "loss": 0.7,
+        }
+
+    @pytest.mark.usefixtures("get_metadata_store_mock")
+    @pytest.mark.usefixtures("get_context_mock")
+    @pytest.mark.usefixtures("get_execution_mock")
+    @pytest.mark.usefixtures("add_context_artifacts_and_executions_mock")
+    @pytest.mark.usefixtures("add_execution_events_mock")
+    def test_flush_keeps_metrics_written_since_start_run(
+        self,
+        get_artifact_mock,
+        update_artifact_mock,
+    ):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, experiment=_TEST_EXPERIMENT
+        )
+        aiplatform.start_run(_TEST_RUN)
+        aiplatform.log_metrics({"accuracy": 0.9})
+        # Another client logs a metric of the same run meanwhile.
+        get_artifact_mock.return_value = GapicArtifact(
+            name=_TEST_ARTIFACT_NAME,
+            display_name=_TEST_ARTIFACT_ID,
+            schema_title=constants.SYSTEM_METRICS,
+            schema_version=constants.SCHEMA_VERSIONS[constants.SYSTEM_METRICS],
+            metadata={"loss": 0.7},
+        )
+
+        metadata.metadata_service.flush()
+
+        assert update_artifact_mock.call_args[1]["artifact"].metadata == {
+            "accuracy": 0.9,
+            "loss": 0.7,
+        }
+
+    @pytest.mark.usefixtures("get_metadata_store_mock")
+    @pytest.mark.usefixtures("get_context_mock")
+    @pytest.mark.usefixtures("get_execution_mock")
+    @pytest.mark.usefixtures("add_context_artifacts_and_executions_mock")
+    @pytest.mark.usefixtures("get_artifact_mock")
+    @pytest.mark.usefixtures("add_execution_events_mock")
+    def test_reset_logs_failed_flush(self, update_execution_mock, caplog):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, experiment=_TEST_EXPERIMENT
+        )
+        aiplatform.start_run(_TEST_RUN)
+        aiplatform.log_params(_TEST_PARAMS)
+        update_execution_mock.side_effect = exceptions.ServiceUnavailable("down")
+
+        metadata.metadata_service.reset()
+
+        assert "Failed to log metadata before resetting" in caplog.text
+        assert metadata.metadata_service.run_name is None
+        # The failed update stays buffered until it is applied.
+        update_execution_mock.side_effect = None
+        metadata.metadata_service.flush()
+        assert update_execution_mock.call_count == 2
+
+    @pytest.mark.usefixtures("get_metadata_store_mock")
+    @pytest.mark.usefixtures("get_context_mock")
+    @pytest.mark.usefixtures("get_execution_mock")
+    @pytest.mark.usefixtures("add_context_artifacts_and_executions_mock")
+    @pytest.mark.usefixtures("get_artifact_mock")
+    @pytest.mark.usefixtures("add_execution_events_mock")
+    def test_start_run_logs_failed_flush(self, update_execution_mock, caplog):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, experiment=_TEST_EXPERIMENT
+        )
+        aiplatform.start_run(_TEST_RUN)
+        aiplatform.log_params(_TEST_PARAMS)
+        update_execution_mock.side_effect = exceptions.PermissionDenied("denied")
+
+        aiplatform.start_run(_TEST_OTHER_RUN)
+
+        assert "Failed to log metadata before starting a new run" in caplog.text
+        assert f"{sorted(_TEST_PARAMS)} of" in caplog.text
+
+    @pytest.mark.usefixtures("get_metadata_store_mock")
+    @pytest.mark.usefixtures("get_context_mock")
+    @pytest.mark.usefixtures("get_execution_mock")
+    @pytest.mark.usefixtures("add_context_artifacts_and_executions_mock")
+    @pytest.mark.usefixtures("get_artifact_mock")
+    @pytest.mark.usefixtures("add_execution_events_mock")
+    def test_start_run_flushes_logged_params(self, update_execution_mock):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, experiment=_TEST_EXPERIMENT
+        )
+        aiplatform.start_run(_TEST_RUN)
+        aiplatform.log_params(_TEST_PARAMS)
+        update_execution_mock.assert_not_called()
+
+        aiplatform.start_run(_TEST_OTHER_RUN)
+
+        update_execution_mock.assert_called_once()
+        assert update_execution_mock.call_args[1]["execution"].metadata == _TEST_PARAMS
+
     @pytest.mark.usefixtures("get_metadata_store_mock")
     @pytest.mark.usefixtures("get_context_mock")
     @pytest.mark.usefixtures("get_execution_mock")
@@ -671,7 +823,8 @@ class TestMetadata:
             [
                 call(execution=_TEST_EXECUTION_NAME),
                 call(execution=_TEST_OTHER_EXECUTION_NAME),
-            ]
+            ],
+            any_order=True,
         )
         experiment_df_truth = pd.DataFrame(
             [
@@ -695,6 +848,58 @@ class TestMetadata:
 
         _assert_frame_equal_with_sorted_columns(experiment_df, experiment_df_truth)
 
+    @pytest.mark.usefixtures("get_context_mock")
+    def test_get_experiment_df_only_fetches_changes(
+        self,
+        list_executions_mock,
+        query_execution_inputs_and_outputs_mock,
+        list_artifacts_mock,
+    ):
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        aiplatform.get_experiment_df(_TEST_EXPERIMENT)
+        list_artifacts_mock.assert_not_called()
+        query_execution_inputs_and_outputs_mock.reset_mock()
+
+        # The other run gets new params, the metrics of the first run change.
+        updated_executions = list(list_executions_mock.return_value)
+        updated_executions[1] = GapicExecution(
+            name=_TEST_OTHER_EXECUTION_NAME,
+            display_name=_TEST_OTHER_RUN,
+            schema_title=constants.SYSTEM_RUN,
+            schema_version=constants.SCHEMA_VERSIONS[constants.SYSTEM_RUN],
+            metadata=_TEST_PARAMS,
+            update_time=_TEST_UPDATE_TIME,
+        )
+        list_executions_mock.return_value = updated_executions
+
+        experiment_df = aiplatform.get_experiment_df(_TEST_EXPERIMENT)
+
+        query_execution_inputs_and_outputs_mock.assert_called_once_with(
+            execution=_TEST_OTHER_EXECUTION_NAME
+        )
+        list_artifacts_mock.assert_called_once()
+        assert (
+            list_artifacts_mock.call_args[1]["request"].filter
+            == 'update_time>="2022-01-01T00:00:00.000000Z" '
+            f'AND (schema_title="{constants.SYSTEM_METRICS}")'
+        )
+        assert experiment_df.to_dict("records") == [
+            {
+                "experiment_name": _TEST_EXPERIMENT,
+                "run_name": _TEST_RUN,
+                "param.%s" % _TEST_PARAM_KEY_1: 0.01,
+                "param.%s" % _TEST_PARAM_KEY_2: 0.2,
+                "metric.%s" % _TEST_METRIC_KEY_2: 0.9,
+            },
+            {
+                "experiment_name": _TEST_EXPERIMENT,
+                "run_name": _TEST_OTHER_RUN,
+                "param.%s" % _TEST_PARAM_KEY_1: 0.01,
+                "param.%s" % _TEST_PARAM_KEY_2: 0.2,
+                "metric.%s" % _TEST_METRIC_KEY_2: 0.9,
+            },
+        ]
+
     @pytest.mark.usefixtures("get_context_not_found_mock")
     def test_get_experiment_df_not_exist(self):
         aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
@@ -733,7 +938,8 @@ class TestMetadata:
             [
                 call(execution=_TEST_EXECUTION_NAME),
                 call(execution=_TEST_OTHER_EXECUTION_NAME),
-            ]
+            ],
+            any_order=True,
         )
         pipeline_df_truth = pd.DataFrame(
             [
@@ -768,3 +974,82 @@ class TestMetadata:
         aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
         with pytest.raises(ValueError):
             aiplatform.get_pipeline_df(_TEST_PIPELINE)
+
+
+class TestBufferedMetadataLogger:
+    def test_flushes_in_background_by_size(self):
+        logger = metadata_logger._BufferedMetadataLogger(
+            max_buffered_updates=2, flush_interval_secs=60
+        )
+        updated = threading.Event()
+        resource = mock.Mock()
+        resource.update.side_effect = lambda metadata: updated.set()
+
+        logger.log(resource, {"a": 1})
+        logger.log(resource, {"b": 2})
+
+        assert updated.wait(timeout=10)
+        resource.update.assert_called_once_with(metadata={"a": 1, "b": 2})
+
+    def test_flushes_in_background_by_time(self):
+        logger = metadata_logger._BufferedMetadataLogger(
+            max_buffered_updates=100, flush_interval_secs=0.1
+        )
+        updated = threading.Event()
+        resource = mock.Mock()
+        resource.update.side_effect = lambda metadata: updated.set()
+
+        logger.log(resource, {"a": 1})
+
+        assert updated.wait(timeout=10)
+        resource.update.assert_called_once_with(metadata={"a": 1})
+
+    def test_flush_keeps_failed_updates_buffered(self):
+        logger = metadata_logger._BufferedMetadataLogger(
+            max_buffered_updates=100, flush_interval_secs=60
+        )
+        resource = mock.Mock()
+        resource.update.side_effect = [exceptions.ServiceUnavailable("down"), None]
+
+        logger.log(resource, {"a": 1, "b": 1})
+        with pytest.raises(exceptions.ServiceUnavailable):
+            logger.flush()
+
+        logger.log(resource, {"b": 2})
+        logger.flush()
+
+        assert resource.update.call_args_list == [
+            call(metadata={"a": 1, "b": 1}),
+            call(metadata={"a": 1, "b": 2}),
+        ]
+
+    def test_flush_drops_updates_failing_with_permanent_errors(self, caplog):
+        logger = metadata_logger._BufferedMetadataLogger(
+            max_buffered_updates=100, flush_interval_secs=60
+        )
+        resource = mock.Mock(resource_name="test-resource")
+        resource.update.side_effect = exceptions.NotFound("missing")
+
+        logger.log(resource, {"a": 1, "b": 1})
+        with pytest.raises(exceptions.NotFound):
+            logger.flush()
+        logger.flush()
+
+        resource.update.assert_called_once()
+        assert "['a', 'b'] of test-resource" in caplog.text
+
+    def test_flush_drops_updates_after_max_attempts(self):
+        logger = metadata_logger._BufferedMetadataLogger(
+            max_buffered_updates=100, flush_interval_secs=60
+        )
+        resource = mock.Mock(resource_name="test-resource")
+        resource.update.side_effect = exceptions.ServiceUnavailable("down")
+
+        logger.log(resource, {"a": 1})
+        with mock.patch.object(metadata_logger, "_MAX_UPDATE_ATTEMPTS", 2):
+            for _ in range(2):
+                with pytest.raises(exceptions.ServiceUnavailable):
+                    logger.flush()
+            logger.flush()
+
+        assert resource.update.call_count == 2
@@ -646,6 +646,22 @@ class TestTensorboardExperiment:
             request={"parent": _TEST_NAME, "filter": None}
         )
 
+    def test_iter_list_tensorboard_experiments(self, list_tensorboard_experiment_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        experiments = list(
+            tensorboard.TensorboardExperiment.iter_list(
+                tensorboard_name=_TEST_NAME, page_size=10
+            )
+        )
+
+        list_tensorboard_experiment_mock.assert_called_once_with(
+            request={"parent": _TEST_NAME, "filter": None, "page_size": 10}
+        )
+        assert [experiment.resource_name for experiment in experiments] == [
+            _TEST_TENSORBOARD_EXPERIMENT_NAME
+        ]
+
 
 class TestTensorboardRun:
     def setup_method(self):
@@ -795,3 +811,22 @@ class TestTensorboardRun:
         list_tensorboard_run_mock.assert_called_once_with(
             request={"parent": _TEST_TENSORBOARD_EXPERIMENT_NAME, "filter": None}
         )
+
+    def test_iter_list_tensorboard_runs(self, list_tensorboard_run_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        runs = list(
+            tensorboard.TensorboardRun.iter_list(
+                tensorboard_experiment_name=_TEST_TENSORBOARD_EXPERIMENT_NAME,
+                page_size=10,
+            )
+        )
+
+        list_tensorboard_run_mock.assert_called_once_with(
+            request={
+                "parent": _TEST_TENSORBOARD_EXPERIMENT_NAME,
+                "filter": None,
+                "page_size": 10,
+            }
+        )
+        assert [run.resource_name for run in runs] == [_TEST_TENSORBOARD_RUN_NAME]
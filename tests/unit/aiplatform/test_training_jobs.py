@@ -288,6 +288,7 @@ def mock_client_bucket():
         MockBucket = mock.Mock(autospec=storage.Bucket)
         MockBucket.name = _TEST_BUCKET_NAME
         MockBlob = mock.Mock(autospec=storage.Blob)
+        MockBlob.exists.return_value = False
         MockBucket.blob.side_effect = functools.partial(
             blob_side_effect, mock_blob=MockBlob, bucket=MockBucket
         )
@@ -516,25 +517,138 @@ class TestTrainingScriptPythonPackager:
             with pytest.raises(RuntimeError):
                 tsp.package_and_copy(copy_method=local_copy_method)
 
-    def test_package_and_copy_to_gcs_copies_to_gcs(self, mock_client_bucket):
+    def test_package_and_copy_to_gcs_copies_to_gcs(self, mock_client_bucket, tmp_path):
         mock_client_bucket, mock_blob = mock_client_bucket
+        mock_blob.exists.return_value = False
 
         tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
 
-        gcs_path = tsp.package_and_copy_to_gcs(
-            gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
-        )
+        with patch.object(source_utils, "_LOCAL_PACKAGE_CACHE_DIR", str(tmp_path)):
+            gcs_path = tsp.package_and_copy_to_gcs(
+                gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+            )
 
         mock_client_bucket.assert_called_once_with(_TEST_BUCKET_NAME)
         mock_client_bucket.return_value.blob.assert_called_once()
 
-        mock_blob.upload_from_filename.call_args[0][0].endswith(
-            "/trainer/dist/aiplatform_custom_trainer_script-0.1.tar.gz"
+        assert mock_blob.upload_from_filename.call_args[0][0].endswith(
+            "/aiplatform_custom_trainer_script-0.1.tar.gz"
         )
 
         assert gcs_path.endswith("-aiplatform_custom_trainer_script-0.1.tar.gz")
         assert gcs_path.startswith(f"gs://{_TEST_BUCKET_NAME}")
 
+    def test_package_and_copy_to_gcs_does_not_rebuild_when_packaging_fails(
+        self, mock_client_bucket, tmp_path
+    ):
+        mock_client_bucket, mock_blob = mock_client_bucket
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+
+        with patch.object(
+            source_utils, "_LOCAL_PACKAGE_CACHE_DIR", str(tmp_path)
+        ), patch.object(
+            source_utils._TrainingScriptPythonPackager,
+            "make_package",
+            side_effect=OSError("No space left on device"),
+        ) as make_package_mock:
+            with pytest.raises(OSError):
+                tsp.package_and_copy_to_gcs(
+                    gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+                )
+
+        make_package_mock.assert_called_once()
+        mock_blob.upload_from_filename.assert_not_called()
+
+    def test_package_and_copy_to_gcs_uploads_when_cache_is_not_writable(
+        self, mock_client_bucket, tmp_path
+    ):
+        mock_client_bucket, mock_blob = mock_client_bucket
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+        # A file where the cache directory should be makes it unwritable.
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("")
+
+        with patch.object(source_utils, "_LOCAL_PACKAGE_CACHE_DIR", str(cache_dir)):
+            tsp.package_and_copy_to_gcs(
+                gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+            )
+
+        mock_blob.upload_from_filename.assert_called_once()
+        assert mock_blob.upload_from_filename.call_args[0][0].endswith(
+            "/aiplatform_custom_trainer_script-0.1.tar.gz"
+        )
+
+    def test_source_hash_changes_with_sources_and_requirements(self):
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+        source_hash = tsp.source_hash()
+
+        assert source_hash == tsp.source_hash()
+        assert (
+            source_utils._TrainingScriptPythonPackager(
+                _TEST_LOCAL_SCRIPT_FILE_PATH, requirements=_TEST_REQUIREMENTS
+            ).source_hash()
+            != source_hash
+        )
+
+        with open(_TEST_LOCAL_SCRIPT_FILE_PATH, "a") as fp:
+            fp.write("\n")
+        assert tsp.source_hash() != source_hash
+
+    def test_package_and_copy_to_gcs_skips_packaging_when_staged(
+        self, mock_client_bucket
+    ):
+        mock_client_bucket, mock_blob = mock_client_bucket
+        mock_blob.exists.return_value = True
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+
+        with patch.object(
+            source_utils._TrainingScriptPythonPackager, "make_package"
+        ) as make_package_mock:
+            gcs_path = tsp.package_and_copy_to_gcs(
+                gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+            )
+
+        make_package_mock.assert_not_called()
+        mock_blob.upload_from_filename.assert_not_called()
+        assert gcs_path == (
+            f"gs://{_TEST_BUCKET_NAME}/aiplatform-{tsp.source_hash()}-"
+            "aiplatform_custom_trainer_script-0.1.tar.gz"
+        )
+
+    def test_package_and_copy_to_gcs_reuses_locally_cached_package(
+        self, mock_client_bucket, tmp_path
+    ):
+        mock_client_bucket, mock_blob = mock_client_bucket
+        mock_blob.exists.return_value = False
+        tsp = source_utils._TrainingScriptPythonPackager(_TEST_LOCAL_SCRIPT_FILE_PATH)
+        make_package = source_utils._TrainingScriptPythonPackager.make_package
+
+        with patch.object(
+            source_utils, "_LOCAL_PACKAGE_CACHE_DIR", str(tmp_path)
+        ), patch.object(
+            source_utils._TrainingScriptPythonPackager,
+            "make_package",
+            autospec=True,
+            side_effect=make_package,
+        ) as make_package_mock:
+            gcs_paths = [
+                tsp.package_and_copy_to_gcs(
+                    gcs_staging_dir=_TEST_BUCKET_NAME, project=_TEST_PROJECT
+                )
+                for _ in range(2)
+            ]
+
+        cached_package_path = str(
+            tmp_path / tsp.source_hash() / "aiplatform_custom_trainer_script-0.1.tar.gz"
+        )
+        make_package_mock.assert_called_once()
+        assert (
+            mock_blob.upload_from_filename.call_args_list
+            == [mock.call(cached_package_path, if_generation_match=0)] * 2
+        )
+        assert gcs_paths[0] == gcs_paths[1]
+        assert tarfile.is_tarfile(cached_package_path)
+
 
 @pytest.fixture
 def mock_pipeline_service_create():
@@ -1983,6 +2097,9 @@ class TestCustomTrainingJob:
             create_request_timeout=None,
         )
 
+        if not sync:
+            job.wait()
+
         assert model is None
 
     @pytest.mark.usefixtures(
@@ -3829,6 +3946,9 @@ class TestCustomContainerTrainingJob:
             create_request_timeout=None,
         )
 
+        if not sync:
+            job.wait()
+
         assert model is None
 
     @pytest.mark.usefixtures(
@@ -5907,6 +6027,9 @@ class TestCustomPythonPackageTrainingJob:
             create_request_timeout=None,
         )
 
+        if not sync:
+            job.wait()
+
         assert model is None
 
     @pytest.mark.usefixtures(
@@ -16,12 +16,14 @@
 #
 """Tests for uploader.py."""
 
+from collections import defaultdict
 import datetime
 import functools
 import logging
 import os
 import re
 import tempfile
+import threading
 from unittest import mock
 
 import grpc
@@ -42,6 +44,7 @@ from tensorboard.uploader.proto import server_info_pb2
 import tensorflow as tf
 
 from google.api_core import datetime_helpers
+from google.api_core import exceptions
 from google.cloud.aiplatform.tensorboard import uploader_utils
 from google.cloud.aiplatform.tensorboard.plugins.tf_profiler import profile_uploader
 import google.cloud.aiplatform.tensorboard.uploader as uploader_lib
@@ -202,6 +205,9 @@ def _create_uploader(
     verbosity=0,  # Use 0 to minimize littering the test output.
     one_shot=None,
     allowed_plugins=_SCALARS_HISTOGRAMS_AND_GRAPHS,
+    max_concurrent_blob_uploads=_USE_DEFAULT,
+    checkpoint_path=None,
+    max_concurrent_runs=1,
 ):
     if writer_client is _USE_DEFAULT:
         writer_client = _create_mock_client()
@@ -219,6 +225,8 @@ def _create_uploader(
         logdir_poll_rate_limiter = util.RateLimiter(0)
     if rpc_rate_limiter is _USE_DEFAULT:
         rpc_rate_limiter = util.RateLimiter(0)
+    if max_concurrent_blob_uploads is _USE_DEFAULT:
+        max_concurrent_blob_uploads = uploader_lib._DEFAULT_MAX_CONCURRENT_BLOB_UPLOADS
 
     upload_limits = server_info_pb2.UploadLimits(
         max_scalar_request_size=max_scalar_request_size,
@@ -242,6 +250,9 @@ def _create_uploader(
         description=description,
         verbosity=verbosity,
         one_shot=one_shot,
+        max_concurrent_blob_uploads=max_concurrent_blob_uploads,
+        checkpoint_path=checkpoint_path,
+        max_concurrent_runs=max_concurrent_runs,
     )
 
 
@@ -669,25 +680,16 @@ class TensorboardUploaderTest(tf.test.TestCase):
             },
             # Note the lack of AbortUploadError here.
         ]
-        mock_logdir_loader_pre_create = mock.create_autospec(logdir_loader.LogdirLoader)
-        mock_logdir_loader_pre_create.get_run_events.side_effect = [
-            {
-                "run 1": _apply_compat(
-                    [_scalar_event("tag_1.1", 5.0), _scalar_event("tag_1.2", 5.0)]
-                ),
-                "run 2": _apply_compat(
-                    [_scalar_event("tag_2.1", 5.0), _scalar_event("tag_2.2", 5.0)]
-                ),
-            },
-            # Note the lack of AbortUploadError here.
-        ]
 
         with mock.patch.object(uploader, "_logdir_loader", mock_logdir_loader):
-            with mock.patch.object(
-                uploader, "_logdir_loader_pre_create", mock_logdir_loader_pre_create
-            ):
-                uploader.start_uploading()
+            uploader.start_uploading()
 
+        # The runs and time series are batch created while reading the logdir once.
+        mock_logdir_loader.get_run_events.assert_called_once()
+        mock_client.batch_create_tensorboard_runs.assert_called_once()
+        self.assertEqual(2, mock_client.batch_create_tensorboard_time_series.call_count)
+        mock_client.create_tensorboard_run.assert_not_called()
+        mock_client.create_tensorboard_time_series.assert_not_called()
         self.assertEqual(2, mock_client.write_tensorboard_experiment_data.call_count)
         self.assertEqual(2, mock_rate_limiter.tick.call_count)
 
@@ -742,6 +744,198 @@ class TensorboardUploaderTest(tf.test.TestCase):
         uploader._upload_once()
         mock_client.write_tensorboard_experiment_data.assert_called_once()
 
+    def test_upload_resumes_from_checkpoint(self):
+        logdir = os.path.join(self.get_temp_dir(), "logdir")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        writer = FileWriter(logdir)
+        writer.add_test_summary("foo", simple_value=5.0, step=1)
+        writer.add_test_summary("foo", simple_value=6.0, step=2)
+        writer.flush()
+
+        mock_client = _create_mock_client()
+        uploader = _create_uploader(
+            mock_client, logdir, checkpoint_path=checkpoint_path
+        )
+        uploader.create_experiment()
+        uploader._upload_once()
+        self.assertEqual(1, mock_client.write_tensorboard_experiment_data.call_count)
+
+        writer.add_test_summary("foo", simple_value=7.0, step=3)
+        writer.flush()
+
+        # A restarted uploader of the same experiment only reads and sends the
+        # new event.
+        mock_client = _create_mock_client()
+        mock_client.create_tensorboard_experiment.side_effect = (
+            exceptions.AlreadyExists("Experiment exists")
+        )
+        mock_client.get_tensorboard_experiment.return_value = (
+            tensorboard_experiment_type.TensorboardExperiment(
+                name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME
+            )
+        )
+        uploader = _create_uploader(
+            mock_client, logdir, checkpoint_path=checkpoint_path
+        )
+        uploader.create_experiment()
+        read_record = uploader_utils.CheckpointedEventFileLoader._read_record
+        with mock.patch.object(
+            uploader_utils.CheckpointedEventFileLoader,
+            "_read_record",
+            autospec=True,
+            side_effect=read_record,
+        ) as mock_read_record:
+            uploader._upload_once()
+
+        # The new record, then the end of the file.
+        self.assertEqual(2, mock_read_record.call_count)
+        self.assertEqual(1, mock_client.write_tensorboard_experiment_data.call_count)
+        call_args = mock_client.write_tensorboard_experiment_data.call_args
+        time_series_data = call_args[1]["write_run_data_requests"][0].time_series_data
+        self.assertEqual([3], [point.step for point in time_series_data[0].values])
+
+    def test_upload_resends_only_runs_not_committed_to_checkpoint(self):
+        logdir = os.path.join(self.get_temp_dir(), "logdir")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        for run_name in ("a", "b"):
+            with FileWriter(os.path.join(logdir, run_name)) as writer:
+                writer.add_test_summary(run_name, simple_value=5.0, step=1)
+
+        class InterruptedError(Exception):
+            pass
+
+        mock_client = _create_mock_client()
+        # The uploader is interrupted while sending run "b", after run "a"
+        # was sent.
+        mock_client.write_tensorboard_experiment_data.side_effect = [
+            None,
+            InterruptedError(),
+        ]
+        uploader = _create_uploader(
+            mock_client, logdir, checkpoint_path=checkpoint_path
+        )
+        uploader.create_experiment()
+        with mock.patch.object(
+            uploader_utils.UploadCheckpoint, "SAVE_INTERVAL_SECS", 0
+        ), self.assertRaises(InterruptedError):
+            uploader._upload_once()
+
+        mock_client = _create_mock_client()
+        mock_client.create_tensorboard_experiment.side_effect = (
+            exceptions.AlreadyExists("Experiment exists")
+        )
+        mock_client.get_tensorboard_experiment.return_value = (
+            tensorboard_experiment_type.TensorboardExperiment(
+                name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME
+            )
+        )
+        uploader = _create_uploader(
+            mock_client, logdir, checkpoint_path=checkpoint_path
+        )
+        uploader.create_experiment()
+        uploader._upload_once()
+
+        mock_client.write_tensorboard_experiment_data.assert_called_once()
+        call_args = mock_client.write_tensorboard_experiment_data.call_args
+        (write_run_data_request,) = call_args[1]["write_run_data_requests"]
+        self.assertEqual(
+            ["b"],
+            [
+                time_series_data.tensorboard_time_series_id
+                for time_series_data in write_run_data_request.time_series_data
+            ],
+        )
+
+    def test_upload_sends_steps_rewritten_by_restarted_run(self):
+        logdir = os.path.join(self.get_temp_dir(), "logdir")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        with FileWriter(logdir, filename_suffix=".1") as writer:
+            writer.add_test_summary("foo", simple_value=5.0, step=1)
+            writer.add_test_summary("foo", simple_value=6.0, step=2)
+
+        mock_client = _create_mock_client()
+        uploader = _create_uploader(
+            mock_client, logdir, checkpoint_path=checkpoint_path
+        )
+        uploader.create_experiment()
+        uploader._upload_once()
+
+        # The restarted training job logs its steps again to a new file.
+        with FileWriter(logdir, filename_suffix=".2") as writer:
+            writer.add_test_summary("foo", simple_value=7.0, step=1)
+            writer.add_test_summary("foo", simple_value=8.0, step=2)
+        mock_client.write_tensorboard_experiment_data.reset_mock()
+        uploader._upload_once()
+
+        mock_client.write_tensorboard_experiment_data.assert_called_once()
+        call_args = mock_client.write_tensorboard_experiment_data.call_args
+        time_series_data = call_args[1]["write_run_data_requests"][0].time_series_data
+        self.assertEqual(
+            [(1, 7.0), (2, 8.0)],
+            [(point.step, point.scalar.value) for point in time_series_data[0].values],
+        )
+
+    def test_upload_ignores_checkpoint_of_new_experiment(self):
+        logdir = os.path.join(self.get_temp_dir(), "logdir")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        with FileWriter(logdir) as writer:
+            writer.add_test_summary("foo", simple_value=5.0, step=1)
+
+        for _ in range(2):
+            mock_client = _create_mock_client()
+            uploader = _create_uploader(
+                mock_client, logdir, checkpoint_path=checkpoint_path
+            )
+            uploader.create_experiment()
+            uploader._upload_once()
+            mock_client.write_tensorboard_experiment_data.assert_called_once()
+
+    def test_upload_runs_concurrently(self):
+        logdir = self.get_temp_dir()
+        for run_name in ("a", "b"):
+            with FileWriter(os.path.join(logdir, run_name)) as writer:
+                for step in range(10):
+                    writer.add_test_summary("foo", simple_value=step, step=step)
+
+        # The first request of each run waits for the other run's, so both
+        # runs must be dispatched at the same time.
+        first_requests_sent = threading.Barrier(2, timeout=10)
+        run_steps = defaultdict(list)
+        lock = threading.Lock()
+
+        def write_tensorboard_experiment_data(
+            tensorboard_experiment, write_run_data_requests
+        ):
+            run_name = write_run_data_requests[0].tensorboard_run
+            with lock:
+                first_request = run_name not in run_steps
+                for request in write_run_data_requests:
+                    for time_series_data in request.time_series_data:
+                        run_steps[request.tensorboard_run].extend(
+                            point.step for point in time_series_data.values
+                        )
+            if first_request:
+                first_requests_sent.wait()
+
+        mock_client = _create_mock_client()
+        mock_client.write_tensorboard_experiment_data.side_effect = (
+            write_tensorboard_experiment_data
+        )
+        uploader = _create_uploader(
+            mock_client,
+            logdir,
+            # Send a few points per request.
+            max_scalar_request_size=200,
+            max_concurrent_runs=2,
+        )
+        uploader.create_experiment()
+        uploader._upload_once()
+
+        self.assertLen(run_steps, 2)
+        for steps in run_steps.values():
+            self.assertEqual(list(range(10)), steps)
+        self.assertGreater(mock_client.write_tensorboard_experiment_data.call_count, 2)
+
     def test_upload_full_logdir(self):
         logdir = self.get_temp_dir()
         mock_client = _create_mock_client()
@@ -1019,6 +1213,8 @@ class TensorboardUploaderTest(tf.test.TestCase):
             logdir,
             logdir_poll_rate_limiter=limiter,
             blob_storage_bucket=mock_bucket,
+            # Upload one blob at a time to keep the order of the graphs.
+            max_concurrent_blob_uploads=1,
         )
         uploader.create_experiment()
 
@@ -1052,6 +1248,62 @@ class TensorboardUploaderTest(tf.test.TestCase):
         with self.subTest("corrupt graphs should be skipped"):
             self.assertLen(actual_blobs, 2)
 
+    def test_start_uploading_graphs_uploads_blobs_concurrently(self):
+        mock_client = _create_mock_client()
+        mock_bucket = mock.create_autospec(storage.Bucket)
+        mock_blob = mock.create_autospec(storage.Blob)
+        mock_bucket.blob.return_value = mock_blob
+
+        # Each upload waits for the other one, so both must run at once.
+        uploads_started = threading.Barrier(2, timeout=10)
+        uploaded_blobs = []
+
+        def upload_from_string(blob):
+            uploads_started.wait()
+            uploaded_blobs.append(blob)
+
+        mock_blob.upload_from_string.side_effect = upload_from_string
+
+        blobs_uploaded_before_write = []
+
+        def write_tensorboard_experiment_data(*args, **kwargs):
+            blobs_uploaded_before_write.append(len(uploaded_blobs))
+
+        mock_client.write_tensorboard_experiment_data.side_effect = (
+            write_tensorboard_experiment_data
+        )
+
+        def create_time_series(tensorboard_time_series, parent=None):
+            return tensorboard_time_series_type.TensorboardTimeSeries(
+                name=_TEST_ONE_PLATFORM_TIME_SERIES_NAME,
+                display_name=tensorboard_time_series.display_name,
+            )
+
+        mock_client.create_tensorboard_time_series.side_effect = create_time_series
+        uploader = _create_uploader(
+            writer_client=mock_client,
+            logdir=_TEST_LOG_DIR_NAME,
+            blob_storage_bucket=mock_bucket,
+            max_concurrent_blob_uploads=2,
+        )
+        uploader.create_experiment()
+
+        graph_event = event_pb2.Event(graph_def=_create_example_graph_bytes(950))
+        mock_logdir_loader = mock.create_autospec(logdir_loader.LogdirLoader)
+        mock_logdir_loader.get_run_events.side_effect = [
+            {"run 1": _apply_compat([graph_event, graph_event])},
+            AbortUploadError,
+        ]
+
+        with mock.patch.object(
+            uploader, "_logdir_loader", mock_logdir_loader
+        ), self.assertRaises(AbortUploadError):
+            uploader.start_uploading()
+
+        self.assertLen(uploaded_blobs, 2)
+        # The data points are only written once their blobs are uploaded.
+        self.assertEqual(blobs_uploaded_before_write, [2])
+
     def test_add_profile_plugin(self):
         uploader = _create_uploader(
             _create_mock_client(),
@@ -1953,6 +2205,103 @@ class FileRequestSenderTest(tf.test.TestCase):
         self.assertLen(sender._source_bucket.copy_blob.call_args_list, 1)
 
 
+class CheckpointedEventFileLoaderTest(tf.test.TestCase):
+    def _write_records(self, path, events):
+        with tf.io.TFRecordWriter(path) as writer:
+            for event in events:
+                writer.write(event.SerializeToString())
+
+    def _create_checkpoint(self, checkpoint_path):
+        return uploader_utils.UploadCheckpoint(
+            checkpoint_path,
+            experiment_resource_name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME,
+            logdir=self.get_temp_dir(),
+        )
+
+    def test_load_resumes_at_committed_offset(self):
+        path = os.path.join(self.get_temp_dir(), "events.out.tfevents.1")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        events = [
+            event_pb2.Event(step=step, file_version="brain.Event:2")
+            for step in range(4)
+        ]
+        self._write_records(path, events[:2])
+
+        checkpoint = self._create_checkpoint(checkpoint_path)
+        loader = uploader_utils.CheckpointedEventFileLoader(path, checkpoint)
+        self.assertEqual([0, 1], [event.step for _, event in loader.Load()])
+        checkpoint.commit()
+
+        # Appending to the file keeps the records written before.
+        self._write_records(path, events)
+        loader = uploader_utils.CheckpointedEventFileLoader(
+            path, self._create_checkpoint(checkpoint_path)
+        )
+        self.assertEqual([2, 3], [event.step for _, event in loader.Load()])
+        self.assertEqual([], list(loader.Load()))
+
+    def test_load_waits_for_truncated_record(self):
+        path = os.path.join(self.get_temp_dir(), "events.out.tfevents.1")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        events = [
+            event_pb2.Event(step=step, file_version="brain.Event:2")
+            for step in range(2)
+        ]
+        self._write_records(path, events)
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:-3])
+
+        loader = uploader_utils.CheckpointedEventFileLoader(
+            path, self._create_checkpoint(checkpoint_path)
+        )
+        self.assertEqual([0], [event.step for _, event in loader.Load()])
+        with open(path, "wb") as f:
+            f.write(data)
+        self.assertEqual([1], [event.step for _, event in loader.Load()])
+
+    def test_checkpoint_of_another_upload_is_ignored(self):
+        path = os.path.join(self.get_temp_dir(), "events.out.tfevents.1")
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        self._write_records(path, [event_pb2.Event(step=0)])
+        checkpoint = self._create_checkpoint(checkpoint_path)
+        list(uploader_utils.CheckpointedEventFileLoader(path, checkpoint).Load())
+        checkpoint.set_time_series_metadata("run", "tag", summary_pb2.SummaryMetadata())
+        checkpoint.commit()
+
+        checkpoint = uploader_utils.UploadCheckpoint(
+            checkpoint_path,
+            experiment_resource_name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME + "-other",
+            logdir=self.get_temp_dir(),
+        )
+        self.assertEqual((0, {}), checkpoint.get_file_state(path))
+        self.assertEqual({}, checkpoint.get_time_series_metadata())
+
+    def test_commit_run_only_commits_files_of_the_run(self):
+        checkpoint_path = os.path.join(self.get_temp_dir(), "checkpoint.json")
+        checkpoint = self._create_checkpoint(checkpoint_path)
+        paths = {}
+        for run_name in ("a", "b"):
+            os.makedirs(os.path.join(self.get_temp_dir(), run_name))
+            paths[run_name] = os.path.join(
+                self.get_temp_dir(), run_name, "events.out.tfevents.1"
+            )
+            self._write_records(paths[run_name], [event_pb2.Event(step=0)])
+            list(
+                uploader_utils.CheckpointedEventFileLoader(
+                    paths[run_name], checkpoint
+                ).Load()
+            )
+
+        checkpoint.commit(run="a")
+        checkpoint.save(force=True)
+
+        checkpoint = self._create_checkpoint(checkpoint_path)
+        self.assertNotEqual(0, checkpoint.get_file_state(paths["a"])[0])
+        self.assertEqual(0, checkpoint.get_file_state(paths["b"])[0])
+
+
 class VarintCostTest(tf.test.TestCase):
     def test_varint_cost(self):
         self.assertEqual(uploader_lib._varint_cost(0), 1)
@@ -16,17 +16,38 @@
 #
 
 
+from concurrent import futures
 import datetime
 import json
 import os
+import subprocess
+import sys
+import textwrap
+import threading
+import types
 from typing import Callable, Dict, Optional
+from unittest import mock
 
 import pytest
 import yaml
-from google.api_core import client_options, gapic_v1
+from google.api_core import client_options, exceptions, gapic_v1
 from google.cloud import aiplatform
-from google.cloud.aiplatform import compat, utils
-from google.cloud.aiplatform.utils import pipeline_utils, tensorboard_utils, yaml_utils
+from google.cloud import storage
+from google.cloud.aiplatform import compat, initializer, utils
+from google.cloud.aiplatform.compat.types import (
+    custom_job as gca_custom_job,
+    job_state as gca_job_state,
+)
+from google.cloud.aiplatform.utils import (
+    bigquery_utils,
+    client_pool,
+    dependency_scheduler,
+    gcs_utils,
+    job_poller,
+    pipeline_utils,
+    tensorboard_utils,
+    yaml_utils,
+)
 from google.cloud.aiplatform_v1.services.model_service import (
     client as model_service_client_v1,
 )
@@ -326,6 +347,125 @@ def test_client_w_override_select_version():
     )
 
 
+def test_client_w_override_creates_selected_version_on_first_use():
+    client_w_override = utils.ModelClientWithOverride(
+        client_options=client_options.ClientOptions(),
+        client_info=gapic_v1.client_info.ClientInfo(),
+    )
+    assert list(client_w_override._clients) == [compat.DEFAULT_VERSION]
+
+    v1beta1_client = client_w_override.select_version(compat.V1BETA1)
+
+    assert client_w_override.select_version(compat.V1BETA1) is v1beta1_client
+    assert (
+        utils.ModelClientWithOverride.get_gapic_client_class(compat.V1BETA1)
+        is model_service_client_v1beta1.ModelServiceClient
+    )
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+def test_client_w_override_reuses_pooled_client():
+    test_client_info = gapic_v1.client_info.ClientInfo()
+    test_client_options = client_options.ClientOptions(
+        api_endpoint="us-central1-aiplatform.googleapis.com"
+    )
+
+    first = utils.ModelClientWithOverride(
+        client_options=test_client_options, client_info=test_client_info
+    )
+    second = utils.ModelClientWithOverride(
+        client_options=client_options.ClientOptions(
+            api_endpoint="us-central1-aiplatform.googleapis.com"
+        ),
+        client_info=test_client_info,
+    )
+    other_location = utils.ModelClientWithOverride(
+        client_options=client_options.ClientOptions(
+            api_endpoint="europe-west4-aiplatform.googleapis.com"
+        ),
+        client_info=test_client_info,
+    )
+
+    assert first.get_model.__self__ is first.get_model.__self__
+    assert first.get_model.__self__ is second.get_model.__self__
+    assert first.get_model.__self__ is not other_location.get_model.__self__
+    assert (
+        first.select_version(compat.V1BETA1).get_model.__self__
+        is not first.get_model.__self__
+    )
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+def test_client_pool_close():
+    pool = client_pool.ClientPool()
+    test_client_info = gapic_v1.client_info.ClientInfo()
+    test_client_options = client_options.ClientOptions()
+
+    client = pool.get_client(
+        client_class=model_service_client_default.ModelServiceClient,
+        client_options=test_client_options,
+        client_info=test_client_info,
+    )
+    assert len(pool) == 1
+
+    with mock.patch.object(client.transport, "close") as close_mock:
+        pool.close()
+        close_mock.assert_called_once_with()
+
+    assert len(pool) == 0
+    assert (
+        pool.get_client(
+            client_class=model_service_client_default.ModelServiceClient,
+            client_options=test_client_options,
+            client_info=test_client_info,
+        )
+        is not client
+    )
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+def test_client_pool_discards_clients_after_fork():
+    pool = client_pool.ClientPool()
+    test_client_info = gapic_v1.client_info.ClientInfo()
+    test_client_options = client_options.ClientOptions()
+
+    client = pool.get_client(
+        client_class=model_service_client_default.ModelServiceClient,
+        client_options=test_client_options,
+        client_info=test_client_info,
+    )
+
+    with mock.patch.object(os, "getpid", return_value=os.getpid() + 1):
+        with mock.patch.object(client.transport, "close") as close_mock:
+            assert (
+                pool.get_client(
+                    client_class=model_service_client_default.ModelServiceClient,
+                    client_options=test_client_options,
+                    client_info=test_client_info,
+                )
+                is not client
+            )
+            close_mock.assert_not_called()
+
+
+def test_create_client_uses_global_client_pool():
+    initializer.global_config.init(project="test-project", location="us-central1")
+    with mock.patch.object(
+        initializer.global_client_pool, "get_client"
+    ) as get_client_mock:
+        client = initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+        get_client_mock.assert_not_called()
+
+        client.get_model
+        get_client_mock.assert_called_once()
+        assert (
+            get_client_mock.call_args.kwargs["client_class"]
+            is model_service_client_default.ModelServiceClient
+        )
+
+
 @pytest.mark.parametrize(
     "year,month,day,hour,minute,second,microsecond,expected_seconds,expected_nanos",
     [
@@ -542,6 +682,485 @@ class TestTensorboardUtils:
             tensorboard_utils.get_experiments_compare_url(("foo-bar", "foo-bar1"))
 
 
+def _fake_bigquery_read_client(stream_pages, fail_stream=None):
+    """Returns a fake BigQueryReadClient serving the given pages per stream."""
+
+    def read_rows(stream_name):
+        if stream_name == fail_stream:
+            raise RuntimeError(f"Failed to read {stream_name}.")
+        pages = [
+            mock.Mock(to_arrow=mock.Mock(return_value=page))
+            for page in stream_pages[stream_name]
+        ]
+        reader = mock.Mock()
+        reader.rows.return_value.pages = pages
+        return reader
+
+    return mock.Mock(read_rows=mock.Mock(side_effect=read_rows))
+
+
+class TestBigqueryUtils:
+    stream_pages = {
+        f"stream_{stream}": [f"batch_{stream}_{page}" for page in range(5)]
+        for stream in range(4)
+    }
+    read_session = mock.Mock(
+        streams=[types.SimpleNamespace(name=name) for name in stream_pages],
+    )
+
+    def test_iter_read_session_record_batches_reads_all_streams(self):
+        read_client = _fake_bigquery_read_client(self.stream_pages)
+
+        batches = list(
+            bigquery_utils.iter_read_session_record_batches(
+                read_client=read_client,
+                read_session=self.read_session,
+                max_concurrent_streams=2,
+                max_queued_batches=1,
+            )
+        )
+
+        assert sorted(batches) == sorted(
+            batch for pages in self.stream_pages.values() for batch in pages
+        )
+        for pages in self.stream_pages.values():
+            stream_batches = [batch for batch in batches if batch in pages]
+            assert stream_batches == pages
+
+    def test_iter_read_session_record_batches_raises_stream_error(self):
+        read_client = _fake_bigquery_read_client(
+            self.stream_pages, fail_stream="stream_2"
+        )
+
+        with pytest.raises(RuntimeError, match="stream_2"):
+            list(
+                bigquery_utils.iter_read_session_record_batches(
+                    read_client=read_client, read_session=self.read_session
+                )
+            )
+
+    def test_iter_read_session_record_batches_stops_when_closed(self):
+        read_client = _fake_bigquery_read_client(self.stream_pages)
+
+        batches = bigquery_utils.iter_read_session_record_batches(
+            read_client=read_client,
+            read_session=self.read_session,
+            max_concurrent_streams=1,
+            max_queued_batches=1,
+        )
+        next(batches)
+        batches.close()
+
+        assert read_client.read_rows.call_count == 1
+
+    def test_iter_read_session_record_batches_without_streams(self):
+        assert (
+            list(
+                bigquery_utils.iter_read_session_record_batches(
+                    read_client=mock.Mock(), read_session=mock.Mock(streams=[])
+                )
+            )
+            == []
+        )
+
+
+_TEST_JOB_PARENT = "projects/test-project/locations/us-central1"
+_JOB_STATE_RUNNING = gca_job_state.JobState.JOB_STATE_RUNNING
+_JOB_STATE_SUCCEEDED = gca_job_state.JobState.JOB_STATE_SUCCEEDED
+_JOB_STATE_FAILED = gca_job_state.JobState.JOB_STATE_FAILED
+
+
+class _FakeJob:
+    """A job whose get calls return the given states in order."""
+
+    _list_method = "list_custom_jobs"
+    _valid_done_states = (_JOB_STATE_SUCCEEDED, _JOB_STATE_FAILED)
+
+    def __init__(self, job_id, states, api_client=None):
+        self._gca_resource = gca_custom_job.CustomJob(
+            name=f"{_TEST_JOB_PARENT}/customJobs/{job_id}", state=_JOB_STATE_RUNNING
+        )
+        self._states = iter(states)
+        self.api_client = api_client
+        self.get_count = 0
+
+    @property
+    def resource_name(self):
+        return self._gca_resource.name
+
+    def _sync_gca_resource(self):
+        self.get_count += 1
+        state = next(self._states)
+        if isinstance(state, Exception):
+            raise state
+        self._gca_resource = gca_custom_job.CustomJob(
+            name=self._gca_resource.name, state=state
+        )
+
+
+class TestGcsUtils:
+    def test_upload_to_gcs_uploads_directory_and_skips_unchanged_files(self, tmp_path):
+        for name, content in [("a.txt", b"a"), ("sub/b.txt", b"bb"), ("c.txt", b"c")]:
+            (tmp_path / name).parent.mkdir(exist_ok=True)
+            (tmp_path / name).write_bytes(content)
+        unchanged_blob = mock.Mock(
+            size=2, crc32c=gcs_utils._file_crc32c(str(tmp_path / "sub/b.txt"))
+        )
+        unchanged_blob.name = "dir/sub/b.txt"
+        changed_blob = mock.Mock(size=1, crc32c="AAAAAA==")
+        changed_blob.name = "dir/a.txt"
+
+        with mock.patch.object(storage, "Client") as client_mock, mock.patch.object(
+            storage.Blob, "upload_from_filename", autospec=True
+        ) as upload_mock:
+            client_mock.return_value.list_blobs.return_value = [
+                unchanged_blob,
+                changed_blob,
+            ]
+            gcs_utils.upload_to_gcs(
+                source_path=str(tmp_path),
+                destination_uri="gs://test-bucket/dir",
+                project="test-project",
+                credentials=mock.Mock(),
+                max_concurrent_uploads=2,
+            )
+
+        client_mock.return_value.list_blobs.assert_called_once_with(
+            mock.ANY, prefix="dir/"
+        )
+        assert sorted(
+            (call.args[0].name, call.kwargs["filename"])
+            for call in upload_mock.call_args_list
+        ) == [
+            ("dir/a.txt", str(tmp_path / "a.txt")),
+            ("dir/c.txt", str(tmp_path / "c.txt")),
+        ]
+
+    def test_upload_to_gcs_composes_large_files_from_parts(self, tmp_path):
+        source_path = tmp_path / "large.bin"
+        source_path.write_bytes(b"0123456789")
+        uploaded_parts = {}
+
+        def upload_from_file(blob, file_obj, size):
+            uploaded_parts[blob.name] = file_obj.read(size)
+
+        with mock.patch.object(
+            gcs_utils, "_COMPOSITE_UPLOAD_THRESHOLD", 10
+        ), mock.patch.object(
+            gcs_utils, "_COMPOSITE_UPLOAD_PART_SIZE", 4
+        ), mock.patch.object(
+            storage, "Client"
+        ), mock.patch.object(
+            storage.Blob, "upload_from_file", autospec=True
+        ) as upload_mock, mock.patch.object(
+            storage.Blob, "compose", autospec=True
+        ) as compose_mock, mock.patch.object(
+            storage.Blob, "delete", autospec=True
+        ) as delete_mock:
+            upload_mock.side_effect = upload_from_file
+            gcs_utils.upload_to_gcs(
+                source_path=str(source_path),
+                destination_uri="gs://test-bucket/large.bin",
+                project="test-project",
+                credentials=mock.Mock(),
+                skip_unchanged=False,
+            )
+
+        part_names = [
+            f"large.bin{gcs_utils._COMPOSITE_UPLOAD_PART_SUFFIX}{index}"
+            for index in range(3)
+        ]
+        assert uploaded_parts == dict(zip(part_names, [b"0123", b"4567", b"89"]))
+        destination_blob, parts = compose_mock.call_args.args
+        assert destination_blob.name == "large.bin"
+        assert [part.name for part in parts] == part_names
+        assert sorted(call.args[0].name for call in delete_mock.call_args_list) == (
+            part_names
+        )
+
+    def test_upload_to_gcs_deletes_parts_when_upload_fails(self, tmp_path):
+        source_path = tmp_path / "large.bin"
+        source_path.write_bytes(b"0123456789")
+
+        with mock.patch.object(
+            gcs_utils, "_COMPOSITE_UPLOAD_THRESHOLD", 10
+        ), mock.patch.object(
+            gcs_utils, "_COMPOSITE_UPLOAD_PART_SIZE", 4
+        ), mock.patch.object(
+            storage, "Client"
+        ), mock.patch.object(
+            storage.Blob,
+            "upload_from_file",
+            autospec=True,
+            side_effect=RuntimeError("upload failed"),
+        ), mock.patch.object(
+            storage.Blob, "compose", autospec=True
+        ) as compose_mock, mock.patch.object(
+            storage.Blob, "delete", autospec=True
+        ) as delete_mock:
+            with pytest.raises(RuntimeError, match="upload failed"):
+                gcs_utils.upload_to_gcs(
+                    source_path=str(source_path),
+                    destination_uri="gs://test-bucket/large.bin",
+                    project="test-project",
+                    credentials=mock.Mock(),
+                    skip_unchanged=False,
+                )
+
+        compose_mock.assert_not_called()
+        assert delete_mock.call_count == 3
+
+    def test_get_or_create_staging_gcs_dir_checks_bucket_once(self):
+        with mock.patch.object(
+            gcs_utils, "_verified_staging_buckets", set()
+        ), mock.patch.object(
+            initializer.global_config, "_staging_bucket", None
+        ), mock.patch.object(
+            storage, "Client"
+        ) as client_mock, mock.patch.object(
+            storage.Bucket, "exists", return_value=False
+        ) as exists_mock:
+            for _ in range(2):
+                staging_gcs_dir = gcs_utils.get_or_create_staging_gcs_dir(
+                    project="test-project",
+                    location="us-central1",
+                    credentials=mock.Mock(),
+                )
+
+        assert staging_gcs_dir == "gs://test-project-vertex-staging-us-central1"
+        exists_mock.assert_called_once()
+        client_mock.return_value.create_bucket.assert_called_once()
+
+    @staticmethod
+    def _get_blob_with_lines(name, lines):
+        blob = storage.Blob(name=name, bucket=storage.Bucket(None, "test-bucket"))
+        contents = b"".join(lines)
+        blob._properties["size"] = len(contents)
+        blob.download_as_bytes = mock.Mock(
+            side_effect=lambda start, end: contents[start : end + 1],
+        )
+        return blob
+
+    def test_iter_blob_lines_streams_blobs_in_order(self):
+        blobs = [
+            self._get_blob_with_lines(
+                f"blob_{i}", [b"%d-%d\n" % (i, j) for j in range(5)]
+            )
+            for i in range(3)
+        ]
+
+        with mock.patch.object(gcs_utils, "_BLOB_LINES_BUFFER_SIZE", 2):
+            lines = list(gcs_utils.iter_blob_lines(blobs, max_concurrent_downloads=2))
+
+        assert lines == [b"%d-%d\n" % (i, j) for i in range(3) for j in range(5)]
+        for blob in blobs:
+            blob.download_as_bytes.assert_called_once_with(start=0, end=blob.size - 1)
+
+    def test_iter_blob_lines_joins_lines_split_across_chunks(self):
+        blob = self._get_blob_with_lines("blob", [b"first\n", b"second\n", b"last"])
+
+        with mock.patch.object(gcs_utils, "_BLOB_DOWNLOAD_CHUNK_SIZE", 4):
+            lines = list(gcs_utils.iter_blob_lines([blob]))
+
+        assert lines == [b"first\n", b"second\n", b"last"]
+        assert blob.download_as_bytes.call_count == 5
+
+    def test_iter_blob_lines_stops_reading_when_closed(self):
+        blobs = [
+            self._get_blob_with_lines(f"blob_{i}", [b"line\n"] * 10) for i in range(4)
+        ]
+
+        with mock.patch.object(gcs_utils, "_BLOB_LINES_BUFFER_SIZE", 1):
+            lines = gcs_utils.iter_blob_lines(blobs, max_concurrent_downloads=2)
+            assert next(lines) == b"line\n"
+            lines.close()
+
+        for blob in blobs[2:]:
+            blob.download_as_bytes.assert_not_called()
+
+    def test_iter_blob_lines_raises_read_errors(self):
+        blob = self._get_blob_with_lines("blob", [b"line\n"])
+        blob.download_as_bytes.side_effect = exceptions.NotFound("blob")
+
+        with pytest.raises(exceptions.NotFound):
+            list(gcs_utils.iter_blob_lines([blob]))
+
+
+class TestJobPoller:
+    def test_watch_yields_after_each_check_until_done(self):
+        poller = job_poller.JobStatusPoller(min_poll_interval=0.01)
+        job = _FakeJob(
+            "1", [_JOB_STATE_RUNNING, _JOB_STATE_RUNNING, _JOB_STATE_SUCCEEDED]
+        )
+
+        assert list(poller.watch(job)) == [job, job]
+        assert job.get_count == 3
+        assert job._gca_resource.state == _JOB_STATE_SUCCEEDED
+
+    def test_as_completed_raises_on_timeout(self):
+        poller = job_poller.JobStatusPoller(min_poll_interval=60)
+        job = _FakeJob("1", [_JOB_STATE_RUNNING, _JOB_STATE_SUCCEEDED])
+
+        with pytest.raises(futures.TimeoutError):
+            list(poller.as_completed([job], timeout=0.1))
+        assert job.get_count == 1
+
+    def test_as_completed_polls_many_jobs_with_one_list_call(self):
+        poller = job_poller.JobStatusPoller(
+            min_poll_interval=0.01, list_batch_min_jobs=2
+        )
+        api_client = mock.Mock()
+        jobs = [
+            _FakeJob("1", [_JOB_STATE_SUCCEEDED], api_client=api_client),
+            _FakeJob("2", [_JOB_STATE_FAILED], api_client=api_client),
+            _FakeJob("3", [_JOB_STATE_SUCCEEDED], api_client=api_client),
+        ]
+        api_client.list_custom_jobs.side_effect = [
+            [
+                gca_custom_job.CustomJob(name=job_id, state=_JOB_STATE_RUNNING)
+                for job_id in [
+                    jobs[1].resource_name,
+                    f"{_TEST_JOB_PARENT}/customJobs/untracked",
+                    jobs[2].resource_name,
+                ]
+            ],
+            [
+                gca_custom_job.CustomJob(
+                    name=jobs[2].resource_name, state=_JOB_STATE_RUNNING
+                )
+            ],
+        ]
+
+        completed = list(poller.as_completed(jobs, timeout=10))
+
+        # Jobs missing from the list of active jobs are fetched once, the last
+        # tracked job is checked with a get call.
+        assert completed == jobs
+        assert [job.get_count for job in jobs] == [1, 1, 1]
+        assert api_client.list_custom_jobs.call_count == 2
+        api_client.list_custom_jobs.assert_called_with(
+            request={
+                "parent": _TEST_JOB_PARENT,
+                "filter": 'state!="JOB_STATE_FAILED" AND state!="JOB_STATE_SUCCEEDED"',
+            }
+        )
+
+    def test_list_call_updates_whole_resource_and_stops_paging(self):
+        poller = job_poller.JobStatusPoller(
+            min_poll_interval=0.01, list_batch_min_jobs=1
+        )
+        api_client = mock.Mock()
+        job = _FakeJob("1", [_JOB_STATE_SUCCEEDED], api_client=api_client)
+        listed = []
+
+        def list_custom_jobs(request):
+            for job_id in [job.resource_name] + [
+                f"{_TEST_JOB_PARENT}/customJobs/untracked-{i}" for i in range(3)
+            ]:
+                listed.append(job_id)
+                yield gca_custom_job.CustomJob(
+                    name=job_id,
+                    state=_JOB_STATE_RUNNING,
+                    web_access_uris={"workerpool0-0": "https://example.com"},
+                )
+
+        api_client.list_custom_jobs.side_effect = [list_custom_jobs(None), []]
+
+        checks = poller.watch(job)
+        next(checks)
+
+        assert job._gca_resource.web_access_uris == {
+            "workerpool0-0": "https://example.com"
+        }
+        assert listed == [job.resource_name]
+        assert list(checks) == []
+        assert job.get_count == 1
+
+    def test_list_call_falls_back_to_get_in_crowded_location(self):
+        poller = job_poller.JobStatusPoller(
+            min_poll_interval=0.01, list_batch_min_jobs=1
+        )
+        api_client = mock.Mock()
+        job = _FakeJob("1", [_JOB_STATE_SUCCEEDED], api_client=api_client)
+        api_client.list_custom_jobs.return_value = (
+            gca_custom_job.CustomJob(
+                name=f"{_TEST_JOB_PARENT}/customJobs/untracked-{i}",
+                state=_JOB_STATE_RUNNING,
+            )
+            for i in range(100)
+        )
+
+        assert list(poller.as_completed([job], timeout=10)) == [job]
+        assert job.get_count == 1
+        # Listing stopped after the capped number of other jobs.
+        assert len(list(api_client.list_custom_jobs.return_value)) == (
+            100 - job_poller._LIST_MAX_JOBS_PER_TRACKED_JOB
+        )
+
+    def test_as_completed_raises_poll_error(self):
+        poller = job_poller.JobStatusPoller(min_poll_interval=0.01)
+        job = _FakeJob("1", [RuntimeError("get failed")])
+
+        with pytest.raises(RuntimeError, match="get failed"):
+            list(poller.as_completed([job], timeout=10))
+
+    def test_as_completed_retries_transient_poll_errors(self):
+        poller = job_poller.JobStatusPoller(min_poll_interval=0.01)
+        job = _FakeJob(
+            "1",
+            [exceptions.ServiceUnavailable("unavailable"), _JOB_STATE_SUCCEEDED],
+        )
+
+        assert list(poller.as_completed([job], timeout=10)) == [job]
+        assert job.get_count == 2
+
+    def test_as_completed_poll_error_only_fails_its_job(self):
+        poller = job_poller.JobStatusPoller(
+            min_poll_interval=0.01, list_batch_min_jobs=2
+        )
+        api_client = mock.Mock()
+        api_client.list_custom_jobs.side_effect = exceptions.ServiceUnavailable(
+            "unavailable"
+        )
+        failing_job = _FakeJob(
+            "1", [exceptions.NotFound("not found")], api_client=api_client
+        )
+        job = _FakeJob("2", [_JOB_STATE_SUCCEEDED], api_client=api_client)
+
+        completed = poller.as_completed([job, failing_job], timeout=10)
+
+        assert next(completed) is job
+        with pytest.raises(exceptions.NotFound):
+            next(completed)
+
+    def test_poll_interval_backs_off_while_unchanged(self):
+        poller = job_poller.JobStatusPoller(
+            min_poll_interval=0.01, max_poll_interval=0.02, backoff_multiplier=4
+        )
+        job = _FakeJob("1", [_JOB_STATE_RUNNING] * 3 + [_JOB_STATE_SUCCEEDED])
+
+        checks = poller.watch(job)
+        for _ in range(3):
+            next(checks)
+        assert poller._poll_interval == 0.02
+        assert list(checks) == []
+
+    def test_wait_all_and_wait_any_use_global_poller(self):
+        jobs = [_FakeJob("1", [_JOB_STATE_SUCCEEDED] * 2)]
+
+        with mock.patch.object(
+            job_poller,
+            "global_poller",
+            job_poller.JobStatusPoller(min_poll_interval=0.01),
+        ):
+            assert aiplatform.wait_all(jobs) == jobs
+            assert aiplatform.wait_any(jobs, timeout=10) is jobs[0]
+
+    def test_wait_any_without_jobs_raises(self):
+        with pytest.raises(ValueError):
+            aiplatform.wait_any([])
+
+
 @pytest.fixture(scope="function")
 def yaml_file(tmp_path):
     data = {"key": "val", "list": ["1", 2, 3.0]}
@@ -560,6 +1179,131 @@ def json_file(tmp_path):
     yield json_file_path
 
 
+class TestDependencyScheduler:
+    def setup_method(self):
+        self.scheduler = dependency_scheduler.DependencyScheduler(max_workers=1)
+
+    def teardown_method(self):
+        self.scheduler.shutdown(wait=True)
+
+    def test_waiting_task_does_not_occupy_worker(self):
+        upstream = futures.Future()
+        downstream = self.scheduler.submit_after([upstream], lambda: "downstream")
+
+        assert self.scheduler.num_waiting == 1
+        # The only worker is free to complete the upstream dependency.
+        self.scheduler.submit(upstream.set_result, "upstream").result(timeout=10)
+
+        assert downstream.result(timeout=10) == "downstream"
+        assert self.scheduler.num_waiting == 0
+
+    def test_task_runs_after_all_dependencies(self):
+        dependencies = [futures.Future() for _ in range(3)]
+        task = mock.Mock(return_value="result")
+
+        future = self.scheduler.submit_after(dependencies, task, 1, key="value")
+        for dependency in dependencies[:-1]:
+            dependency.set_result(None)
+        task.assert_not_called()
+        dependencies[-1].set_result(None)
+
+        assert future.result(timeout=10) == "result"
+        task.assert_called_once_with(1, key="value")
+
+    def test_dependency_exception_propagates(self):
+        upstream = futures.Future()
+        task = mock.Mock()
+
+        downstream = self.scheduler.submit_after([upstream], task)
+        upstream.set_exception(ValueError("failed"))
+
+        with pytest.raises(ValueError):
+            downstream.result(timeout=10)
+        task.assert_not_called()
+
+    def test_queue_depth_and_resize(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(timeout=10)
+
+        blocking = self.scheduler.submit(block)
+        assert started.wait(timeout=10)
+        queued = self.scheduler.submit(lambda: "queued")
+
+        assert self.scheduler.num_running == 1
+        assert self.scheduler.num_queued == 1
+
+        self.scheduler.set_max_workers(2)
+        # Tasks scheduled after resizing run on the new worker threads.
+        assert self.scheduler.submit(lambda: "new").result(timeout=10) == "new"
+        assert self.scheduler.max_workers == 2
+
+        release.set()
+        blocking.result(timeout=10)
+        assert queued.result(timeout=10) == "queued"
+
+    def test_shutdown_waits_for_waiting_tasks(self):
+        upstream = futures.Future()
+        downstream = self.scheduler.submit_after([upstream], lambda: "downstream")
+        threading.Timer(0.1, upstream.set_result, args=(None,)).start()
+
+        self.scheduler.shutdown(wait=True)
+
+        assert downstream.result(timeout=0) == "downstream"
+        with pytest.raises(RuntimeError):
+            self.scheduler.submit(lambda: None)
+
+    def test_shutdown_cancels_tasks_not_started(self):
+        release = threading.Event()
+        blocking = self.scheduler.submit(release.wait)
+        queued_task = mock.Mock()
+        queued = self.scheduler.submit(queued_task)
+        waiting = self.scheduler.submit_after([futures.Future()], mock.Mock())
+
+        self.scheduler.shutdown(wait=False, cancel_futures=True)
+        release.set()
+
+        assert blocking.result(timeout=10)
+        assert queued.cancelled()
+        assert waiting.cancelled()
+        queued_task.assert_not_called()
+
+    @pytest.mark.skipif(
+        sys.executable is None, reason="requires python path to invoke subprocess"
+    )
+    def test_pending_chain_completes_when_script_exits(self):
+        script = textwrap.dedent(
+            """
+            import time
+            from google.cloud.aiplatform.utils import dependency_scheduler
+
+            def upstream():
+                time.sleep(1)
+                print("upstream done", flush=True)
+
+            def downstream():
+                print("downstream done", flush=True)
+
+            scheduler = dependency_scheduler.DependencyScheduler(max_workers=2)
+            upstream_future = scheduler.submit(upstream)
+            scheduler.submit_after([upstream_future], downstream)
+            """
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        ).stdout
+
+        assert output.splitlines() == ["upstream done", "downstream done"]
+
+
 class TestYamlUtils:
     def test_load_yaml_from_local_file__with_json(self, yaml_file):
         actual = yaml_utils.load_yaml(yaml_file)